@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Check Scheduler — Antigravity Agent Framework
+=============================================
+
+Resource-aware parallel runner for the verify_all/checklist suites.
+
+CHECK_NEEDS records, per checker script, what it needs: how many cores
+it keeps busy, whether it drives a browser or the network, whether it
+must run alone, and which checks it runs after. Those orderings only
+sequence checks (Playwright runs after the test suite, whether or not
+the tests passed); a run's own `Check.after` dependencies, such as
+checklist's performance checks on the required core checks, must pass
+or the dependent check is blocked.
+
+The scheduler starts a check as soon as its dependencies are done and
+its resources are free, always picking the ready check with the longest
+remaining chain first (durations estimated from previous runs), so the
+suite finishes in about the time of its longest chain instead of the sum
+of all checks. Lighthouse and Playwright never share the browser slot;
+lint, tests and the security scan each take every core.
+
+After a run, `critical_path()` walks back from the last check to finish
+through whatever it waited on — a dependency or a check holding a
+resource it needed — and that chain is what bounded the wall time.
+
+Fail-fast: when a required check fails, the orchestrator's on_fail
+policy for its category decides what happens to the others — "cancel"
+(SIGTERM every running check's process group, start nothing more),
+"category" (the same, limited to that category) or "finish" (start
+nothing more, let running checks complete). Cancelled checks keep the
+output they produced so far.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from file_inventory import CACHE_DIR
+
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+ALL_CORES = 0                  # Needs.cpu sentinel: the check saturates every core
+
+@dataclass(frozen=True)
+class Needs:
+    cpu: int = 1                    # cores kept busy (ALL_CORES = every core)
+    browser: bool = False           # holds the single headless-browser slot
+    network: bool = False           # talks to the target URL / the internet
+    exclusive: bool = False         # nothing else may run alongside it
+    after: Tuple[str, ...] = ()     # script names that must finish first (pass or fail)
+
+
+# Kept here rather than in each checker script so the scheduler can plan a
+# run without importing them; keyed by script file name so verify_all and
+# checklist share one table. Scripts not listed need one core and nothing else.
+CHECK_NEEDS: Dict[str, Needs] = {
+    "security_scan.py":       Needs(cpu=ALL_CORES),        # process pool over every core
+    "lint_runner.py":         Needs(cpu=ALL_CORES),
+    "test_runner.py":         Needs(cpu=ALL_CORES),
+    "dependency_analyzer.py": Needs(),                     # offline advisory index
+    "lighthouse_audit.py":    Needs(cpu=2, browser=True, network=True),
+    "playwright_runner.py":   Needs(cpu=2, browser=True, network=True, after=("test_runner.py",)),
+    "bundle_analyzer.py":     Needs(cpu=2),
+}
+
+DEFAULT_ESTIMATE = 5.0         # seconds, for checks with no recorded duration
+TERM_GRACE = 5.0               # seconds between SIGTERM and SIGKILL of a cancelled check
+ON_FAIL_POLICIES = ("cancel", "category", "finish")
+HISTORY_FILE = CACHE_DIR / "check_durations.json"
+HISTORY_WEIGHT = 0.5           # weight of the newest run in the moving average
+
+
+def needs_for(script_path) -> Needs:
+    return CHECK_NEEDS.get(Path(script_path).name, Needs())
+
+
+# ─── Data Types ───────────────────────────────────────────────────────────────
+
+@dataclass
+class Check:
+    name: str
+    script: Path
+    required: bool = False
+    category: str = ""
+    needs: Needs = field(default_factory=Needs)
+    after: Tuple[str, ...] = ()     # script names that must finish and pass first, for this run
+    token: "CancelToken" = field(default_factory=lambda: CancelToken(), repr=False, compare=False)
+
+    @property
+    def key(self) -> str:
+        return self.script.name
+
+    @property
+    def depends_on(self) -> Tuple[str, ...]:
+        return self.needs.after + self.after
+
+
+class DurationHistory:
+    """Moving average of each check's wall time, kept under the project."""
+
+    def __init__(self, project_path: Path):
+        self.path = Path(project_path) / HISTORY_FILE
+        try:
+            self.durations: Dict[str, float] = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.durations = {}
+
+    def estimate(self, key: str) -> float:
+        return self.durations.get(key, DEFAULT_ESTIMATE)
+
+    def record(self, key: str, seconds: float) -> None:
+        old = self.durations.get(key)
+        self.durations[key] = seconds if old is None else HISTORY_WEIGHT * seconds + (1 - HISTORY_WEIGHT) * old
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.durations, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+# ─── Cancellation ─────────────────────────────────────────────────────────────
+
+def _popen_group_kwargs() -> dict:
+    """Start the child as the leader of its own process group."""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def terminate_group(proc: subprocess.Popen, grace: float = TERM_GRACE) -> None:
+    """SIGTERM the process group of `proc`; SIGKILL it if still alive after `grace`."""
+    if proc.poll() is not None:
+        return
+    try:
+        if os.name == "nt":
+            proc.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            os.killpg(proc.pid, signal.SIGTERM)
+    except (OSError, ValueError):
+        return
+
+    def kill():
+        if proc.poll() is None:
+            try:
+                if os.name == "nt":
+                    proc.kill()
+                else:
+                    os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+    timer = threading.Timer(grace, kill)
+    timer.daemon = True
+    timer.start()
+
+
+class CancelToken:
+    """
+    Per-check cancellation handle. Subprocesses attached to it are
+    terminated (whole process group) on cancel(); in-process plugins can
+    poll `cancelled` between units of work.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._procs: List[subprocess.Popen] = []
+        self._lock = threading.Lock()
+        self.reason = ""
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            procs = list(self._procs)
+        for proc in procs:
+            terminate_group(proc)
+
+    def attach(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            self._procs.append(proc)
+            cancelled = self._event.is_set()
+        if cancelled:
+            terminate_group(proc)
+
+    def detach(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            if proc in self._procs:
+                self._procs.remove(proc)
+
+
+def run_command(cmd: List[str], env: Optional[Dict[str, str]] = None, timeout: Optional[float] = None,
+                token: Optional[CancelToken] = None) -> dict:
+    """
+    subprocess.run() for checks: the child gets its own process group so
+    a timeout or cancellation takes down everything it spawned (test
+    runners, browsers), and the output produced up to that point is kept.
+    Returns returncode, stdout, stderr, timed_out and cancelled.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                            env=env, **_popen_group_kwargs())
+    if token:
+        token.attach(proc)
+    timed_out = False
+    try:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            terminate_group(proc)
+            stdout, stderr = proc.communicate()
+    finally:
+        if token:
+            token.detach(proc)
+    return {
+        "returncode": proc.returncode,
+        "stdout": stdout or "",
+        "stderr": stderr or "",
+        "timed_out": timed_out,
+        "cancelled": bool(token and token.cancelled),
+    }
+
+
+# ─── Scheduler ────────────────────────────────────────────────────────────────
+
+class Scheduler:
+    """
+    List scheduler over a thread pool. `run_one(check)` does the work (a
+    subprocess or an in-process plugin) and returns the orchestrator's
+    result dict; the scheduler adds `start`/`end` (seconds since the run
+    began) and `waited_on` (the checks whose completion let it start).
+    """
+
+    def __init__(self, checks: List[Check], run_one: Callable[[Check], dict],
+                 cores: Optional[int] = None, browsers: int = 1,
+                 history: Optional[DurationHistory] = None):
+        self.checks = checks
+        self.run_one = run_one
+        self.cores = max(1, cores or os.cpu_count() or 1)
+        self.capacity = {"cpu": self.cores, "browser": browsers}
+        self.history = history
+        self.by_key = {c.key: c for c in checks}
+        self.priority = self._priorities()
+
+    def _estimate(self, check: Check) -> float:
+        return self.history.estimate(check.key) if self.history else DEFAULT_ESTIMATE
+
+    def _priorities(self) -> Dict[str, float]:
+        """Longest estimated chain from each check to the end of the suite."""
+        dependents: Dict[str, List[str]] = {c.key: [] for c in self.checks}
+        for c in self.checks:
+            for dep in c.depends_on:
+                if dep in dependents:
+                    dependents[dep].append(c.key)
+
+        memo: Dict[str, float] = {}
+
+        def chain(key: str) -> float:
+            if key not in memo:
+                memo[key] = 0.0      # cycle guard
+                memo[key] = self._estimate(self.by_key[key]) + max(
+                    (chain(d) for d in dependents[key]), default=0.0)
+            return memo[key]
+
+        return {c.key: chain(c.key) for c in self.checks}
+
+    def demand(self, check: Check) -> Dict[str, int]:
+        if check.needs.exclusive:
+            return dict(self.capacity)
+        cpu = self.cores if check.needs.cpu == ALL_CORES else min(check.needs.cpu, self.cores)
+        return {"cpu": cpu, "browser": 1 if check.needs.browser else 0}
+
+    def run(self, on_fail: Optional[Callable[[Check, dict], Optional[str]]] = None) -> List[dict]:
+        """
+        Run every check; returns results in the order of `self.checks`.
+
+        When a check fails, `on_fail(check, result)` may return one of
+        ON_FAIL_POLICIES. Checks that are then not started are reported as
+        skipped ("blocked"), as is any check whose `Check.after` dependency
+        failed or was blocked (`Needs.after` only orders checks); running checks that get cancelled report what they had
+        done ("cancelled").
+        """
+        free = dict(self.capacity)
+        results: Dict[str, dict] = {}
+        pending = sorted(self.checks, key=lambda c: -self.priority[c.key])
+        running: Dict[Future, Tuple[Check, Dict[str, int]]] = {}
+        exclusive_running = False
+        stopped: Optional[str] = None    # no check starts any more
+        closed: Dict[str, str] = {}      # category -> reason none of its checks start
+        waited_on: Dict[str, List[str]] = {}
+        last_done: List[str] = []        # completions that unblocked this round's starts
+        t0 = time.perf_counter()
+
+        def timed(check: Check) -> dict:
+            start = time.perf_counter() - t0
+            result = self.run_one(check)
+            result["start"], result["end"] = start, time.perf_counter() - t0
+            return result
+
+        def skip(check: Check, reason: str) -> None:
+            pending.remove(check)
+            results[check.key] = {"name": check.name, "passed": True, "skipped": True, "blocked": True,
+                                  "warning": reason, "category": check.category}
+
+        with ThreadPoolExecutor(max_workers=max(1, len(self.checks))) as pool:
+            while pending or running:
+                for check in list(pending):
+                    reason = stopped or closed.get(check.category)
+                    if reason:
+                        skip(check, f"not started: {reason}")
+                        continue
+                    deps = [d for d in check.depends_on if d in self.by_key]
+                    bad = [self.by_key[d].name for d in check.after
+                           if d in results and (results[d].get("blocked") or not results[d]["passed"])]
+                    if bad:
+                        skip(check, f"dependency did not pass: {', '.join(bad)}")
+                        continue
+                    if any(d not in results for d in deps):
+                        continue
+                    if exclusive_running or (check.needs.exclusive and running):
+                        continue
+                    demand = self.demand(check)
+                    if any(free[r] < n for r, n in demand.items()):
+                        continue
+                    for r, n in demand.items():
+                        free[r] -= n
+                    exclusive_running = check.needs.exclusive
+                    pending.remove(check)
+                    waited_on[check.key] = list(last_done)
+                    running[pool.submit(timed, check)] = (check, demand)
+
+                if not running:
+                    for check in list(pending):
+                        skip(check, "dependency cycle")
+                    break
+
+                last_done = []
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    check, demand = running.pop(future)
+                    for r, n in demand.items():
+                        free[r] += n
+                    if check.needs.exclusive:
+                        exclusive_running = False
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        now = time.perf_counter() - t0
+                        result = {"name": check.name, "passed": False, "skipped": False,
+                                  "error": str(e), "start": now, "end": now}
+                    result["category"] = check.category
+                    result["waited_on"] = [self.by_key[k].name for k in waited_on[check.key]]
+                    results[check.key] = result
+                    last_done.append(check.key)
+                    if self.history and not result.get("skipped"):
+                        self.history.record(check.key, result["end"] - result["start"])
+                    failed = not result["passed"] and not result.get("skipped")
+                    policy = on_fail(check, result) if failed and on_fail else None
+                    if policy:
+                        reason = f"{check.name} failed"
+                        if policy == "category":
+                            closed.setdefault(check.category, reason)
+                        elif stopped is None:
+                            stopped = reason
+                        if policy in ("cancel", "category"):
+                            for other, _ in running.values():
+                                if policy == "cancel" or other.category == check.category:
+                                    other.token.cancel(f"cancelled: {reason}")
+
+        return [results[c.key] for c in self.checks]
+
+
+# ─── Reporting ────────────────────────────────────────────────────────────────
+
+def critical_path(results: List[dict]) -> List[dict]:
+    """
+    The chain that bounded the run: from the last check to finish, step
+    back to the latest-finishing check it waited on, until a check that
+    started right away.
+    """
+    timed = {r["name"]: r for r in results if "end" in r}
+    if not timed:
+        return []
+    chain = [max(timed.values(), key=lambda r: r["end"])]
+    while True:
+        before = [timed[n] for n in chain[-1].get("waited_on", []) if n in timed]
+        if not before:
+            break
+        chain.append(max(before, key=lambda r: r["end"]))
+    return chain[::-1]
+
+
+def format_critical_path(results: List[dict]) -> str:
+    chain = critical_path(results)
+    if not chain:
+        return ""
+    steps = " → ".join(f"{r['name']} ({r['end'] - r['start']:.1f}s)" for r in chain)
+    busy = sum(r["end"] - r["start"] for r in results if "end" in r)
+    return (f"Critical path: {steps} = {chain[-1]['end']:.1f}s wall "
+            f"({busy:.1f}s of check time)")
+
+
+def format_plan(scheduler: Scheduler) -> List[str]:
+    """One line per check, longest chain first: resources, dependencies, estimate."""
+    lines = []
+    for check in sorted(scheduler.checks, key=lambda c: -scheduler.priority[c.key]):
+        needs = check.needs
+        demand = scheduler.demand(check)
+        cpu = "all cores" if demand["cpu"] == scheduler.cores else f"{demand['cpu']} core(s)"
+        tags = [cpu] + [t for t, on in (("browser", needs.browser), ("network", needs.network),
+                                         ("exclusive", needs.exclusive)) if on]
+        deps = [scheduler.by_key[d].name for d in check.depends_on if d in scheduler.by_key]
+        after = f", after {', '.join(deps)}" if deps else ""
+        lines.append(f"{check.name}: {', '.join(tags)}{after} (~{scheduler.priority[check.key]:.0f}s chain)")
+    return lines
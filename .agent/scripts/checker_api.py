@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Checker Plugin API — Antigravity Agent Framework
+================================================
+
+In-process entry point for the skill checker scripts. A checker that
+defines
+
+    def run(context: CheckContext) -> Findings
+
+can be loaded by verify_all/checklist into the orchestrator's own
+interpreter instead of being started as `python script.py <path>`: no
+interpreter start-up or re-import per check, every checker sees the
+same in-memory file inventory (and its content cache), and results come
+back as structured findings rather than stdout text and an exit code.
+
+`run()` must not print or exit; its `passed` verdict is the one the
+script's CLI turns into exit status 0. Scripts without `run()` (the ones
+that drive external tools: linters, test runners, Lighthouse, ...) are
+still started as subprocesses, and the orchestrators keep a
+`--subprocess` switch to isolate every check.
+
+A cancelled check cannot be killed in-process, so long plugins poll
+`context.cancelled` between units of work (or call
+`context.raise_if_cancelled()`), stop their worker pools and raise
+CheckCancelled; run_plugin() then reports the check as cancelled.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import re
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+from file_inventory import FileInventory, get_inventory
+
+
+# ─── Data Types ───────────────────────────────────────────────────────────────
+
+class CheckCancelled(Exception):
+    """A plugin stopped early because its check was cancelled."""
+
+
+SEVERITIES = ("critical", "high", "medium", "low", "info")
+
+
+@dataclass
+class CheckContext:
+    project_path: Path
+    url: Optional[str] = None
+    options: Dict[str, Any] = field(default_factory=dict)
+    token: Any = None              # check_scheduler.CancelToken when run under the scheduler
+
+    def __post_init__(self):
+        self.project_path = Path(self.project_path).resolve()
+
+    @property
+    def inventory(self) -> FileInventory:
+        return get_inventory(self.project_path)
+
+    @property
+    def cancelled(self) -> bool:
+        """True once the orchestrator cancelled this check; long plugins poll it."""
+        return bool(self.token is not None and self.token.cancelled)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise CheckCancelled once the orchestrator cancelled this check."""
+        if self.cancelled:
+            raise CheckCancelled(self.token.reason)
+
+    def relpath(self, path) -> str:
+        """`path` relative to the project (POSIX), or unchanged if outside it."""
+        try:
+            return Path(path).resolve().relative_to(self.project_path).as_posix()
+        except ValueError:
+            return str(path)
+
+
+@dataclass
+class Finding:
+    message: str
+    severity: str = "medium"       # one of SEVERITIES
+    file: Optional[str] = None     # relative to the project when known
+    line: Optional[int] = None
+    rule: Optional[str] = None
+
+
+@dataclass
+class Findings:
+    passed: bool
+    findings: List[Finding] = field(default_factory=list)
+    summary: str = ""
+    data: Dict[str, Any] = field(default_factory=dict)   # the checker's own report
+    skipped: bool = False
+
+    def count(self, *severities: str) -> int:
+        return sum(1 for f in self.findings if f.severity in severities)
+
+
+_TAGGED_RE = re.compile(r"^\[([^\]]+)\]\s*(?:([^\s:]+):\s+)?(.*)$", re.DOTALL)
+
+
+def parse_tagged(text: str, severity: str) -> Finding:
+    """
+    Finding from the `[Category] file: message` strings the design audits
+    report; a category tagged CRITICAL overrides `severity`.
+    """
+    m = _TAGGED_RE.match(text)
+    if not m:
+        return Finding(text, severity)
+    tag, file, message = m.groups()
+    if "CRITICAL" in tag:
+        severity = "critical"
+    return Finding(message, severity, file=file, rule=tag.replace(" CRITICAL", ""))
+
+
+# ─── Loading ──────────────────────────────────────────────────────────────────
+
+_plugins: Dict[Path, Optional[ModuleType]] = {}
+_plugins_lock = threading.Lock()
+_RUN_DEF_RE = re.compile(r"^def run\(", re.MULTILINE)
+
+
+def load_plugin(script_path: Path) -> Optional[ModuleType]:
+    """
+    Import `script_path` as a module (once per process) and return it if
+    it defines `run()`, else None. Scripts whose source has no top-level
+    `def run(` are not imported at all, since a plain script may do its
+    work at import time. The module is registered under its file stem
+    with its directory on sys.path, as if run as a script, so process
+    pools it starts can pickle its functions.
+    """
+    script_path = Path(script_path).resolve()
+    with _plugins_lock:
+        if script_path in _plugins:
+            return _plugins[script_path]
+        if not _RUN_DEF_RE.search(script_path.read_text(encoding="utf-8", errors="replace")):
+            _plugins[script_path] = None
+            return None
+
+        name = script_path.stem
+        existing = sys.modules.get(name)
+        if existing is not None and Path(getattr(existing, "__file__", "") or "").resolve() != script_path:
+            name = f"_agent_check_{name}"     # stem already taken by another module
+
+        module = sys.modules.get(name)
+        if module is None:
+            if str(script_path.parent) not in sys.path:
+                sys.path.insert(0, str(script_path.parent))
+            spec = importlib.util.spec_from_file_location(name, script_path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[name]
+                raise
+
+        plugin = module if callable(getattr(module, "run", None)) else None
+        _plugins[script_path] = plugin
+        return plugin
+
+
+# ─── Execution ────────────────────────────────────────────────────────────────
+
+def run_plugin(name: str, script_path: Path, context: CheckContext) -> Dict[str, Any]:
+    """
+    Run one checker in-process. Returns the same result dict as the
+    orchestrators' subprocess runner, plus `findings` (list of dicts)
+    and `data`.
+    """
+    start = time.perf_counter()
+    if context.cancelled:
+        return _cancelled(name, context, 0.0)
+    try:
+        plugin = load_plugin(script_path)
+        if plugin is None:
+            raise ImportError(f"{Path(script_path).name} does not define run(context)")
+        result: Findings = plugin.run(context)
+    except CheckCancelled:
+        return _cancelled(name, context, time.perf_counter() - start)
+    except SystemExit as e:
+        return {"name": name, "passed": False, "skipped": False, "mode": "plugin",
+                "duration": time.perf_counter() - start, "error": f"exited with status {e.code}"}
+    except Exception as e:
+        return {"name": name, "passed": False, "skipped": False, "mode": "plugin",
+                "duration": time.perf_counter() - start, "error": f"{type(e).__name__}: {e}"}
+
+    if context.cancelled:       # a partial result is not a verdict
+        return _cancelled(name, context, time.perf_counter() - start)
+
+    lines = [result.summary] if result.summary else []
+    lines += [_format(f) for f in result.findings]
+    return {
+        "name": name,
+        "passed": result.passed,
+        "skipped": result.skipped,
+        "mode": "plugin",
+        "duration": time.perf_counter() - start,
+        "output": "\n".join(lines),
+        "error": "" if result.passed else (result.summary or f"{len(result.findings)} finding(s)"),
+        "findings": [asdict(f) for f in result.findings],
+        "data": result.data,
+    }
+
+
+def _cancelled(name: str, context: CheckContext, duration: float) -> Dict[str, Any]:
+    return {"name": name, "passed": True, "skipped": True, "cancelled": True, "mode": "plugin",
+            "duration": duration, "warning": context.token.reason if context.token else "Cancelled"}
+
+
+def _format(finding: Finding) -> str:
+    where = ""
+    if finding.file:
+        where = f" {finding.file}" + (f":{finding.line}" if finding.line else "")
+    return f"[{finding.severity}]{where} {finding.message}"
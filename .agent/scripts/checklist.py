@@ -9,6 +9,8 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --subprocess       # One process per check (isolation)
+    python scripts/checklist.py . --no-fail-fast     # Finish every check after a Core failure
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -21,18 +23,21 @@ Priority Order:
 """
 
 import sys
-import subprocess
 import argparse
 from pathlib import Path
 from typing import List, Tuple, Optional
 
 # ANSI colors for terminal output
-import concurrent.futures
 import sys
-import subprocess
 import argparse
+import threading
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+from file_inventory import export_inventory
+from checker_api import CheckContext, load_plugin, run_plugin
+from check_scheduler import (CancelToken, Check, DurationHistory, Scheduler, format_critical_path,
+                             needs_for, run_command)
 
 # ... (Colors and print functions remain same, omitted for brevity if unchanged, but I need to include imports if I change top of file.
 # The previous `replace_file_content` context shows imports at top. I will replace from imports down to main loop.)
@@ -40,6 +45,9 @@ from typing import List, Tuple, Optional
 # To avoid replacing the whole file and dealing with large context, I'll modify imports first, then the main execution logic.
 # Wait, let's just replace the whole main function and imports.
 
+# Checks run on scheduler threads; keep each message on its own line
+_print_lock = threading.RLock()
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -57,16 +65,20 @@ def print_header(text: str):
     print(f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}\n")
 
 def print_step(text: str):
-    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
+    with _print_lock:
+        print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
 
 def print_success(text: str):
-    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
+    with _print_lock:
+        print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
 
 def print_warning(text: str):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
+    with _print_lock:
+        print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
 
 def print_error(text: str):
-    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
+    with _print_lock:
+        print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
 # Define priority-ordered checks
 CORE_CHECKS = [
@@ -83,11 +95,17 @@ PERFORMANCE_CHECKS = [
     ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
 ]
 
+# What a failed required check does to the rest (see check_scheduler.py):
+# a core failure cancels everything still running; a performance failure
+# lets the other performance check finish
+ON_FAIL = {"Core": "cancel", "Performance": "finish"}
+
 def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               env: Optional[Dict[str, str]] = None, token: Optional[CancelToken] = None) -> dict:
     """
     Run a validation script and capture results
     """
@@ -99,33 +117,58 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
         cmd.append(url)
     
-    # Run script
+    # Run script in its own process group (fail-fast cancels the whole group)
     try:
-        result = subprocess.run(
+        result = run_command(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+            env=env,
+            timeout=300,  # 5 minute timeout
+            token=token
         )
         
-        passed = result.returncode == 0
+        if result["cancelled"]:
+            return {"name": name, "passed": True, "output": result["stdout"], "error": result["stderr"],
+                    "skipped": True, "cancelled": True, "warning": token.reason}
+        
+        if result["timed_out"]:
+            return {"name": name, "passed": False, "output": result["stdout"], "error": "Timeout", "skipped": False}
+        
+        passed = result["returncode"] == 0
         
         return {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "output": result["stdout"],
+            "error": result["stderr"],
             "skipped": False
         }
     
-    except subprocess.TimeoutExpired:
-        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False}
-    
     except Exception as e:
         return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
 
+def run_check(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+              env: Optional[Dict[str, str]] = None, in_process: bool = True,
+              token: Optional[CancelToken] = None) -> dict:
+    """
+    Run a check in this interpreter if its script defines run(context),
+    else as a subprocess
+    """
+    plugin = None
+    if in_process and check_script_exists(script_path):
+        try:
+            plugin = load_plugin(script_path)
+        except (Exception, SystemExit):
+            plugin = None  # let the subprocess run report the import failure
+    if plugin is None:
+        return run_script(name, script_path, project_path, url, env=env, token=token)
+    return run_plugin(name, script_path, CheckContext(project_path, url, token=token))
+
 def print_result(result: dict):
     """Print result immediately"""
+    with _print_lock:
+        _print_result(result)
+
+def _print_result(result: dict):
     name = result["name"]
     if result.get("skipped"):
         print_warning(f"{name}: Skipped ({result.get('warning', 'Unknown reason')})")
@@ -137,6 +180,8 @@ def print_result(result: dict):
         print_error(f"{name}: FAILED")
         if result.get("error"):
             print(f"  Error: {result['error'][:200]}")
+        for f in result.get("findings", [])[:3]:
+            print(f"  - [{f['severity']}] {f['message'][:120]}")
 
 def print_summary(results: List[dict]):
     """Print final summary report"""
@@ -150,6 +195,9 @@ def print_summary(results: List[dict]):
     print(f"{Colors.GREEN}✅ Passed: {passed_count}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed_count}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped_count}{Colors.ENDC}")
+    critical = format_critical_path(results)
+    if critical:
+        print(critical)
     print()
     
     # Detailed results
@@ -180,6 +228,12 @@ def main():
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--subprocess", action="store_true",
+                        help="Run every check as its own process (isolation mode)")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Cores the scheduler may fill (default: CPU count, 1 = one check at a time)")
+    parser.add_argument("--no-fail-fast", action="store_true",
+                        help="Let every check finish even after a required check failed")
     
     args = parser.parse_args()
     
@@ -192,49 +246,44 @@ def main():
     print_header("🚀 ANTIGRAVITY KIT - MASTER CHECKLIST")
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
-    print(f"Mode: Parallel Execution ⚡")
-    
-    results = []
-    
-    # Run core checks in parallel
-    print_header("📋 CORE CHECKS (Parallel)")
-    
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future_to_check = {}
-        for name, script_path, required in CORE_CHECKS:
-            script = project_path / script_path
-            print_step(f"Scheduled: {name}")
-            future = executor.submit(run_script, name, script, str(project_path))
-            future_to_check[future] = (name, required)
-            
-        for future in concurrent.futures.as_completed(future_to_check):
-            name, required = future_to_check[future]
-            try:
-                result = future.result()
-                results.append(result)
-                print_result(result)
-            except Exception as e:
-                print_error(f"{name}: Exception - {e}")
-                results.append({"name": name, "passed": False, "error": str(e)})
-
+    print(f"Mode: Scheduled Parallel Execution ⚡ ({'subprocess per check' if args.subprocess else 'in-process plugins'})")
+    
+    # Walk the project once; in-process checks and checker processes share it
+    env = export_inventory(project_path)
+    
+    # Core checks run in parallel; performance checks wait for the required ones
+    checks = [Check(name, project_path / script_path, required, "Core", needs_for(script_path))
+              for name, script_path, required in CORE_CHECKS]
+    if args.url and not args.skip_performance:
+        gate = tuple(Path(script_path).name for _, script_path, required in CORE_CHECKS if required)
+        checks += [Check(name, project_path / script_path, required, "Performance", needs_for(script_path), after=gate)
+                   for name, script_path, required in PERFORMANCE_CHECKS]
+    
+    def run_one(check: Check) -> dict:
+        print_step(f"Running: {check.name}")
+        result = run_check(check.name, check.script, str(project_path),
+                           args.url if check.category == "Performance" else None,
+                           env=env, in_process=not args.subprocess, token=check.token)
+        print_result(result)
+        return result
+    
+    print_header("📋 CHECKS (Scheduled)")
+    history = DurationHistory(project_path)
+    on_fail = None
+    if not args.no_fail_fast:
+        on_fail = lambda check, result: ON_FAIL[check.category] if check.required else None
+    results = Scheduler(checks, run_one, cores=args.jobs, history=history).run(on_fail)
+    history.save()
+    
     # Verify required checks
-    failed_required = [r for r in results if not r["passed"] and not r.get("skipped") and any(c[0] == r["name"] and c[2] for c in CORE_CHECKS)]
+    failed_required = [r for c, r in zip(checks, results)
+                       if c.required and c.category == "Core" and not r["passed"] and not r.get("skipped")]
     
     if failed_required:
          print_error(f"CRITICAL: {len(failed_required)} required checks failed. Stopping checklist.")
          print_summary(results)
          sys.exit(1)
     
-    # Run performance checks (Sequential as they might compete for browser/resources)
-    if args.url and not args.skip_performance:
-        print_header("⚡ PERFORMANCE CHECKS (Sequential)")
-        for name, script_path, required in PERFORMANCE_CHECKS:
-            script = project_path / script_path
-            print_step(f"Running: {name}")
-            result = run_script(name, script, str(project_path), args.url)
-            results.append(result)
-            print_result(result)
-    
     # Print summary
     all_passed = print_summary(results)
     
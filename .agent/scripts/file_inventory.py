@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+File Inventory — Antigravity Agent Framework
+=============================================
+
+One walk of a project, shared by every skill checker. The file list comes
+from `git ls-files` (tracked + untracked, .gitignore honoured) when the
+project is a git work tree, otherwise from a parallel directory scan; in
+both cases the usual build/vendor directories are pruned. Each entry
+records size, mtime and a coarse type, and decoded file contents are
+served from a bounded LRU cache so checkers that look at the same file
+read it once.
+
+Checkers call `get_inventory(root)`: the inventory is built once per
+process, or loaded from the snapshot an orchestrator exported through
+$AGENT_FILE_INVENTORY (see `export_inventory`), so a whole
+verify_all/checklist run walks the tree a single time. Checkers that must
+see ignored files too (secrets live in gitignored .env files) ask for
+`get_inventory(root, gitignore=False)`, which always walks.
+
+Usage:
+    python .agent/scripts/file_inventory.py [path]           # Summary by type
+    python .agent/scripts/file_inventory.py [path] --json    # Full listing
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+# Never part of the inventory, git-tracked or not
+SKIP_DIRS = frozenset({
+    "node_modules", ".git", "dist", "build", "__pycache__", ".venv", "venv", ".next",
+})
+CACHE_DIR = Path(".agent/.cache")
+
+SNAPSHOT_ENV = "AGENT_FILE_INVENTORY"
+CONTENT_CACHE_BYTES = 64 * 1024 * 1024
+STAT_BATCH = 256
+
+KINDS = {
+    "code":   {".py", ".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs", ".go", ".java", ".rb",
+               ".php", ".dart", ".kt", ".swift", ".rs", ".c", ".cpp", ".h", ".cs"},
+    "markup": {".html", ".htm", ".vue", ".svelte", ".astro", ".xml", ".svg"},
+    "style":  {".css", ".scss", ".sass", ".less"},
+    "config": {".json", ".yaml", ".yml", ".toml", ".ini", ".cfg", ".env", ".lock"},
+    "doc":    {".md", ".mdx", ".rst", ".txt", ".po"},
+}
+_KIND_BY_EXT = {ext: kind for kind, exts in KINDS.items() for ext in exts}
+
+
+# ─── Data Types ───────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class FileEntry:
+    rel: str          # POSIX path relative to the inventory root
+    size: int
+    mtime_ns: int
+    ext: str          # lowercased suffix, "" if none
+    kind: str         # code | markup | style | config | doc | other
+
+    @property
+    def name(self) -> str:
+        return self.rel.rsplit("/", 1)[-1]
+
+    @property
+    def parts(self) -> tuple:
+        return tuple(self.rel.split("/"))
+
+
+def _entry(rel: str, st: os.stat_result) -> FileEntry:
+    ext = os.path.splitext(rel)[1].lower()
+    return FileEntry(rel, st.st_size, st.st_mtime_ns, ext, _KIND_BY_EXT.get(ext, "other"))
+
+
+def _pruned(rel: str) -> bool:
+    parts = rel.split("/")
+    return any(p in SKIP_DIRS for p in parts[:-1]) or "/".join(parts[:2]) == CACHE_DIR.as_posix()
+
+
+# ─── Walkers ──────────────────────────────────────────────────────────────────
+
+def _git_paths(root: Path) -> Optional[List[str]]:
+    """Tracked + untracked, non-ignored files under `root`; None outside a work tree."""
+    try:
+        r = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root, capture_output=True, timeout=60,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if r.returncode != 0:
+        return None
+    return [p for p in r.stdout.decode("utf-8", "surrogateescape").split("\0") if p]
+
+
+def _stat_batch(root: Path, rels: List[str]) -> List[FileEntry]:
+    out = []
+    for rel in rels:
+        try:
+            st = os.stat(root / rel)
+        except OSError:
+            continue          # deleted but still in the index
+        if not os.path.isdir(root / rel):   # submodules show up as paths
+            out.append(_entry(rel, st))
+    return out
+
+
+def _scan_dir(root: Path, rel_dir: str) -> tuple:
+    """One directory level: (file entries, subdirectory rels)."""
+    files, dirs = [], []
+    try:
+        with os.scandir(root / rel_dir if rel_dir else root) as it:
+            for de in it:
+                rel = f"{rel_dir}/{de.name}" if rel_dir else de.name
+                try:
+                    if de.is_dir(follow_symlinks=False):
+                        if de.name not in SKIP_DIRS and rel != CACHE_DIR.as_posix():
+                            dirs.append(rel)
+                    elif de.is_file():
+                        files.append(_entry(rel, de.stat()))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, dirs
+
+
+def _walk_parallel(root: Path, pool: ThreadPoolExecutor) -> List[FileEntry]:
+    """Breadth-first scandir with each directory level fanned out over `pool`."""
+    entries: List[FileEntry] = []
+    level = [""]
+    while level:
+        nxt: List[str] = []
+        for files, dirs in pool.map(lambda d: _scan_dir(root, d), level):
+            entries.extend(files)
+            nxt.extend(dirs)
+        level = nxt
+    return entries
+
+
+# ─── Inventory ────────────────────────────────────────────────────────────────
+
+PathLike = Union[str, Path, FileEntry]
+
+
+class FileInventory:
+    """
+    Immutable listing of a project's files plus a shared content cache.
+
+    `files()` filters the listing (by extension, name, extra skipped
+    directories or a predicate); `read_text()` returns decoded contents,
+    re-reading a file only when it changed on disk or was evicted.
+    """
+
+    def __init__(self, root: Path, entries: Iterable[FileEntry], source: str,
+                 cache_bytes: int = CONTENT_CACHE_BYTES):
+        self.root = Path(root).resolve()
+        self.entries: List[FileEntry] = sorted(entries, key=lambda e: e.rel)
+        self.source = source
+        self.cache_bytes = cache_bytes
+        self._by_rel = {e.rel: e for e in self.entries}
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ── Construction ──
+
+    @classmethod
+    def scan(cls, root: Union[str, Path], jobs: Optional[int] = None,
+             gitignore: bool = True) -> "FileInventory":
+        """
+        List `root` through git when it is a work tree and `gitignore` is
+        set, else by walking it (ignored files included).
+        """
+        root = Path(root).resolve()
+        jobs = jobs or min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            rels = _git_paths(root) if gitignore else None
+            if not rels:      # not a work tree, or the whole root is ignored
+                return cls(root, _walk_parallel(root, pool), "walk")
+            rels = [r for r in rels if not _pruned(r)]
+            batches = [rels[i:i + STAT_BATCH] for i in range(0, len(rels), STAT_BATCH)]
+            entries = [e for batch in pool.map(lambda b: _stat_batch(root, b), batches) for e in batch]
+        return cls(root, entries, "git")
+
+    def save(self, path: Path) -> None:
+        data = {"root": str(self.root), "source": self.source,
+                "entries": [list(asdict(e).values()) for e in self.entries]}
+        tmp = Path(str(path) + ".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["FileInventory"]:
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            return cls(Path(data["root"]), (FileEntry(*e) for e in data["entries"]), data["source"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    # ── Queries ──
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[FileEntry]:
+        return iter(self.entries)
+
+    def get(self, rel: str) -> Optional[FileEntry]:
+        return self._by_rel.get(rel)
+
+    def path(self, entry: PathLike) -> Path:
+        if isinstance(entry, FileEntry):
+            return self.root / entry.rel
+        p = Path(entry)
+        return p if p.is_absolute() else self.root / p
+
+    def files(self, exts: Optional[Iterable[str]] = None, names: Optional[Iterable[str]] = None,
+              skip_dirs: Iterable[str] = (), under: Optional[str] = None,
+              where: Optional[Callable[[FileEntry], bool]] = None) -> List[FileEntry]:
+        """
+        Entries matching every given filter, in path order. `exts` and
+        `names` are alternatives (a file matches if either does);
+        `skip_dirs` drops files below any directory with one of those names.
+        """
+        exts = {e.lower() for e in exts} if exts is not None else None
+        names = set(names) if names is not None else None
+        skip = set(skip_dirs)
+        prefix = under.rstrip("/") + "/" if under else None
+        out = []
+        for e in self.entries:
+            if exts is not None or names is not None:
+                if not ((exts is not None and e.ext in exts) or (names is not None and e.name in names)):
+                    continue
+            if prefix and not e.rel.startswith(prefix):
+                continue
+            if skip and any(p in skip for p in e.parts[:-1]):
+                continue
+            if where and not where(e):
+                continue
+            out.append(e)
+        return out
+
+    # ── Contents ──
+
+    def read_text(self, entry: PathLike, errors: str = "ignore") -> str:
+        """
+        Decoded UTF-8 contents with universal newlines (as open(..., 'r')),
+        from the LRU cache when the file is unchanged since it was cached.
+        Raises OSError like open() would.
+        """
+        path = self.path(entry)
+        key = (str(path), errors)
+        st = os.stat(path)
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit and hit[0] == (st.st_mtime_ns, st.st_size):
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return hit[1]
+        with open(path, "r", encoding="utf-8", errors=errors) as f:
+            text = f.read()
+        size = len(text)
+        with self._lock:
+            self.misses += 1
+            if size <= self.cache_bytes // 4:      # one huge file must not flush the cache
+                old = self._cache.pop(key, None)
+                if old:
+                    self._cached_bytes -= len(old[1])
+                self._cache[key] = ((st.st_mtime_ns, st.st_size), text)
+                self._cached_bytes += size
+                while self._cached_bytes > self.cache_bytes:
+                    _, (_, evicted) = self._cache.popitem(last=False)
+                    self._cached_bytes -= len(evicted)
+        return text
+
+    def stats(self) -> Dict[str, object]:
+        kinds: Dict[str, int] = {}
+        for e in self.entries:
+            kinds[e.kind] = kinds.get(e.kind, 0) + 1
+        return {"root": str(self.root), "source": self.source, "files": len(self.entries),
+                "bytes": sum(e.size for e in self.entries), "by_kind": kinds,
+                "cache": {"hits": self.hits, "misses": self.misses, "bytes": self._cached_bytes}}
+
+
+# ─── Shared Access ────────────────────────────────────────────────────────────
+
+_inventories: Dict[tuple, FileInventory] = {}
+_inventories_lock = threading.Lock()
+
+
+def get_inventory(root: Union[str, Path], gitignore: bool = True) -> FileInventory:
+    """
+    The process-wide inventory for `root`: the orchestrator's snapshot
+    when $AGENT_FILE_INVENTORY points at one for this root, else a fresh
+    scan. Built once and reused by every caller in the process.
+    With `gitignore=False` ignored files are listed too; a git-based
+    snapshot cannot provide those, so that inventory is walked.
+    """
+    root = Path(root).resolve()
+    with _inventories_lock:
+        inv = _inventories.get((root, gitignore))
+        if inv is None:
+            snap = os.environ.get(SNAPSHOT_ENV)
+            inv = FileInventory.load(Path(snap)) if snap else None
+            if inv is None or inv.root != root or (not gitignore and inv.source != "walk"):
+                inv = FileInventory.scan(root, gitignore=gitignore)
+            _inventories[(root, gitignore)] = inv
+        return inv
+
+
+def read_text(path: Union[str, Path], errors: str = "ignore") -> str:
+    """
+    Contents of `path` through the cache of the loaded inventory that
+    contains it; a plain read when no inventory covers it.
+    """
+    path = Path(os.path.abspath(path))
+    for (root, _), inv in list(_inventories.items()):
+        if root in path.parents:
+            return inv.read_text(path, errors)
+    with open(path, "r", encoding="utf-8", errors=errors) as f:
+        return f.read()
+
+
+def export_inventory(root: Union[str, Path]) -> Dict[str, str]:
+    """
+    Scan `root` once and return an environment for child checker
+    processes whose get_inventory() then loads this scan instead of
+    walking. The snapshot file is removed when this process exits.
+    """
+    inv = get_inventory(root)
+    fd, name = tempfile.mkstemp(prefix="inventory-", suffix=".json")
+    os.close(fd)
+    atexit.register(lambda: os.path.exists(name) and os.unlink(name))
+    inv.save(Path(name))
+    return dict(os.environ, **{SNAPSHOT_ENV: name})
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Shared project file inventory")
+    parser.add_argument("path", nargs="?", default=".", help="Project root")
+    parser.add_argument("--json", action="store_true", help="Print every entry as JSON")
+    args = parser.parse_args()
+
+    inv = FileInventory.scan(args.path)
+    if args.json:
+        print(json.dumps({**inv.stats(), "entries": [asdict(e) for e in inv.entries]}, indent=2))
+    else:
+        s = inv.stats()
+        print(f"{s['root']} ({s['source']}): {s['files']} files, {s['bytes']} bytes")
+        for kind, n in sorted(s["by_kind"].items()):
+            print(f"  {kind:<8} {n}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
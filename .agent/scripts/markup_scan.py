@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Markup Scan — Antigravity Agent Framework
+=========================================
+
+Element-level view of HTML, JSX/TSX, Vue and Svelte sources for the
+design audits. Questions like "is there an <img> without alt?" were
+asked with patterns such as `<img(?![^>]*alt=)[^>]*>`, which rescan the
+rest of the line from every candidate (quadratic on minified bundles
+and long JSX lines) and happily match across element boundaries.
+
+`iter_tags(text)` is a single forward pass that yields one `Tag` event
+per start/end tag, with its attributes already split out: quoted
+values, unquoted values, JSX `{expressions}` (nested braces and strings
+included) and Vue/Svelte directive names (`:alt`, `@click`, `on:click`)
+are all understood. Comments are skipped and `<script>`/`<style>`
+bodies are treated as raw text. Each tag's lookahead is capped at
+MAX_TAG_LENGTH characters, so a stray `<` or unterminated quote costs a
+bounded amount of work instead of a rescan of the file, and brace
+matching is shared between tags, so a run of unterminated `{` is not
+rescanned from every `<` in front of it either.
+
+`Markup(text)` builds on those events: an element list in document
+order with parent links (unknown end tags are ignored, missing ones are
+closed implicitly), so audits can ask element-scoped questions:
+
+    markup = Markup(content)
+    [img for img in markup.find("img") if not img.has("alt")]
+    max(len(markup.descendants(form, "input")) for form in markup.find("form"))
+
+There is no JavaScript parser behind this: a TypeScript generic such as
+`useState<string>(...)` reads as an element that is never closed. Such
+phantom elements only ever add a level of nesting; they do not match
+the names audits ask about.
+
+Tag and attribute names are matched case-insensitively, as in HTML;
+`Element.name` keeps the spelling from the source for callers that
+need to tell a `<Text>` component from a `<text>` SVG element.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Longest tag (from "<" to ">") the tokenizer will look at; inline style
+# objects and long class lists fit comfortably
+MAX_TAG_LENGTH = 8192
+
+# HTML elements that never have content (only when written in lower case:
+# <Link> or <Input> in JSX are components with children)
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+                 "param", "source", "track", "wbr"}
+
+RAW_TEXT_ELEMENTS = {"script", "style"}
+
+_TAG_START = re.compile(r"<(/?)([A-Za-z][\w.:-]*)|<!--")
+_ATTR_NAME = re.compile(r"\s*([^\s=/>{}\"'<]+)")
+_EQUALS = re.compile(r"\s*=\s*")
+_UNQUOTED = re.compile(r"[^\s>\"'{}<]+")
+_TAG_END = re.compile(r"\s*(/?)>")
+_SPACE = re.compile(r"\s*")
+_BRACE_TOKEN = re.compile(r"[{}\"'`]")
+_STRINGS = {q: re.compile(rf"{q}(?:[^{q}\\]|\\.)*{q}", re.DOTALL) for q in "\"'`"}
+_RAW_TEXT_END = {name: re.compile(rf"</{name}\s*>", re.IGNORECASE) for name in RAW_TEXT_ELEMENTS}
+
+
+# ─── Tokenizer ────────────────────────────────────────────────────────────────
+
+@dataclass
+class Tag:
+    name: str
+    attrs: Dict[str, Optional[str]]   # lower-cased names; None for bare attributes
+    start: int                        # offset of "<"
+    end: int                          # offset just past ">"
+    closing: bool = False             # </name>
+    self_closing: bool = False        # <name ... />
+
+
+class _Scan:
+    """State of one brace-matching scan: its unmatched `{` offsets and where it stopped."""
+
+    def __init__(self, pos: int):
+        self.open = [pos]
+        self.pos = pos + 1
+
+
+class _Braces:
+    """
+    Brace matching for one text. Every `{` reached while looking for the
+    match of another is remembered with the scan that reached it, so when
+    a later tag asks about it that scan resumes where it stopped instead
+    of starting over: a run of unterminated `{` (`<b {` repeated,
+    minified code) is tokenized once rather than once per candidate tag.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.closes: Dict[int, int] = {}   # "{" offset -> offset just past its "}"
+        self.scans: Dict[int, _Scan] = {}  # unmatched "{" offset -> the scan that reached it
+
+    def skip(self, pos: int, endpos: int) -> int:
+        """Offset just past the `}` matching the `{` at `pos`, or -1 before `endpos`."""
+        close = self.closes.get(pos)
+        if close is not None:
+            return close if close <= endpos else -1
+        scan = self.scans.get(pos)
+        if scan is None:
+            scan = self.scans[pos] = _Scan(pos)
+        text, at = self.text, scan.pos
+        while True:
+            m = _BRACE_TOKEN.search(text, at, endpos)
+            if m is None:
+                scan.pos = max(at, endpos)
+                return -1
+            c = m.group()
+            if c == "{":
+                scan.open.append(m.start())
+                self.scans[m.start()] = scan
+                at = m.end()
+            elif c == "}":
+                start = scan.open.pop()
+                self.scans.pop(start, None)
+                self.closes[start] = at = m.end()
+                if start == pos:
+                    scan.pos = at
+                    return at
+            else:
+                s = _STRINGS[c].match(text, m.start(), endpos)
+                if s is None:                          # retried with the next caller's endpos
+                    scan.pos = m.start()
+                    return -1
+                at = s.end()
+
+
+def _read_tag(text: str, pos: int, endpos: int, braces: _Braces) -> Optional[Tuple[Dict[str, Optional[str]], int, bool]]:
+    """Attributes, end offset and self-closing flag of a start tag whose name ends at `pos`."""
+    attrs: Dict[str, Optional[str]] = {}
+    while True:
+        m = _TAG_END.match(text, pos, endpos)
+        if m:
+            return attrs, m.end(), bool(m.group(1))
+        pos = _SPACE.match(text, pos, endpos).end()
+        if pos < endpos and text[pos] == "{":            # JSX spread: {...props}
+            pos = braces.skip(pos, endpos)
+            if pos < 0:
+                return None
+            continue
+        m = _ATTR_NAME.match(text, pos, endpos)
+        if m is None:
+            return None
+        name = m.group(1).lower()
+        pos = m.end()
+        eq = _EQUALS.match(text, pos, endpos)
+        if eq is None:
+            attrs.setdefault(name, None)
+            continue
+        pos = eq.end()
+        c = text[pos:pos + 1]
+        if c in ("\"", "'"):
+            close = text.find(c, pos + 1, endpos)
+            if close < 0:
+                return None
+            value, pos = text[pos + 1:close], close + 1
+        elif c == "{":
+            close = braces.skip(pos, endpos)
+            if close < 0:
+                return None
+            value, pos = text[pos:close], close
+        else:
+            v = _UNQUOTED.match(text, pos, endpos)
+            if v is None:
+                return None
+            value, pos = v.group(), v.end()
+        attrs.setdefault(name, value)
+
+
+def iter_tags(text: str) -> Iterator[Tag]:
+    """Start and end tags of `text` in order; see the module docstring."""
+    pos, size = 0, len(text)
+    braces = _Braces(text)
+    while True:
+        m = _TAG_START.search(text, pos)
+        if m is None:
+            return
+        if m.group() == "<!--":
+            close = text.find("-->", m.end())
+            if close < 0:
+                return
+            pos = close + 3
+            continue
+
+        name = m.group(2)
+        endpos = min(size, m.start() + MAX_TAG_LENGTH)
+        if m.group(1):
+            end = _TAG_END.match(text, m.end(), endpos)
+            if end is None:
+                pos = m.end()
+                continue
+            yield Tag(name, {}, m.start(), end.end(), closing=True)
+            pos = end.end()
+            continue
+
+        parsed = _read_tag(text, m.end(), endpos, braces)
+        if parsed is None:                              # unterminated, or not markup after all
+            pos = m.end()
+            continue
+        attrs, end, self_closing = parsed
+        yield Tag(name, attrs, m.start(), end, self_closing=self_closing)
+        pos = end
+
+        lower = name.lower()
+        if lower in RAW_TEXT_ELEMENTS and not self_closing:
+            close = _RAW_TEXT_END[lower].search(text, pos)
+            if close is None:
+                return
+            yield Tag(name, {}, close.start(), close.end(), closing=True)
+            pos = close.end()
+
+
+# ─── Elements ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class Element:
+    name: str
+    attrs: Dict[str, Optional[str]]
+    start: int
+    end: int                            # end of the start tag
+    index: int = 0                      # position in Markup.elements
+    parent: Optional[int] = None        # index of the enclosing element
+    children: int = 0                   # direct child elements
+    close: Optional[int] = None         # offset of the end tag (start tag end if void/self-closing)
+    last: int = 0                       # index of the last descendant (itself if none)
+
+    def has(self, attr: str) -> bool:
+        """True if `attr` is set, bound (Vue `:attr`, `v-bind:attr`) or not."""
+        return attr in self.attrs or f":{attr}" in self.attrs or f"v-bind:{attr}" in self.attrs
+
+    def get(self, attr: str) -> Optional[str]:
+        for key in (attr, f":{attr}", f"v-bind:{attr}"):
+            if self.attrs.get(key) is not None:
+                return self.attrs[key]
+        return None
+
+
+class Markup:
+    """Elements of one source file, built from `iter_tags` in one pass."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.elements: List[Element] = []
+        self._by_name: Dict[str, List[Element]] = {}
+        open_: List[Element] = []
+        open_names: Dict[str, int] = {}
+
+        for tag in iter_tags(text):
+            lower = tag.name.lower()
+            if tag.closing:
+                if not open_names.get(lower):
+                    continue                            # stray end tag
+                depth = len(open_) - 1
+                while open_[depth].name.lower() != lower:
+                    depth -= 1
+                for el in open_[depth:]:
+                    el.close = tag.start
+                    open_names[el.name.lower()] -= 1
+                del open_[depth:]
+                continue
+
+            el = Element(tag.name, tag.attrs, tag.start, tag.end, index=len(self.elements))
+            if open_:
+                el.parent = open_[-1].index
+                open_[-1].children += 1
+            self.elements.append(el)
+            self._by_name.setdefault(lower, []).append(el)
+            if tag.self_closing or lower in VOID_ELEMENTS and (tag.name.islower() or tag.name.isupper()):
+                el.close = tag.end
+            else:
+                open_.append(el)
+                open_names[lower] = open_names.get(lower, 0) + 1
+
+        # Descendants of an element are the ones after it up to `last`
+        for el in reversed(self.elements):
+            el.last = max(el.last, el.index)
+            if el.parent is not None:
+                parent = self.elements[el.parent]
+                parent.last = max(parent.last, el.last)
+
+    def find(self, *names: str) -> List[Element]:
+        """Elements with any of `names`, in document order."""
+        if len(names) == 1:
+            return self._by_name.get(names[0].lower(), [])
+        wanted = {n.lower() for n in names}
+        return [el for el in self.elements if el.name.lower() in wanted]
+
+    def count(self, *names: str) -> int:
+        return sum(len(self._by_name.get(n.lower(), ())) for n in set(map(str.lower, names)))
+
+    def descendants(self, element: Element, *names: str) -> List[Element]:
+        """Elements nested in `element`, optionally only those with `names`."""
+        inner = self.elements[element.index + 1:element.last + 1]
+        if not names:
+            return inner
+        wanted = {n.lower() for n in names}
+        return [el for el in inner if el.name.lower() in wanted]
+
+    def inside(self, element: Element, *names: str) -> bool:
+        """True if `element` is nested in an element with any of `names`."""
+        wanted = {n.lower() for n in names}
+        parent = element.parent
+        while parent is not None:
+            if self.elements[parent].name.lower() in wanted:
+                return True
+            parent = self.elements[parent].parent
+        return False
+
+    def content(self, element: Element) -> Optional[str]:
+        """Source between the start and end tag; None if the end tag is missing."""
+        if element.close is None:
+            return None
+        return self.text[element.end:element.close]
+
+    def leading_text(self, element: Element) -> str:
+        """Text after the start tag up to the first nested tag or the end tag."""
+        stop = element.close if element.close is not None else len(self.text)
+        if element.children:
+            stop = min(stop, self.elements[element.index + 1].start)
+        return self.text[element.end:stop]
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Pattern Scan — Antigravity Agent Framework
+==========================================
+
+Answer a table of named regex questions about one text. The design
+audits ask every file a hundred small questions ("how many <input>s?",
+"is there a prefers-reduced-motion?"), and asking each with its own
+`re.search`/`re.findall` recompiles nothing but rescans the file for
+every call, including the same pattern asked by several rules.
+
+A `PatternSet` compiles the table once at import, merging identical
+patterns. `scan(text)` returns a lazy `Scan`: each pattern runs at most
+once per text and only if a rule asks about it, presence questions stop
+at the first match, and patterns that are plain literal alternations
+(`"footer|<footer"`, case-insensitive or not) are answered with
+substring search on the text, lower-cased once per scan, instead of the
+regex engine. Results are identical to calling `re` directly:
+
+    PATTERNS = PatternSet({
+        "input":  (r"<input|<select|<textarea", re.IGNORECASE),
+        "motion": r"prefers-reduced-motion",
+        "shadow": r"box-shadow:\\s*([^;]+)",
+    })
+    scan = PATTERNS.scan(content)
+    scan.count("input"), scan.has("motion"), scan.findall("shadow")
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+PatternSpec = Union[str, Tuple[str, int]]
+
+_SPECIAL = set(".^$*+?{}[]()|\\")
+
+# Characters whose str.lower() differs from what re.IGNORECASE matches
+# for an ASCII letter (İ lowers to two characters, ı and ſ not at all)
+_FOLD_FIXES = str.maketrans({"İ": "i", "ı": "i", "ſ": "s"})
+
+
+def _literal_branches(regex: str) -> Optional[Tuple[str, ...]]:
+    """The alternatives of `regex` if it is `lit|lit|...` of plain literals, else None."""
+    branches, current, i = [], [], 0
+    while i < len(regex):
+        c = regex[i]
+        if c == "\\":
+            nxt = regex[i + 1:i + 2]
+            if not nxt or nxt.isalnum():
+                return None                       # \d, \s, \b, back-references ...
+            current.append(nxt)
+            i += 2
+            continue
+        if c == "|":
+            branches.append("".join(current))
+            current = []
+        elif c in _SPECIAL:
+            return None
+        else:
+            current.append(c)
+        i += 1
+    branches.append("".join(current))
+    return tuple(branches) if all(branches) else None
+
+
+def fold(text: str) -> str:
+    """
+    `text` lower-cased so ASCII substring tests agree with re.IGNORECASE.
+    Length is preserved, so offsets into the result are offsets into `text`
+    (the security scanner's literal prefilter relies on that).
+    """
+    return text.lower() if text.isascii() else text.translate(_FOLD_FIXES).lower()
+
+
+# ─── Pattern Set ──────────────────────────────────────────────────────────────
+
+class PatternSet:
+    """Named regexes compiled once and shared by every `scan()`."""
+
+    def __init__(self, patterns: Mapping[str, PatternSpec]):
+        self._index: Dict[str, int] = {}
+        atoms: Dict[Tuple[str, int], int] = {}
+        for name, spec in patterns.items():
+            regex, flags = (spec, 0) if isinstance(spec, str) else spec
+            self._index[name] = atoms.setdefault((regex, flags), len(atoms))
+        self.names = tuple(self._index)
+
+        self._compiled: List[re.Pattern] = []
+        self._literals: List[Optional[Tuple[str, ...]]] = []
+        self._folded: List[bool] = []
+        for regex, flags in atoms:
+            self._compiled.append(re.compile(regex, flags))
+            literals = _literal_branches(regex)
+            folded = bool(flags & re.IGNORECASE)
+            if literals and folded:
+                literals = tuple(lit.lower() for lit in literals) if all(map(str.isascii, literals)) else None
+            self._literals.append(literals)
+            self._folded.append(folded)
+
+    def __len__(self) -> int:
+        """Number of distinct patterns after merging duplicates."""
+        return len(self._compiled)
+
+    def scan(self, text: str) -> "Scan":
+        return Scan(self, text)
+
+
+# ─── Scan ─────────────────────────────────────────────────────────────────────
+
+class Scan:
+    """Lazy, cached answers about one text; see `PatternSet`."""
+
+    def __init__(self, patterns: PatternSet, text: str):
+        self._patterns = patterns
+        self.text = text
+        self._lower: Optional[str] = None
+        self._has: Dict[int, bool] = {}
+        self._count: Dict[int, int] = {}
+        self._found: Dict[int, list] = {}
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = fold(self.text)
+        return self._lower
+
+    def _haystack(self, atom: int) -> str:
+        return self.lower if self._patterns._folded[atom] else self.text
+
+    def has(self, name: str) -> bool:
+        """Same as `bool(re.search(pattern, text))`."""
+        atom = self._patterns._index[name]
+        if atom not in self._has:
+            if atom in self._count:
+                self._has[atom] = self._count[atom] > 0
+            else:
+                literals = self._patterns._literals[atom]
+                if literals is not None:
+                    hay = self._haystack(atom)
+                    self._has[atom] = any(lit in hay for lit in literals)
+                else:
+                    self._has[atom] = self._patterns._compiled[atom].search(self.text) is not None
+        return self._has[atom]
+
+    def count(self, name: str) -> int:
+        """Same as `len(re.findall(pattern, text))`."""
+        atom = self._patterns._index[name]
+        if atom not in self._count:
+            literals = self._patterns._literals[atom]
+            if atom in self._found:
+                n = len(self._found[atom])
+            elif self._has.get(atom) is False:
+                n = 0
+            elif literals is not None and len(literals) == 1:
+                n = self._haystack(atom).count(literals[0])
+            else:
+                n = sum(1 for _ in self._patterns._compiled[atom].finditer(self.text))
+            self._count[atom] = n
+        return self._count[atom]
+
+    def findall(self, name: str) -> list:
+        """Same as `re.findall(pattern, text)`."""
+        atom = self._patterns._index[name]
+        if atom not in self._found:
+            self._found[atom] = [] if self._has.get(atom) is False else \
+                self._patterns._compiled[atom].findall(self.text)
+        return self._found[atom]
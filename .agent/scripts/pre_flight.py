@@ -4,13 +4,19 @@ Pre-Flight Validation Gate — Antigravity Agent Framework
 =========================================================
 
 Lightweight environment health check before any code modification.
-Runs 4 gates in sequence: Git → Build → Tests → Dependencies.
+Runs 4 gates: Git, Build, Tests, Dependencies. Gates declare their
+prerequisites (Tests needs Build and Deps) and independent gates run
+concurrently; a failed prerequisite cancels its dependents.
+Green build/tests/deps results are cached by content fingerprint, so an
+unchanged repo re-passes without re-running them.
 
 Usage:
     python .agent/scripts/pre_flight.py                   # All gates
     python .agent/scripts/pre_flight.py --gate git        # Single gate
     python .agent/scripts/pre_flight.py --json            # Machine-readable JSON
     python .agent/scripts/pre_flight.py --strict          # Fail on warnings too
+    python .agent/scripts/pre_flight.py --jobs 1          # Sequential execution
+    python .agent/scripts/pre_flight.py --no-cache        # Ignore cached gate results
 
 Exit codes:
     0  All gates passed (or skipped). Environment is CLEAN. Proceed.
@@ -22,17 +28,20 @@ Author: Antigravity Self-Enhancement v3
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import platform
 import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Callable, Literal, Optional
 
 
 # ─── ANSI Colors ──────────────────────────────────────────────────────────────
@@ -70,6 +79,11 @@ class GateResult:
     detail: str = ""
     duration_s: float = 0.0
     recovery: Optional[str] = None   # "opencode" | "install" | "commit" | None
+    depends_on: list[str] = field(default_factory=list)
+    started_s: float = 0.0           # offset from run start
+    finished_s: float = 0.0
+    cancelled_by: Optional[str] = None   # failed prerequisite, if cancelled
+    cache: str = "off"               # "hit" | "miss" | "off"
 
     @property
     def ok(self) -> bool:
@@ -100,7 +114,27 @@ class PreFlightReport:
     def exit_code(self) -> int:
         return 0 if self.passed else 1
 
+    def critical_path(self) -> tuple[list[str], float]:
+        """Longest chain of gate durations through the dependency graph."""
+        by_name = {g.gate: g for g in self.gates}
+        memo: dict[str, tuple[list[str], float]] = {}
+
+        def chain(name: str) -> tuple[list[str], float]:
+            if name not in memo:
+                best: tuple[list[str], float] = ([], 0.0)
+                for dep in by_name[name].depends_on:
+                    if dep in by_name:
+                        c = chain(dep)
+                        if c[1] > best[1]:
+                            best = c
+                memo[name] = (best[0] + [name], best[1] + by_name[name].duration_s)
+            return memo[name]
+
+        paths = [chain(n) for n in by_name]
+        return max(paths, key=lambda p: p[1]) if paths else ([], 0.0)
+
     def to_dict(self) -> dict:
+        path, path_s = self.critical_path()
         return {
             "passed": self.passed,
             "project_path": self.project_path,
@@ -110,6 +144,8 @@ class PreFlightReport:
             "gates": [asdict(g) for g in self.gates],
             "failed_gates": [g.gate for g in self.gates if not g.ok and g.status == "FAIL"],
             "recovery_actions": {g.gate: g.recovery for g in self.gates if g.recovery},
+            "critical_path": {"gates": path, "duration_s": round(path_s, 2)},
+            "cache": {g.gate: g.cache for g in self.gates},
         }
 
 
@@ -147,12 +183,8 @@ class ProjectDetector:
             except Exception:
                 pass
             return None  # No build script
-        if self.detect() == "python":
-            py_files = list(self.root.rglob("*.py"))
-            if py_files:
-                return [sys.executable, "-m", "py_compile"] + [str(f) for f in py_files[:50]]
-            return None
-        return None  # Generic → no build
+        # Python is byte-compiled in-process by gate_py_compile (no subprocess)
+        return None  # Python / Generic → no build command
 
     def test_command(self) -> Optional[list[str]]:
         """Returns the fast unit test command, or None if not applicable."""
@@ -236,6 +268,9 @@ def gate_git(root: Path, strict: bool = False) -> GateResult:
 
 def gate_build(root: Path, detector: ProjectDetector) -> GateResult:
     """Gate B: Build / compile validation."""
+    if detector.detect() == "python":
+        return gate_py_compile(root)
+
     t0 = time.monotonic()
     cmd = detector.build_command()
 
@@ -261,6 +296,117 @@ def gate_build(root: Path, detector: ProjectDetector) -> GateResult:
     )
 
 
+# Directories never descended into when collecting Python sources
+PY_SKIP_DIRS = frozenset({
+    ".git", ".hg", ".svn", "node_modules", ".venv", "venv", "env", "__pycache__",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache", "build", "dist",
+    "site-packages", ".eggs",
+})
+PY_COMPILE_CACHE = Path(".agent/.cache/py_compile.json")
+PY_COMPILE_POOL_MIN = 200   # below this many changed files, compile inline
+
+
+def _iter_py_files(root: Path):
+    """Yield project .py files, pruning ignored directories during the walk."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames
+                       if d not in PY_SKIP_DIRS and not d.endswith(".egg-info")]
+        for name in filenames:
+            if name.endswith(".py"):
+                yield Path(dirpath) / name
+
+
+def _compile_batch(paths: list[str]) -> list[tuple[str, Optional[str]]]:
+    """Compile sources without writing .pyc. Returns (path, error | None)."""
+    out = []
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                source = f.read()
+            # dont_inherit: this module's `from __future__` flags must not leak
+            compile(source, path, "exec", dont_inherit=True)
+            out.append((path, None))
+        except SyntaxError as e:
+            out.append((path, f"line {e.lineno}: {e.msg}"))
+        except (ValueError, OSError) as e:
+            out.append((path, str(e)))
+        except (RecursionError, MemoryError) as e:
+            # Deeply nested code exhausts the compiler; the import would fail too
+            out.append((path, f"{type(e).__name__} while compiling" + (f": {e}" if str(e) else "")))
+    return out
+
+
+def gate_py_compile(root: Path, jobs: Optional[int] = None) -> GateResult:
+    """
+    Gate B (Python): byte-compile every project source file.
+
+    Results are cached per file by (mtime, size) for the running
+    interpreter version, so only changed files are recompiled; large change
+    sets are spread over a process pool. Every syntax error found is
+    reported, not just the first.
+    """
+    t0 = time.monotonic()
+    cache_path = root / PY_COMPILE_CACHE
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        # Another interpreter accepts a different grammar: start over
+        cache: dict[str, list] = data["files"] if data.get("python") == sys.version else {}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        cache = {}
+
+    entries: dict[str, list] = {}
+    todo: list[str] = []
+    for path in _iter_py_files(root):
+        rel = path.relative_to(root).as_posix()
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        hit = cache.get(rel)
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            entries[rel] = hit
+        else:
+            entries[rel] = [st.st_mtime_ns, st.st_size, None]
+            todo.append(str(path))
+
+    if not entries:
+        return GateResult("build", "SKIP", "No Python files found", duration_s=time.monotonic() - t0)
+
+    jobs = jobs or os.cpu_count() or 1
+    if len(todo) >= PY_COMPILE_POOL_MIN and jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        size = max(16, len(todo) // (jobs * 4))
+        batches = [todo[i:i + size] for i in range(0, len(todo), size)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            compiled = [r for batch in pool.map(_compile_batch, batches) for r in batch]
+    else:
+        compiled = _compile_batch(todo)
+
+    for path, error in compiled:
+        entries[Path(path).relative_to(root).as_posix()][2] = error
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"python": sys.version, "files": entries}), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+
+    dur = time.monotonic() - t0
+    errors = sorted(f"{rel}: {e[2]}" for rel, e in entries.items() if e[2])
+    counts = f"{len(entries)} file(s), {len(todo)} recompiled"
+    if not errors:
+        return GateResult("build", "PASS", f"Python sources compile ({counts})", duration_s=dur)
+    return GateResult(
+        "build", "FAIL",
+        f"{len(errors)} syntax error(s) ({counts})",
+        detail="\n".join(errors),
+        duration_s=dur,
+        recovery="opencode",
+    )
+
+
 def gate_tests(root: Path, detector: ProjectDetector) -> GateResult:
     """Gate C: Fast unit test check (no E2E, 60s timeout)."""
     t0 = time.monotonic()
@@ -335,6 +481,208 @@ def gate_deps(root: Path, detector: ProjectDetector) -> GateResult:
                       duration_s=time.monotonic() - t0)
 
 
+# ─── Result Cache ─────────────────────────────────────────────────────────────
+
+LOCKFILES = (
+    "package.json", "package-lock.json", "pnpm-lock.yaml", "yarn.lock",
+    "requirements.txt", "pyproject.toml", "poetry.lock", "Pipfile.lock", "Cargo.lock",
+)
+
+
+class GateCache:
+    """
+    Green gate results keyed by the inputs that can change them.
+
+    The fingerprint covers the tree hash of tracked files (including
+    uncommitted edits), untracked file stats, lockfile hashes, the
+    Python/Node versions, the interpreter path and the state of its
+    site-packages. Only PASS results are stored, and the git gate
+    is never cached — it *is* the tree check and costs milliseconds.
+    """
+
+    CACHE_FILE = Path(".agent/.cache/pre_flight.json")
+    VERSION = 1
+    CACHEABLE = ("build", "tests", "deps")
+    SNAPSHOT_ATTEMPTS = 3
+
+    def __init__(self, root: Path, detector: ProjectDetector, enabled: bool = True):
+        self.root = root
+        self.detector = detector
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._fp: Optional[dict] = None
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        if enabled:
+            try:
+                data = json.loads((root / self.CACHE_FILE).read_text(encoding="utf-8"))
+                if data.get("version") == self.VERSION:
+                    self._entries = data.get("gates", {})
+            except (OSError, ValueError):
+                pass
+
+    # ── Fingerprint ──────────────────────────────────────
+    def _tree_hash(self) -> str:
+        # `git stash create` snapshots index + worktree without touching them;
+        # it prints nothing on a clean tree, where HEAD's tree is current. It
+        # fails while another git process holds index.lock: retry, and if it
+        # keeps failing return "" (no caching) rather than HEAD's tree, which
+        # would hand a dirty tree the key of its last commit.
+        for attempt in range(self.SNAPSHOT_ATTEMPTS):
+            rc, stash, _ = _run(["git", "stash", "create"], self.root, timeout=30)
+            if rc == 0:
+                break
+            time.sleep(0.05 * (attempt + 1))
+        else:
+            return ""
+        rev = stash.strip() or "HEAD"
+        rc, out, _ = _run(["git", "rev-parse", f"{rev}^{{tree}}"], self.root, timeout=5)
+        if rc != 0:
+            return ""
+        h = hashlib.sha256(out.strip().encode())
+        # Untracked (but not ignored) files can feed the build too; our own
+        # artifacts are excluded or every run would invalidate the cache.
+        rc, out, _ = _run(
+            ["git", "ls-files", "--others", "--exclude-standard", "-z", "--",
+             f":(exclude){self.CACHE_FILE.parent.as_posix()}",
+             f":(exclude){PreFlightRunner.OUTPUT_FILE.as_posix()}"],
+            self.root, timeout=30,
+        )
+        for rel in sorted(p for p in out.split("\0") if p):
+            try:
+                st = (self.root / rel).stat()
+                h.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\0".encode())
+            except OSError:
+                continue
+        return h.hexdigest()
+
+    def _lock_hashes(self) -> dict[str, str]:
+        hashes = {}
+        for name in LOCKFILES:
+            p = self.root / name
+            if p.is_file():
+                hashes[name] = hashlib.sha256(p.read_bytes()).hexdigest()
+        return hashes
+
+    def _install_marker(self) -> str:
+        """Something that changes when dependencies are (re)installed."""
+        for p in (self.root / "node_modules" / ".package-lock.json", self.root / "node_modules"):
+            if p.exists():
+                return str(p.stat().st_mtime_ns)
+        return ""
+
+    @staticmethod
+    def _site_marker() -> str:
+        """site-packages mtimes: a pip install/uninstall adds or removes entries there."""
+        import site
+        import sysconfig
+        dirs = {sysconfig.get_paths()[k] for k in ("purelib", "platlib")}
+        dirs.update(getattr(site, "getsitepackages", lambda: [])())
+        if site.ENABLE_USER_SITE:
+            dirs.add(site.getusersitepackages())
+        marks = []
+        for d in sorted(dirs):
+            try:
+                marks.append(f"{d}\0{os.stat(d).st_mtime_ns}")
+            except OSError:
+                continue
+        return "\0".join(marks)
+
+    def fingerprint(self) -> dict:
+        """Compute the input fingerprint once per run."""
+        with self._lock:
+            if self._fp is None:
+                node = ""
+                if self.detector.detect() == "node":
+                    rc, out, _ = _run(["node", "--version"], self.root, timeout=10)
+                    node = out.strip() if rc == 0 else ""
+                self._fp = {
+                    "tree": self._tree_hash(),
+                    "locks": self._lock_hashes(),
+                    "python": sys.version,
+                    "executable": sys.executable,
+                    "site": self._site_marker(),
+                    "node": node,
+                    "install": self._install_marker(),
+                }
+            return self._fp
+
+    def key(self, gate: str) -> Optional[str]:
+        fp = self.fingerprint()
+        if gate in ("build", "tests"):
+            if not fp["tree"]:
+                return None   # no git → no trustworthy content hash
+            keys = ("tree", "locks", "python", "executable", "node")
+            parts = {k: fp[k] for k in keys + (("site",) if gate == "tests" else ())}
+        else:  # deps: independent of source edits
+            parts = {k: fp[k] for k in ("locks", "python", "executable", "site", "node", "install")}
+        blob = json.dumps({"gate": gate, **parts}, sort_keys=True)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    # ── Lookup / store ───────────────────────────────────
+    def get(self, gate: str) -> Optional[GateResult]:
+        if not self.enabled or gate not in self.CACHEABLE:
+            return None
+        t0 = time.monotonic()
+        key = self.key(gate)
+        entry = self._entries.get(gate)
+        if key is None or not entry or entry.get("key") != key:
+            return None
+        r = entry["result"]
+        return GateResult(gate, r["status"], r["message"], detail=r.get("detail", ""),
+                          duration_s=time.monotonic() - t0, cache="hit")
+
+    def put(self, result: GateResult) -> None:
+        if not self.enabled or result.gate not in self.CACHEABLE:
+            return
+        result.cache = "miss"
+        if result.status != "PASS":
+            return
+        key = self.key(result.gate)
+        if key is None:
+            return
+        with self._lock:
+            self._entries[result.gate] = {
+                "key": key,
+                "stored": datetime.now().isoformat(),
+                "result": {"status": result.status, "message": result.message, "detail": result.detail},
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            path = self.root / self.CACHE_FILE
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": self.VERSION, "gates": self._entries}, indent=2),
+                           encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"  {C.YELLOW}⚠️  Could not write gate cache: {e}{C.RESET}")
+
+
+# ─── Gate Graph ───────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class GateSpec:
+    name: str
+    depends_on: tuple[str, ...] = ()
+
+
+# Declaration order is the report order. Tests need a successful build and
+# installed dependencies; git, build and deps are independent.
+GATES: tuple[GateSpec, ...] = (
+    GateSpec("git"),
+    GateSpec("build"),
+    GateSpec("tests", depends_on=("build", "deps")),
+    GateSpec("deps"),
+)
+
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+
+
 # ─── Runner ───────────────────────────────────────────────────────────────────
 
 class PreFlightRunner:
@@ -343,11 +691,14 @@ class PreFlightRunner:
     MEMORY_DIR = Path(".agent/memory")
     OUTPUT_FILE = MEMORY_DIR / "last_preflight.json"
 
-    def __init__(self, root: Path, strict: bool = False, gate_filter: Optional[str] = None):
+    def __init__(self, root: Path, strict: bool = False, gate_filter: Optional[str] = None,
+                 jobs: int = DEFAULT_JOBS, use_cache: bool = True):
         self.root = root
         self.strict = strict
         self.gate_filter = gate_filter
+        self.jobs = max(1, jobs)
         self.detector = ProjectDetector(root)
+        self.cache = GateCache(root, self.detector, enabled=use_cache)
 
     def run(self) -> PreFlightReport:
         ptype = self.detector.detect()
@@ -360,7 +711,9 @@ class PreFlightRunner:
         _header(f"🛡️  PRE-FLIGHT VALIDATION — {self.root.name}")
         print(f"{C.DIM}  Project type : {ptype}{C.RESET}")
         print(f"{C.DIM}  Strict mode  : {'ON' if self.strict else 'OFF'}{C.RESET}")
-        print(f"{C.DIM}  Gate filter  : {self.gate_filter or 'all'}{C.RESET}\n")
+        print(f"{C.DIM}  Gate filter  : {self.gate_filter or 'all'}{C.RESET}")
+        print(f"{C.DIM}  Parallelism  : {self.jobs}{C.RESET}")
+        print(f"{C.DIM}  Result cache : {'ON' if self.cache.enabled else 'OFF'}{C.RESET}\n")
 
         t_start = time.monotonic()
 
@@ -371,12 +724,10 @@ class PreFlightRunner:
             "deps":  lambda: gate_deps(self.root, self.detector),
         }
 
-        for name, fn in gate_map.items():
-            if self.gate_filter and self.gate_filter != name:
-                continue
-            result = fn()
-            report.gates.append(result)
-            self._print_gate(result)
+        specs = [g for g in GATES if not self.gate_filter or g.name == self.gate_filter]
+        results = self._execute(specs, gate_map, t_start)
+        report.gates = [results[g.name] for g in specs]
+        self.cache.save()
 
         report.total_duration_s = time.monotonic() - t_start
 
@@ -385,9 +736,81 @@ class PreFlightRunner:
 
         return report
 
+    def _execute(
+        self,
+        specs: list[GateSpec],
+        gate_map: dict[str, Callable[[], GateResult]],
+        t_start: float,
+    ) -> dict[str, GateResult]:
+        """
+        Run gates on a bounded thread pool as soon as their prerequisites
+        pass. Gates whose prerequisite failed (or was itself cancelled) are
+        never started and are recorded as cancelled SKIPs.
+        """
+        if self.cache.enabled:
+            # Snapshot the inputs before any gate runs: the git gate's own
+            # git commands would otherwise race `git stash create` for the index.
+            self.cache.fingerprint()
+        selected = {g.name for g in specs}
+        pending = {g.name: g for g in specs}
+        results: dict[str, GateResult] = {}
+        running: dict[Future, str] = {}
+
+        def blocked_by(spec: GateSpec) -> Optional[str]:
+            for dep in spec.depends_on:
+                r = results.get(dep)
+                if r is not None and (not r.ok or r.cancelled_by):
+                    return dep
+            return None
+
+        def timed(spec: GateSpec) -> GateResult:
+            started = time.monotonic() - t_start
+            result = self.cache.get(spec.name)
+            if result is None:
+                result = gate_map[spec.name]()
+                self.cache.put(result)
+            result.depends_on = list(spec.depends_on)
+            result.started_s = round(started, 3)
+            result.finished_s = round(time.monotonic() - t_start, 3)
+            return result
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                # Cancel dependents of failed gates (repeat for transitive chains)
+                changed = True
+                while changed:
+                    changed = False
+                    for name, spec in list(pending.items()):
+                        dep = blocked_by(spec)
+                        if dep:
+                            now = round(time.monotonic() - t_start, 3)
+                            r = GateResult(name, "SKIP", f"Cancelled — prerequisite '{dep}' did not pass",
+                                           depends_on=list(spec.depends_on), started_s=now,
+                                           finished_s=now, cancelled_by=dep)
+                            results[name] = r
+                            del pending[name]
+                            self._print_gate(r)
+                            changed = True
+
+                # Submit every gate whose selected prerequisites are done
+                for name, spec in list(pending.items()):
+                    if all(d in results or d not in selected for d in spec.depends_on):
+                        running[pool.submit(timed, spec)] = name
+                        del pending[name]
+
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name = running.pop(fut)
+                    results[name] = fut.result()
+                    self._print_gate(results[name])
+
+        return results
+
     def _print_gate(self, r: GateResult) -> None:
         status_str = f"{r.color}{C.BOLD}{r.status}{C.RESET}"
-        dur_str = f"{C.DIM}({r.duration_s:.1f}s){C.RESET}"
+        dur_str = f"{C.DIM}({r.duration_s:.1f}s{', cached' if r.cache == 'hit' else ''}){C.RESET}"
         print(f"  {r.icon} Gate [{r.gate.upper():5s}]  {status_str}  {r.message}  {dur_str}")
         if r.detail:
             for line in r.detail.splitlines()[:5]:
@@ -407,6 +830,13 @@ class PreFlightRunner:
               f"{C.DIM}⏭️  {skipped} SKIP{C.RESET}  "
               f"{C.YELLOW}⚠️  {warned} WARN{C.RESET}  "
               f"{C.DIM}({report.total_duration_s:.1f}s total){C.RESET}")
+        hits = sum(1 for g in report.gates if g.cache == "hit")
+        misses = sum(1 for g in report.gates if g.cache == "miss")
+        if hits or misses:
+            print(f"  {C.DIM}Cache: {hits} hit / {misses} miss{C.RESET}")
+        path, path_s = report.critical_path()
+        if len(report.gates) > 1 and path:
+            print(f"  {C.DIM}Critical path: {' → '.join(path)} ({path_s:.1f}s){C.RESET}")
 
         if report.passed:
             print(f"\n  {C.GREEN}{C.BOLD}🟢 ENVIRONMENT IS CLEAN — OK to proceed.{C.RESET}")
@@ -447,6 +877,8 @@ Examples:
   python .agent/scripts/pre_flight.py --gate git        Git check only
   python .agent/scripts/pre_flight.py --json            JSON output only
   python .agent/scripts/pre_flight.py --strict          Fail on warnings
+  python .agent/scripts/pre_flight.py --jobs 1          Run gates sequentially
+  python .agent/scripts/pre_flight.py --no-cache        Force a full run
         """,
     )
     parser.add_argument(
@@ -465,6 +897,14 @@ Examples:
         "--strict", action="store_true",
         help="Treat warnings as failures"
     )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=DEFAULT_JOBS,
+        help=f"Max gates running concurrently (default: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore cached gate results and run every gate"
+    )
 
     args = parser.parse_args()
     root = Path(args.project).resolve()
@@ -478,12 +918,14 @@ Examples:
         import io, contextlib
         buf = io.StringIO()
         with contextlib.redirect_stdout(buf):
-            runner = PreFlightRunner(root, strict=args.strict, gate_filter=args.gate)
+            runner = PreFlightRunner(root, strict=args.strict, gate_filter=args.gate, jobs=args.jobs,
+                                     use_cache=not args.no_cache)
             report = runner.run()
         print(json.dumps(report.to_dict(), indent=2))
         return report.exit_code
 
-    runner = PreFlightRunner(root, strict=args.strict, gate_filter=args.gate)
+    runner = PreFlightRunner(root, strict=args.strict, gate_filter=args.gate, jobs=args.jobs,
+                             use_cache=not args.no_cache)
     report = runner.run()
     return report.exit_code
 
@@ -7,6 +7,7 @@ Usage:
     python .agent/scripts/session_checkpoint.py --write "description of current state"
     python .agent/scripts/session_checkpoint.py --read
     python .agent/scripts/session_checkpoint.py --diff
+    python .agent/scripts/session_checkpoint.py --diff -2 -1
     python .agent/scripts/session_checkpoint.py --read --json
 
 Purpose:
@@ -17,7 +18,9 @@ Purpose:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import re
 import subprocess
 import sys
 from datetime import datetime, timezone
@@ -29,6 +32,15 @@ ROOT = Path(__file__).parent.parent.parent
 SESSION_LOG = ROOT / ".agent" / "memory" / "SESSION_LOG.md"
 PLAN_FILE = ROOT / "ralph_plan.md"
 
+# Same task marker grammar as progress_reporter.TASK_RE
+TASK_RE = re.compile(r"^\s*[-*]\s*\[([x/! \-])\]\s*(.+)$", re.IGNORECASE)
+CHECKPOINT_RE = re.compile(
+    r"## \[(\d{4}-\d{2}-\d{2}T[\d:+\-]+)\] (.+?)(?=\n## \[|\Z)",
+    re.DOTALL,
+)
+KV_RE = re.compile(r"^- (\w[\w_]*): (.+)$", re.MULTILINE)
+LIST_RE = re.compile(r"^- (files_modified|decisions|open_questions):\n((?:  - .+\n?)*)", re.MULTILINE)
+
 # ── ANSI colors (TTY only) ────────────────────────────────────────────────────
 _ON = sys.stdout.isatty()
 
@@ -70,7 +82,6 @@ def _last_completed_task() -> str:
     if not PLAN_FILE.exists():
         return "unknown"
     for line in reversed(PLAN_FILE.read_text(encoding="utf-8").splitlines()):
-        import re
         m = re.match(r"\s*-\s*\[x\]\s*(.+)", line, re.IGNORECASE)
         if m:
             return m.group(1).strip()[:80]
@@ -101,48 +112,118 @@ def _current_branch() -> str:
     return out if rc == 0 else "unknown"
 
 
-# ── Read last checkpoint ──────────────────────────────────────────────────────
-def read_last_checkpoint() -> Optional[dict]:
+def _git_tree_hash() -> Optional[str]:
     """
-    Parse SESSION_LOG.md and return the last checkpoint as a dict.
-    Returns None if no checkpoint found.
+    Return the tree hash of the current working state (tracked files).
+    `git stash create` snapshots index + worktree without touching either;
+    it prints nothing on a clean tree, in which case HEAD's tree is current.
+    Returns None when no snapshot can be taken (e.g. another git process
+    holds index.lock): HEAD's tree would misrecord a dirty working tree.
     """
-    if not SESSION_LOG.exists():
+    rc, stash, _ = _run(["git", "stash", "create"])
+    if rc != 0:
         return None
+    rc, out, _ = _run(["git", "rev-parse", f"{stash or 'HEAD'}^{{tree}}"])
+    return out if rc == 0 else None
+
+
+def _task_key(text: str) -> str:
+    """Short stable key for a plan task (8 hex chars of sha1)."""
+    return hashlib.sha1(text.strip().encode("utf-8")).hexdigest()[:8]
+
+
+def _plan_tasks(path: Optional[Path] = None) -> dict[str, tuple[str, str]]:
+    """Return {task_key: (marker, text)} for every task line in the plan."""
+    path = path or PLAN_FILE
+    if not path.exists():
+        return {}
+    tasks: dict[str, tuple[str, str]] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        m = TASK_RE.match(line)
+        if not m:
+            continue
+        text = m.group(2).strip()
+        key = _task_key(text)
+        # Duplicate task texts get a positional suffix so keys stay unique
+        n = 1
+        while key in tasks:
+            n += 1
+            key = f"{_task_key(text)}.{n}"
+        tasks[key] = (m.group(1).lower().replace(" ", "_"), text[:80])
+    return tasks
+
+
+def plan_state_digest(path: Optional[Path] = None) -> str:
+    """
+    Compact plan-state digest: space-separated `marker:key` pairs.
+    A todo marker is written as `_` so the digest never contains blanks.
+    """
+    return " ".join(f"{marker}:{key}" for key, (marker, _) in _plan_tasks(path).items())
 
-    content = SESSION_LOG.read_text(encoding="utf-8")
-    import re
 
-    # Find all checkpoint blocks: ## [ISO_TIMESTAMP] description
-    pattern = re.compile(
-        r"## \[(\d{4}-\d{2}-\d{2}T[\d:+\-]+)\] (.+?)(?=\n## \[|\Z)",
-        re.DOTALL,
-    )
-    matches = list(pattern.finditer(content))
-    if not matches:
-        return None
+def parse_plan_state(digest: str) -> dict[str, str]:
+    """Inverse of plan_state_digest → {task_key: marker}."""
+    state: dict[str, str] = {}
+    for pair in digest.split():
+        marker, _, key = pair.partition(":")
+        if key:
+            state[key] = marker
+    return state
+
 
-    last = matches[-1]
-    ts_str = last.group(1)
-    description = last.group(2).strip()
-    body = last.group(0)
+# ── Read checkpoints ──────────────────────────────────────────────────────────
+def _parse_checkpoint(match: re.Match) -> dict:
+    """Turn one `## [ISO] description` block into a dict."""
+    body = match.group(0)
+    # group(2) spans the whole block (DOTALL) — keep only the heading line
+    description = match.group(2).strip().splitlines()[0]
+    fields: dict = {"timestamp": match.group(1), "description": description}
 
     # Parse key-value lines: "- key: value"
-    kv_pattern = re.compile(r"^- (\w[\w_]*): (.+)$", re.MULTILINE)
-    fields: dict = {"timestamp": ts_str, "description": description}
-    for kv in kv_pattern.finditer(body):
+    for kv in KV_RE.finditer(body):
         fields[kv.group(1)] = kv.group(2).strip()
 
     # Parse list fields: "- files_modified:\n  - file1\n  - file2"
-    list_pattern = re.compile(r"^- (files_modified|decisions|open_questions):\n((?:  - .+\n?)*)", re.MULTILINE)
-    for lm in list_pattern.finditer(body):
-        key = lm.group(1)
-        items = re.findall(r"  - (.+)", lm.group(2))
-        fields[key] = items
+    for lm in LIST_RE.finditer(body):
+        fields[lm.group(1)] = re.findall(r"  - (.+)", lm.group(2))
 
     return fields
 
 
+def read_checkpoints() -> list[dict]:
+    """Parse SESSION_LOG.md and return every checkpoint, oldest first."""
+    if not SESSION_LOG.exists():
+        return []
+    content = SESSION_LOG.read_text(encoding="utf-8")
+    return [_parse_checkpoint(m) for m in CHECKPOINT_RE.finditer(content)]
+
+
+def read_last_checkpoint() -> Optional[dict]:
+    """
+    Parse SESSION_LOG.md and return the last checkpoint as a dict.
+    Returns None if no checkpoint found.
+    """
+    checkpoints = read_checkpoints()
+    return checkpoints[-1] if checkpoints else None
+
+
+def resolve_checkpoint(ref: str, checkpoints: list[dict]) -> Optional[int]:
+    """
+    Resolve a checkpoint reference to an index into `checkpoints`.
+    Accepts a 1-based position, a negative position (-1 = last) or a
+    timestamp prefix such as `2026-02-19T22:31`.
+    """
+    try:
+        n = int(ref)
+    except ValueError:
+        for i in range(len(checkpoints) - 1, -1, -1):
+            if checkpoints[i]["timestamp"].startswith(ref):
+                return i
+        return None
+    idx = n - 1 if n > 0 else len(checkpoints) + n
+    return idx if 0 <= idx < len(checkpoints) else None
+
+
 # ── Write checkpoint ──────────────────────────────────────────────────────────
 def write_checkpoint(description: str, decisions: list[str] = None, open_questions: list[str] = None) -> None:
     """
@@ -152,6 +233,8 @@ def write_checkpoint(description: str, decisions: list[str] = None, open_questio
     last_task = _last_completed_task()
     modified = _git_modified_files()
     branch = _current_branch()
+    tree = _git_tree_hash()
+    plan_state = plan_state_digest()
 
     decisions = decisions or []
     open_questions = open_questions or []
@@ -163,6 +246,10 @@ def write_checkpoint(description: str, decisions: list[str] = None, open_questio
         f"- branch: {branch}",
         f"- last_task: {last_task}",
     ]
+    if tree:
+        lines.append(f"- tree: {tree}")
+    if plan_state:
+        lines.append(f"- plan_state: {plan_state}")
 
     # files_modified
     if modified:
@@ -213,7 +300,6 @@ def _update_frontmatter(now: str) -> None:
         return
 
     content = SESSION_LOG.read_text(encoding="utf-8")
-    import re
     content = re.sub(
         r"(last_checkpoint:\s*)[\d\-T:+]+",
         rf"\g<1>{now}",
@@ -222,15 +308,182 @@ def _update_frontmatter(now: str) -> None:
     SESSION_LOG.write_text(content, encoding="utf-8")
 
 
-# ── Diff since checkpoint ─────────────────────────────────────────────────────
-def diff_since_checkpoint() -> None:
-    """Show git diff stat + list of modified files since last commit."""
-    checkpoint = read_last_checkpoint()
+# ── Diff between checkpoints ──────────────────────────────────────────────────
+MARKER_NAMES = {
+    "x": "done", "/": "in_progress", "_": "todo", "!": "blocked", "-": "cancelled",
+}
+
+
+def current_state() -> dict:
+    """Snapshot of the live working state, shaped like a checkpoint."""
+    return {
+        "timestamp": _now_iso(),
+        "description": "working tree (now)",
+        "tree": _git_tree_hash(),
+        "plan_state": plan_state_digest(),
+        "files_modified": _git_modified_files(),
+    }
+
+
+def _list_field(checkpoint: dict, key: str) -> list[str]:
+    value = checkpoint.get(key, [])
+    return value if isinstance(value, list) else []
+
+
+def _tree_changes(tree_a: str, tree_b: str) -> Optional[list[dict]]:
+    """
+    Files changed between two tree objects. git walks both trees and skips
+    identical subtrees by hash, so cost is proportional to what changed.
+    """
+    if tree_a == tree_b:
+        return []
+    rc, out, _ = _run(["git", "diff-tree", "-r", "--name-status", tree_a, tree_b])
+    if rc != 0:
+        return None
+    changes = []
+    for line in out.splitlines():
+        status, _, path = line.partition("\t")
+        changes.append({"status": status[:1], "path": path})
+    return changes
+
+
+def diff_checkpoints(checkpoints: list[dict], a: int, b: Optional[int] = None,
+                     live: Optional[dict] = None) -> dict:
+    """
+    Compare checkpoint `a` with checkpoint `b` (or with `live` when b is None).
+
+    Returns files touched, plan task transitions and decisions added. Files
+    come from a tree-to-tree diff when both sides recorded a tree hash,
+    otherwise from the union of `files_modified` lists in between.
+    """
+    old = checkpoints[a]
+    new = checkpoints[b] if b is not None else (live or current_state())
+    between = checkpoints[a + 1:(b + 1 if b is not None else None)]
+    if b is not None and b < a:
+        between = []
+
+    # Files
+    changes = None
+    if old.get("tree") and new.get("tree"):
+        changes = _tree_changes(old["tree"], new["tree"])
+    if changes is None:
+        touched: dict[str, None] = {}
+        for cp in between + ([new] if b is None else []):
+            for f in _list_field(cp, "files_modified"):
+                touched.setdefault(f, None)
+        changes = [{"status": "?", "path": f} for f in touched]
+
+    # Plan task transitions
+    state_a = parse_plan_state(old.get("plan_state", ""))
+    state_b = parse_plan_state(new.get("plan_state", ""))
+    names = {key: text for key, (_, text) in _plan_tasks().items()}
+    transitions = []
+    for key in state_a.keys() | state_b.keys():
+        before, after = state_a.get(key), state_b.get(key)
+        if before == after:
+            continue
+        transitions.append({
+            "task": names.get(key, key),
+            "from": MARKER_NAMES.get(before, "absent"),
+            "to": MARKER_NAMES.get(after, "absent"),
+        })
+    transitions.sort(key=lambda t: t["task"])
+
+    # Decisions recorded after `a` that were not already known at `a`
+    known = {d for cp in checkpoints[:a + 1] for d in _list_field(cp, "decisions")}
+    added: list[str] = []
+    for cp in between:
+        for d in _list_field(cp, "decisions"):
+            if d not in known:
+                known.add(d)
+                added.append(d)
+
+    return {
+        "from": {"timestamp": old["timestamp"], "description": old.get("description", "")},
+        "to": {"timestamp": new["timestamp"], "description": new.get("description", "")},
+        "comparable": bool(old.get("tree") and new.get("tree")),
+        "files": changes,
+        "tasks": transitions,
+        "decisions_added": added,
+    }
+
+
+def print_checkpoint_diff(result: dict) -> None:
+    """Render diff_checkpoints() output."""
+    print(f"{C.DIM}From: [{result['from']['timestamp']}] {result['from']['description']}{C.RESET}")
+    print(f"{C.DIM}To:   [{result['to']['timestamp']}] {result['to']['description']}{C.RESET}\n")
+    if not result["comparable"]:
+        warn("Tree hash missing on one side — file list taken from recorded files_modified.")
+
+    files = result["files"]
+    print(f"{C.BOLD}Files touched ({len(files)}):{C.RESET}")
+    for f in files:
+        print(f"  {C.CYAN}{f['status']}{C.RESET} {f['path']}")
+    if not files:
+        print(f"  {C.DIM}none{C.RESET}")
+
+    tasks = result["tasks"]
+    print(f"\n{C.BOLD}Plan transitions ({len(tasks)}):{C.RESET}")
+    for t in tasks:
+        print(f"  {C.YELLOW}{t['from']} → {t['to']}{C.RESET}  {t['task']}")
+    if not tasks:
+        print(f"  {C.DIM}none{C.RESET}")
+
+    decisions = result["decisions_added"]
+    print(f"\n{C.BOLD}Decisions added ({len(decisions)}):{C.RESET}")
+    for d in decisions:
+        print(f"  {C.GREEN}+{C.RESET} {d}")
+    if not decisions:
+        print(f"  {C.DIM}none{C.RESET}")
+    print()
 
-    print(f"\n{C.BOLD}{'─'*54}{C.RESET}")
-    print(f"  {C.BOLD}📊 DIFF SINCE LAST CHECKPOINT{C.RESET}")
-    print(f"{'─'*54}{C.RESET}\n")
 
+def diff_since_checkpoint(refs: Optional[list[str]] = None, as_json: bool = False) -> int:
+    """
+    Diff two checkpoints, or a checkpoint against the live working state.
+
+    With no refs the last checkpoint is compared to the working tree; if it
+    has no tree hash, fall back to the plain `git diff HEAD` view (as JSON,
+    to the files_modified comparison of diff_checkpoints()).
+    """
+    refs = refs or []
+    checkpoints = read_checkpoints()
+
+    if not as_json:
+        if len(refs) > 1:
+            title = f"DIFF BETWEEN CHECKPOINTS {refs[0]} AND {refs[1]}"
+        elif refs:
+            title = f"DIFF SINCE CHECKPOINT {refs[0]}"
+        else:
+            title = "DIFF SINCE LAST CHECKPOINT"
+        print(f"\n{C.BOLD}{'─'*54}{C.RESET}")
+        print(f"  {C.BOLD}📊 {title}{C.RESET}")
+        print(f"{'─'*54}{C.RESET}\n")
+
+    if refs:
+        idx = [resolve_checkpoint(r, checkpoints) for r in refs[:2]]
+        for ref, i in zip(refs, idx):
+            if i is None:
+                err(f"Unknown checkpoint: {ref}")
+                return 1
+        result = diff_checkpoints(checkpoints, idx[0], idx[1] if len(idx) > 1 else None)
+    elif checkpoints and (checkpoints[-1].get("tree") or as_json):
+        # JSON consumers get the files_modified fallback of diff_checkpoints()
+        result = diff_checkpoints(checkpoints, len(checkpoints) - 1)
+    elif as_json:
+        print(json.dumps({"error": "No previous checkpoint found."}, indent=2))
+        return 1
+    else:
+        result = None
+
+    if result is not None:
+        if as_json:
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+        else:
+            print_checkpoint_diff(result)
+        return 0
+
+    checkpoint = checkpoints[-1] if checkpoints else None
     if checkpoint:
         ts = checkpoint.get("timestamp", "unknown")
         desc = checkpoint.get("description", "")
@@ -247,6 +500,7 @@ def diff_since_checkpoint() -> None:
         for f in modified:
             print(f"  {C.CYAN}·{C.RESET} {f}")
     print()
+    return 0
 
 
 # ── CLI ───────────────────────────────────────────────────────────────────────
@@ -260,24 +514,30 @@ Examples:
   python session_checkpoint.py --read
   python session_checkpoint.py --read --json
   python session_checkpoint.py --diff
+  python session_checkpoint.py --diff 3          # checkpoint #3 vs working tree
+  python session_checkpoint.py --diff -2 -1      # previous vs last checkpoint
+  python session_checkpoint.py --diff 2026-02-19T22:31 --json
         """,
     )
     parser.add_argument("--write", metavar="DESC", help="Write a new checkpoint with description")
     parser.add_argument("--read", action="store_true", help="Read last checkpoint")
-    parser.add_argument("--diff", action="store_true", help="Show git diff since last checkpoint")
-    parser.add_argument("--json", action="store_true", help="Output as JSON (use with --read)")
+    parser.add_argument("--diff", nargs="*", metavar="REF", default=None,
+                        help="Diff checkpoints: none = last vs now, one REF = REF vs now, two = REF vs REF "
+                             "(REF: 1-based index, negative index, or timestamp prefix)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON (use with --read or --diff)")
     parser.add_argument("--decision", action="append", metavar="TEXT", default=[], help="Decision to record (use multiple times)")
     parser.add_argument("--question", action="append", metavar="TEXT", default=[], help="Open question to record (use multiple times)")
 
     args = parser.parse_args()
 
-    if not any([args.write, args.read, args.diff]):
+    if not any([args.write, args.read, args.diff is not None]):
         parser.print_help()
         return 0
 
-    print(f"\n{C.BOLD}{'─'*54}{C.RESET}")
-    print(f"  {C.BOLD}🔐 CONTEXT GUARDIAN{C.RESET}")
-    print(f"{'─'*54}{C.RESET}\n")
+    if not (args.json and args.diff is not None):
+        print(f"\n{C.BOLD}{'─'*54}{C.RESET}")
+        print(f"  {C.BOLD}🔐 CONTEXT GUARDIAN{C.RESET}")
+        print(f"{'─'*54}{C.RESET}\n")
 
     if args.write:
         write_checkpoint(args.write, decisions=args.decision, open_questions=args.question)
@@ -300,8 +560,11 @@ Examples:
                     print(f"  {C.CYAN}{k}:{C.RESET} {v}")
         print()
 
-    if args.diff:
-        diff_since_checkpoint()
+    if args.diff is not None:
+        if len(args.diff) > 2:
+            err("--diff takes at most two checkpoint references")
+            return 1
+        return diff_since_checkpoint(args.diff, as_json=args.json)
 
     return 0
 
@@ -12,6 +12,8 @@ Usage:
     python .agent/scripts/smart_commit.py --from-plan --push
     python .agent/scripts/smart_commit.py --create-remote --push --all
     python .agent/scripts/smart_commit.py --status
+    python .agent/scripts/smart_commit.py --batch --dry-run
+    python .agent/scripts/smart_commit.py --batch --push
 
 Conventional Commit types:
     feat     New feature
@@ -74,6 +76,7 @@ def _run(
     cwd: Optional[Path] = None,
     capture: bool = True,
     check: bool = False,
+    input: Optional[str] = None,
 ) -> tuple[int, str, str]:
     """Run a subprocess. Returns (returncode, stdout, stderr)."""
     try:
@@ -82,6 +85,7 @@ def _run(
             capture_output=capture,
             text=True,
             cwd=cwd or Path.cwd(),
+            input=input,
         )
         return r.returncode, r.stdout.strip(), r.stderr.strip()
     except FileNotFoundError:
@@ -90,9 +94,9 @@ def _run(
         return 1, "", str(e)
 
 
-def _run_check(cmd: list[str], cwd: Optional[Path] = None) -> str:
+def _run_check(cmd: list[str], cwd: Optional[Path] = None, input: Optional[str] = None) -> str:
     """Run command and return stdout, raise on failure."""
-    rc, out, stderr = _run(cmd, cwd)
+    rc, out, stderr = _run(cmd, cwd, input=input)
     if rc != 0:
         raise RuntimeError(f"`{' '.join(cmd)}` failed (exit {rc}): {stderr}")
     return out
@@ -138,6 +142,35 @@ class GitContext:
         rc, out, _ = _run(["git", "status", "--porcelain"], self.root)
         return [l.strip() for l in out.splitlines() if l.strip()]
 
+    def dirty_paths(self) -> list[str]:
+        """Returns bare paths of modified/untracked files (rename → new path)."""
+        # Not via _run: its .strip() would eat the leading status column
+        try:
+            r = subprocess.run(
+                ["git", "status", "--porcelain", "-z", "--untracked-files=all"],
+                capture_output=True, text=True, cwd=self.root,
+            )
+        except FileNotFoundError:
+            return []
+        if r.returncode != 0:
+            return []
+        paths = []
+        entries = r.stdout.split("\0")
+        i = 0
+        while i < len(entries):
+            entry = entries[i]
+            i += 1
+            if len(entry) < 4:
+                continue
+            paths.append(entry[3:])
+            if entry[0] in "RC":
+                # -z prints the rename source as a separate entry; it must be
+                # committed together with the destination.
+                if i < len(entries) and entries[i]:
+                    paths.append(entries[i])
+                i += 1
+        return paths
+
     def staged_files(self) -> list[str]:
         rc, out, _ = _run(["git", "diff", "--cached", "--name-only"], self.root)
         return [l for l in out.splitlines() if l]
@@ -182,6 +215,9 @@ class GitContext:
 
 VALID_TYPES = {"feat", "fix", "docs", "refactor", "test", "chore", "perf", "style", "ci", "build"}
 
+DONE_TASK_RE = re.compile(r"^\s*-\s*\[x\]\s*(.*)$", re.IGNORECASE | re.MULTILINE)
+SCOPE_RE = re.compile(r"\.agent/(rules|scripts|workflows|memory|skills)/(\w[\w-]*)")
+
 @dataclass
 class CommitGenerator:
     """
@@ -212,6 +248,14 @@ class CommitGenerator:
 
         return header
 
+    def done_tasks(self) -> list[str]:
+        """All [x] task texts from ralph_plan.md, in file order."""
+        plan_path = self.root / "ralph_plan.md"
+        if not plan_path.exists():
+            return []
+        content = plan_path.read_text(encoding="utf-8")
+        return [m.group(1).strip() for m in DONE_TASK_RE.finditer(content)]
+
     def from_plan(self) -> tuple[str, str, Optional[str]]:
         """
         Read last completed task from ralph_plan.md.
@@ -221,22 +265,23 @@ class CommitGenerator:
         if not plan_path.exists():
             return "update agent framework", "chore", None
 
-        content = plan_path.read_text(encoding="utf-8")
-        lines = content.splitlines()
-
-        # Find last [x] task line
+        # Find last [x] task line, scanning from the end
         last_done = None
-        for line in lines:
-            if re.match(r"\s*-\s*\[x\]", line, re.IGNORECASE):
-                last_done = line
+        for line in reversed(plan_path.read_text(encoding="utf-8").splitlines()):
+            m = DONE_TASK_RE.match(line)
+            if m:
+                last_done = m.group(1).strip()
+                break
 
         if not last_done:
             return "update agent framework", "chore", None
 
-        # Extract task description
-        match = re.sub(r"\s*-\s*\[x\]\s*", "", last_done).strip()
+        return self.from_task(last_done)
+
+    def from_task(self, task: str) -> tuple[str, str, Optional[str]]:
+        """Turn one completed task text into (message, type, scope)."""
         # Remove markdown code backticks
-        match = re.sub(r"`([^`]+)`", r"\1", match)
+        match = re.sub(r"`([^`]+)`", r"\1", task)
         # Truncate to 50 chars max for message
         msg = match[:50].strip()
 
@@ -255,13 +300,177 @@ class CommitGenerator:
 
         # Infer scope from path/content
         scope = None
-        path_match = re.search(r"\.agent/(rules|scripts|workflows|memory|skills)/(\w[\w-]*)", msg)
+        path_match = SCOPE_RE.search(msg)
         if path_match:
             scope = path_match.group(2).replace("-", "_")
 
         return msg, ctype, scope
 
 
+# ─── CommitPlanner ────────────────────────────────────────────────────────────
+
+@dataclass
+class CommitGroup:
+    """One planned commit: a cluster of dirty files plus its message."""
+    key: str
+    scope: Optional[str]
+    files: list[str] = field(default_factory=list)
+    task: Optional[str] = None
+    message: str = ""
+
+    def to_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "scope": self.scope,
+            "message": self.message,
+            "task": self.task,
+            "files": self.files,
+        }
+
+
+@dataclass
+class CommitPlanner:
+    """
+    Splits a dirty working tree into logical commits.
+
+    Files are clustered by directory and by `.agent/<kind>/<name>` scope,
+    clusters that habitually change together in recent history are merged,
+    and each cluster is labelled with the latest completed plan task that
+    mentions it.
+    """
+    root: Path
+    ctx: GitContext
+    gen: CommitGenerator
+    history: int = 200           # commits scanned for co-change
+    min_support: int = 3         # co-changes needed before merging
+    min_ratio: float = 0.6       # co-changes / commits touching the rarer cluster
+
+    @staticmethod
+    def cluster_key(path: str) -> tuple[str, Optional[str]]:
+        """Return (cluster key, scope) for a repo-relative path."""
+        m = SCOPE_RE.match(path)
+        if m:
+            kind, name = m.group(1), m.group(2)
+            if kind == "skills":
+                return f".agent/skills/{name}", name.replace("-", "_")
+            return f".agent/{kind}", kind
+        parts = path.split("/")
+        if len(parts) == 1:
+            return ".", None
+        if parts[0] == ".agent" or len(parts) == 2:
+            return parts[0], parts[0].lstrip(".") or None
+        return f"{parts[0]}/{parts[1]}", parts[0]
+
+    def _cochange_counts(self, keys: set[str]) -> tuple[dict[str, int], dict[tuple[str, str], int]]:
+        """Per-cluster and per-pair commit counts from one `git log` call."""
+        rc, out, _ = _run(
+            ["git", "log", f"-n{self.history}", "--name-only", "--format=%x1e"],
+            self.root,
+        )
+        single: dict[str, int] = {}
+        pairs: dict[tuple[str, str], int] = {}
+        if rc != 0:
+            return single, pairs
+        for record in out.split("\x1e"):
+            touched = {self.cluster_key(p)[0] for p in record.split("\n") if p.strip()}
+            touched &= keys
+            for k in touched:
+                single[k] = single.get(k, 0) + 1
+            ordered = sorted(touched)
+            for i, a in enumerate(ordered):
+                for b in ordered[i + 1:]:
+                    pairs[(a, b)] = pairs.get((a, b), 0) + 1
+        return single, pairs
+
+    def _merge_cochanged(self, groups: dict[str, CommitGroup]) -> list[CommitGroup]:
+        """Union clusters whose co-change ratio clears the thresholds."""
+        parent = {k: k for k in groups}
+
+        def find(k: str) -> str:
+            while parent[k] != k:
+                parent[k] = parent[parent[k]]
+                k = parent[k]
+            return k
+
+        single, pairs = self._cochange_counts(set(groups))
+        for (a, b), n in pairs.items():
+            rarer = min(single.get(a, 0), single.get(b, 0))
+            if n >= self.min_support and rarer and n / rarer >= self.min_ratio:
+                ra, rb = find(a), find(b)
+                if ra != rb:
+                    parent[max(ra, rb)] = min(ra, rb)
+
+        merged: dict[str, CommitGroup] = {}
+        for key in sorted(groups):
+            g = groups[key]
+            root_key = find(key)
+            if root_key not in merged:
+                merged[root_key] = CommitGroup(key=root_key, scope=groups[root_key].scope)
+            merged[root_key].files.extend(g.files)
+        return list(merged.values())
+
+    def _default_message(self, group: CommitGroup) -> tuple[str, str]:
+        """(message, type) for a cluster with no matching plan task."""
+        files = group.files
+        if all(f.endswith(".md") for f in files):
+            ctype = "docs"
+        elif all(f.startswith("tests/") or "/test_" in f or f.startswith("test_") for f in files):
+            ctype = "test"
+        else:
+            ctype = "chore"
+        label = group.key if group.key != "." else "project files"
+        return f"update {label}", ctype
+
+    def plan(self, paths: Optional[list[str]] = None) -> list[CommitGroup]:
+        """Cluster dirty files and label each cluster with a commit message."""
+        paths = paths if paths is not None else self.ctx.dirty_paths()
+        groups: dict[str, CommitGroup] = {}
+        for path in paths:
+            key, scope = self.cluster_key(path)
+            groups.setdefault(key, CommitGroup(key=key, scope=scope)).files.append(path)
+        if not groups:
+            return []
+
+        clusters = self._merge_cochanged(groups) if len(groups) > 1 else list(groups.values())
+
+        tasks = self.gen.done_tasks()
+        for group in clusters:
+            needles = {group.key} | set(group.files)
+            if group.scope:
+                needles.add(group.scope)
+            # Latest completed task that mentions the cluster wins
+            for task in reversed(tasks):
+                text = task.replace("`", "")
+                if any(n in text for n in needles if n != "."):
+                    group.task = task
+                    break
+
+            if group.task:
+                msg, ctype, scope = self.gen.from_task(group.task)
+                scope = scope or group.scope
+            else:
+                msg, ctype = self._default_message(group)
+                scope = group.scope
+            group.message = self.gen.build(msg, commit_type=ctype, scope=scope)
+
+        return clusters
+
+    def commit_group(self, group: CommitGroup) -> str:
+        """
+        Commit one cluster: a single `git add` and a single `git commit`,
+        both fed the whole pathspec on stdin. `git commit <pathspec>` only
+        records those paths, so anything else already staged is left alone.
+        """
+        spec = "\0".join(group.files) + "\0"
+        pathspec = ["--pathspec-from-file=-", "--pathspec-file-nul"]
+        _run_check(["git", "add", "-A", *pathspec], self.root, input=spec)
+        info(f"Committing {len(group.files)} file(s): {C.BOLD}{group.message}{C.RESET}")
+        _run_check(["git", "commit", "-q", "-m", group.message, *pathspec], self.root, input=spec)
+        commit_hash = self.ctx.last_commit_hash() or "?"
+        ok(f"Commit created: {C.DIM}{commit_hash}{C.RESET} — {group.message}")
+        return commit_hash
+
+
 # ─── RepoManager ──────────────────────────────────────────────────────────────
 
 @dataclass
@@ -441,6 +650,7 @@ class SmartCommit:
         self.gen = CommitGenerator(root)
         self.runner = CommitRunner(root, self.ctx)
         self.repo_mgr = RepoManager(root, self.ctx)
+        self.planner = CommitPlanner(root, self.ctx, self.gen)
 
     def run(self, args: argparse.Namespace) -> int:
         print(f"\n{C.BOLD}{C.CYAN}{'─'*54}{C.RESET}")
@@ -467,6 +677,10 @@ class SmartCommit:
                 )
                 self.repo_mgr.add_remote(url)
 
+            # ── Batch mode: one commit per logical cluster ───
+            if args.batch:
+                return self.run_batch(args)
+
             # ── Step 3: Build commit message ─────────────────
             if args.from_plan:
                 msg_text, ctype, scope = self.gen.from_plan()
@@ -520,6 +734,31 @@ class SmartCommit:
             warn("\nInterrupted.")
             return 130
 
+    def run_batch(self, args: argparse.Namespace) -> int:
+        """Plan and create N commits from the dirty tree in one run."""
+        groups = self.planner.plan()
+        if not groups:
+            warn("Nothing to commit — working tree clean.")
+            return 0
+
+        info(f"Planned {len(groups)} commit(s) for {sum(len(g.files) for g in groups)} file(s)")
+        for g in groups:
+            task = f" ← {g.task[:50]}" if g.task else ""
+            dim(f"{g.message}  [{len(g.files)} file(s)]{task}")
+
+        if args.dry_run:
+            print(json.dumps([g.to_dict() for g in groups], indent=2, ensure_ascii=False))
+            return 0
+
+        for g in groups:
+            self.planner.commit_group(g)
+
+        if args.push:
+            self.runner.push(set_upstream=args.create_remote or not self.ctx.has_remote())
+
+        print(f"\n{C.GREEN}{C.BOLD}  ✨ Done! {len(groups)} commit(s){C.RESET}\n")
+        return 0
+
 
 # ─── CLI ──────────────────────────────────────────────────────────────────────
 
@@ -534,6 +773,7 @@ Examples:
   python .agent/scripts/smart_commit.py --from-plan --all --push
   python .agent/scripts/smart_commit.py "initial commit" --create-remote --all --push
   python .agent/scripts/smart_commit.py --status
+  python .agent/scripts/smart_commit.py --batch --dry-run
         """,
     )
 
@@ -573,6 +813,10 @@ Examples:
                         help="Auto-generate message from last [x] in ralph_plan.md")
     parser.add_argument("--status", action="store_true",
                         help="Print repository status as JSON and exit")
+    parser.add_argument("--batch", action="store_true",
+                        help="Group dirty files into logical clusters and create one commit per cluster")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="With --batch: print the commit plan as JSON without committing")
 
     # Project root
     parser.add_argument("--root", default=".", help="Project root (default: cwd)")
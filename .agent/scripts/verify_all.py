@@ -8,6 +8,14 @@ Use this before deployment or major releases.
 
 Usage:
     python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> --subprocess   # One process per check
+    python scripts/verify_all.py . --url <URL> --jobs 1       # One check at a time
+    python scripts/verify_all.py . --url <URL> --fail-fast    # CI: stop at the first critical failure
+
+Checks run in parallel, packed onto the available cores by the resource
+needs recorded for each script (CHECK_NEEDS in check_scheduler.py).
+Checks whose script defines run(context) (see checker_api.py) run inside
+this interpreter; the rest are started as subprocesses.
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -23,12 +31,20 @@ Includes ALL checks:
 """
 
 import sys
-import subprocess
 import argparse
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from file_inventory import export_inventory
+from checker_api import CheckContext, load_plugin, run_plugin
+from check_scheduler import (CancelToken, Check, DurationHistory, Scheduler, format_critical_path,
+                             format_plan, needs_for, run_command)
+
+# Checks run on scheduler threads; keep each message on its own line
+_print_lock = threading.RLock()
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -46,22 +62,27 @@ def print_header(text: str):
     print(f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.ENDC}\n")
 
 def print_step(text: str):
-    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
+    with _print_lock:
+        print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
 
 def print_success(text: str):
-    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
+    with _print_lock:
+        print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
 
 def print_warning(text: str):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
+    with _print_lock:
+        print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
 
 def print_error(text: str):
-    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
+    with _print_lock:
+        print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
 # Complete verification suite
 VERIFICATION_SUITE = [
     # P0: Security (CRITICAL)
     {
         "category": "Security",
+        "on_fail": "cancel",
         "checks": [
             ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True),
             ("Dependency Analysis", ".agent/skills/vulnerability-scanner/scripts/dependency_analyzer.py", False),
@@ -71,6 +92,7 @@ VERIFICATION_SUITE = [
     # P1: Code Quality (CRITICAL)
     {
         "category": "Code Quality",
+        "on_fail": "cancel",
         "checks": [
             ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True),
             ("Type Coverage", ".agent/skills/lint-and-validate/scripts/type_coverage.py", False),
@@ -115,6 +137,7 @@ VERIFICATION_SUITE = [
     {
         "category": "Performance",
         "requires_url": True,
+        "on_fail": "category",
         "checks": [
             ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
             ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False),
@@ -147,7 +170,14 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+# What a failed required check does to the rest under --fail-fast:
+#   "cancel"   - SIGTERM every running check's process group, start nothing more
+#   "category" - the same, limited to the failed check's category
+#   "finish"   - start nothing more, let running checks complete
+DEFAULT_ON_FAIL = "cancel"
+
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               env: Optional[Dict[str, str]] = None, token: Optional[CancelToken] = None) -> dict:
     """Run validation script"""
     if not script_path.exists():
         print_warning(f"{name}: Script not found, skipping")
@@ -161,44 +191,78 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
         cmd.append(url)
     
-    # Run
+    # Run in its own process group so a timeout or cancellation stops everything it started
     try:
-        result = subprocess.run(
+        result = run_command(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
+            env=env,
+            timeout=600,  # 10 minute timeout for slow checks
+            token=token
         )
         
         duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
         
-        if passed:
-            print_success(f"{name}: PASSED ({duration:.1f}s)")
-        else:
-            print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
+        if result["cancelled"]:
+            print_warning(f"{name}: {token.reason} ({duration:.1f}s)")
+            return {"name": name, "passed": True, "skipped": True, "cancelled": True,
+                    "warning": token.reason, "output": result["stdout"], "error": result["stderr"],
+                    "duration": duration}
+        
+        if result["timed_out"]:
+            print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
+            return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout",
+                    "output": result["stdout"]}
+        
+        passed = result["returncode"] == 0
+        
+        with _print_lock:
+            if passed:
+                print_success(f"{name}: PASSED ({duration:.1f}s)")
+            else:
+                print_error(f"{name}: FAILED ({duration:.1f}s)")
+                if result["stderr"]:
+                    print(f"  {result['stderr'][:300]}")
         
         return {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "output": result["stdout"],
+            "error": result["stderr"],
             "skipped": False,
             "duration": duration
         }
     
-    except subprocess.TimeoutExpired:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
-    
     except Exception as e:
         duration = (datetime.now() - start_time).total_seconds()
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
 
+def run_check(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+              env: Optional[Dict[str, str]] = None, in_process: bool = True,
+              token: Optional[CancelToken] = None) -> dict:
+    """Run a check in this interpreter if its script defines run(context), else as a subprocess"""
+    plugin = None
+    if in_process and script_path.exists():
+        try:
+            plugin = load_plugin(script_path)
+        except (Exception, SystemExit):
+            plugin = None  # let the subprocess run report the import failure
+    if plugin is None:
+        return run_script(name, script_path, project_path, url, env=env, token=token)
+    
+    print_step(f"Running: {name}")
+    result = run_plugin(name, script_path, CheckContext(project_path, url, token=token))
+    with _print_lock:
+        if result.get("cancelled"):
+            print_warning(f"{name}: {result['warning']}")
+        elif result["passed"]:
+            print_success(f"{name}: PASSED ({result['duration']:.1f}s)")
+        else:
+            print_error(f"{name}: FAILED ({result['duration']:.1f}s)")
+            if result.get("error"):
+                print(f"  {result['error'][:300]}")
+    return result
+
 def print_final_report(results: List[dict], start_time: datetime):
     """Print comprehensive final report"""
     total_duration = (datetime.now() - start_time).total_seconds()
@@ -216,6 +280,9 @@ def print_final_report(results: List[dict], start_time: datetime):
     print(f"{Colors.GREEN}✅ Passed: {passed}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped}{Colors.ENDC}")
+    critical = format_critical_path(results)
+    if critical:
+        print(critical)
     print()
     
     # Category breakdown
@@ -235,7 +302,10 @@ def print_final_report(results: List[dict], start_time: datetime):
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
-        duration_str = f"({r.get('duration', 0):.1f}s)" if not r.get("skipped") else ""
+        if r.get("skipped"):
+            duration_str = f"({r['warning']})" if r.get("warning") else ""
+        else:
+            duration_str = f"({r.get('duration', 0):.1f}s)"
         print(f"  {status} {r['name']} {duration_str}")
     
     print()
@@ -249,6 +319,8 @@ def print_final_report(results: List[dict], start_time: datetime):
                 if r.get("error"):
                     error_preview = r["error"][:200]
                     print(f"  Error: {error_preview}")
+                for f in r.get("findings", [])[:3]:
+                    print(f"  - [{f['severity']}] {f['message'][:120]}")
         print()
     
     # Final verdict
@@ -273,7 +345,13 @@ Examples:
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
-    parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--fail-fast", "--stop-on-fail", dest="fail_fast", action="store_true",
+                        help="On a required check's failure apply its category's on_fail policy "
+                             "(cancel running checks, or stop starting new ones)")
+    parser.add_argument("--subprocess", action="store_true",
+                        help="Run every check as its own process (isolation mode)")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Cores the scheduler may fill (default: CPU count, 1 = one check at a time)")
     
     args = parser.parse_args()
     
@@ -289,9 +367,12 @@ Examples:
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     start_time = datetime.now()
-    results = []
     
-    # Run all verification categories
+    # Walk the project once; in-process checks and checker processes share it
+    env = export_inventory(project_path)
+    
+    # Collect the checks of every applicable category
+    checks = []
     for suite in VERIFICATION_SUITE:
         category = suite["category"]
         requires_url = suite.get("requires_url", False)
@@ -304,19 +385,37 @@ Examples:
         if args.no_e2e and category == "E2E Testing":
             continue
         
-        print_header(f"📋 {category.upper()}")
-        
         for name, script_path, required in suite["checks"]:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+            checks.append(Check(name, script, required, category, needs_for(script)))
+    
+    # Run them in parallel as resources and dependencies allow
+    history = DurationHistory(project_path)
+    scheduler = Scheduler(
+        checks,
+        lambda check: run_check(check.name, check.script, str(project_path), args.url, env=env,
+                                in_process=not args.subprocess, token=check.token),
+        cores=args.jobs, history=history,
+    )
+    print_header("📋 SCHEDULE")
+    for line in format_plan(scheduler):
+        print(f"  {line}")
+    print()
+    
+    # Fail fast on critical failure if flag set: apply the category's on_fail policy
+    on_fail = None
+    if args.fail_fast:
+        policies = {suite["category"]: suite.get("on_fail", DEFAULT_ON_FAIL) for suite in VERIFICATION_SUITE}
+        on_fail = lambda check, result: policies[check.category] if check.required else None
+    results = scheduler.run(on_fail)
+    history.save()
+    
+    failed_required = [c.name for c, r in zip(checks, results)
+                       if c.required and not r["passed"] and not r.get("skipped")]
+    cancelled = [r["name"] for r in results if r.get("cancelled")]
+    if args.fail_fast and failed_required:
+        print_error(f"CRITICAL: {', '.join(failed_required)} failed. Stopped remaining checks"
+                    + (f" (cancelled: {', '.join(cancelled)})." if cancelled else "."))
     
     # Print final report
     all_passed = print_final_report(results, start_time)
@@ -20,23 +20,39 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared file inventory and checker plugin API (.agent/scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from checker_api import CheckContext, Finding, Findings
+from markup_scan import Markup
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 except:
     pass
 
+# Accessibility issues are important but not blocking: allow a few minor ones
+MAX_ISSUES = 5
+
+# Attributes that give a control an accessible name
+LABEL_ATTRS = ('aria-label', 'aria-labelledby', 'id')
+CLICK_HANDLERS = ('onclick', '@click', 'v-on:click', 'on:click')
+KEY_HANDLERS = ('onkeydown', 'onkeyup', 'onkeypress', '@keydown', '@keyup', 'v-on:keydown', 'on:keydown', 'on:keyup')
+# Elements the browser already makes focusable and keyboard-operable
+KEYBOARD_NATIVE = {'a', 'button', 'input', 'select', 'textarea', 'summary', 'option', 'label'}
+# tabindex="2", tabIndex={3}
+POSITIVE_TABINDEX = re.compile(r'^[{"\']*\s*[1-9]\d*\s*[}"\']*$')
+
 
 def find_html_files(project_path: Path) -> list:
     """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
+    inventory = get_inventory(project_path)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
+    for ext in ['.html', '.jsx', '.tsx']:
+        files.extend(inventory.path(e) for e in inventory.files(exts={ext}, skip_dirs=skip_dirs))
     
     return files[:50]
 
@@ -46,28 +62,27 @@ def check_accessibility(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
+        markup = Markup(content)
         
-        # Check for form inputs without labels
-        inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
-        for inp in inputs:
-            if 'type="hidden"' not in inp.lower():
-                if 'aria-label' not in inp.lower() and 'id=' not in inp.lower():
+        # Check for form inputs without labels (a wrapping <label> counts)
+        for inp in markup.find('input'):
+            if (inp.get('type') or '').lower() != 'hidden':
+                if not any(inp.has(a) for a in LABEL_ATTRS) and not markup.inside(inp, 'label'):
                     issues.append("Input without label or aria-label")
                     break
         
         # Check for buttons without accessible text
-        buttons = re.findall(r'<button[^>]*>[^<]*</button>', content, re.IGNORECASE)
-        for btn in buttons:
+        for btn in markup.find('button'):
             # Check if button has text content or aria-label
-            if 'aria-label' not in btn.lower():
-                text = re.sub(r'<[^>]+>', '', btn)
-                if not text.strip():
-                    issues.append("Button without accessible text")
-                    break
+            if btn.children or any(btn.has(a) for a in LABEL_ATTRS[:2]):
+                continue
+            if not (markup.content(btn) or '').strip():
+                issues.append("Button without accessible text")
+                break
         
         # Check for missing lang attribute
-        if '<html' in content.lower() and 'lang=' not in content.lower():
+        if any(not html.has('lang') for html in markup.find('html')):
             issues.append("Missing lang attribute on <html>")
         
         # Check for missing skip link
@@ -76,29 +91,26 @@ def check_accessibility(file_path: Path) -> list:
                 issues.append("Consider adding skip-to-main-content link")
         
         # Check for click handlers without keyboard support
-        onclick_count = content.lower().count('onclick=')
-        onkeydown_count = content.lower().count('onkeydown=') + content.lower().count('onkeyup=')
-        if onclick_count > 0 and onkeydown_count == 0:
-            issues.append("onClick without keyboard handler (onKeyDown)")
+        for el in markup.elements:
+            if any(el.has(a) for a in CLICK_HANDLERS) and el.name.lower() not in KEYBOARD_NATIVE:
+                if not any(el.has(a) for a in KEY_HANDLERS):
+                    issues.append("onClick without keyboard handler (onKeyDown)")
+                    break
         
         # Check for tabIndex misuse
-        if 'tabindex=' in content.lower():
-            if 'tabindex="-1"' not in content.lower() and 'tabindex="0"' not in content.lower():
-                positive_tabindex = re.findall(r'tabindex="([1-9]\d*)"', content, re.IGNORECASE)
-                if positive_tabindex:
-                    issues.append("Avoid positive tabIndex values")
+        for el in markup.elements:
+            if POSITIVE_TABINDEX.match(el.get('tabindex') or ''):
+                issues.append("Avoid positive tabIndex values")
+                break
         
         # Check for autoplay media
-        if 'autoplay' in content.lower():
-            if 'muted' not in content.lower():
-                issues.append("Autoplay media should be muted")
+        if any(el.has('autoplay') and not el.has('muted') for el in markup.elements):
+            issues.append("Autoplay media should be muted")
         
-        # Check for role usage
-        if 'role="button"' in content.lower():
-            # Divs with role button should have tabindex
-            div_buttons = re.findall(r'<div[^>]*role="button"[^>]*>', content, re.IGNORECASE)
-            for div in div_buttons:
-                if 'tabindex' not in div.lower():
+        # Check for role usage: custom buttons need to be focusable
+        for el in markup.elements:
+            if (el.get('role') or '').strip('{}"\'') == 'button' and not el.has('tabindex'):
+                if el.name.lower() not in KEYBOARD_NATIVE:
                     issues.append("role='button' without tabindex")
                     break
         
@@ -108,6 +120,23 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
+def run(context: CheckContext) -> Findings:
+    """Plugin entry point for verify_all/checklist; same verdict as main()."""
+    files = find_html_files(context.project_path)
+    findings = []
+    for f in files:
+        context.raise_if_cancelled()
+        for issue in check_accessibility(f):
+            findings.append(Finding(issue, "medium", file=context.relpath(f), rule="a11y"))
+
+    return Findings(
+        passed=len(findings) < MAX_ISSUES,
+        findings=findings,
+        summary=f"{len(files)} file(s) checked, {len(findings)} accessibility issue(s)",
+        data={"files_checked": len(files), "issues_found": len(findings)},
+    )
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -162,8 +191,7 @@ def main():
         print("No accessibility issues found!")
     
     total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Accessibility issues are important but not blocking
-    passed = total_issues < 5  # Allow minor issues
+    passed = total_issues < MAX_ISSUES
     
     output = {
         "script": "accessibility_checker",
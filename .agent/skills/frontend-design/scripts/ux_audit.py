@@ -87,597 +87,680 @@ Analyzes code for compliance with:
    - Form labels
 
 Total: 80+ checks across all design principles
+
+The checks are declared in the RULES table (id, tag, level, condition,
+message) and ask their questions through the named PATTERNS, which are
+compiled once and evaluated at most once per file. Questions about
+elements (img without alt, form fields, headings, paragraph text) are
+answered from the file's tag structure (.agent/scripts/markup_scan.py)
+rather than by regexes that scan across element boundaries.
 """
 
 import sys
 import os
 import re
 import json
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+# Shared file inventory and checker plugin API (.agent/scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from checker_api import CheckCancelled, CheckContext, Findings, parse_tagged
+from markup_scan import Markup
+from pattern_scan import PatternSet
+
+
+# ---------------------------------------------------------------------------
+# Patterns: every regex the rules ask about, compiled once. A file is scanned
+# lazily (see .agent/scripts/pattern_scan.py): each pattern runs at most once
+# per file and only if a rule reaches it, so a pattern used by several rules
+# is listed once.
+# ---------------------------------------------------------------------------
+
+I = re.IGNORECASE
+
+PURPLES = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
+           '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
+           'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
+
+PATTERNS = PatternSet({
+    # Page content
+    'form':             (r'<form|<input|password|credit|card|payment', I),
+    'nav_item':         (r'<NavLink|<Link|<a\s+href|nav-item', I),
+    'hero':             (r'hero|<h1|banner', I),
+    'footer':           (r'footer|<footer', I),
+    'button_word':      (r'button', I),
+    'click':            r'onClick|@click|onclick',
+    'interactive':      r'<button|<a\s+href|onClick|@click',
+    'image':            r'<img|background-image:|bg-\[url',
+
+    # Wording
+    'step_words':       (r'step|wizard|stage', I),
+    'primary':          (r'primary|bg-primary|Button.*primary|variant=["\']primary', I),
+    'feedback':         (r'transition|animate|hover:|focus:|disabled|loading|spinner', I),
+    'state_change':     r'setState|useState|disabled|loading',
+    'reflective':       (r'about|story|mission|values|why we|our journey|testimonials', I),
+    'security_signal':  (r'ssl|secure|encrypt|lock|padlock|https', I),
+    'checkout':         (r'checkout|payment', I),
+    'social_proof':     (r'review|testimonial|rating|star|trust|trusted by|customer|logo', I),
+    'authority':        (r'certif|award|media|press|featured|as seen in', I),
+    'progressive':      (r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', I),
+    'label':            (r'<label|placeholder|aria-label', I),
+    'defaults':         r'checked|selected|default|value=["\'].*["\']',
+    'radio':            (r'type=["\']radio', I),
+    'price':            (r'price|pricing|cost|\$\d+', I),
+    'anchor':           (r'original|was|strike|del|save \d+%', I),
+    'social_words':     (r'join|subscriber|member|user', I),
+    'number_count':     r'\d+[+kmb]|\d+,\d+',
+    'progress':         (r'progress|step \d+|complete|%|bar', I),
+    'food':             (r'restaurant|food|cooking|recipe|menu|dish|meal', I),
+
+    # Typography
+    'font_face':        (r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', I),
+    'google_font':      (r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', I),
+    'font_family':      (r'font-family:\s*([^;]+)', I),
+    'font_weight':      (r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', I),
+    'font_size_decl':   r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)',
+    'font_size_value':  r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)',
+    'clamp':            r'clamp\(|responsive:',
+    'line_length':      r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch',
+    'leading':          r'leading-|line-height:',
+    'line_height':      r'(?:leading-|line-height:\s*)([\d.]+)',
+    'heading_size':     (r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', I),
+    'uppercase':        (r'uppercase|text-transform:\s*uppercase', I),
+    'tracking':         r'tracking-|letter-spacing:',
+    'display_text':     r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx',
+    'tracking_tight':   r'tracking-tight|letter-spacing:\s*-[0-9]',
+
+    # Layout and effects
+    'small_height':     r'height:\s*([0-3]\d)px',
+    'small_h_class':    r'h-[1-9]\b|h-10\b',
+    'gradient':         r'gradient',
+    'gradient_any':     (r'gradient', I),
+    'background':       r'background:|bg-',
+    'blur':             r'backdrop-filter|blur\(',
+    'translucent_bg':   r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+',
+    'box_shadow':       r'box-shadow:\s*([^;]+)',
+    'glow_shadow':      r'box-shadow:\s*[^;]*0\s+0\s+',
+    'text_shadow':      r'text-shadow:',
+    'rgba_alpha':       r'rgba?\([^)]+,\s*([\d.]+)\)',
+    'border_any':       r'border:|border-',
+    'border_decl':      r'border:',
+    'overlay':          r'overlay|rgba\(0|gradient.*transparent|::after|::before',
+    'will_change':      r'will-change:',
+    'will_change_prop': r'will-change:\s*([^;]+)',
+    'expensive_prop':   r'width|height|top|left|right|bottom|margin|padding',
+
+    # Color
+    'color_value':      r'#[0-9a-fA-F]{3,6}|rgb|hsl',
+    'hex_color':        r'#[0-9a-fA-F]{3,6}',
+    'hex6':             r'#[0-9a-fA-F]{6}',
+    'hsl':              r'hsl\(',
+    'hsl_hue':          r'hsl\((\d+),\s*\d+%,\s*\d+%\)',
+    'bg_decl':          r'(?:background|bg-|bg\[)([^;}\s]+)',
+    'text_decl':        r'(?:color|text-)([^;}\s]+)',
+    'pure_black':       r'color:\s*#000000|#000\b',
+    'pure_white':       r'background:\s*#ffffff|#fff\b',
+    'dark_mode':        r'dark:\s*|dark:',
+    'light_contrast':   r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]',
+    'dark_contrast':    r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]',
+    'blue':             r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}',
+    'color_var':        r'--color-|color-|primary-|secondary-',
+
+    # Animation and motion
+    'animation':        r'@keyframes|transition:|animate-',
+    'keyframes':        r'@keyframes|transition:',
+    'reduced_motion':   r'prefers-reduced-motion',
+    'transition_word':  (r'transition', I),
+    'duration':         r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)',
+    'ease_in_entry':    r'ease-in\s+.*entry|fade-in.*ease-in',
+    'ease_out_exit':    r'ease-out\s+.*exit|fade-out.*ease-out',
+    'hover_focus':      r'hover:|focus:|:hover|:focus',
+    'async':            r'async|await|fetch|axios|loading|isLoading',
+    'loading_state':    r'skeleton|spinner|progress|loading|<circle.*animate',
+    'routing':          r'router|navigate|Link.*to|useHistory',
+    'page_transition':  r'AnimatePresence|motion\.|transition.*page|fade.*route',
+    'scroll_anim':      r'onScroll|scroll.*trigger|IntersectionObserver',
+    'lottie':           r'lottie|Lottie|@lottie-react',
+    'lottie_fallback':  r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop',
+    'gsap':             r'gsap|ScrollTrigger|from\(.*gsap',
+    'gsap_cleanup':     r'kill\(|revert\(|useEffect.*return.*gsap',
+    'svg_animation':    r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset',
+    'transform_3d':     r'transform3d|perspective\(|rotate3d|translate3d',
+    'perspective':      r'perspective:\s*\d+px|perspective\s*\(',
+    'particles':        r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js',
+    'scroll_driven':    r'IntersectionObserver.*animate|scroll.*progress|view-timeline',
+    'throttle':         r'throttle|debounce|requestAnimationFrame',
+    'functional_anim':  r'hover:|focus:|disabled|loading|error|success',
+})
+
+# Applied to single matches or lines, not to the file
+SHADOW_Y_OFFSET = re.compile(r'\d+px\s+[1-9]\d*px')
+SCROLL_LAYOUT_PROP = re.compile(r'[^\w](width|height|top|left)')
+
+# Element names the markup questions ask about
+HEADINGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+FORM_FIELDS = ('input', 'select', 'textarea')
+NAV_LINKS = ('navlink', 'link', 'a')
+
+GENERIC_FONTS = {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial',
+                 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}
+WEIGHT_NAMES = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500',
+                'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
+SCALE_RATIOS = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
+LAYOUT_PROPS = {'width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding'}
+CTA_WORDS = ['contact', 'login', 'sign', 'get started', 'cta', 'button']
+
+
+def _number(text: str):
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+class FileFacts:
+    """One file's scan plus the derived values several rules share."""
+
+    def __init__(self, filename: str, scan):
+        self.filename = filename
+        self.scan = scan
+        self.has = scan.has
+        self.count = scan.count
+        self.findall = scan.findall
+
+    @cached_property
+    def markup(self) -> Markup:
+        return Markup(self.scan.text)
+
+    def _text_class(self, *names: str) -> bool:
+        """True if an element in `names` has 'text' in its class list."""
+        return any('text' in (el.get('class') or el.get('classname') or '').lower()
+                   for el in self.markup.find(*names))
+
+    @cached_property
+    def long_text(self) -> bool:
+        return (bool(self.markup.find('p')) or 'article' in self.scan.lower or
+                self._text_class('div', 'span'))
+
+    @cached_property
+    def text_elements(self) -> bool:
+        return (bool(self.markup.find('p', 'span', *HEADINGS)) or self._text_class('div'))
+
+    @cached_property
+    def form(self) -> bool:
+        return self.has('form')
+
+    @cached_property
+    def complex_elements(self) -> int:
+        return self.markup.count(*FORM_FIELDS, 'option')
+
+    @cached_property
+    def form_fields(self) -> int:
+        """Fields of the largest <form>, or of the whole file if it has none."""
+        forms = self.markup.find('form')
+        if not forms:
+            return self.markup.count(*FORM_FIELDS)
+        return max(len(self.markup.descendants(form, *FORM_FIELDS)) for form in forms)
+
+    @cached_property
+    def nav_text(self) -> list:
+        """One entry per nav link: the text of plain <a href> links, '' for router links."""
+        texts = []
+        for el in self.markup.find(*NAV_LINKS):
+            if el.name.lower() != 'a':
+                texts.append('')
+            elif el.has('href') and not el.children and el.close is not None:
+                text = self.markup.content(el)
+                if text:
+                    texts.append(text)
+        return texts
+
+    @cached_property
+    def paragraphs(self) -> list:
+        """Text of the <p> elements that contain no other elements."""
+        return [text for text in (self.markup.content(p) for p in self.markup.find('p') if not p.children)
+                if text]
+
+    @cached_property
+    def img_without_alt(self) -> bool:
+        return any(not img.has('alt') for img in self.markup.find('img'))
+
+    @cached_property
+    def scroll_layout(self) -> bool:
+        """A layout property after `onScroll` on the same line."""
+        text = self.scan.text
+        start = text.find('onScroll')
+        while start >= 0:
+            eol = text.find('\n', start)
+            eol = len(text) if eol < 0 else eol
+            if SCROLL_LAYOUT_PROP.search(text, start + len('onScroll'), eol):
+                return True
+            start = text.find('onScroll', eol)
+        return False
+
+    @cached_property
+    def nav_items(self) -> int:
+        return self.count('nav_item')
+
+    @cached_property
+    def hero(self) -> bool:
+        return self.has('hero')
+
+    @cached_property
+    def shadows(self) -> list:
+        return self.findall('box_shadow')
+
+    @cached_property
+    def font_families(self) -> set:
+        families = {font.strip().lower() for font in self.findall('font_face')}
+        for font in self.findall('google_font'):
+            for f in font.replace('+', ' ').split('|'):
+                families.add(f.split(':')[0].strip().lower())
+        for family in self.findall('font_family'):
+            first_font = family.split(',')[0].strip().strip('"\'')   # first font of the stack
+            if first_font.lower() not in GENERIC_FONTS:
+                families.add(first_font.lower())
+        return families
+
+    @cached_property
+    def weights(self) -> list:
+        values = []
+        for w in self.findall('font_weight'):
+            val = WEIGHT_NAMES.get((w[0] or w[1]).lower(), w[0] or w[1])
+            if val.isdigit():
+                values.append(int(val))
+        return values
+
+    @cached_property
+    def headings(self) -> list:
+        return [el.name for el in self.markup.find(*HEADINGS)]
+
+    @cached_property
+    def scale_ratios(self) -> list:
+        # font-size values normalized to rem
+        sizes = [float(size) / (16 if unit == 'px' else 1) for size, unit in self.findall('font_size_value')]
+        if len(sizes) <= 2:
+            return []
+        sizes = sorted(set(sizes))
+        return [sizes[i] / sizes[i - 1] for i in range(1, len(sizes)) if sizes[i - 1] > 0]
+
+    @cached_property
+    def effect_count(self) -> int:
+        return (int(self.has('gradient')) + len(self.shadows) +
+                self.count('blur') + self.count('text_shadow'))
+
+    @cached_property
+    def total_animations(self) -> int:
+        return self.count('animation') + int(self.has('lottie')) + int(self.has('gsap'))
+
+
+# ---------------------------------------------------------------------------
+# Rules: `when` returns a falsy value (no finding), True or a dict of message
+# fields (one finding), or - for scope "each" - one dict per finding. Level
+# "pass" counts a passed check instead of reporting.
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Rule:
+    id: str
+    tag: str
+    level: str                      # "issue" | "warning" | "pass"
+    when: Callable[[FileFacts], Any]
+    message: Union[str, Dict[str, str]] = ""   # dict: template per fields['variant']
+    scope: str = "file"             # "file" | "each"
+
+    def evaluate(self, facts: FileFacts) -> Iterator[dict]:
+        result = self.when(facts)
+        if self.scope == "each":
+            yield from (result or ())
+        elif result:
+            yield result if isinstance(result, dict) else {}
+
+
+def _last_nav_item_minor(f: FileFacts) -> bool:
+    if f.nav_items <= 3:
+        return False
+    nav_text = f.nav_text
+    if len(nav_text) <= 2:
+        return False
+    return not any(x in nav_text[-1].lower() for x in CTA_WORDS)
+
+
+def _adjacent_weights(f: FileFacts):
+    w = f.weights
+    return [{'a': a, 'b': b} for a, b in zip(w, w[1:]) if abs(a - b) == 100]
+
+
+def _skipped_headings(f: FileFacts):
+    levels = [int(h[1]) for h in f.headings]
+    return [{'a': a, 'b': b} for a, b in zip(levels, levels[1:]) if b > a + 1]
+
+
+def _off_scale(f: FileFacts):
+    for ratio in f.scale_ratios[:3]:
+        if not any(abs(ratio - r) < 0.05 for r in SCALE_RATIOS):
+            return {'ratio': ratio}
+    return None
+
+
+def _uniform_shadow_opacity(f: FileFacts) -> bool:
+    if len(f.shadows) < 3:
+        return False
+    opacities = [o for o in map(_number, f.findall('rgba_alpha')) if o is not None and o < 0.5]
+    return bool(opacities) and len(set(opacities)) < 2
+
+
+def _purple(f: FileFacts):
+    for purple in PURPLES:
+        if purple.lower() in f.scan.lower:
+            return {'color': purple}
+    return None
+
+
+def _many_colors(f: FileFacts):
+    if f.count('hex_color') + f.count('hsl') <= 3 or not (f.has('bg_decl') and f.has('text_decl')):
+        return None
+    unique = set(f.findall('hex6'))
+    return len(unique) > 5 and {'n': len(unique)}
+
+
+def _monochrome(f: FileFacts):
+    hues = [int(h) for h in f.findall('hsl_hue')]
+    return len(hues) >= 3 and max(hues) - min(hues) < 10 and {'range': max(hues) - min(hues)}
+
+
+def _durations(f: FileFacts):
+    for duration, unit in f.findall('duration'):
+        ms = _number(duration)
+        if ms is None:
+            continue
+        ms *= 1000 if unit == 's' else 1
+        if ms < 50:
+            yield {'variant': 'fast', 'duration': duration, 'unit': unit}
+        elif ms > 1000 and f.has('transition_word'):
+            yield {'variant': 'slow', 'duration': duration, 'unit': unit}
+
+
+RULES = [
+    # --- 1. PSYCHOLOGY LAWS ---
+    Rule("hicks-law", "Hick's Law", "issue",
+         lambda f: f.nav_items > 7 and {'n': f.nav_items},
+         "{n} nav items (Max 7)"),
+    Rule("fitts-law", "Fitts' Law", "warning",
+         lambda f: f.has('small_height') or f.has('small_h_class'),
+         "Small targets (< 44px)"),
+    Rule("millers-law", "Miller's Law", "warning",
+         lambda f: f.form_fields > 7 and not f.has('step_words') and {'n': f.form_fields},
+         "Complex form ({n} fields)"),
+    Rule("von-restorff", "Von Restorff", "warning",
+         lambda f: f.has('button_word') and not f.has('primary'),
+         "No primary CTA"),
+    Rule("serial-position", "Serial Position", "warning", _last_nav_item_minor,
+         "Last nav item may not be important. Place key actions at start/end."),
+
+    # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
+    Rule("visceral", "Visceral", "warning",
+         lambda f: f.hero and not (f.has('gradient') or f.has('animation')) and not f.has('background'),
+         "Hero section lacks visual appeal. Consider gradients or subtle animations."),
+    Rule("behavioral", "Behavioral", "warning",
+         lambda f: f.has('click') and not f.has('feedback') and not f.has('state_change'),
+         "Interactive elements lack immediate feedback. Add hover/focus/disabled states."),
+    Rule("reflective", "Reflective", "warning",
+         lambda f: f.long_text and not f.has('reflective'),
+         "Long-form content without brand story/values. Add 'About' or 'Why We Exist' section."),
+
+    # --- 1.6 TRUST BUILDING ---
+    Rule("form-security", "Trust", "warning",
+         lambda f: f.form and not f.has('security_signal') and not f.has('checkout'),
+         "Form without security indicators. Add 'SSL Secure' or lock icon."),
+    Rule("social-proof", "Trust", "pass", lambda f: f.has('social_proof')),
+    Rule("no-social-proof", "Trust", "warning",
+         lambda f: not f.has('social_proof') and f.long_text,
+         "No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos."),
+    Rule("footer-authority", "Trust", "warning",
+         lambda f: f.has('footer') and not f.has('authority'),
+         "Footer lacks authority signals. Add certifications, awards, or media mentions."),
+
+    # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
+    Rule("progressive-disclosure", "Cognitive Load", "warning",
+         lambda f: f.complex_elements > 5 and not f.has('progressive'),
+         "Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle."),
+    Rule("visual-noise", "Cognitive Load", "warning",
+         lambda f: f.count('color_value') > 15 and f.count('border_any') > 10,
+         "High visual noise detected. Many colors and borders increase cognitive load."),
+    Rule("form-labels", "Cognitive Load", "issue",
+         lambda f: f.form and not f.has('label'),
+         "Form inputs without labels. Use <label> for accessibility and clarity."),
+
+    # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
+    Rule("smart-defaults", "Persuasion", "warning",
+         lambda f: f.form and f.has('radio') and not f.has('defaults'),
+         "Radio buttons without default selection. Pre-select recommended option."),
+    Rule("price-anchoring", "Persuasion", "warning",
+         lambda f: f.has('price') and not f.has('anchor'),
+         "Prices without anchoring. Show original price to frame discount value."),
+    Rule("social-numbers", "Persuasion", "warning",
+         lambda f: f.has('social_words') and not f.has('number_count'),
+         "Social proof without specific numbers. Use 'Join 10,000+' format."),
+    Rule("form-progress", "Persuasion", "warning",
+         lambda f: f.form and f.complex_elements > 5 and not f.has('progress'),
+         "Long form without progress indicator. Add progress bar or 'Step X of Y'."),
+
+    # --- 2. TYPOGRAPHY SYSTEM ---
+    Rule("font-pairing", "Typography", "issue",
+         lambda f: len(f.font_families) > 3 and {'n': len(f.font_families)},
+         "{n} font families detected. Limit to 2-3 for cohesion."),
+    Rule("line-length", "Typography", "warning",
+         lambda f: f.long_text and not f.has('line_length'),
+         "No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch]."),
+    Rule("line-height", "Typography", "warning",
+         lambda f: f.text_elements and not f.has('leading'),
+         "Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3"),
+    Rule("heading-line-height", "Typography", "warning",
+         lambda f: f.has('heading_size') and [{'lh': lh} for lh in f.findall('line_height')
+                                              if (_number(lh) or 0) > 1.5],
+         "Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).", scope="each"),
+    Rule("uppercase-tracking", "Typography", "warning",
+         lambda f: f.has('uppercase') and not f.has('tracking'),
+         "Uppercase text without tracking. ALL CAPS needs +5-10% spacing."),
+    Rule("display-tracking", "Typography", "warning",
+         lambda f: f.has('display_text') and not f.has('tracking_tight'),
+         "Large display text without tracking-tight. Big text needs -1% to -4% spacing."),
+    Rule("adjacent-weights", "Typography", "warning", _adjacent_weights,
+         "Adjacent font weights ({a}/{b}). Skip at least 2 levels for contrast.", scope="each"),
+    Rule("weight-count", "Typography", "warning",
+         lambda f: len(set(f.weights)) > 4 and {'n': len(set(f.weights))},
+         "{n} font weights. Limit to 3-4 per page."),
+    Rule("fluid-type", "Typography", "warning",
+         lambda f: f.has('font_size_decl') and not f.has('clamp'),
+         "Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)"),
+    Rule("heading-order", "Typography", "warning", _skipped_headings,
+         "Skipped heading level (h{a} -> h{b}). Maintain sequential hierarchy.", scope="each"),
+    Rule("missing-h1", "Typography", "warning",
+         lambda f: f.headings and 'h1' not in [h.lower() for h in f.headings] and f.long_text,
+         "No h1 found. Each page should have one primary heading."),
+    Rule("modular-scale", "Typography", "warning", _off_scale,
+         "Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third)."),
+    Rule("long-paragraph", "Typography", "warning",
+         lambda f: [{'n': len(p.split())} for p in f.paragraphs if len(p.split()) > 100],
+         "Long paragraph detected ({n} words). Break into 3-4 line chunks for readability.", scope="each"),
+    Rule("subheadings", "Typography", "warning",
+         lambda f: len(f.paragraphs) > 5 and not f.markup.find(*HEADINGS[1:]),
+         "Long content without subheadings. Add h2/h3 to break up text."),
+
+    # --- 3. VISUAL EFFECTS ---
+    Rule("glassmorphism", "Visual", "warning",
+         lambda f: f.has('blur') and not f.has('translucent_bg'),
+         "Blur used without semi-transparent background (Glassmorphism fail)"),
+    Rule("animated-layout", "Performance", "warning",
+         lambda f: f.has('keyframes') and f.has('expensive_prop') and
+         {'props': ', '.join(set(f.findall('expensive_prop')))},
+         "Animating expensive properties ({props}). Use transform/opacity where possible."),
+    Rule("reduced-motion", "Accessibility", "warning",
+         lambda f: f.has('keyframes') and not f.has('reduced_motion'),
+         "Animations found without prefers-reduced-motion check"),
+    Rule("natural-shadow", "Visual", "warning",
+         lambda f: [{} for s in f.shadows if ',' not in s and not SHADOW_Y_OFFSET.search(s)],
+         "Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.", scope="each"),
+    Rule("neomorphism-inset", "Visual", "warning",
+         lambda f: [{} for s in f.shadows if ',' in s and '-' in s and 'inset' in s],
+         "Neomorphism inset detected. Ensure adequate contrast for accessibility.", scope="each"),
+    Rule("shadow-hierarchy", "Visual", "warning", _uniform_shadow_opacity,
+         "All shadows at same opacity level. Vary shadow intensity for elevation hierarchy."),
+    Rule("gradient-overuse", "Visual", "warning",
+         lambda f: f.has('gradient') and f.count('gradient_any') > 5 and {'n': f.count('gradient_any')},
+         "Many gradients detected ({n}). Ensure this serves purpose, not decoration."),
+    Rule("flat-hero", "Visual", "warning",
+         lambda f: not f.has('gradient') and f.hero and not f.has('background'),
+         "Hero section without visual interest. Consider gradient for depth."),
+    Rule("border-count", "Visual", "warning",
+         lambda f: f.has('border_any') and f.count('border_decl') > 8 and {'n': f.count('border_decl')},
+         "Many border declarations ({n}). Simplify for cleaner look."),
+    Rule("text-glow", "Visual", "warning",
+         lambda f: [{} for ts in f.findall('text_shadow') if ',' in ts],
+         "Text glow effect detected. Ensure readability is maintained.", scope="each"),
+    Rule("glow-overuse", "Visual", "warning",
+         lambda f: f.count('glow_shadow') > 2,
+         "Multiple glow effects detected. Use sparingly for emphasis only."),
+    Rule("image-overlay", "Visual", "warning",
+         lambda f: f.has('image') and f.long_text and not f.has('overlay'),
+         "Text over image without overlay. Add gradient overlay for readability."),
+    Rule("will-change-layout", "Performance", "issue",
+         lambda f: [{'prop': p} for p in (p.strip().lower() for p in f.findall('will_change_prop'))
+                    if p in LAYOUT_PROPS],
+         "will-change on '{prop}' (layout property). Use only for transform/opacity.", scope="each"),
+    Rule("will-change-count", "Performance", "warning",
+         lambda f: f.count('will_change') > 3 and {'n': f.count('will_change')},
+         "Many will-change declarations ({n}). Use sparingly, only for heavy animations."),
+    Rule("effect-overuse", "Visual", "warning",
+         lambda f: f.effect_count > 10 and {'n': f.effect_count},
+         "Many visual effects ({n}). Ensure effects serve purpose, not decoration."),
+    Rule("flat-design", "Visual", "warning",
+         lambda f: f.long_text and f.effect_count == 0,
+         "Flat design with no depth. Consider shadows or subtle gradients for hierarchy."),
+
+    # --- 4. COLOR SYSTEM ---
+    Rule("purple-ban", "Color", "issue", _purple,
+         "PURPLE DETECTED ('{color}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead."),
+    Rule("60-30-10", "Color", "warning", _many_colors,
+         "{n} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%)."),
+    Rule("monochromatic", "Color", "warning", _monochrome,
+         "Monochromatic palette detected (hue variance: {range}deg). Ensure adequate contrast."),
+    Rule("pure-black", "Color", "warning",
+         lambda f: f.has('pure_black'),
+         "Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode."),
+    Rule("pure-white-dark", "Color", "warning",
+         lambda f: f.has('pure_white') and f.has('dark_mode'),
+         "Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain."),
+    Rule("low-contrast", "Color", "warning",
+         lambda f: f.has('light_contrast') or f.has('dark_contrast'),
+         "Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text)."),
+    Rule("food-blue", "Color", "warning",
+         lambda f: f.has('blue') and f.has('food'),
+         "Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow)."),
+    Rule("hsl-palette", "Color", "warning",
+         lambda f: f.has('color_var') and not f.has('hsl'),
+         "Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness)."),
+
+    # --- 5. ANIMATION GUIDE ---
+    Rule("animation-duration", "Animation", "warning", _durations, {
+        'fast': "Very fast animation ({duration}{unit}). Minimum 50ms for visibility.",
+        'slow': "Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.",
+    }, scope="each"),
+    Rule("entry-easing", "Animation", "warning",
+         lambda f: f.has('ease_in_entry'),
+         "Entry animation with ease-in. Entry should use ease-out for snappy feel."),
+    Rule("exit-easing", "Animation", "warning",
+         lambda f: f.has('ease_out_exit'),
+         "Exit animation with ease-out. Exit should use ease-in for natural feel."),
+    Rule("micro-interactions", "Animation", "warning",
+         lambda f: f.count('interactive') > 2 and not f.has('hover_focus'),
+         "Interactive elements without hover/focus states. Add micro-interactions for feedback."),
+    Rule("loading-state", "Animation", "warning",
+         lambda f: f.has('async') and not f.has('loading_state'),
+         "Async operations without loading indicator. Add skeleton or spinner for perceived performance."),
+    Rule("page-transition", "Animation", "warning",
+         lambda f: f.has('routing') and not f.has('page_transition'),
+         "Routing detected without page transitions. Consider fade/slide for context continuity."),
+    Rule("scroll-layout", "Animation", "issue",
+         lambda f: f.has('scroll_anim') and f.scroll_layout,
+         "Scroll handler animating layout properties. Use transform/opacity for 60fps."),
+
+    # --- 6. MOTION GRAPHICS ---
+    Rule("lottie-fallback", "Motion", "warning",
+         lambda f: f.has('lottie') and not f.has('lottie_fallback'),
+         "Lottie animation without reduced-motion fallback. Add pause/stop for accessibility."),
+    Rule("gsap-cleanup", "Motion", "issue",
+         lambda f: f.has('gsap') and not f.has('gsap_cleanup'),
+         "GSAP animation without cleanup (kill/revert). Memory leak risk on unmount."),
+    Rule("svg-animation", "Motion", "warning",
+         lambda f: f.count('svg_animation') > 3,
+         "Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance."),
+    Rule("3d-perspective", "Motion", "warning",
+         lambda f: f.has('transform_3d') and not f.has('perspective'),
+         "3D transform without perspective parent. Add perspective: 1000px for realistic depth."),
+    Rule("3d-mobile", "Motion", "warning",
+         lambda f: f.has('transform_3d'),
+         "3D transforms detected. Test on mobile; can impact performance on low-end devices."),
+    Rule("particles", "Motion", "warning",
+         lambda f: f.has('particles'),
+         "Particle effects detected. Ensure fallback or reduced-quality option for mobile devices."),
+    Rule("scroll-throttle", "Motion", "issue",
+         lambda f: f.has('scroll_driven') and not f.has('throttle'),
+         "Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps."),
+    Rule("decorative-motion", "Motion", "warning",
+         lambda f: f.total_animations > 5 and f.count('functional_anim') < f.total_animations / 2
+         and {'n': f.total_animations},
+         "Many animations ({n}). Ensure majority serve functional purpose (feedback, guidance), not decoration."),
+
+    # --- 7. ACCESSIBILITY ---
+    Rule("img-alt", "Accessibility", "issue",
+         lambda f: f.img_without_alt,
+         "Missing img alt text"),
+]
+
 
 class UXAuditor:
-    def __init__(self):
+    def __init__(self, rules: List[Rule] = None):
+        self.rules = RULES if rules is None else rules
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
-    
-    def audit_file(self, filepath: str) -> None:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-        except: return
-        
+
+    def audit_file(self, filepath: str, content: str = None) -> None:
+        if content is None:
+            try:
+                content = read_text(filepath, errors='replace')
+            except: return
+
         self.files_checked += 1
-        filename = os.path.basename(filepath)
-
-        # Pre-calculate common flags
-        has_long_text = bool(re.search(r'<p|<div.*class=.*text|article|<span.*text', content, re.IGNORECASE))
-        has_form = bool(re.search(r'<form|<input|password|credit|card|payment', content, re.IGNORECASE))
-        complex_elements = len(re.findall(r'<input|<select|<textarea|<option', content, re.IGNORECASE))
-
-        # --- 1. PSYCHOLOGY LAWS ---
-        # Hick's Law
-        nav_items = len(re.findall(r'<NavLink|<Link|<a\s+href|nav-item', content, re.IGNORECASE))
-        if nav_items > 7:
-            self.issues.append(f"[Hick's Law] {filename}: {nav_items} nav items (Max 7)")
-        
-        # Fitts' Law
-        if re.search(r'height:\s*([0-3]\d)px', content) or re.search(r'h-[1-9]\b|h-10\b', content):
-            self.warnings.append(f"[Fitts' Law] {filename}: Small targets (< 44px)")
-        
-        # Miller's Law
-        form_fields = len(re.findall(r'<input|<select|<textarea', content, re.IGNORECASE))
-        if form_fields > 7 and not re.search(r'step|wizard|stage', content, re.IGNORECASE):
-            self.warnings.append(f"[Miller's Law] {filename}: Complex form ({form_fields} fields)")
-            
-        # Von Restorff
-        if 'button' in content.lower() and not re.search(r'primary|bg-primary|Button.*primary|variant=["\']primary', content, re.IGNORECASE):
-            self.warnings.append(f"[Von Restorff] {filename}: No primary CTA")
-
-        # Serial Position Effect - Important items at beginning/end
-        if nav_items > 3:
-            # Check if last nav item is important (contact, login, etc.)
-            nav_content = re.findall(r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', content, re.IGNORECASE)
-            if nav_content and len(nav_content) > 2:
-                last_item = nav_content[-1].lower() if nav_content else ''
-                if not any(x in last_item for x in ['contact', 'login', 'sign', 'get started', 'cta', 'button']):
-                    self.warnings.append(f"[Serial Position] {filename}: Last nav item may not be important. Place key actions at start/end.")
-
-        # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
-
-        # Visceral: First impressions (aesthetics, gradients, animations)
-        has_hero = bool(re.search(r'hero|<h1|banner', content, re.IGNORECASE))
-        if has_hero:
-            # Check for visual appeal elements
-            has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient', content))
-            has_animation = bool(re.search(r'@keyframes|transition:|animate-', content))
-            has_visual_interest = has_gradient or has_animation
-
-            if not has_visual_interest and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visceral] {filename}: Hero section lacks visual appeal. Consider gradients or subtle animations.")
-
-        # Behavioral: Instant feedback and usability
-        if 'onClick' in content or '@click' in content or 'onclick' in content:
-            has_feedback = re.search(r'transition|animate|hover:|focus:|disabled|loading|spinner', content, re.IGNORECASE)
-            has_state_change = re.search(r'setState|useState|disabled|loading', content)
-
-            if not has_feedback and not has_state_change:
-                self.warnings.append(f"[Behavioral] {filename}: Interactive elements lack immediate feedback. Add hover/focus/disabled states.")
-
-        # Reflective: Brand story, values, identity
-        has_reflective = bool(re.search(r'about|story|mission|values|why we|our journey|testimonials', content, re.IGNORECASE))
-        if has_long_text and not has_reflective:
-            self.warnings.append(f"[Reflective] {filename}: Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.")
-
-        # --- 1.6 TRUST BUILDING (Enhanced) ---
-
-        # Security signals
-        if has_form:
-            security_signals = re.findall(r'ssl|secure|encrypt|lock|padlock|https', content, re.IGNORECASE)
-            if len(security_signals) == 0 and not re.search(r'checkout|payment', content, re.IGNORECASE):
-                self.warnings.append(f"[Trust] {filename}: Form without security indicators. Add 'SSL Secure' or lock icon.")
-
-        # Social proof elements
-        social_proof = re.findall(r'review|testimonial|rating|star|trust|trusted by|customer|logo', content, re.IGNORECASE)
-        if len(social_proof) > 0:
-            self.passed_count += 1
-        else:
-            if has_long_text:
-                self.warnings.append(f"[Trust] {filename}: No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.")
-
-        # Authority indicators
-        has_footer = bool(re.search(r'footer|<footer', content, re.IGNORECASE))
-        if has_footer:
-            authority = re.findall(r'certif|award|media|press|featured|as seen in', content, re.IGNORECASE)
-            if len(authority) == 0:
-                self.warnings.append(f"[Trust] {filename}: Footer lacks authority signals. Add certifications, awards, or media mentions.")
-
-        # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
-
-        # Progressive disclosure
-        if complex_elements > 5:
-            has_progressive = re.search(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', content, re.IGNORECASE)
-            if not has_progressive:
-                self.warnings.append(f"[Cognitive Load] {filename}: Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.")
-
-        # Visual noise check
-        has_many_colors = len(re.findall(r'#[0-9a-fA-F]{3,6}|rgb|hsl', content)) > 15
-        has_many_borders = len(re.findall(r'border:|border-', content)) > 10
-        if has_many_colors and has_many_borders:
-            self.warnings.append(f"[Cognitive Load] {filename}: High visual noise detected. Many colors and borders increase cognitive load.")
-
-        # Familiar patterns
-        if has_form:
-            has_standard_labels = bool(re.search(r'<label|placeholder|aria-label', content, re.IGNORECASE))
-            if not has_standard_labels:
-                self.issues.append(f"[Cognitive Load] {filename}: Form inputs without labels. Use <label> for accessibility and clarity.")
-
-        # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
-
-        # Smart defaults
-        if has_form:
-            has_defaults = bool(re.search(r'checked|selected|default|value=["\'].*["\']', content))
-            radio_inputs = len(re.findall(r'type=["\']radio', content, re.IGNORECASE))
-            if radio_inputs > 0 and not has_defaults:
-                self.warnings.append(f"[Persuasion] {filename}: Radio buttons without default selection. Pre-select recommended option.")
-
-        # Anchoring (showing original price)
-        if re.search(r'price|pricing|cost|\$\d+', content, re.IGNORECASE):
-            has_anchor = bool(re.search(r'original|was|strike|del|save \d+%', content, re.IGNORECASE))
-            if not has_anchor:
-                self.warnings.append(f"[Persuasion] {filename}: Prices without anchoring. Show original price to frame discount value.")
-
-        # Social proof live indicators
-        has_social = bool(re.search(r'join|subscriber|member|user', content, re.IGNORECASE))
-        if has_social:
-            has_count = bool(re.findall(r'\d+[+kmb]|\d+,\d+', content))
-            if not has_count:
-                self.warnings.append(f"[Persuasion] {filename}: Social proof without specific numbers. Use 'Join 10,000+' format.")
-
-        # Progress indicators
-        if has_form:
-            has_progress = bool(re.search(r'progress|step \d+|complete|%|bar', content, re.IGNORECASE))
-            if complex_elements > 5 and not has_progress:
-                self.warnings.append(f"[Persuasion] {filename}: Long form without progress indicator. Add progress bar or 'Step X of Y'.")
-
-        # --- 2. TYPOGRAPHY SYSTEM (Complete Coverage) ---
-
-        # 2.1 Font Pairing - Too many font families
-        font_families = set()
-        # Check for @font-face, Google Fonts, font-family declarations
-        font_faces = re.findall(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', content, re.IGNORECASE)
-        google_fonts = re.findall(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', content, re.IGNORECASE)
-        font_family_css = re.findall(r'font-family:\s*([^;]+)', content, re.IGNORECASE)
-
-        for font in font_faces: font_families.add(font.strip().lower())
-        for font in google_fonts:
-            for f in font.replace('+', ' ').split('|'):
-                font_families.add(f.split(':')[0].strip().lower())
-        for family in font_family_css:
-            # Extract first font from stack
-            first_font = family.split(',')[0].strip().strip('"\'')
-
-            if first_font.lower() not in {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}:
-                font_families.add(first_font.lower())
-
-        if len(font_families) > 3:
-            self.issues.append(f"[Typography] {filename}: {len(font_families)} font families detected. Limit to 2-3 for cohesion.")
-
-        # 2.2 Line Length - Character-based width
-        if has_long_text and not re.search(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', content):
-            self.warnings.append(f"[Typography] {filename}: No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].")
-
-        # 2.3 Line Height - Proper leading ratios
-        # Check for text without proper line-height
-        text_elements = len(re.findall(r'<p|<span|<div.*text|<h[1-6]', content, re.IGNORECASE))
-        if text_elements > 0 and not re.search(r'leading-|line-height:', content):
-            self.warnings.append(f"[Typography] {filename}: Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3")
-
-        # Check for heading-specific line height issues
-        if re.search(r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', content, re.IGNORECASE):
-            # Extract line-height values
-            line_heights = re.findall(r'(?:leading-|line-height:\s*)([\d.]+)', content)
-            for lh in line_heights:
-                if float(lh) > 1.5:
-                    self.warnings.append(f"[Typography] {filename}: Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).")
-
-        # 2.4 Letter Spacing (Tracking)
-        # Uppercase without tracking
-        if re.search(r'uppercase|text-transform:\s*uppercase', content, re.IGNORECASE):
-            if not re.search(r'tracking-|letter-spacing:', content):
-                self.warnings.append(f"[Typography] {filename}: Uppercase text without tracking. ALL CAPS needs +5-10% spacing.")
-
-        # Large text (display/hero) should have negative tracking
-        if re.search(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', content):
-            if not re.search(r'tracking-tight|letter-spacing:\s*-[0-9]', content):
-                self.warnings.append(f"[Typography] {filename}: Large display text without tracking-tight. Big text needs -1% to -4% spacing.")
-
-        # 2.5 Weight and Emphasis - Contrast levels
-        # Check for adjacent weight levels (poor contrast)
-        weights = re.findall(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', content, re.IGNORECASE)
-        weight_values = []
-        for w in weights:
-            val = w[0] or w[1]
-            if val:
-                # Map named weights to numbers
-                weight_map = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
-                val = weight_map.get(val.lower(), val)
-                try:
-                    weight_values.append(int(val))
-                except: pass
-
-        # Check for adjacent weights (400/500, 500/600, etc.)
-        for i in range(len(weight_values) - 1):
-            diff = abs(weight_values[i] - weight_values[i+1])
-            if diff == 100:
-                self.warnings.append(f"[Typography] {filename}: Adjacent font weights ({weight_values[i]}/{weight_values[i+1]}). Skip at least 2 levels for contrast.")
-
-        # Too many weight levels
-        unique_weights = set(weight_values)
-        if len(unique_weights) > 4:
-            self.warnings.append(f"[Typography] {filename}: {len(unique_weights)} font weights. Limit to 3-4 per page.")
-
-        # 2.6 Responsive Typography - Fluid sizing with clamp()
-        has_font_sizes = bool(re.search(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', content))
-        if has_font_sizes and not re.search(r'clamp\(|responsive:', content):
-            self.warnings.append(f"[Typography] {filename}: Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)")
-
-        # 2.7 Hierarchy - Heading structure
-        headings = re.findall(r'<(h[1-6])', content, re.IGNORECASE)
-        if headings:
-            # Check for skipped levels (h1 -> h3)
-            for i in range(len(headings) - 1):
-                curr = int(headings[i][1])
-                next_h = int(headings[i+1][1])
-                if next_h > curr + 1:
-                    self.warnings.append(f"[Typography] {filename}: Skipped heading level (h{curr} -> h{next_h}). Maintain sequential hierarchy.")
-
-            # Check if h1 exists for main content
-            if 'h1' not in [h.lower() for h in headings] and has_long_text:
-                self.warnings.append(f"[Typography] {filename}: No h1 found. Each page should have one primary heading.")
-
-        # 2.8 Modular Scale - Consistent sizing
-        # Extract font-size values
-        font_sizes = re.findall(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', content)
-        size_values = []
-        for size, unit in font_sizes:
-            if unit == 'rem' or unit == 'em':
-                size_values.append(float(size))
-            elif unit == 'px':
-                size_values.append(float(size) / 16)  # Normalize to rem
-
-        if len(size_values) > 2:
-            # Check if sizes follow a modular scale roughly
-            sorted_sizes = sorted(set(size_values))
-            ratios = []
-            for i in range(1, len(sorted_sizes)):
-                if sorted_sizes[i-1] > 0:
-                    ratios.append(sorted_sizes[i] / sorted_sizes[i-1])
-
-            # Common scale ratios: 1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618
-            common_ratios = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
-            for ratio in ratios[:3]:  # Check first 3 ratios
-                if not any(abs(ratio - cr) < 0.05 for cr in common_ratios):
-                    self.warnings.append(f"[Typography] {filename}: Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third).")
-                    break
-
-        # 2.9 Readability - Content chunking
-        # Check for very long paragraphs (>5 lines estimated)
-        paragraphs = re.findall(r'<p[^>]*>([^<]+)</p>', content, re.IGNORECASE)
-        for p in paragraphs:
-            word_count = len(p.split())
-            if word_count > 100:  # ~5-6 lines
-                self.warnings.append(f"[Typography] {filename}: Long paragraph detected ({word_count} words). Break into 3-4 line chunks for readability.")
-
-        # Check for missing subheadings in long content
-        if len(paragraphs) > 5:
-            subheadings = len(re.findall(r'<h[2-6]', content, re.IGNORECASE))
-            if subheadings == 0:
-                self.warnings.append(f"[Typography] {filename}: Long content without subheadings. Add h2/h3 to break up text.")
-
-        # --- 3. VISUAL EFFECTS (visual-effects.md) ---
-        
-        # Glassmorphism Check
-        if 'backdrop-filter' in content or 'blur(' in content:
-            if not re.search(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', content):
-                self.warnings.append(f"[Visual] {filename}: Blur used without semi-transparent background (Glassmorphism fail)")
-        
-        # GPU Acceleration / Performance
-        if re.search(r'@keyframes|transition:', content):
-            expensive_props = re.findall(r'width|height|top|left|right|bottom|margin|padding', content)
-            if expensive_props:
-                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible.")
-            
-            # Reduced Motion
-            if not re.search(r'prefers-reduced-motion', content):
-                self.warnings.append(f"[Accessibility] {filename}: Animations found without prefers-reduced-motion check")
-
-        # Natural Shadows
-        shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in shadows:
-            # Check if natural (Y > X) or multiple layers
-            if ',' not in shadow and not re.search(r'\d+px\s+[1-9]\d*px', shadow): # Simple heuristic for Y-offset
-                 self.warnings.append(f"[Visual] {filename}: Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.")
-
-        # --- 3.1 NEOMORPHISM CHECK ---
-        # Check for neomorphism patterns (dual shadows with opposite directions)
-        neo_shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in neo_shadows:
-            # Neomorphism has two shadows: positive offset + negative offset
-            if ',' in shadow and '-' in shadow:
-                # Check for inset pattern (pressed state)
-                if 'inset' in shadow:
-                    self.warnings.append(f"[Visual] {filename}: Neomorphism inset detected. Ensure adequate contrast for accessibility.")
-
-        # --- 3.2 SHADOW HIERARCHY ---
-        # Count shadow levels to check for elevation consistency
-        shadow_count = len(shadows)
-        if shadow_count > 0:
-            # Check for shadow opacity levels (should indicate hierarchy)
-            opacities = re.findall(r'rgba?\([^)]+,\s*([\d.]+)\)', content)
-            shadow_opacities = [float(o) for o in opacities if float(o) < 0.5]
-            if shadow_count >= 3 and len(shadow_opacities) > 0:
-                # Check if there's variety in shadow opacities for different elevations
-                unique_opacities = len(set(shadow_opacities))
-                if unique_opacities < 2:
-                    self.warnings.append(f"[Visual] {filename}: All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.")
-
-        # --- 3.3 GRADIENT CHECKS ---
-        # Check for gradient usage
-        has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient|conic-gradient', content))
-        if has_gradient:
-            # Warn about mesh/aurora gradients (can be overused)
-            gradient_count = len(re.findall(r'gradient', content, re.IGNORECASE))
-            if gradient_count > 5:
-                self.warnings.append(f"[Visual] {filename}: Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration.")
-        else:
-            # Check if hero section exists without gradient
-            if has_hero and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visual] {filename}: Hero section without visual interest. Consider gradient for depth.")
-
-        # --- 3.4 BORDER EFFECTS ---
-        # Check for gradient borders or animated borders
-        has_border = bool(re.search(r'border:|border-', content))
-        if has_border:
-            # Check for overly complex borders
-            border_count = len(re.findall(r'border:', content))
-            if border_count > 8:
-                self.warnings.append(f"[Visual] {filename}: Many border declarations ({border_count}). Simplify for cleaner look.")
-
-        # --- 3.5 GLOW EFFECTS ---
-        # Check for text-shadow or multiple box-shadow layers (glow effects)
-        text_shadows = re.findall(r'text-shadow:', content)
-        for ts in text_shadows:
-            # Multiple text-shadow layers indicate glow
-            if ',' in ts:
-                self.warnings.append(f"[Visual] {filename}: Text glow effect detected. Ensure readability is maintained.")
-
-        # Check for box-shadow glow (multiple layers with 0 offset)
-        glow_shadows = re.findall(r'box-shadow:\s*[^;]*0\s+0\s+', content)
-        if len(glow_shadows) > 2:
-            self.warnings.append(f"[Visual] {filename}: Multiple glow effects detected. Use sparingly for emphasis only.")
-
-        # --- 3.6 OVERLAY TECHNIQUES ---
-        # Check for image overlays (for readability)
-        has_images = bool(re.search(r'<img|background-image:|bg-\[url', content))
-        if has_images and has_long_text:
-            has_overlay = bool(re.search(r'overlay|rgba\(0|gradient.*transparent|::after|::before', content))
-            if not has_overlay:
-                self.warnings.append(f"[Visual] {filename}: Text over image without overlay. Add gradient overlay for readability.")
-
-        # --- 3.7 PERFORMANCE: will-change ---
-        # Check for will-change usage
-        if re.search(r'will-change:', content):
-            will_change_props = re.findall(r'will-change:\s*([^;]+)', content)
-            for prop in will_change_props:
-                prop = prop.strip().lower()
-                if prop in ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']:
-                    self.issues.append(f"[Performance] {filename}: will-change on '{prop}' (layout property). Use only for transform/opacity.")
-
-        # Check for excessive will-change usage
-        will_change_count = len(re.findall(r'will-change:', content))
-        if will_change_count > 3:
-            self.warnings.append(f"[Performance] {filename}: Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations.")
-
-        # --- 3.8 EFFECT SELECTION ---
-        # Check for effect overuse (too many visual effects)
-        effect_count = (
-            (1 if has_gradient else 0) +
-            shadow_count +
-            len(re.findall(r'backdrop-filter|blur\(', content)) +
-            len(re.findall(r'text-shadow:', content))
-        )
-        if effect_count > 10:
-            self.warnings.append(f"[Visual] {filename}: Many visual effects ({effect_count}). Ensure effects serve purpose, not decoration.")
-
-        # Check for static/flat design (no depth)
-        if has_long_text and effect_count == 0:
-            self.warnings.append(f"[Visual] {filename}: Flat design with no depth. Consider shadows or subtle gradients for hierarchy.")
-
-        # --- 4. COLOR SYSTEM (color-system.md) ---
-
-        # 4.1 PURPLE BAN - Critical check from color-system.md
-        purple_hexes = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
-                        '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
-                        '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
-                        'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
-        for purple in purple_hexes:
-            if purple.lower() in content.lower():
-                self.issues.append(f"[Color] {filename}: PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
-                break
-
-        # 4.2 60-30-10 Rule check
-        # Count color usage to estimate ratio
-        color_hex_count = len(re.findall(r'#[0-9a-fA-F]{3,6}', content))
-        hsl_count = len(re.findall(r'hsl\(', content))
-        total_colors = color_hex_count + hsl_count
-        if total_colors > 3:
-            # Check for dominant colors (should be ~60%)
-            bg_declarations = re.findall(r'(?:background|bg-|bg\[)([^;}\s]+)', content)
-            text_declarations = re.findall(r'(?:color|text-)([^;}\s]+)', content)
-            if len(bg_declarations) > 0 and len(text_declarations) > 0:
-                # Just warn if too many distinct colors
-                unique_hexes = set(re.findall(r'#[0-9a-fA-F]{6}', content))
-                if len(unique_hexes) > 5:
-                    self.warnings.append(f"[Color] {filename}: {len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).")
-
-        # 4.3 Color Scheme Pattern Detection
-        # Detect monochromatic (same hue, different lightness)
-        hsl_matches = re.findall(r'hsl\((\d+),\s*\d+%,\s*\d+%\)', content)
-        if len(hsl_matches) >= 3:
-            hues = [int(h) for h in hsl_matches]
-            hue_range = max(hues) - min(hues)
-            if hue_range < 10:
-                self.warnings.append(f"[Color] {filename}: Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast.")
-
-        # 4.4 Dark Mode Compliance
-        # Check for pure black (#000000) or pure white (#FFFFFF) text (forbidden)
-        if re.search(r'color:\s*#000000|#000\b', content):
-            self.warnings.append(f"[Color] {filename}: Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.")
-        if re.search(r'background:\s*#ffffff|#fff\b', content) and re.search(r'dark:\s*|dark:', content):
-            self.warnings.append(f"[Color] {filename}: Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.")
-
-        # 4.5 WCAG Contrast Pattern Check
-        # Look for potential low-contrast combinations
-        light_bg_light_text = bool(re.search(r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', content))
-        dark_bg_dark_text = bool(re.search(r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', content))
-        if light_bg_light_text or dark_bg_dark_text:
-            self.warnings.append(f"[Color] {filename}: Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
-
-        # 4.6 Color Psychology Context Check
-        # Warn if blue used for food/restaurant context
-        has_blue = bool(re.search(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', content))
-        has_food_context = bool(re.search(r'restaurant|food|cooking|recipe|menu|dish|meal', content, re.IGNORECASE))
-        if has_blue and has_food_context:
-            self.warnings.append(f"[Color] {filename}: Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).")
-
-        # 4.7 HSL-Based Palette Detection
-        # Check if using HSL for palette (recommended in color-system.md)
-        has_color_vars = bool(re.search(r'--color-|color-|primary-|secondary-', content))
-        if has_color_vars and not re.search(r'hsl\(', content):
-            self.warnings.append(f"[Color] {filename}: Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).")
-
-        # --- 5. ANIMATION GUIDE (animation-guide.md) ---
-
-        # 5.1 Duration Appropriateness
-        # Check for excessively long or short animations
-        durations = re.findall(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', content)
-        for duration, unit in durations:
-            duration_ms = float(duration) * (1000 if unit == 's' else 1)
-            if duration_ms < 50:
-                self.warnings.append(f"[Animation] {filename}: Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
-            elif duration_ms > 1000 and 'transition' in content.lower():
-                self.warnings.append(f"[Animation] {filename}: Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
-
-        # 5.2 Easing Function Correctness
-        # Check for incorrect easing patterns
-        if re.search(r'ease-in\s+.*entry|fade-in.*ease-in', content):
-            self.warnings.append(f"[Animation] {filename}: Entry animation with ease-in. Entry should use ease-out for snappy feel.")
-        if re.search(r'ease-out\s+.*exit|fade-out.*ease-out', content):
-            self.warnings.append(f"[Animation] {filename}: Exit animation with ease-out. Exit should use ease-in for natural feel.")
-
-        # 5.3 Micro-interaction Feedback Patterns
-        # Check for interactive elements without hover/focus states
-        interactive_elements = len(re.findall(r'<button|<a\s+href|onClick|@click', content))
-        has_hover_focus = bool(re.search(r'hover:|focus:|:hover|:focus', content))
-        if interactive_elements > 2 and not has_hover_focus:
-            self.warnings.append(f"[Animation] {filename}: Interactive elements without hover/focus states. Add micro-interactions for feedback.")
-
-        # 5.4 Loading State Indicators
-        # Check for loading patterns
-        has_async = bool(re.search(r'async|await|fetch|axios|loading|isLoading', content))
-        has_loading_indicator = bool(re.search(r'skeleton|spinner|progress|loading|<circle.*animate', content))
-        if has_async and not has_loading_indicator:
-            self.warnings.append(f"[Animation] {filename}: Async operations without loading indicator. Add skeleton or spinner for perceived performance.")
-
-        # 5.5 Page Transition Patterns
-        # Check for page/view transitions
-        has_routing = bool(re.search(r'router|navigate|Link.*to|useHistory', content))
-        has_page_transition = bool(re.search(r'AnimatePresence|motion\.|transition.*page|fade.*route', content))
-        if has_routing and not has_page_transition:
-            self.warnings.append(f"[Animation] {filename}: Routing detected without page transitions. Consider fade/slide for context continuity.")
-
-        # 5.6 Scroll Animation Performance
-        # Check for scroll-driven animations
-        has_scroll_anim = bool(re.search(r'onScroll|scroll.*trigger|IntersectionObserver', content))
-        if has_scroll_anim:
-            # Check if using expensive properties in scroll handlers
-            if re.search(r'onScroll.*[^\w](width|height|top|left)', content):
-                self.issues.append(f"[Animation] {filename}: Scroll handler animating layout properties. Use transform/opacity for 60fps.")
-
-        # --- 6. MOTION GRAPHICS (motion-graphics.md) ---
-
-        # 6.1 Lottie Animation Checks
-        has_lottie = bool(re.search(r'lottie|Lottie|@lottie-react', content))
-        if has_lottie:
-            # Check for reduced motion fallback
-            has_lottie_fallback = bool(re.search(r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', content))
-            if not has_lottie_fallback:
-                self.warnings.append(f"[Motion] {filename}: Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.")
-
-        # 6.2 GSAP Memory Leak Risks
-        has_gsap = bool(re.search(r'gsap|ScrollTrigger|from\(.*gsap', content))
-        if has_gsap:
-            # Check for cleanup patterns
-            has_gsap_cleanup = bool(re.search(r'kill\(|revert\(|useEffect.*return.*gsap', content))
-            if not has_gsap_cleanup:
-                self.issues.append(f"[Motion] {filename}: GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.")
-
-        # 6.3 SVG Animation Performance
-        svg_animations = re.findall(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset', content)
-        if len(svg_animations) > 3:
-            self.warnings.append(f"[Motion] {filename}: Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.")
-
-        # 6.4 3D Transform Performance
-        has_3d_transform = bool(re.search(r'transform3d|perspective\(|rotate3d|translate3d', content))
-        if has_3d_transform:
-            # Check for perspective on parent
-            has_perspective_parent = bool(re.search(r'perspective:\s*\d+px|perspective\s*\(', content))
-            if not has_perspective_parent:
-                self.warnings.append(f"[Motion] {filename}: 3D transform without perspective parent. Add perspective: 1000px for realistic depth.")
-
-            # Warn about mobile performance
-            self.warnings.append(f"[Motion] {filename}: 3D transforms detected. Test on mobile; can impact performance on low-end devices.")
-
-        # 6.5 Particle Effect Warnings
-        # Check for canvas/WebGL particle systems
-        has_particles = bool(re.search(r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js', content))
-        if has_particles:
-            self.warnings.append(f"[Motion] {filename}: Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.")
-
-        # 6.6 Scroll-Driven Animation Performance
-        has_scroll_driven = bool(re.search(r'IntersectionObserver.*animate|scroll.*progress|view-timeline', content))
-        if has_scroll_driven:
-            # Check for throttling/debouncing
-            has_throttle = bool(re.search(r'throttle|debounce|requestAnimationFrame', content))
-            if not has_throttle:
-                self.issues.append(f"[Motion] {filename}: Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.")
-
-        # 6.7 Motion Decision Tree - Context Check
-        # Check if animation serves purpose (not just decoration)
-        total_animations = (
-            len(re.findall(r'@keyframes|transition:|animate-', content)) +
-            (1 if has_lottie else 0) +
-            (1 if has_gsap else 0)
-        )
-        if total_animations > 5:
-            # Check if animations are functional
-            functional_animations = len(re.findall(r'hover:|focus:|disabled|loading|error|success', content))
-            if functional_animations < total_animations / 2:
-                self.warnings.append(f"[Motion] {filename}: Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration.")
-
-        # --- 7. ACCESSIBILITY ---
-        if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
-            self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
-
-    def audit_directory(self, directory: str) -> None:
+        facts = FileFacts(os.path.basename(filepath), PATTERNS.scan(content))
+        for rule in self.rules:
+            for fields in rule.evaluate(facts):
+                if rule.level == "pass":
+                    self.passed_count += 1
+                    continue
+                template = rule.message[fields['variant']] if isinstance(rule.message, dict) else rule.message
+                target = self.issues if rule.level == "issue" else self.warnings
+                target.append(f"[{rule.tag}] {facts.filename}: {template.format(**fields)}")
+
+    def audit_directory(self, directory: str, cancelled: Optional[Callable[[], bool]] = None) -> None:
+        """Audit every UI file under `directory`; stops with CheckCancelled once `cancelled()` is True."""
         extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        inventory = get_inventory(directory)
+        for entry in inventory.files(exts=extensions, skip_dirs={'node_modules', '.git', 'dist', 'build', '.next'}):
+            if cancelled is not None and cancelled():
+                raise CheckCancelled("UX audit cancelled")
+            try:
+                content = inventory.read_text(entry, errors='replace')
+            except OSError:
+                continue
+            self.audit_file(str(inventory.path(entry)), content)
 
     def get_report(self):
         return {
@@ -688,6 +771,21 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
+def run(context: CheckContext) -> Findings:
+    """Plugin entry point for verify_all/checklist; same verdict as main()."""
+    auditor = UXAuditor()
+    auditor.audit_directory(str(context.project_path), cancelled=lambda: context.cancelled)
+    report = auditor.get_report()
+    findings = ([parse_tagged(i, "high") for i in report['issues']] +
+                [parse_tagged(w, "low") for w in report['warnings']])
+    return Findings(
+        passed=report['compliant'],
+        findings=findings,
+        summary=(f"{report['files_checked']} files checked, "
+                 f"{len(report['issues'])} issue(s), {len(report['warnings'])} warning(s)"),
+        data=report,
+    )
+
 def main():
     if len(sys.argv) < 2: sys.exit(1)
     
@@ -21,6 +21,12 @@ import re
 import json
 from pathlib import Path
 
+# Shared file inventory and checker plugin API (.agent/scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from checker_api import CheckContext, Finding, Findings
+from markup_scan import Markup
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -43,6 +49,9 @@ SKIP_FILES = {
     'tailwind.config', 'postcss.config', 'next.config'
 }
 
+# Average page score (%) a project needs to pass
+PASS_SCORE = 60
+
 
 def is_page_file(file_path: Path) -> bool:
     """Check if this file is likely a public-facing page."""
@@ -80,14 +89,13 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_web_pages(project_path: Path) -> list:
     """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+    inventory = get_inventory(project_path)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
+    for ext in ['.html', '.htm', '.jsx', '.tsx']:
+        # Skip excluded directories
+        for entry in inventory.files(exts={ext}, skip_dirs=SKIP_DIRS):
+            f = inventory.path(entry)
             
             # Check if it's likely a page
             if is_page_file(f):
@@ -99,12 +107,13 @@ def find_web_pages(project_path: Path) -> list:
 def check_page(file_path: Path) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
     issues = []
     passed = []
+    markup = Markup(content)
     
     # 1. JSON-LD Structured Data (Critical for AI)
     if 'application/ld+json' in content:
@@ -120,8 +129,8 @@ def check_page(file_path: Path) -> dict:
         issues.append("No JSON-LD structured data (AI engines prefer structured content)")
     
     # 2. Heading Structure
-    h1_count = len(re.findall(r'<h1[^>]*>', content, re.I))
-    h2_count = len(re.findall(r'<h2[^>]*>', content, re.I))
+    h1_count = markup.count('h1')
+    h2_count = markup.count('h2')
     
     if h1_count == 1:
         passed.append("Single H1 heading (clear topic)")
@@ -158,12 +167,12 @@ def check_page(file_path: Path) -> dict:
         passed.append("FAQ section detected (highly citable)")
     
     # 6. Lists (Structured content)
-    list_count = len(re.findall(r'<(ul|ol)[^>]*>', content, re.I))
+    list_count = markup.count('ul', 'ol')
     if list_count >= 2:
         passed.append(f"{list_count} lists (structured content)")
     
     # 7. Tables (Comparison data)
-    table_count = len(re.findall(r'<table[^>]*>', content, re.I))
+    table_count = markup.count('table')
     if table_count >= 1:
         passed.append(f"{table_count} table(s) (comparison data)")
     
@@ -172,10 +181,13 @@ def check_page(file_path: Path) -> dict:
         r'"@type"\s*:\s*"Organization"',
         r'"@type"\s*:\s*"LocalBusiness"', 
         r'"@type"\s*:\s*"Brand"',
-        r'itemtype.*schema\.org/(Organization|Person|Brand)',
         r'rel="author"'
     ]
     has_entity = any(re.search(p, content, re.I) for p in entity_patterns)
+    # Microdata: itemtype="https://schema.org/Organization" on the element itself
+    has_entity = has_entity or any(
+        re.search(r'schema\.org/(Organization|Person|Brand)', el.get('itemtype') or '', re.I)
+        for el in markup.elements)
     if has_entity:
         passed.append("Entity/Brand recognition (E-E-A-T)")
     
@@ -219,6 +231,32 @@ def check_page(file_path: Path) -> dict:
     }
 
 
+def run(context: CheckContext) -> Findings:
+    """Plugin entry point for verify_all/checklist; same verdict as main()."""
+    pages = find_web_pages(context.project_path)
+    if not pages:
+        return Findings(True, summary="No public web pages found", data={"pages_checked": 0})
+
+    results = []
+    for page in pages:
+        context.raise_if_cancelled()
+        results.append(check_page(page))
+    findings = []
+    for page, result in zip(pages, results):
+        severity = "low" if result['score'] >= PASS_SCORE else "medium"
+        for issue in result['issues']:
+            findings.append(Finding(issue, severity, file=context.relpath(page), rule="geo"))
+
+    avg_score = sum(r['score'] for r in results) / len(results)
+    return Findings(
+        passed=avg_score >= PASS_SCORE,
+        findings=findings,
+        summary=f"Average GEO score {avg_score:.0f}% over {len(results)} page(s)",
+        data={"pages_checked": len(results), "average_score": round(avg_score),
+              "scores": {context.relpath(p): r['score'] for p, r in zip(pages, results)}},
+    )
+
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     target_path = Path(target).resolve()
@@ -250,9 +288,9 @@ def main():
     
     # Print results
     for result in results:
-        status = "[OK]" if result['score'] >= 60 else "[!]"
+        status = "[OK]" if result['score'] >= PASS_SCORE else "[!]"
         print(f"{status} {result['file']}: {result['score']}%")
-        if result['issues'] and result['score'] < 60:
+        if result['issues'] and result['score'] < PASS_SCORE:
             for issue in result['issues'][:2]:  # Show max 2 issues
                 print(f"    - {issue}")
     
@@ -278,11 +316,11 @@ def main():
         "project": str(target_path),
         "pages_checked": len(results),
         "average_score": round(avg_score),
-        "passed": avg_score >= 60
+        "passed": avg_score >= PASS_SCORE
     }
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if avg_score >= 60 else 1)
+    sys.exit(0 if avg_score >= PASS_SCORE else 1)
 
 
 if __name__ == "__main__":
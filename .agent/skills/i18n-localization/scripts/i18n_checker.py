@@ -8,6 +8,11 @@ import re
 import json
 from pathlib import Path
 
+# Shared file inventory and checker plugin API (.agent/scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from checker_api import CheckContext, Finding, Findings
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -50,22 +55,20 @@ I18N_PATTERNS = [
     r'i18n\.',             # Generic i18n
 ]
 
+LOCALE_DIRS = {'locales', 'translations', 'lang', 'i18n'}  # any depth below
+
+def is_locale_file(entry) -> bool:
+    dirs = entry.parts[:-1]
+    if entry.ext == '.po':  # gettext
+        return True
+    if entry.ext != '.json':
+        return False
+    return any(d in LOCALE_DIRS for d in dirs) or (bool(dirs) and dirs[-1] == 'messages')
+
 def find_locale_files(project_path: Path) -> list:
     """Find translation/locale files."""
-    patterns = [
-        "**/locales/**/*.json",
-        "**/translations/**/*.json",
-        "**/lang/**/*.json",
-        "**/i18n/**/*.json",
-        "**/messages/*.json",
-        "**/*.po",  # gettext
-    ]
-    
-    files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
-    
-    return [f for f in files if 'node_modules' not in str(f)]
+    inventory = get_inventory(project_path)
+    return [inventory.path(e) for e in inventory.files(where=is_locale_file)]
 
 def check_locale_completeness(locale_files: list) -> dict:
     """Check if all locales have the same keys."""
@@ -81,7 +84,7 @@ def check_locale_completeness(locale_files: list) -> dict:
         if f.suffix == '.json':
             try:
                 lang = f.parent.name
-                content = json.loads(f.read_text(encoding='utf-8'))
+                content = json.loads(read_text(f, errors='strict'))
                 if lang not in locales:
                     locales[lang] = {}
                 locales[lang][f.stem] = set(flatten_keys(content))
@@ -140,12 +143,11 @@ def check_hardcoded_strings(project_path: Path) -> dict:
         '.py': 'python'
     }
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
-    
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    inventory = get_inventory(project_path)
+    code_files = [inventory.path(e) for e in inventory.files(
+        exts=extensions,
+        where=lambda e: not any(x in e.rel for x in
+                                ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec']))]
     
     if not code_files:
         return {'passed': ["[!] No code files found"], 'issues': []}
@@ -156,7 +158,7 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     for file_path in code_files[:50]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path)
             ext = file_path.suffix
             file_type = extensions.get(ext, 'jsx')
             
@@ -196,6 +198,28 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
+def _status_finding(item: str) -> Finding:
+    """Finding from an `[X]` / `[!]` / `→` status line."""
+    if item.startswith("[X]"):
+        return Finding(item[3:].strip(), "high", rule="i18n")
+    if item.startswith("[!]"):
+        return Finding(item[3:].strip(), "low", rule="i18n")
+    return Finding(item.strip().lstrip("→ "), "info", rule="i18n")
+
+def run(context: CheckContext) -> Findings:
+    """Plugin entry point for verify_all/checklist; same verdict as main()."""
+    locale_result = check_locale_completeness(find_locale_files(context.project_path))
+    code_result = check_hardcoded_strings(context.project_path)
+    
+    issues = locale_result['issues'] + code_result['issues']
+    critical_issues = sum(1 for i in issues if i.startswith("[X]"))
+    return Findings(
+        passed=critical_issues == 0,
+        findings=[_status_finding(i) for i in issues],
+        summary=f"{critical_issues} i18n issue(s)",
+        data={"locales": locale_result, "code": code_result},
+    )
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     project_path = Path(target)
@@ -8,6 +8,11 @@ import re
 import subprocess
 from pathlib import Path
 
+# Shared file inventory and checker plugin API (.agent/scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from checker_api import CheckContext, Finding, Findings
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -21,15 +26,15 @@ def check_typescript_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
-    ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
+    inventory = get_inventory(project_path)
+    ts_files = [inventory.path(e) for e in inventory.files(exts={'.ts', '.tsx'}, where=lambda e: '.d.ts' not in e.rel)]
     
     if not ts_files:
         return {'type': 'typescript', 'files': 0, 'passed': [], 'issues': ["[!] No TypeScript files found"], 'stats': stats}
     
     for file_path in ts_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path)
             
             # Count 'any' usage
             any_matches = re.findall(r':\s*any\b', content)
@@ -77,15 +82,15 @@ def check_python_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
-    py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
+    inventory = get_inventory(project_path)
+    py_files = [inventory.path(e) for e in inventory.files(exts={'.py'}, where=lambda e: 'venv' not in e.rel)]
     
     if not py_files:
         return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
     
     for file_path in py_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path)
             
             # Count Any usage
             any_matches = re.findall(r':\s*Any\b', content)
@@ -125,6 +130,26 @@ def check_python_coverage(project_path: Path) -> dict:
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
+def run(context: CheckContext) -> Findings:
+    """Plugin entry point for verify_all/checklist; same verdict as main()."""
+    results = [r for r in (check_typescript_coverage(context.project_path),
+                           check_python_coverage(context.project_path)) if r['files'] > 0]
+    
+    findings = []
+    for result in results:
+        for item in result['issues']:
+            severity = "high" if item.startswith("[X]") else "low"
+            findings.append(Finding(item[3:].strip(), severity, rule=f"types/{result['type']}"))
+    
+    critical_issues = sum(1 for f in findings if f.severity == "high")
+    return Findings(
+        passed=critical_issues == 0,
+        findings=findings,
+        summary=f"{critical_issues} critical type coverage issue(s)" if results
+                else "No TypeScript or Python files found",
+        data={r['type']: r for r in results},
+    )
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     project_path = Path(target)
@@ -19,10 +19,15 @@ Usage:
 """
 import sys
 import json
-import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared file inventory and checker plugin API (.agent/scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from checker_api import CheckContext, Finding, Findings
+from markup_scan import Markup
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -77,14 +82,13 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_pages(project_path: Path) -> list:
     """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+    inventory = get_inventory(project_path)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
+    for ext in ['.html', '.htm', '.jsx', '.tsx']:
+        # Skip excluded directories
+        for entry in inventory.files(exts={ext}, skip_dirs=SKIP_DIRS):
+            f = inventory.path(entry)
             
             # Check if it's likely a page
             if is_page_file(f):
@@ -98,10 +102,12 @@ def check_page(file_path: Path) -> dict:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
+    markup = Markup(content)
+    
     # Detect if this is a layout/template file (has Head component)
     is_layout = 'Head>' in content or '<head' in content.lower()
     
@@ -121,18 +127,16 @@ def check_page(file_path: Path) -> dict:
         issues.append("Missing Open Graph tags")
     
     # 4. Heading hierarchy - multiple H1s
-    h1_matches = re.findall(r'<h1[^>]*>', content, re.I)
-    if len(h1_matches) > 1:
-        issues.append(f"Multiple H1 tags ({len(h1_matches)})")
+    h1_count = markup.count('h1')
+    if h1_count > 1:
+        issues.append(f"Multiple H1 tags ({h1_count})")
     
     # 5. Images without alt
-    img_pattern = r'<img[^>]+>'
-    imgs = re.findall(img_pattern, content, re.I)
-    for img in imgs:
-        if 'alt=' not in img.lower():
+    for img in markup.find('img'):
+        if not img.has('alt'):
             issues.append("Image missing alt attribute")
             break
-        if 'alt=""' in img or "alt=''" in img:
+        if img.get('alt') == '':
             issues.append("Image has empty alt attribute")
             break
     
@@ -145,6 +149,23 @@ def check_page(file_path: Path) -> dict:
     }
 
 
+def run(context: CheckContext) -> Findings:
+    """Plugin entry point for verify_all/checklist; same verdict as main()."""
+    pages = find_pages(context.project_path)
+    findings = []
+    for f in pages:
+        context.raise_if_cancelled()
+        for issue in check_page(f)["issues"]:
+            findings.append(Finding(issue, "medium", file=context.relpath(f), rule="seo"))
+
+    return Findings(
+        passed=not findings,
+        findings=findings,
+        summary=f"{len(pages)} page(s) checked, {len(findings)} SEO issue(s)",
+        data={"files_checked": len(pages), "issues_found": len(findings)},
+    )
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
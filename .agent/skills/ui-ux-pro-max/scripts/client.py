@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Client - the part of search.py that talks to the daemon
+
+A search answered by the daemon costs well under a millisecond, so the
+client's own start-up is the CLI's latency: this module imports only the
+standard library pieces it needs (no core, no pathlib, no CSV data) and
+holds the static domain and stack names search.py offers on its command
+line. They must match core.PROFILES; test_uiux_search.py checks that.
+"""
+
+import hashlib
+import json
+import os
+import socket
+
+# ============ CONFIGURATION ============
+SCRIPTS_DIR = os.path.dirname(os.path.realpath(__file__))
+# Same directory as core.INDEX_DIR (.agent/.cache/ui-ux-pro-max)
+INDEX_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(SCRIPTS_DIR))), ".cache", "ui-ux-pro-max")
+
+CLIENT_TIMEOUT = 10.0      # seconds a client waits for an answer before searching itself
+
+DEFAULT_PROFILE = "skills"
+MAX_RESULTS = 3
+
+_STACKS = ["html-tailwind", "react", "nextjs", "astro", "vue", "nuxtjs", "nuxt-ui", "svelte", "swiftui",
+           "react-native", "flutter", "shadcn", "jetpack-compose"]
+
+# Domain and stack choices per profile, in core's order
+DOMAINS = {
+    "skills": ["style", "color", "chart", "landing", "product", "ux", "typography", "icons", "react", "web"],
+    "shared": ["style", "prompt", "color", "chart", "landing", "product", "ux", "typography", "icons", "react", "web"],
+}
+STACKS = {
+    "skills": _STACKS,
+    "shared": [stack for stack in _STACKS if stack != "astro"],
+}
+
+
+# ============ CLIENT ============
+class DaemonUnavailable(Exception):
+    """No daemon answered the request; search in-process instead"""
+
+
+def default_socket():
+    """Socket of this copy of the scripts ($UIUX_SEARCH_SOCKET overrides it)"""
+    if os.environ.get("UIUX_SEARCH_SOCKET"):
+        return os.environ["UIUX_SEARCH_SOCKET"]
+    key = hashlib.sha1(SCRIPTS_DIR.encode("utf-8")).hexdigest()[:10]
+    path = os.path.join(INDEX_DIR, f"search-{key}.sock")
+    if len(os.fsencode(path)) >= 100:      # sun_path holds 104-108 bytes
+        import tempfile
+        user = f"{os.getuid()}-" if hasattr(os, "getuid") else ""
+        path = os.path.join(tempfile.gettempdir(), f"ui-ux-pro-max-{user}{key}.sock")
+    return path
+
+
+def request(op, args=None, socket_path=None, timeout=CLIENT_TIMEOUT):
+    """The daemon's result for one request, or DaemonUnavailable"""
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailable("Unix domain sockets are not available")
+    path = str(socket_path or default_socket())
+    message = json.dumps({"op": op, "args": args or {}}, ensure_ascii=False).encode("utf-8") + b"\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(message)
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        response = json.loads(line)
+    except (OSError, ValueError) as e:
+        raise DaemonUnavailable(str(e)) from e
+    if not response.get("ok"):
+        raise DaemonUnavailable(response.get("error", "request failed"))
+    return response["result"]
@@ -2,18 +2,49 @@
 # -*- coding: utf-8 -*-
 """
 UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
+
+Each CSV (domain or stack) is tokenized and fitted once into a search
+index that is pickled under .agent/.cache/ui-ux-pro-max/ and loaded at
+most once per process; it is rebuilt when the CSV's content changes.
+A query only scores against the loaded index.
+
+The engine serves two profiles: "skills" (this skill's data) and
+"shared" (.agent/.shared/ui-ux-pro-max/data, with a prompt domain and its
+own style and color columns). Indexes are keyed by CSV content, so the
+files both profiles have in common are parsed and held in memory once.
 """
 
 import csv
+import hashlib
+import heapq
+import os
+import pickle
 import re
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+# NumPy is imported by the first query worth vectorizing (see _load_numpy):
+# the import alone costs more than a whole CLI search
+np = None
+NUMPY_AVAILABLE = None      # unknown until then
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
 MAX_RESULTS = 3
 
+# Prebuilt indexes (one pickle per CSV content and search-column set)
+INDEX_DIR = Path(__file__).resolve().parents[3] / ".cache" / "ui-ux-pro-max"
+INDEX_VERSION = 3   # bump when tokenize() or the index layout changes
+
+# Batches of at least this many searches may be spread over worker processes
+PARALLEL_MIN_SEARCHES = 256
+
+# Matched postings from which top_k_many() scores a query with NumPy by
+# default (and at least 1/8 of the corpus: zeroing and ranking a dense score
+# array only pays off when the query touches a good share of documents)
+VECTORIZE_MIN_POSTINGS = 10000
+
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
@@ -91,20 +122,123 @@ _STACK_COLS = {
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
+DOMAIN_KEYWORDS = {
+    "color": ["color", "palette", "hex", "#", "rgb"],
+    "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
+    "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
+    "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
+    "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora", "prompt", "css", "implementation", "variable", "checklist", "tailwind"],
+    "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
+    "typography": ["font", "typography", "heading", "serif", "sans"],
+    "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
+    "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
+    "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
+}
+
+
+def _insert_before(mapping, key, new_key, value):
+    """Copy of mapping with new_key: value placed just before key"""
+    items = []
+    for k, v in mapping.items():
+        if k == key:
+            items.append((new_key, value))
+        items.append((k, v))
+    return dict(items)
+
+
+# ============ SHARED PROFILE ============
+# The .agent/.shared copy of the data: styles without the prompt columns
+# (those live in prompts.csv, the "prompt" domain), colors with keywords
+# and borders, no astro stack
+SHARED_DATA_DIR = Path(__file__).resolve().parents[3] / ".shared" / "ui-ux-pro-max" / "data"
+
+SHARED_CSV_CONFIG = _insert_before({
+    **CSV_CONFIG,
+    "style": {
+        "file": "styles.csv",
+        "search_cols": ["Style Category", "Keywords", "Best For", "Type"],
+        "output_cols": ["Style Category", "Type", "Keywords", "Primary Colors", "Effects & Animation", "Best For", "Performance", "Accessibility", "Framework Compatibility", "Complexity"]
+    },
+    "color": {
+        "file": "colors.csv",
+        "search_cols": ["Product Type", "Keywords", "Notes"],
+        "output_cols": ["Product Type", "Keywords", "Primary (Hex)", "Secondary (Hex)", "CTA (Hex)", "Background (Hex)", "Text (Hex)", "Border (Hex)", "Notes"]
+    }
+}, "color", "prompt", {
+    "file": "prompts.csv",
+    "search_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords"],
+    "output_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords", "Implementation Checklist"]
+})
+
+SHARED_STACK_CONFIG = {stack: config for stack, config in STACK_CONFIG.items() if stack != "astro"}
+
+_PROMPT_KEYWORDS = ["prompt", "css", "implementation", "variable", "checklist", "tailwind"]
+SHARED_DOMAIN_KEYWORDS = _insert_before({
+    **DOMAIN_KEYWORDS,
+    "style": [kw for kw in DOMAIN_KEYWORDS["style"] if kw not in _PROMPT_KEYWORDS]
+}, "style", "prompt", _PROMPT_KEYWORDS)
+
+
+# ============ PROFILES ============
+class Profile:
+    """One configuration of the engine: data directory, domains, stacks and domain keywords"""
+
+    def __init__(self, name, data_dir, csv_config, stack_config, domain_keywords):
+        self.name = name
+        self.data_dir = data_dir
+        self.csv_config = csv_config
+        self.stack_config = stack_config
+        self.domain_keywords = domain_keywords
+        self.stacks = list(stack_config.keys())
+
+    def sources(self):
+        """(CSV path, search columns) of every domain and stack"""
+        sources = [(self.data_dir / c["file"], c["search_cols"]) for c in self.csv_config.values()]
+        sources += [(self.data_dir / c["file"], _STACK_COLS["search_cols"]) for c in self.stack_config.values()]
+        return sources
+
+
+PROFILES = {
+    "skills": Profile("skills", DATA_DIR, CSV_CONFIG, STACK_CONFIG, DOMAIN_KEYWORDS),
+    "shared": Profile("shared", SHARED_DATA_DIR, SHARED_CSV_CONFIG, SHARED_STACK_CONFIG, SHARED_DOMAIN_KEYWORDS),
+}
+DEFAULT_PROFILE = "skills"
+
+
+def get_profile(profile=DEFAULT_PROFILE):
+    """Profile by name (a Profile is returned as is)"""
+    if isinstance(profile, Profile):
+        return profile
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile: {profile}. Available: {', '.join(PROFILES)}")
+    return PROFILES[profile]
+
 
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
-    """BM25 ranking algorithm for text search"""
+    """
+    BM25 ranking algorithm for text search.
+
+    fit() builds an inverted index: for every term, the documents that
+    contain it and the term's finished BM25 contribution to each (term
+    frequency and length normalization are folded in at fit time). A
+    query walks only the postings of its own terms, so its cost grows
+    with the matches rather than the corpus, and top_k() selects with a
+    heap instead of sorting every document. With NumPy installed,
+    top_k_many() scores queries that match much of a large corpus with
+    vectorized adds; scores are bit-identical either way.
+    """
 
     def __init__(self, k1=1.5, b=0.75):
         self.k1 = k1
         self.b = b
-        self.corpus = []
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}      # term -> ([doc index, ...], [contribution, ...])
         self.N = 0
+        self._arrays = None     # postings as NumPy arrays, built on first use
 
     def tokenize(self, text):
         """Lowercase, split, remove punctuation, filter short words"""
@@ -113,46 +247,228 @@ class BM25:
 
     def fit(self, documents):
         """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        corpus = [self.tokenize(doc) for doc in documents]
+        self.N = len(corpus)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
+        self.doc_lengths = [len(doc) for doc in corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+        term_freqs = [Counter(doc) for doc in corpus]
+        for counts in term_freqs:
+            for word in counts:
+                self.doc_freqs[word] += 1
 
         for word, freq in self.doc_freqs.items():
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
-
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
-
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+        for idx, counts in enumerate(term_freqs):
+            if not counts:
+                continue
+            norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[idx] / self.avgdl)
+            for word, tf in counts.items():
+                docs, weights = self.postings.setdefault(word, ([], []))
+                docs.append(idx)
+                weights.append(self.idf[word] * (tf * (self.k1 + 1)) / (tf + norm))
+
+    def state(self):
+        """Fitted data as plain values (for pickling without this class)."""
+        return {"k1": self.k1, "b": self.b, "doc_lengths": self.doc_lengths, "avgdl": self.avgdl,
+                "idf": self.idf, "doc_freqs": dict(self.doc_freqs), "postings": self.postings, "N": self.N}
+
+    @classmethod
+    def from_state(cls, state):
+        bm25 = cls(state["k1"], state["b"])
+        bm25.doc_lengths = state["doc_lengths"]
+        bm25.avgdl = state["avgdl"]
+        bm25.idf = state["idf"]
+        bm25.doc_freqs = defaultdict(int, state["doc_freqs"])
+        bm25.postings = state["postings"]
+        bm25.N = state["N"]
+        return bm25
+
+    def _accumulate(self, query_tokens):
+        """Score of every document matching a query term (all scores > 0)"""
+        scores = {}
+        for token in query_tokens:
+            posting = self.postings.get(token)
+            if posting:
+                for idx, weight in zip(*posting):
+                    scores[idx] = scores.get(idx, 0) + weight
+        return scores
 
-            scores.append((idx, score))
-
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+    def score(self, query):
+        """Score all documents against query, best first"""
+        scores = self._accumulate(self.tokenize(query))
+        return sorted(((idx, scores.get(idx, 0)) for idx in range(self.N)), key=lambda x: x[1], reverse=True)
+
+    def top_k(self, query, k, query_tokens=None):
+        """The k best (index, score) pairs with score > 0, ties in document order"""
+        if query_tokens is None:
+            query_tokens = self.tokenize(query)
+        scores = self._accumulate(query_tokens)
+        return heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def _score_array(self, query_tokens):
+        if self._arrays is None:
+            self._arrays = {term: (np.array(docs, dtype=np.intp), np.array(weights, dtype=np.float64))
+                            for term, (docs, weights) in self.postings.items()}
+        scores = np.zeros(self.N, dtype=np.float64)
+        for token in query_tokens:
+            posting = self._arrays.get(token)
+            if posting is not None:
+                scores[posting[0]] += posting[1]      # documents are unique within a posting
+        return scores
+
+    def _matched(self, query_tokens):
+        return sum(len(self.postings[t][0]) for t in query_tokens if t in self.postings)
+
+    def top_k_many(self, queries, k, vectorized=None):
+        """
+        top_k() for each query (strings, or token lists from tokenize()).
+        vectorized=None picks NumPy per query when installed and worthwhile.
+        """
+        if vectorized and not _load_numpy():
+            raise RuntimeError("vectorized scoring needs NumPy (pip install numpy)")
+        threshold = max(VECTORIZE_MIN_POSTINGS, self.N // 8)
+
+        results = []
+        for query in queries:
+            tokens = self.tokenize(query) if isinstance(query, str) else query
+            use_numpy = vectorized
+            if vectorized is None:
+                use_numpy = self._matched(tokens) >= threshold and _load_numpy()
+            if not use_numpy:
+                results.append(self.top_k(None, k, tokens))
+                continue
+            scores = self._score_array(tokens)
+            matched = np.flatnonzero(scores > 0)
+            best = matched[np.lexsort((matched, -scores[matched]))][:k]
+            results.append([(int(idx), float(scores[idx])) for idx in best])
+        return results
+
+
+def _load_numpy():
+    """True once NumPy is imported as np, False if it is not installed"""
+    global np, NUMPY_AVAILABLE
+    if NUMPY_AVAILABLE is None:
+        try:
+            import numpy as np
+            NUMPY_AVAILABLE = True
+        except ImportError:
+            NUMPY_AVAILABLE = False
+    return NUMPY_AVAILABLE
+
+
+# ============ SEARCH INDEX ============
+class SearchIndex:
+    """A CSV's rows plus the BM25 fitted on its search columns"""
+
+    def __init__(self, rows, bm25, signature):
+        self.rows = rows
+        self.bm25 = bm25
+        self.signature = signature
+
+    @classmethod
+    def build(cls, filepath, search_cols, signature):
+        rows = _load_csv(filepath)
+        documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in rows]
+        bm25 = BM25()
+        bm25.fit(documents)
+        return cls(rows, bm25, signature)
+
+
+# Loaded indexes by signature, and the signature each (CSV path, search
+# columns) had when it was last loaded
+_indexes = {}
+_loaded = {}
+
+# Content digest of each CSV, recomputed only when its mtime or size changes
+_digests = {}
+
+
+def _digest(filepath):
+    st = filepath.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _digests.get(filepath)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, hashlib.sha1(filepath.read_bytes()).hexdigest())
+        _digests[filepath] = cached
+    return cached[1]
+
+
+def _signature(filepath, search_cols):
+    """Changes whenever the index built for these arguments would; equal for identical CSVs"""
+    return (INDEX_VERSION, _digest(filepath), tuple(search_cols))
+
+
+def _index_path(filepath, signature):
+    key = "|".join([str(part) for part in signature[:2]] + list(signature[2]))
+    return INDEX_DIR / f"{filepath.stem}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.pickle"
+
+
+def _read_index(path, signature):
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data["signature"] != signature:
+            return None
+        return SearchIndex(data["rows"], BM25.from_state(data["bm25"]), signature)
+    except Exception:
+        return None     # missing, stale layout or corrupt: rebuild
+
+
+def _write_index(path, index):
+    data = {"signature": index.signature, "rows": index.rows, "bm25": index.bm25.state()}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        pass            # read-only install: keep the index in memory only
+
+
+def load_index(filepath, search_cols):
+    """Index for a CSV: from memory, else from disk, else built (and saved)"""
+    key = (filepath, tuple(search_cols))
+    signature = _signature(filepath, search_cols)
+    previous = _loaded.get(key)
+    if previous != signature:
+        _loaded[key] = signature
+        if previous is not None and previous not in _loaded.values():
+            _indexes.pop(previous, None)     # the CSV changed: drop what nothing else uses
+    index = _indexes.get(signature)
+    if index is None:
+        path = _index_path(filepath, signature)
+        index = _read_index(path, signature)
+        if index is None:
+            index = SearchIndex.build(filepath, search_cols, signature)
+            _write_index(path, index)
+        _indexes[signature] = index
+    return index
+
+
+def build_indexes():
+    """
+    Compile every domain and stack CSV of every profile ahead of time and
+    delete index files no profile uses any more; returns the CSVs indexed.
+    """
+    built, keep = [], set()
+    for profile in PROFILES.values():
+        for filepath, search_cols in profile.sources():
+            if filepath.exists():
+                load_index(filepath, search_cols)
+                keep.add(_index_path(filepath, _signature(filepath, search_cols)))
+                built.append(filepath)
+    for path in INDEX_DIR.glob("*.pickle"):
+        if path not in keep:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+    return built
 
 
 # ============ SEARCH FUNCTIONS ============
@@ -167,76 +483,114 @@ def _search_csv(filepath, search_cols, output_cols, query, max_results):
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
-
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    index = load_index(filepath, search_cols)
+    return _output_rows(index, index.bm25.top_k(query, max_results), output_cols)
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
 
-    # Get top results with score > 0
+def _output_rows(index, ranked, output_cols):
+    """Output columns of the top results (score > 0)"""
     results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
-
+    for idx, score in ranked:
+        row = index.rows[idx]
+        results.append({col: row.get(col, "") for col in output_cols if col in row})
     return results
 
 
-def detect_domain(query):
+def detect_domain(query, profile=DEFAULT_PROFILE):
     """Auto-detect the most relevant domain from query"""
     query_lower = query.lower()
-
-    domain_keywords = {
-        "color": ["color", "palette", "hex", "#", "rgb"],
-        "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
-        "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
-        "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
-        "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora", "prompt", "css", "implementation", "variable", "checklist", "tailwind"],
-        "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
-        "typography": ["font", "typography", "heading", "serif", "sans"],
-        "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
-        "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
-        "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
-    }
+    domain_keywords = get_profile(profile).domain_keywords
 
     scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
     best = max(scores, key=scores.get)
     return best if scores[best] > 0 else "style"
 
 
-def search(query, domain=None, max_results=MAX_RESULTS):
+def search(query, domain=None, max_results=MAX_RESULTS, profile=DEFAULT_PROFILE):
     """Main search function with auto-domain detection"""
-    if domain is None:
-        domain = detect_domain(query)
-
-    config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
-    filepath = DATA_DIR / config["file"]
-
-    if not filepath.exists():
-        return {"error": f"File not found: {filepath}", "domain": domain}
+    return run_searches([(query, domain, max_results)], profile=profile)[0]
+
+
+def run_searches(requests, jobs=1, profile=DEFAULT_PROFILE):
+    """
+    search() for each (query, domain, max_results) request, in order.
+
+    Requests are grouped by domain so each index is loaded once and
+    scores a whole group at a time; each distinct query is tokenized
+    once. With jobs > 1, batches of PARALLEL_MIN_SEARCHES or more are
+    split across worker processes (which load the prebuilt indexes from
+    disk). Results are exactly what search() returns per request.
+    """
+    profile = get_profile(profile)
+    csv_config, data_dir = profile.csv_config, profile.data_dir
+    requests = [(q, detect_domain(q, profile) if d is None else d, n) for q, d, n in requests]
+    if jobs and jobs > 1 and len(requests) >= PARALLEL_MIN_SEARCHES:
+        for domain in {d for _, d, _ in requests}:           # build once, before the workers need them
+            config = csv_config.get(domain, csv_config["style"])
+            if (data_dir / config["file"]).exists():
+                load_index(data_dir / config["file"], config["search_cols"])
+        size = -(-len(requests) // jobs)
+        chunks = [requests[i:i + size] for i in range(0, len(requests), size)]
+        from concurrent.futures import ProcessPoolExecutor   # only batch jobs pay for the import
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(run_searches, chunks, [1] * len(chunks), [profile.name] * len(chunks))
+            return [result for chunk in results for result in chunk]
+
+    tokenize = BM25().tokenize
+    tokens = {}
+    by_domain = defaultdict(list)
+    for i, (query, domain, max_results) in enumerate(requests):
+        if query not in tokens:
+            tokens[query] = tokenize(query)
+        by_domain[domain].append(i)
+
+    results = [None] * len(requests)
+    for domain, members in by_domain.items():
+        config = csv_config.get(domain, csv_config["style"])
+        filepath = data_dir / config["file"]
+        if not filepath.exists():
+            for i in members:
+                results[i] = {"error": f"File not found: {filepath}", "domain": domain}
+            continue
+
+        index = load_index(filepath, config["search_cols"])
+        k = max(requests[i][2] for i in members)
+        ranked = index.bm25.top_k_many([tokens[requests[i][0]] for i in members], k)
+        for i, top in zip(members, ranked):
+            query, _, max_results = requests[i]
+            rows = _output_rows(index, top[:max_results], config["output_cols"])
+            results[i] = {
+                "domain": domain,
+                "query": query,
+                "file": config["file"],
+                "count": len(rows),
+                "results": rows
+            }
+    return results
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
 
-    return {
-        "domain": domain,
-        "query": query,
-        "file": config["file"],
-        "count": len(results),
-        "results": results
-    }
+def search_many(queries, domains=None, max_results=MAX_RESULTS, jobs=1, profile=DEFAULT_PROFILE):
+    """
+    Search every query in every domain (domains=None: each query's
+    detected domain). Returns one {domain: search() result} per query.
+    """
+    if domains is None:
+        requests = [(q, detect_domain(q, profile), max_results) for q in queries]
+    else:
+        requests = [(q, d, max_results) for q in queries for d in domains]
+    results = run_searches(requests, jobs, profile)
+    per_query = 1 if domains is None else len(domains)
+    return [{requests[j][1]: results[j] for j in range(i * per_query, (i + 1) * per_query)}
+            for i in range(len(queries))]
 
 
-def search_stack(query, stack, max_results=MAX_RESULTS):
+def search_stack(query, stack, max_results=MAX_RESULTS, profile=DEFAULT_PROFILE):
     """Search stack-specific guidelines"""
-    if stack not in STACK_CONFIG:
-        return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
+    profile = get_profile(profile)
+    if stack not in profile.stack_config:
+        return {"error": f"Unknown stack: {stack}. Available: {', '.join(profile.stacks)}"}
 
-    filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
+    filepath = profile.data_dir / profile.stack_config[stack]["file"]
 
     if not filepath.exists():
         return {"error": f"Stack file not found: {filepath}", "stack": stack}
@@ -247,7 +601,7 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "domain": "stack",
         "stack": stack,
         "query": query,
-        "file": STACK_CONFIG[stack]["file"],
+        "file": profile.stack_config[stack]["file"],
         "count": len(results),
         "results": results
     }
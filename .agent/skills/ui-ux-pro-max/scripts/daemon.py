@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Daemon - resident search server for search.py
+Usage: python daemon.py                 # serve in the foreground
+       python daemon.py --start         # serve in the background
+       python daemon.py --status | --stop
+       python daemon.py --benchmark [--runs 20]
+
+Every search.py call otherwise starts an interpreter, imports the engine
+and loads the indexes to answer one sub-millisecond query. The daemon
+keeps all of that warm and listens on a Unix domain socket; search.py
+sends it the request and prints the answer, and searches in-process
+when no daemon is running (or it cannot be reached).
+
+Protocol (client side in client.py): one JSON object per line each way.
+    -> {"op": "search", "args": {"query": "glass", "domain": "style", "max_results": 3}}
+    <- {"ok": true, "result": {...}}        or  {"ok": false, "error": "..."}
+Operations: search, search_stack, design_system, persist_design_system
+(the arguments of search(), search_stack(), generate_design_system() and
+generate_and_persist_design_system(), profile included), ping, shutdown. One daemon serves both entry points (this skill's
+search.py and the .agent/.shared one) from one set of indexes.
+
+Indexes still follow CSV changes (they are checked on every search); a
+change to the engine's own code makes the daemon exit, so a stale
+daemon never answers for new code.
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from client import CLIENT_TIMEOUT, DaemonUnavailable, default_socket, request  # noqa: F401
+from core import build_indexes
+
+# ============ CONFIGURATION ============
+SCRIPTS_DIR = Path(__file__).resolve().parent
+SOURCES = ["core.py", "design_system.py", "daemon.py", "client.py"]
+
+IDLE_TIMEOUT = 3600        # seconds without a request before the daemon exits (0: never)
+START_TIMEOUT = 10.0
+
+BENCH_QUERIES = ["glassmorphism dark", "fintech dashboard", "elegant serif", "pricing hero", "accessibility touch"]
+
+
+def _source_stamp():
+    stamp = []
+    for name in SOURCES:
+        try:
+            st = (SCRIPTS_DIR / name).stat()
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append(None)
+    return stamp
+
+
+# ============ OPERATIONS ============
+def dispatch(op, args):
+    """Run one request in this process; the daemon and the fallback share it"""
+    if op == "search":
+        from core import search
+        return search(**args)
+    if op == "search_stack":
+        from core import search_stack
+        return search_stack(**args)
+    if op == "design_system":
+        from design_system import generate_design_system
+        return generate_design_system(**args)
+    if op == "persist_design_system":
+        from design_system import generate_and_persist_design_system
+        return generate_and_persist_design_system(**args)
+    raise ValueError(f"Unknown operation: {op}")
+
+
+# ============ SERVER ============
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            response = self.server.answer(line)
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+class SearchDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Answers requests from warm indexes, one at a time (each takes well under a millisecond)"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path=None, idle_timeout=IDLE_TIMEOUT):
+        self.path = Path(socket_path or default_socket())
+        self.idle_timeout = idle_timeout
+        self.last_request = time.monotonic()
+        self._lock = threading.Lock()
+        self._stamp = _source_stamp()
+        _claim(self.path)
+        super().__init__(str(self.path), _Handler)
+        os.chmod(self.path, 0o600)
+        self._inode = self.path.stat().st_ino
+
+    def answer(self, line):
+        self.last_request = time.monotonic()
+        try:
+            message = json.loads(line)
+            op, args = message["op"], message.get("args") or {}
+        except (ValueError, KeyError, TypeError) as e:
+            return {"ok": False, "error": f"Bad request: {e}"}
+
+        if _source_stamp() != self._stamp:
+            self._stop()
+            return {"ok": False, "error": "Engine code changed; daemon is exiting"}
+        if op == "ping":
+            return {"ok": True, "result": {"pid": os.getpid(), "scripts": str(SCRIPTS_DIR)}}
+        if op == "shutdown":
+            self._stop()
+            return {"ok": True, "result": None}
+
+        with self._lock:
+            try:
+                return {"ok": True, "result": dispatch(op, args)}
+            except Exception as e:
+                return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    def _stop(self):
+        # shutdown() blocks until serve_forever() returns: answer the client first
+        threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def _watch_idle(self):
+        while True:
+            left = self.last_request + self.idle_timeout - time.monotonic()
+            if left <= 0:
+                self.shutdown()
+                return
+            time.sleep(min(left, 60))
+
+    def serve(self):
+        if self.idle_timeout:
+            threading.Thread(target=self._watch_idle, daemon=True).start()
+        try:
+            self.serve_forever()
+        finally:
+            self.server_close()
+            try:
+                if self.path.stat().st_ino == self._inode:   # not replaced by a newer daemon
+                    self.path.unlink()
+            except OSError:
+                pass
+
+
+def _claim(path):
+    """Remove a socket left behind by a dead daemon; refuse if one is running"""
+    try:
+        request("ping", socket_path=path, timeout=1.0)
+    except DaemonUnavailable:
+        if path.exists():
+            path.unlink()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return
+    raise RuntimeError(f"A daemon is already listening on {path}")
+
+
+def warm_up():
+    """Load every profile's indexes and the design-system module before accepting requests"""
+    build_indexes()
+    import design_system  # noqa: F401
+
+
+def start(socket_path=None, idle_timeout=IDLE_TIMEOUT, timeout=START_TIMEOUT):
+    """Start a background daemon and wait until it answers; returns its pid"""
+    path = Path(socket_path or default_socket())
+    cmd = [sys.executable, str(SCRIPTS_DIR / "daemon.py"), "--socket", str(path), "--idle-timeout", str(idle_timeout)]
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            return request("ping", socket_path=path, timeout=1.0)["pid"]
+        except DaemonUnavailable:
+            if proc.poll() is not None:
+                raise RuntimeError(f"Daemon exited with status {proc.returncode}")
+            time.sleep(0.05)
+    proc.terminate()
+    raise RuntimeError(f"Daemon did not answer on {path} within {timeout:.0f}s")
+
+
+def stop(socket_path=None):
+    """Ask the daemon to exit; False if none was running"""
+    try:
+        request("shutdown", socket_path=socket_path, timeout=2.0)
+        return True
+    except DaemonUnavailable:
+        return False
+
+
+# ============ BENCHMARK ============
+def _timed(cmd, env):
+    begin = time.perf_counter()
+    out = subprocess.run(cmd, env=env, stdout=subprocess.PIPE, check=True).stdout
+    return (time.perf_counter() - begin) * 1000, out
+
+
+def benchmark(runs=20, queries=BENCH_QUERIES):
+    """
+    Latency (ms) of a cold search.py, search.py through a daemon and a
+    bare daemon request, for searches and design systems; and whether
+    both CLI paths printed the same output.
+    """
+    search_py = str(SCRIPTS_DIR / "search.py")
+    kinds = [("search", [], "search"), ("design system", ["--design-system"], "design_system")]
+    timings = {}
+    identical = True
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.sock"
+        env = dict(os.environ, UIUX_SEARCH_SOCKET=str(path))
+        start(path, idle_timeout=0)
+        try:
+            for kind, flags, op in kinds:
+                cold_ms, warm_ms, request_ms = (timings.setdefault(f"{kind}: {mode}", [])
+                                                for mode in ("cold CLI", "CLI via daemon", "daemon request"))
+                for i in range(runs):
+                    query = queries[i % len(queries)]
+                    cold, cold_out = _timed([sys.executable, search_py, query, *flags, "--no-daemon"], env)
+                    warm, warm_out = _timed([sys.executable, search_py, query, *flags], env)
+                    begin = time.perf_counter()
+                    request(op, {"query": query}, socket_path=path)
+                    request_ms.append((time.perf_counter() - begin) * 1000)
+                    cold_ms.append(cold)
+                    warm_ms.append(warm)
+                    identical = identical and cold_out == warm_out
+        finally:
+            stop(path)
+    return timings, identical
+
+
+def format_benchmark(timings, identical):
+    width = max(map(len, timings)) + 2
+    lines = [f"{'':<{width}}{'median ms':>10}{'p95 ms':>10}"]
+    for name, values in timings.items():
+        ordered = sorted(values)
+        median = (ordered[(len(ordered) - 1) // 2] + ordered[len(ordered) // 2]) / 2
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        lines.append(f"{name:<{width}}{median:>10.1f}{p95:>10.1f}")
+    lines.append(f"Identical CLI output: {'yes' if identical else 'NO'}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search daemon")
+    parser.add_argument("--socket", type=str, default=None, help="Socket path (default: per scripts directory)")
+    parser.add_argument("--idle-timeout", type=int, default=IDLE_TIMEOUT, help="Exit after this many idle seconds (0: never)")
+    parser.add_argument("--start", action="store_true", help="Start a daemon in the background")
+    parser.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    parser.add_argument("--status", action="store_true", help="Report whether a daemon is running")
+    parser.add_argument("--benchmark", action="store_true", help="Compare cold CLI and daemon latency")
+    parser.add_argument("--runs", type=int, default=20, help="Benchmark runs (default: 20)")
+    args = parser.parse_args()
+    path = Path(args.socket) if args.socket else default_socket()
+
+    if args.benchmark:
+        print(format_benchmark(*benchmark(args.runs)))
+    elif args.start:
+        print(f"Daemon started (pid {start(path, args.idle_timeout)}) on {path}")
+    elif args.stop:
+        print("Daemon stopped" if stop(path) else "No daemon running")
+    elif args.status:
+        try:
+            print(f"Daemon running (pid {request('ping', socket_path=path)['pid']}) on {path}")
+        except DaemonUnavailable:
+            print("No daemon running")
+            sys.exit(1)
+    else:
+        warm_up()
+        try:
+            server = SearchDaemon(path, args.idle_timeout)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"Listening on {path}", flush=True)
+        server.serve()
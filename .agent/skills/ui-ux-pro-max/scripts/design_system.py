@@ -11,19 +11,34 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+    report = generate_and_persist_design_system("SaaS dashboard", "My Project")  # + files written/unchanged
+
+    # Many at once: the searches of all requests are batched per domain
+    results = generate_design_systems(["SaaS dashboard", ("fintech crypto", "Ledger")], jobs=4)
+
+    # From the .agent/.shared data instead of this skill's (see core.PROFILES)
+    result = generate_design_system("SaaS dashboard", profile="shared")
 """
 
 import csv
+import hashlib
 import json
 import os
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import DEFAULT_PROFILE, get_profile, run_searches
 
 
 # ============ CONFIGURATION ============
 REASONING_FILE = "ui-reasoning.csv"
 
+# Content hashes of the persisted files, next to MASTER.md
+MANIFEST_FILE = ".manifest.json"
+
+# Stands in for the "Generated" time while a file is rendered and hashed,
+# so unchanged content hashes the same on every run
+_TIMESTAMP_SLOT = "\x00generated\x00"
+
 SEARCH_CONFIG = {
     "product": {"max_results": 1},
     "style": {"max_results": 3},
@@ -33,63 +48,127 @@ SEARCH_CONFIG = {
 }
 
 
+# ============ REASONING RULES ============
+class ReasoningRules:
+    """
+    The rules of ui-reasoning.csv, indexed by category.
+
+    A category resolves to the first rule (in file order) whose name
+    equals it (case-insensitive), else contains it or is contained in
+    it, else shares a keyword with it. Names and keywords are looked up
+    in tables built once; each category is resolved once, and each
+    rule's reasoning is parsed once.
+    """
+
+    def __init__(self, rules: list):
+        self.rules = rules
+        self._names = [rule.get("UI_Category", "").lower() for rule in rules]
+        self.by_name = {}
+        self.by_keyword = {}
+        for i, name in enumerate(self._names):
+            self.by_name.setdefault(name, i)
+            for keyword in name.replace("/", " ").replace("-", " ").split():
+                self.by_keyword.setdefault(keyword, i)
+        self._found = {}
+        self._parsed = {}
+
+    def find(self, category: str):
+        """Index of the rule for a category, or None."""
+        key = category.lower()
+        if key not in self._found:
+            self._found[key] = self._resolve(key)
+        return self._found[key]
+
+    def _resolve(self, key: str):
+        if key in self.by_name:
+            return self.by_name[key]
+        for i, name in enumerate(self._names):
+            if name in key or key in name:
+                return i
+        matches = [i for keyword, i in self.by_keyword.items() if keyword in key]
+        return min(matches) if matches else None
+
+    def reasoning(self, index: int) -> dict:
+        """The reasoning of a rule (a fresh copy; callers may modify it)."""
+        if index not in self._parsed:
+            rule = self.rules[index]
+            # Parse decision rules JSON
+            decision_rules = {}
+            try:
+                decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
+            except json.JSONDecodeError:
+                pass
+            self._parsed[index] = {
+                "pattern": rule.get("Recommended_Pattern", ""),
+                "style_priority": [s.strip() for s in rule.get("Style_Priority", "").split("+")],
+                "color_mood": rule.get("Color_Mood", ""),
+                "typography_mood": rule.get("Typography_Mood", ""),
+                "key_effects": rule.get("Key_Effects", ""),
+                "anti_patterns": rule.get("Anti_Patterns", ""),
+                "decision_rules": decision_rules,
+                "severity": rule.get("Severity", "MEDIUM")
+            }
+        parsed = self._parsed[index]
+        return {**parsed, "style_priority": list(parsed["style_priority"]),
+                "decision_rules": dict(parsed["decision_rules"])}
+
+
+# Compiled rules by CSV path: ((mtime_ns, size), ReasoningRules), shared by
+# every generator in the process
+_reasoning_rules = {}
+
+
+def load_reasoning_rules(filepath: Path) -> ReasoningRules:
+    """Rules of a reasoning CSV, parsed again only when the file changes."""
+    try:
+        st = filepath.stat()
+    except OSError:
+        return ReasoningRules([])
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _reasoning_rules.get(filepath)
+    if cached is None or cached[0] != stamp:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            cached = (stamp, ReasoningRules(list(csv.DictReader(f))))
+        _reasoning_rules[filepath] = cached
+    return cached[1]
+
+
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
     """Generates design system recommendations from aggregated searches."""
 
-    def __init__(self):
-        self.reasoning_data = self._load_reasoning()
+    def __init__(self, profile: str = DEFAULT_PROFILE):
+        self.profile = get_profile(profile).name
+        self.rules = load_reasoning_rules(get_profile(self.profile).data_dir / REASONING_FILE)
+        self.reasoning_data = self.rules.rules
 
-    def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
-        filepath = DATA_DIR / REASONING_FILE
-        if not filepath.exists():
-            return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
-
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
+    def _search_requests(self, query: str, style_priority: list = None) -> list:
+        """(query, domain, max_results) for each domain of SEARCH_CONFIG."""
+        requests = []
         for domain, config in SEARCH_CONFIG.items():
             if domain == "style" and style_priority:
                 # For style, also search with priority keywords
                 priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
+                requests.append((f"{query} {priority_query}", domain, config["max_results"]))
             else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
+                requests.append((query, domain, config["max_results"]))
+        return requests
+
+    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
+        """Execute searches across multiple domains."""
+        requests = self._search_requests(query, style_priority)
+        return dict(zip(SEARCH_CONFIG, run_searches(requests, profile=self.profile)))
 
     def _find_reasoning_rule(self, category: str) -> dict:
         """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
-
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
-
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
-
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
-
-        return {}
+        index = self.rules.find(category)
+        return self.rules.rules[index] if index is not None else {}
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
+        index = self.rules.find(category)
 
-        if not rule:
+        if index is None:
             return {
                 "pattern": "Hero + Features + CTA",
                 "style_priority": ["Minimalism", "Flat Design"],
@@ -101,23 +180,7 @@ class DesignSystemGenerator:
                 "severity": "MEDIUM"
             }
 
-        # Parse decision rules JSON
-        decision_rules = {}
-        try:
-            decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
-        except json.JSONDecodeError:
-            pass
-
-        return {
-            "pattern": rule.get("Recommended_Pattern", ""),
-            "style_priority": [s.strip() for s in rule.get("Style_Priority", "").split("+")],
-            "color_mood": rule.get("Color_Mood", ""),
-            "typography_mood": rule.get("Typography_Mood", ""),
-            "key_effects": rule.get("Key_Effects", ""),
-            "anti_patterns": rule.get("Anti_Patterns", ""),
-            "decision_rules": decision_rules,
-            "severity": rule.get("Severity", "MEDIUM")
-        }
+        return self.rules.reasoning(index)
 
     def _select_best_match(self, results: list, priority_keywords: list) -> dict:
         """Select best matching result based on priority keywords."""
@@ -162,21 +225,40 @@ class DesignSystemGenerator:
 
     def generate(self, query: str, project_name: str = None) -> dict:
         """Generate complete design system recommendation."""
+        return self.generate_many([(query, project_name)])[0]
+
+    def generate_many(self, requests: list, jobs: int = 1) -> list:
+        """
+        generate() for each (query, project_name), with the searches of
+        all requests batched: one run for the product lookups, one for
+        the remaining domains (see core.run_searches).
+        """
         # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
-        product_results = product_result.get("results", [])
-        category = "General"
-        if product_results:
-            category = product_results[0].get("Product Type", "General")
-
-        # Step 2: Get reasoning rules for this category
-        reasoning = self._apply_reasoning(category, {})
-        style_priority = reasoning.get("style_priority", [])
+        product_results = run_searches([(query, "product", 1) for query, _ in requests], jobs, self.profile)
+
+        # Step 2: Get reasoning rules for each category
+        plans = []
+        searches = []
+        for (query, _), product_result in zip(requests, product_results):
+            products = product_result.get("results", [])
+            category = products[0].get("Product Type", "General") if products else "General"
+            reasoning = self._apply_reasoning(category, {})
+            plans.append((category, reasoning))
+            # The product search is reused below, so it is not repeated
+            searches += [r for r in self._search_requests(query, reasoning.get("style_priority", []))
+                         if r[1] != "product"]
 
         # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
-
+        found = iter(run_searches(searches, jobs, self.profile))
+        design_systems = []
+        for (query, project_name), product_result, (category, reasoning) in zip(requests, product_results, plans):
+            search_results = {domain: next(found) for domain in SEARCH_CONFIG if domain != "product"}
+            search_results["product"] = product_result  # Reuse product search
+            design_systems.append(self._build(query, project_name, category, reasoning, search_results))
+        return design_systems
+
+    def _build(self, query: str, project_name: str, category: str, reasoning: dict, search_results: dict) -> dict:
+        """Steps 4-5: pick the best match per domain and assemble the recommendation."""
         # Step 4: Select best matches from each domain using priority
         style_results = self._extract_results(search_results.get("style", {}))
         color_results = self._extract_results(search_results.get("color", {}))
@@ -460,7 +542,8 @@ def format_markdown(design_system: dict) -> str:
 
 # ============ MAIN ENTRY POINT ============
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page: str = None, output_dir: str = None,
+                           profile: str = DEFAULT_PROFILE) -> str:
     """
     Main entry point for design system generation.
 
@@ -471,24 +554,72 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         persist: If True, save design system to design-system/ folder
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
+        profile: Engine profile whose data is searched ("skills" or "shared")
 
     Returns:
         Formatted design system string
     """
-    generator = DesignSystemGenerator()
-    design_system = generator.generate(query, project_name)
-    
-    # Persist to files if requested
     if persist:
-        persist_design_system(design_system, page, output_dir, query)
+        return generate_and_persist_design_system(query, project_name, output_format, page, output_dir,
+                                                  profile)["output"]
+
+    generator = DesignSystemGenerator(profile)
+    design_system = generator.generate(query, project_name)
 
     if output_format == "markdown":
         return format_markdown(design_system)
     return format_ascii_box(design_system)
 
 
+def generate_and_persist_design_system(query: str, project_name: str = None, output_format: str = "ascii",
+                                       page: str = None, output_dir: str = None,
+                                       profile: str = DEFAULT_PROFILE) -> dict:
+    """
+    generate_design_system(..., persist=True) that also reports the files.
+
+    Returns:
+        dict with "output", the formatted design system string, and
+        "persisted", what persist_design_system() returned (which files
+        were written and which were left unchanged)
+    """
+    design_system = DesignSystemGenerator(profile).generate(query, project_name)
+    persisted = persist_design_system(design_system, page, output_dir, query, profile)
+    output = format_markdown(design_system) if output_format == "markdown" else format_ascii_box(design_system)
+    return {"output": output, "persisted": persisted}
+
+
+def generate_design_systems(requests: list, output_format: str = "ascii", persist: bool = False,
+                            output_dir: str = None, jobs: int = 1, profile: str = DEFAULT_PROFILE) -> list:
+    """
+    Batch generate_design_system() for a nightly job or a whole site.
+
+    Args:
+        requests: Queries, or (query, project_name) pairs
+        output_format: "ascii" (default) or "markdown"
+        persist: If True, save each design system to design-system/<project>/
+        output_dir: Optional output directory (defaults to current working directory)
+        jobs: Worker processes for large batches of searches
+        profile: Engine profile whose data is searched ("skills" or "shared")
+
+    Returns:
+        Formatted design system strings, in request order; each is what
+        generate_design_system() returns for that request
+    """
+    pairs = [(r, None) if isinstance(r, str) else tuple(r) for r in requests]
+    design_systems = DesignSystemGenerator(profile).generate_many(pairs, jobs)
+
+    formatted = []
+    for (query, _), design_system in zip(pairs, design_systems):
+        if persist:
+            persist_design_system(design_system, None, output_dir, query, profile)
+        formatted.append(format_markdown(design_system) if output_format == "markdown"
+                         else format_ascii_box(design_system))
+    return formatted
+
+
 # ============ PERSISTENCE FUNCTIONS ============
-def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
+def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None,
+                          profile: str = DEFAULT_PROFILE) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
     
@@ -497,9 +628,16 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
+        profile: Engine profile searched for the page overrides
     
     Returns:
-        dict with created file paths and status
+        dict with created file paths and status; "written" lists the files
+        whose content changed, "unchanged" the ones left untouched
+
+    Files are rendered in memory and hashed without their "Generated"
+    time; a file is rewritten (atomically) only when its hash differs
+    from the one in .manifest.json or it was modified since it was
+    written. Re-persisting an unchanged design system writes nothing.
     """
     base_dir = Path(output_dir) if output_dir else Path.cwd()
     
@@ -510,36 +648,74 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
     design_system_dir = base_dir / "design-system" / project_slug
     pages_dir = design_system_dir / "pages"
     
-    created_files = []
-    
     # Create directories
     design_system_dir.mkdir(parents=True, exist_ok=True)
     pages_dir.mkdir(parents=True, exist_ok=True)
     
-    master_file = design_system_dir / "MASTER.md"
+    # Render MASTER.md and, if page is specified, the page override file
+    files = {"MASTER.md": format_master_md(design_system, _TIMESTAMP_SLOT)}
+    if page:
+        page_content = format_page_override_md(design_system, page, page_query, profile, _TIMESTAMP_SLOT)
+        files[f"pages/{page.lower().replace(' ', '-')}.md"] = page_content
     
-    # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
+    manifest_file = design_system_dir / MANIFEST_FILE
+    manifest = _read_manifest(manifest_file)
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    created_files, written, unchanged = [], [], []
+    for name, content in files.items():
+        path = design_system_dir / name
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        created_files.append(str(path))
+        if _is_current(path, manifest.get(name), digest):
+            unchanged.append(str(path))
+            continue
+        _write_atomic(path, content.replace(_TIMESTAMP_SLOT, timestamp))
+        st = path.stat()
+        manifest[name] = {"sha256": digest, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        written.append(str(path))
     
-    # If page is specified, create page override file with intelligent content
-    if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
+    if written:
+        _write_atomic(manifest_file, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
     
     return {
         "status": "success",
         "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "created_files": created_files,
+        "written": written,
+        "unchanged": unchanged
     }
 
 
-def format_master_md(design_system: dict) -> str:
+def _read_manifest(path: Path) -> dict:
+    """Manifest entries by file name (relative to the project folder); empty if missing or corrupt."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _is_current(path: Path, entry: dict, digest: str) -> bool:
+    """True if path holds the content hashed as digest, untouched since it was written."""
+    if not isinstance(entry, dict) or entry.get("sha256") != digest:
+        return False
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return st.st_mtime_ns == entry.get("mtime_ns") and st.st_size == entry.get("size")
+
+
+def _write_atomic(path: Path, content: str):
+    """Write through a temporary file, so watchers never see a half-written file."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+
+def format_master_md(design_system: dict, timestamp: str = None) -> str:
     """Format design system as MASTER.md with hierarchical override logic."""
     project = design_system.get("project_name", "PROJECT")
     pattern = design_system.get("pattern", {})
@@ -549,7 +725,7 @@ def format_master_md(design_system: dict) -> str:
     effects = design_system.get("key_effects", "")
     anti_patterns = design_system.get("anti_patterns", "")
     
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     lines = []
     
@@ -802,14 +978,15 @@ def format_master_md(design_system: dict) -> str:
     return "\n".join(lines)
 
 
-def format_page_override_md(design_system: dict, page_name: str, page_query: str = None) -> str:
+def format_page_override_md(design_system: dict, page_name: str, page_query: str = None,
+                            profile: str = DEFAULT_PROFILE, timestamp: str = None) -> str:
     """Format a page-specific override file with intelligent AI-generated content."""
     project = design_system.get("project_name", "PROJECT")
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     page_title = page_name.replace("-", " ").replace("_", " ").title()
     
     # Detect page type and generate intelligent overrides
-    page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
+    page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system, profile)
     
     lines = []
     
@@ -911,7 +1088,8 @@ def format_page_override_md(design_system: dict, page_name: str, page_query: str
     return "\n".join(lines)
 
 
-def _generate_intelligent_overrides(page_name: str, page_query: str, design_system: dict) -> dict:
+def _generate_intelligent_overrides(page_name: str, page_query: str, design_system: dict,
+                                    profile: str = DEFAULT_PROFILE) -> dict:
     """
     Generate intelligent overrides based on page type using layered search.
     
@@ -925,9 +1103,9 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     combined_context = f"{page_lower} {query_lower}"
     
     # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
+    style_search = search(combined_context, "style", max_results=1, profile=profile)
+    ux_search = search(combined_context, "ux", max_results=3, profile=profile)
+    landing_search = search(combined_context, "landing", max_results=1, profile=profile)
     
     # Extract results from search response
     style_results = style_search.get("results", [])
@@ -5,18 +5,34 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py --build-index
 
-Domains: style, prompt, color, chart, landing, product, ux, typography
-Stacks: html-tailwind, react, nextjs
+Domains: style, color, chart, landing, product, ux, typography, icons, react, web
+         (the shared profile adds prompt)
+Stacks: html-tailwind, react, nextjs, vue, svelte, swiftui, react-native, flutter, ...
+
+Profiles: this script searches the skill's own data ("skills" profile);
+.agent/.shared/ui-ux-pro-max/scripts/search.py runs the same engine on the
+shared data ("shared" profile). See core.PROFILES.
 
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+
+Indexes: each CSV is compiled into a search index on first use and kept in
+.agent/.cache/ui-ux-pro-max/ until the CSV changes; --build-index compiles
+them all ahead of time.
+
+Daemon: while `python daemon.py --start` is running, searches are answered
+by it from warm indexes; without one (or with --no-daemon) they run in
+this process. The output is the same either way. Only that in-process
+path loads the engine: talking to a daemon needs nothing but client.py.
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import json
+import os
+from client import DEFAULT_PROFILE, DOMAINS, MAX_RESULTS, STACKS, DaemonUnavailable, request
 
 
 def format_output(result):
@@ -45,11 +61,49 @@ def format_output(result):
     return "\n".join(output)
 
 
-if __name__ == "__main__":
+def format_persisted(persisted, output_dir):
+    """Persistence confirmation: each file and whether it was written or left unchanged"""
+    def rel(path):
+        return os.path.relpath(path, output_dir).replace(os.sep, "/")
+
+    project_dir = rel(persisted["design_system_dir"])
+    written, unchanged = persisted["written"], persisted["unchanged"]
+    output = ["\n" + "=" * 60]
+    if written:
+        output.append(f"✅ Design system persisted to {project_dir}/ "
+                      f"({len(written)} written, {len(unchanged)} unchanged)")
+    else:
+        output.append(f"✅ Design system in {project_dir}/ is up to date (nothing written)")
+    for path in persisted["created_files"]:
+        role = "Global Source of Truth" if os.path.basename(path) == "MASTER.md" else "Page Overrides"
+        state = "written" if path in written else "unchanged"
+        output.append(f"   📄 {rel(path)} ({role}, {state})")
+    output.append("")
+    output.append(f"📖 Usage: When building a page, check {project_dir}/pages/[page].md first.")
+    output.append(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
+    output.append("=" * 60)
+    return "\n".join(output)
+
+
+def run(op, args, use_daemon=True):
+    """Answer a request through the daemon when one is running, else in this process"""
+    if use_daemon:
+        try:
+            return request(op, args)
+        except DaemonUnavailable:
+            pass
+    from daemon import dispatch
+    return dispatch(op, args)
+
+
+def main(profile=DEFAULT_PROFILE):
+    """Command line for one engine profile"""
+    if profile not in DOMAINS:
+        raise ValueError(f"Unknown profile: {profile}. Available: {', '.join(DOMAINS)}")
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
-    parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
-    parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
+    parser.add_argument("query", nargs="?", help="Search query")
+    parser.add_argument("--domain", "-d", choices=DOMAINS[profile], help="Search domain")
+    parser.add_argument("--stack", "-s", choices=STACKS[profile], help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     # Design system generation
@@ -60,47 +114,53 @@ if __name__ == "__main__":
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    parser.add_argument("--build-index", action="store_true", help="Prebuild the search index of every profile's domains and stacks, then exit")
+    parser.add_argument("--no-daemon", action="store_true", help="Search in this process even if a daemon is running")
 
     args = parser.parse_args()
 
+    if args.build_index:
+        from core import build_indexes
+        built = build_indexes()
+        print(f"Indexed {len(built)} CSV files")
+    elif args.query is None:
+        parser.error("the following arguments are required: query")
     # Design system takes priority
-    if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
-            args.format,
-            persist=args.persist,
-            page=args.page,
-            output_dir=args.output_dir
-        )
-        print(result)
-        
-        # Print persistence confirmation
-        if args.persist:
-            project_slug = args.project_name.lower().replace(' ', '-') if args.project_name else "default"
-            print("\n" + "=" * 60)
-            print(f"✅ Design system persisted to design-system/{project_slug}/")
-            print(f"   📄 design-system/{project_slug}/MASTER.md (Global Source of Truth)")
-            if args.page:
-                page_filename = args.page.lower().replace(' ', '-')
-                print(f"   📄 design-system/{project_slug}/pages/{page_filename}.md (Page Overrides)")
-            print("")
-            print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
-            print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
-            print("=" * 60)
+    elif args.design_system:
+        request = {
+            "query": args.query,
+            "project_name": args.project_name,
+            "output_format": args.format,
+            "page": args.page,
+            "profile": profile,
+        }
+        if not args.persist:
+            print(run("design_system", request, not args.no_daemon))
+        else:
+            # The daemon has its own working directory
+            output_dir = os.path.abspath(args.output_dir or os.getcwd())
+            result = run("persist_design_system", dict(request, output_dir=output_dir), not args.no_daemon)
+            print(result["output"])
+            print(format_persisted(result["persisted"], output_dir))
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        result = run("search_stack", {"query": args.query, "stack": args.stack, "max_results": args.max_results,
+                                     "profile": profile},
+                     not args.no_daemon)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        result = run("search", {"query": args.query, "domain": args.domain, "max_results": args.max_results,
+                               "profile": profile},
+                     not args.no_daemon)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
+
+
+if __name__ == "__main__":
+    main()
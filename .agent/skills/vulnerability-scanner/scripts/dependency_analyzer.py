@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Skill: vulnerability-scanner
+Script: dependency_analyzer.py
+Purpose: Offline dependency vulnerability check against a local advisory index
+Usage: python dependency_analyzer.py <project_path> [--db PATH] [--output json|summary]
+       python dependency_analyzer.py --import DUMP [DUMP ...] [--db PATH]
+Output: JSON with vulnerable packages
+
+The index is built once from an OSV-format advisory dump (a directory of
+advisory .json files, a .zip of them as published by osv.dev / the GitHub
+Advisory Database, or a .json/.jsonl list) and then works without network:
+
+1. Lockfiles - package-lock.json, pnpm-lock.yaml, poetry.lock, requirements.txt
+               are resolved to exact (ecosystem, name, version) in one pass
+2. Lookup    - each package is matched against the advisory ranges for its
+               name; versions are compared with SemVer (npm) or PEP 440 (PyPI)
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# Checker plugin API (.agent/scripts/checker_api.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from checker_api import CheckContext, Finding, Findings
+
+# Fix Windows console encoding for Unicode output
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass  # Python < 3.7
+
+
+# ============================================================================
+#  CONFIGURATION
+# ============================================================================
+
+# Shared by every project checked from this toolkit checkout; override with
+# AGENT_ADVISORY_DB or --db. .agent/.cache/ is git-ignored.
+DEFAULT_DB = Path(__file__).resolve().parents[3] / ".cache" / "advisories.json"
+INDEX_FORMAT = 1
+
+ECOSYSTEMS = {"npm", "PyPI"}
+
+SEVERITY_MAP = {"CRITICAL": "critical", "HIGH": "high", "MODERATE": "medium",
+                "MEDIUM": "medium", "LOW": "low"}
+DEFAULT_SEVERITY = "medium"
+
+LOCKFILES = {
+    "package-lock.json": "npm",
+    "npm-shrinkwrap.json": "npm",
+    "pnpm-lock.yaml": "npm",
+    "poetry.lock": "PyPI",
+    "requirements.txt": "PyPI",
+}
+
+
+def default_db_path() -> Path:
+    env = os.environ.get("AGENT_ADVISORY_DB")
+    return Path(env) if env else DEFAULT_DB
+
+
+def normalize_name(ecosystem: str, name: str) -> str:
+    """PEP 503 names for PyPI; npm names are already canonical (lowercase)."""
+    if ecosystem == "PyPI":
+        return re.sub(r"[-_.]+", "-", name).lower()
+    return name.lower()
+
+
+# ============================================================================
+#  VERSION ORDERING
+# ============================================================================
+
+VersionKey = Tuple[Any, ...]
+
+_SEMVER_RE = re.compile(r"^\s*[v=]?(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]*)?\s*$")
+
+_PEP440_RE = re.compile(
+    r"^\s*v?(?:(\d+)!)?(\d+(?:\.\d+)*)"
+    r"(?:[-_.]?(a|b|c|rc|alpha|beta|pre|preview)[-_.]?(\d*))?"
+    r"(?:-(\d+)|[-_.]?(?:post|rev|r)[-_.]?(\d*))?"
+    r"(?:[-_.]?dev[-_.]?(\d*))?"
+    r"(?:\+[a-z0-9]+(?:[-_.][a-z0-9]+)*)?\s*$",
+    re.IGNORECASE,
+)
+_PRE_RANK = {"a": 0, "alpha": 0, "b": 1, "beta": 1, "c": 2, "rc": 2, "pre": 2, "preview": 2}
+
+
+def semver_key(version: str) -> Optional[VersionKey]:
+    """Sort key following SemVer 2.0 precedence (prereleases before the release)."""
+    m = _SEMVER_RE.match(version)
+    if not m:
+        return None
+    major, minor, patch, pre = m.groups()
+    if pre is None:
+        pre_key: Tuple = (1,)
+    else:
+        pre_key = (0, tuple((0, int(p), "") if p.isdigit() else (1, 0, p) for p in pre.split(".")))
+    return (int(major), int(minor or 0), int(patch or 0), pre_key)
+
+
+def pep440_key(version: str) -> Optional[VersionKey]:
+    """Sort key following PEP 440 (epoch, release, pre, post, dev; local ignored)."""
+    m = _PEP440_RE.match(version)
+    if not m:
+        return None
+    epoch, release, pre_l, pre_n, post_implicit, post_n, dev_n = m.groups()
+    parts = [int(p) for p in release.split(".")]
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    # Optional number groups are "" when the tag is present without a number
+    post = post_implicit is not None or post_n is not None
+    dev = dev_n is not None
+    if pre_l:
+        pre_key: Tuple = (1, _PRE_RANK[pre_l.lower()], int(pre_n or 0))
+    elif dev and not post:
+        pre_key = (0, 0, 0)          # 1.0.dev0 sorts before 1.0a1
+    else:
+        pre_key = (2, 0, 0)
+    post_key = (1, int(post_implicit or post_n or 0)) if post else (0, 0)
+    dev_key = (0, int(dev_n or 0)) if dev else (1, 0)
+    return (int(epoch or 0), tuple(parts), pre_key, post_key, dev_key)
+
+
+VERSION_KEYS = {"npm": semver_key, "PyPI": pep440_key}
+
+
+# ============================================================================
+#  ADVISORY INDEX
+# ============================================================================
+
+def _osv_ranges(affected: Dict[str, Any]) -> List[List[Optional[str]]]:
+    """OSV range events -> [introduced, fixed, last_affected] intervals."""
+    intervals = []
+    for rng in affected.get("ranges", []):
+        if rng.get("type") not in ("SEMVER", "ECOSYSTEM"):
+            continue
+        start: Optional[str] = None
+        open_ = False
+        for event in rng.get("events", []):
+            if "introduced" in event:
+                start, open_ = event["introduced"], True
+            elif open_ and "fixed" in event:
+                intervals.append([start, event["fixed"], None])
+                open_ = False
+            elif open_ and "last_affected" in event:
+                intervals.append([start, None, event["last_affected"]])
+                open_ = False
+        if open_:
+            intervals.append([start, None, None])
+    return intervals
+
+
+def _osv_severity(advisory: Dict[str, Any], affected: Dict[str, Any]) -> str:
+    for source in (affected.get("database_specific", {}), advisory.get("database_specific", {})):
+        sev = str(source.get("severity", "")).upper()
+        if sev in SEVERITY_MAP:
+            return SEVERITY_MAP[sev]
+    return DEFAULT_SEVERITY
+
+
+def _iter_dump(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield OSV advisories from a directory, .zip, .json (object or list) or .jsonl."""
+    def parse(text: str) -> Iterator[Dict[str, Any]]:
+        data = json.loads(text)
+        if isinstance(data, list):
+            yield from data
+        else:
+            yield data
+
+    if path.is_dir():
+        for root, _, files in os.walk(path):
+            for name in sorted(files):
+                if name.endswith(".json"):
+                    yield from parse(Path(root, name).read_text(encoding="utf-8"))
+    elif path.suffix == ".zip":
+        with zipfile.ZipFile(path) as zf:
+            for name in zf.namelist():
+                if name.endswith(".json"):
+                    yield from parse(zf.read(name).decode("utf-8"))
+    elif path.suffix == ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        yield from parse(path.read_text(encoding="utf-8"))
+
+
+def build_index(dumps: List[Path]) -> Dict[str, Any]:
+    """Build the on-disk index document from one or more advisory dumps."""
+    packages: Dict[str, Dict[str, list]] = {eco: {} for eco in ECOSYSTEMS}
+    seen: Set[Tuple[str, str, str]] = set()
+    count = 0
+    for dump in dumps:
+        for adv in _iter_dump(dump):
+            if adv.get("withdrawn") or "id" not in adv:
+                continue
+            for affected in adv.get("affected", []):
+                pkg = affected.get("package", {})
+                eco = pkg.get("ecosystem")
+                if eco not in ECOSYSTEMS or not pkg.get("name"):
+                    continue
+                name = normalize_name(eco, pkg["name"])
+                if (eco, name, adv["id"]) in seen:
+                    continue
+                seen.add((eco, name, adv["id"]))
+                packages[eco].setdefault(name, []).append({
+                    "id": adv["id"],
+                    "aliases": adv.get("aliases", []),
+                    "summary": (adv.get("summary") or adv.get("details") or "")[:200],
+                    "severity": _osv_severity(adv, affected),
+                    "ranges": _osv_ranges(affected),
+                    "versions": affected.get("versions", []),
+                })
+                count += 1
+    return {
+        "format": INDEX_FORMAT,
+        "built": datetime.now().isoformat(),
+        "sources": [str(d) for d in dumps],
+        "entries": count,
+        "packages": packages,
+    }
+
+
+def save_index(index: Dict[str, Any], db_path: Path) -> None:
+    """Write atomically so a concurrent reader never sees a partial index."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = db_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, db_path)
+
+
+# (advisory, [(low key, high key, high inclusive)], exact versions)
+_Compiled = List[Tuple[Dict[str, Any], List[Tuple[Optional[VersionKey], Optional[VersionKey], bool]], Set[str]]]
+
+
+class AdvisoryIndex:
+    """
+    In-memory view of the advisory index.
+
+    Advisories are looked up by (ecosystem, name) in a dict; the range
+    bounds of a package are parsed into version keys the first time the
+    package is queried and kept, so each later query is a handful of
+    tuple comparisons.
+    """
+
+    def __init__(self, data: Dict[str, Any], path: Optional[Path] = None):
+        self.path = path
+        self.built = data.get("built")
+        self.packages: Dict[str, Dict[str, list]] = data.get("packages", {})
+        self._compiled: Dict[Tuple[str, str], _Compiled] = {}
+
+    @classmethod
+    def load(cls, db_path: Optional[Path] = None) -> Optional["AdvisoryIndex"]:
+        """The index at `db_path` (default: default_db_path()), or None if absent/unreadable."""
+        db_path = db_path or default_db_path()
+        try:
+            data = json.loads(db_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("format") != INDEX_FORMAT:
+            return None
+        return cls(data, db_path)
+
+    def _compile(self, ecosystem: str, name: str) -> _Compiled:
+        key_fn = VERSION_KEYS[ecosystem]
+        compiled: _Compiled = []
+        for adv in self.packages.get(ecosystem, {}).get(name, []):
+            intervals = []
+            for introduced, fixed, last in adv["ranges"]:
+                lo = None if introduced in (None, "0") else key_fn(introduced)
+                hi_raw = fixed if fixed is not None else last
+                hi = key_fn(hi_raw) if hi_raw is not None else None
+                if (introduced not in (None, "0") and lo is None) or (hi_raw is not None and hi is None):
+                    continue   # unparseable bound: rely on the explicit version list
+                intervals.append((lo, hi, fixed is None))
+            compiled.append((adv, intervals, set(adv["versions"])))
+        return compiled
+
+    def query(self, ecosystem: str, name: str, version: str) -> List[Dict[str, Any]]:
+        """Advisories affecting `name`@`version` (empty list when none)."""
+        name = normalize_name(ecosystem, name)
+        if name not in self.packages.get(ecosystem, {}):
+            return []
+        compiled = self._compiled.get((ecosystem, name))
+        if compiled is None:
+            compiled = self._compiled[(ecosystem, name)] = self._compile(ecosystem, name)
+
+        key = VERSION_KEYS[ecosystem](version)
+        hits = []
+        for adv, intervals, versions in compiled:
+            if version in versions:
+                hits.append(adv)
+                continue
+            if key is None:
+                continue
+            for lo, hi, inclusive in intervals:
+                if lo is not None and key < lo:
+                    continue
+                if hi is not None and (key > hi if inclusive else key >= hi):
+                    continue
+                hits.append(adv)
+                break
+        return hits
+
+
+# ============================================================================
+#  LOCKFILE RESOLUTION
+# ============================================================================
+
+Package = Tuple[str, str, str, str]   # (ecosystem, name, version, lockfile)
+
+
+def _package_lock(path: Path) -> Iterator[Tuple[str, str]]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if "packages" in data:                       # lockfileVersion 2/3
+        for key, meta in data["packages"].items():
+            if not key or meta.get("link") or "version" not in meta:
+                continue
+            yield meta.get("name") or key.rsplit("node_modules/", 1)[-1], meta["version"]
+        return
+
+    def walk(deps: Dict[str, Any]) -> Iterator[Tuple[str, str]]:   # lockfileVersion 1
+        for name, meta in deps.items():
+            if "version" in meta and not str(meta["version"]).startswith(("file:", "link:")):
+                yield name, meta["version"]
+            yield from walk(meta.get("dependencies", {}))
+    yield from walk(data.get("dependencies", {}))
+
+
+_PNPM_KEY_RE = re.compile(r"^  ['\"]?/?(@?[^@'\"\s(]+?)[@/](\d[^'\"():_\s]*)")
+
+
+def _pnpm_lock(path: Path) -> Iterator[Tuple[str, str]]:
+    """Keys under `packages:` - v5 `/name/1.0.0_peer`, v6 `/name@1.0.0(peer)`, v9 `name@1.0.0`."""
+    in_packages = False
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line and not line[0].isspace():
+                in_packages = line.rstrip() == "packages:"
+                continue
+            if in_packages and line.startswith("  ") and not line.startswith("   "):
+                m = _PNPM_KEY_RE.match(line)
+                if m:
+                    yield m.group(1), m.group(2)
+
+
+_TOML_STR_RE = re.compile(r'^(name|version)\s*=\s*"([^"]*)"')
+
+
+def _poetry_lock(path: Path) -> Iterator[Tuple[str, str]]:
+    name = version = None
+    in_package = False
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("["):
+                if name and version:
+                    yield name, version
+                name = version = None
+                in_package = line == "[[package]]"
+                continue
+            if in_package:
+                m = _TOML_STR_RE.match(line)
+                if m:
+                    if m.group(1) == "name":
+                        name = m.group(2)
+                    else:
+                        version = m.group(2)
+    if name and version:
+        yield name, version
+
+
+_REQ_PIN_RE = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*===?\s*([^\s;,\\]+)")
+
+
+def _requirements(path: Path) -> Iterator[Tuple[str, str]]:
+    """Exact pins only (`name==1.2.3`); ranges cannot be resolved offline."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split(" #", 1)[0].strip()
+            if not line or line.startswith(("#", "-")):
+                continue
+            m = _REQ_PIN_RE.match(line)
+            if m:
+                yield m.group(1), m.group(2)
+
+
+_PARSERS = {
+    "package-lock.json": _package_lock,
+    "npm-shrinkwrap.json": _package_lock,
+    "pnpm-lock.yaml": _pnpm_lock,
+    "poetry.lock": _poetry_lock,
+    "requirements.txt": _requirements,
+}
+
+
+def resolve_packages(project_path: str) -> Tuple[List[Package], List[Dict[str, str]]]:
+    """
+    Read every lockfile in the project root once and return the distinct
+    resolved packages, plus any lockfiles that could not be parsed.
+    """
+    packages: List[Package] = []
+    seen: Set[Tuple[str, str, str]] = set()
+    errors = []
+    for filename, ecosystem in LOCKFILES.items():
+        path = Path(project_path) / filename
+        if not path.is_file():
+            continue
+        try:
+            for name, version in _PARSERS[filename](path):
+                key = (ecosystem, normalize_name(ecosystem, name), version)
+                if key not in seen:
+                    seen.add(key)
+                    packages.append((ecosystem, name, version, filename))
+        except (OSError, ValueError, UnicodeDecodeError) as e:
+            errors.append({"file": filename, "error": str(e)})
+    return packages, errors
+
+
+def check_project(project_path: str, index: AdvisoryIndex) -> Dict[str, Any]:
+    """All vulnerable (package, advisory) pairs in the project's lockfiles."""
+    packages, errors = resolve_packages(project_path)
+    vulnerable = []
+    for ecosystem, name, version, source in packages:
+        for adv in index.query(ecosystem, name, version):
+            fixed = sorted({f for _, f, _ in adv["ranges"] if f})
+            vulnerable.append({
+                "ecosystem": ecosystem,
+                "package": name,
+                "version": version,
+                "file": source,
+                "advisory": adv["id"],
+                "aliases": adv.get("aliases", []),
+                "severity": adv["severity"],
+                "summary": adv["summary"],
+                "fixed": fixed,
+            })
+    by_severity = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+    for v in vulnerable:
+        by_severity[v["severity"]] = by_severity.get(v["severity"], 0) + 1
+    return {
+        "packages": len(packages),
+        "vulnerable": vulnerable,
+        "by_severity": by_severity,
+        "lockfile_errors": errors,
+    }
+
+
+# ============================================================================
+#  PLUGIN ENTRY POINT
+# ============================================================================
+
+def run(context: CheckContext) -> Findings:
+    """In-process entry point for verify_all/checklist; same verdict as main()."""
+    db_path = context.options.get("advisory_db") or default_db_path()
+    index = AdvisoryIndex.load(Path(db_path))
+    if index is None:
+        return Findings(True, summary=f"[SKIP] No advisory index at {db_path}; build one with --import DUMP")
+
+    result = check_project(str(context.project_path), index)
+    findings = [
+        Finding(f"{v['package']}@{v['version']}: {v['summary'] or v['advisory']}"
+                + (f" (fixed in {', '.join(v['fixed'])})" if v["fixed"] else ""),
+                v["severity"], file=v["file"], rule=v["advisory"])
+        for v in result["vulnerable"]
+    ]
+    failing = result["by_severity"]["critical"] + result["by_severity"]["high"]
+    return Findings(
+        passed=not failing,
+        findings=findings,
+        summary=f"{len(findings)} advisory match(es) in {result['packages']} package(s)",
+        data=result,
+    )
+
+
+# ============================================================================
+#  MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Offline dependency vulnerability check (vulnerability-scanner skill)"
+    )
+    parser.add_argument("project_path", nargs="?", default=".", help="Project directory to check")
+    parser.add_argument("--db", type=Path, default=None,
+                        help="Advisory index path (default: $AGENT_ADVISORY_DB or .agent/.cache/advisories.json)")
+    parser.add_argument("--import", dest="dumps", nargs="+", type=Path, metavar="DUMP",
+                        help="Build the index from OSV advisory dumps (dir, .zip, .json, .jsonl) and exit")
+    parser.add_argument("--output", choices=["json", "summary"], default="json", help="Output format")
+    args = parser.parse_args()
+    db_path = args.db or default_db_path()
+
+    if args.dumps:
+        missing = [str(d) for d in args.dumps if not d.exists()]
+        if missing:
+            print(json.dumps({"error": f"Dump not found: {', '.join(missing)}"}))
+            sys.exit(1)
+        index = build_index(args.dumps)
+        save_index(index, db_path)
+        print(json.dumps({"index": str(db_path), "entries": index["entries"],
+                          "packages": {eco: len(p) for eco, p in index["packages"].items()}}))
+        return
+
+    if not os.path.isdir(args.project_path):
+        print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
+        sys.exit(1)
+
+    index = AdvisoryIndex.load(db_path)
+    if index is None:
+        # Nothing to check against: report it, but do not fail the pipeline
+        print(json.dumps({"project": args.project_path, "index": None,
+                          "status": f"[SKIP] No advisory index at {db_path}; build one with --import DUMP"}))
+        return
+
+    result = {"project": args.project_path, "index": str(index.path), "index_built": index.built}
+    result.update(check_project(args.project_path, index))
+    failing = result["by_severity"]["critical"] + result["by_severity"]["high"]
+
+    if args.output == "summary":
+        print(f"\n{'='*60}")
+        print(f"Dependency Analysis: {result['project']}")
+        print(f"{'='*60}")
+        print(f"Packages: {result['packages']}  Vulnerable: {len(result['vulnerable'])}")
+        for v in result["vulnerable"]:
+            fix = f" (fixed in {', '.join(v['fixed'])})" if v["fixed"] else ""
+            print(f"  - [{v['severity']}] {v['package']}@{v['version']}: {v['advisory']}{fix}")
+    else:
+        print(json.dumps(result, indent=2))
+
+    sys.exit(1 if failing else 0)
+
+
+if __name__ == "__main__":
+    main()
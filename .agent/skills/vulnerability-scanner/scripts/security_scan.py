@@ -3,8 +3,11 @@
 Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
-Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
-Output: JSON with validation findings
+Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config] [--jobs N]
+                                              [--since GIT_REF] [--no-cache] [--max-file-size MB]
+                                              [--output json|summary|jsonl|sarif] [--sarif PATH]
+Output: JSON with validation findings (JSONL streams one record per finding as it
+        is found; SARIF 2.1.0 is written from the same stream)
 
 This script verifies:
 1. Dependencies - Supply chain security (OWASP A03)
@@ -18,9 +21,24 @@ import os
 import sys
 import re
 import argparse
+import hashlib
+import mmap
+import queue
+import threading
+from bisect import bisect_right
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Any
-from datetime import datetime
+from typing import Callable, Dict, List, Any, IO, Iterator, Optional, Sequence, Set, Tuple
+from datetime import datetime, timezone
+
+from dependency_analyzer import AdvisoryIndex, check_project, default_db_path
+
+# Shared file inventory and checker plugin API (.agent/scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory
+from pattern_scan import fold
+from checker_api import CheckCancelled, CheckContext, Finding, Findings
 
 # Fix Windows console encoding for Unicode output
 try:
@@ -85,9 +103,149 @@ DANGEROUS_PATTERNS = [
     (r'yaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)', "Unsafe YAML load", "high", "Deserialization risk"),
 ]
 
+# Literal prefilter: for each pattern, literals of which at least one must
+# occur (case-insensitively) wherever the pattern matches. A pattern left
+# out of these tables is simply checked everywhere.
+SECRET_LITERALS = {
+    "API Key": ("api",),
+    "Token": ("token",),
+    "Bearer Token": ("bearer",),
+    "AWS Access Key": ("akia",),
+    "AWS Secret": ("aws",),
+    "Azure Credential": ("azure",),
+    "GCP Credential": ("google",),
+    "Password": ("password",),
+    "Database Connection String": ("://",),
+    "Private Key": ("-----begin",),
+    "SSH Key": ("ssh-rsa",),
+    "JWT Token": ("eyj",),
+}
+
+PATTERN_LITERALS = {
+    "eval() usage": ("eval",),
+    "exec() usage": ("exec",),
+    "Function constructor": ("function",),
+    "child_process.exec": ("child_process.exec",),
+    "subprocess with shell=True": ("subprocess.call",),
+    "dangerouslySetInnerHTML": ("dangerouslysetinnerhtml",),
+    "innerHTML assignment": (".innerhtml",),
+    "document.write": ("document.write",),
+    "SQL String Concat": ("select", "insert", "update", "delete"),
+    "SQL f-string": ('f"',),
+    "SSL Verify Disabled": ("verify",),
+    "Insecure flag": ("--insecure",),
+    "SSL Disabled": ("disable",),
+    "pickle usage": ("pickle.load",),
+    "Unsafe YAML load": ("yaml.load",),
+}
+
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
+CONFIG_FILENAMES = {'next.config.js', 'webpack.config.js', '.eslintrc.js'}
+SCAN_BATCH_SIZE = 64      # files per worker task
+
+# Large files are mapped and scanned as bytes in line-aligned chunks instead
+# of being decoded whole; above MAX_SCAN_BYTES only head and tail are read.
+MMAP_THRESHOLD = 4 * 1024 * 1024
+MAX_SCAN_BYTES = 32 * 1024 * 1024   # default for --max-file-size
+SCAN_CHUNK_BYTES = 4 * 1024 * 1024
+SNIFF_BYTES = 8192                  # a NUL in here marks the file as binary
+
+# Findings kept in the JSON report per scan; streaming reporters see all of them
+REPORT_LIMITS = {"secrets": 15, "patterns": 20}
+
+
+# ============================================================================
+#  MATCHING ENGINE
+# ============================================================================
+
+class LiteralPrefilter:
+    """
+    Literal prefilter (Aho-Corasick style) for a pattern table.
+
+    Every pattern declares literals, one of which must occur wherever it
+    matches. Literals are located in the case-folded text with str.find
+    (C fastsearch, overlapping occurrences included), so a file is read
+    once and only patterns whose literals occur need their full regex run.
+    That regex alone decides a finding, so results are identical to
+    checking every pattern everywhere. Literals and text may be str or
+    bytes, as long as both are the same type.
+    """
+
+    def __init__(self, literals: Sequence[Tuple[str, ...]]):
+        self.by_literal: Dict[str, Set[int]] = {}
+        self.always: Set[int] = set()
+        for idx, lits in enumerate(literals):
+            if not lits:
+                self.always.add(idx)
+            for lit in lits:
+                self.by_literal.setdefault(lit.lower(), set()).add(idx)
+
+    def candidates(self, folded: str) -> List[int]:
+        """Sorted pattern indices that may match anywhere in the text."""
+        found = set(self.always)
+        for lit, idxs in self.by_literal.items():
+            if lit in folded:
+                found |= idxs
+        return sorted(found)
+
+    def line_candidates(self, folded: str, line_starts: List[int]) -> Dict[int, Set[int]]:
+        """{0-based line index: candidate pattern indices} for the text."""
+        per_line: Dict[int, Set[int]] = {}
+        for lit, idxs in self.by_literal.items():
+            pos = folded.find(lit)
+            while pos != -1:
+                line = bisect_right(line_starts, pos) - 1
+                per_line.setdefault(line, set()).update(idxs)
+                # Skip to the next line: one hit per line is enough
+                nxt = line_starts[line + 1] if line + 1 < len(line_starts) else len(folded)
+                pos = folded.find(lit, max(nxt, pos + 1))
+        if self.always:
+            for i in range(len(line_starts)):
+                per_line.setdefault(i, set()).update(self.always)
+        return per_line
+
+
+_SECRET_RES = [re.compile(p, re.IGNORECASE) for p, _, _ in SECRET_PATTERNS]
+_SECRET_FILTER = LiteralPrefilter([SECRET_LITERALS.get(t, ()) for _, t, _ in SECRET_PATTERNS])
+_PATTERN_RES = [re.compile(p, re.IGNORECASE) for p, _, _, _ in DANGEROUS_PATTERNS]
+_PATTERN_FILTER = LiteralPrefilter([PATTERN_LITERALS.get(n, ()) for _, n, _, _ in DANGEROUS_PATTERNS])
+_CONFIG_RES = [(re.compile(p, re.IGNORECASE), issue, sev) for p, issue, sev in CONFIG_ISSUES]
+
+# Bytes twins for mapped files. All patterns and literals are ASCII, and
+# bytes.lower() folds exactly what a bytes re.IGNORECASE folds.
+_SECRET_RES_B = [re.compile(p.encode(), re.IGNORECASE) for p, _, _ in SECRET_PATTERNS]
+_SECRET_FILTER_B = LiteralPrefilter([tuple(l.encode() for l in SECRET_LITERALS.get(t, ()))
+                                     for _, t, _ in SECRET_PATTERNS])
+_PATTERN_RES_B = [re.compile(p.encode(), re.IGNORECASE) for p, _, _, _ in DANGEROUS_PATTERNS]
+_PATTERN_FILTER_B = LiteralPrefilter([tuple(l.encode() for l in PATTERN_LITERALS.get(n, ()))
+                                      for _, n, _, _ in DANGEROUS_PATTERNS])
+_CONFIG_RES_B = [(re.compile(p.encode(), re.IGNORECASE), issue, sev) for p, issue, sev in CONFIG_ISSUES]
+
+
+def _file_ext(name: str) -> str:
+    """Extension used for rule selection; dotenv files (".env", ".env.local") count whole."""
+    lower = name.lower()
+    return lower if lower in CONFIG_EXTENSIONS else os.path.splitext(lower)[1]
+
+
+def _line_starts(lines_with_ends: List[str]) -> List[int]:
+    """Start offset of each line, matching str.splitlines() boundaries."""
+    starts, pos = [], 0
+    for line in lines_with_ends:
+        starts.append(pos)
+        pos += len(line)
+    return starts
 
 
 # ============================================================================
@@ -97,7 +255,7 @@ CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.
 def scan_dependencies(project_path: str) -> Dict[str, Any]:
     """
     Validate supply chain security (OWASP A03).
-    Checks: npm audit, lock file presence, dependency age.
+    Checks: lock file presence, known-vulnerable versions (offline index).
     """
     results = {"tool": "dependency_scanner", "findings": [], "status": "[OK] Secure"}
     
@@ -128,49 +286,33 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
                     "message": f"{manager}: No lock file found. Supply chain integrity at risk."
                 })
     
-    # Run npm audit if applicable
-    if (Path(project_path) / "package.json").exists():
-        try:
-            result = subprocess.run(
-                ["npm", "audit", "--json"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            try:
-                audit_data = json.loads(result.stdout)
-                vulnerabilities = audit_data.get("vulnerabilities", {})
-                
-                severity_count = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
-                for vuln in vulnerabilities.values():
-                    sev = vuln.get("severity", "low").lower()
-                    if sev in severity_count:
-                        severity_count[sev] += 1
-                
-                if severity_count["critical"] > 0:
-                    results["status"] = "[!!] Critical vulnerabilities"
-                    results["findings"].append({
-                        "type": "npm audit",
-                        "severity": "critical",
-                        "message": f"{severity_count['critical']} critical vulnerabilities in dependencies"
-                    })
-                elif severity_count["high"] > 0:
-                    results["status"] = "[!] High vulnerabilities"
-                    results["findings"].append({
-                        "type": "npm audit",
-                        "severity": "high",
-                        "message": f"{severity_count['high']} high severity vulnerabilities"
-                    })
-                
-                results["npm_audit"] = severity_count
-                
-            except json.JSONDecodeError:
-                pass
-                
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+    # Known-vulnerable versions, from the offline advisory index
+    index = AdvisoryIndex.load()
+    if index is None:
+        results["advisories"] = {
+            "index": None,
+            "note": f"No advisory index at {default_db_path()}; build one with dependency_analyzer.py --import DUMP"
+        }
+    else:
+        check = check_project(project_path, index)
+        results["advisories"] = {
+            "index": str(index.path),
+            "built": index.built,
+            "packages": check["packages"],
+            "by_severity": check["by_severity"],
+        }
+        for v in check["vulnerable"]:
+            fix = f", fixed in {', '.join(v['fixed'])}" if v["fixed"] else ""
+            results["findings"].append({
+                "type": "Vulnerable Dependency",
+                "severity": v["severity"],
+                "file": v["file"],
+                "message": f"{v['package']}@{v['version']}: {v['advisory']} {v['summary']}".rstrip() + fix
+            })
+        if check["by_severity"]["critical"] > 0:
+            results["status"] = "[!!] Critical vulnerabilities"
+        elif check["by_severity"]["high"] > 0:
+            results["status"] = "[!] High vulnerabilities"
     
     if not results["findings"]:
         results["status"] = "[OK] Supply chain checks passed"
@@ -182,30 +324,37 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
 #  UNIFIED SCANNING
 # ============================================================================
 
-def scan_file_content(filepath: Path, project_path: str, checks: List[str]) -> Dict[str, List[Dict]]:
-    """
-    Analyze a single file for multiple types of issues to minimize I/O.
-    """
-    findings = {
+def _empty_findings() -> Dict[str, List[Dict]]:
+    return {
         "secrets": [],
         "patterns": [],
         "config": []
     }
-    
-    try:
-        # Read file once
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-            lines = content.splitlines()
 
+
+def scan_file_content(filepath: Path, project_path: str, checks: List[str],
+                      max_bytes: int = MAX_SCAN_BYTES) -> Dict[str, List[Dict]]:
+    """
+    Analyze a single file for multiple types of issues to minimize I/O.
+    """
+    return _scan_path(str(filepath), project_path, checks, None, max_bytes)[1]
+
+
+def scan_text(content: str, filepath: Path, project_path: str, checks: List[str]) -> Dict[str, List[Dict]]:
+    """Run all requested checks over already-decoded file content."""
+    findings = _empty_findings()
+
+    try:
         rel_path = str(filepath.relative_to(project_path))
-        ext = filepath.suffix.lower()
+        ext = _file_ext(filepath.name)
+        folded = fold(content)
 
         # 1. Secret Scanning (All text files)
         if "secrets" in checks and (ext in CODE_EXTENSIONS or ext in CONFIG_EXTENSIONS):
-            for pattern, secret_type, severity in SECRET_PATTERNS:
-                matches = re.findall(pattern, content, re.IGNORECASE)
+            for idx in _SECRET_FILTER.candidates(folded):
+                matches = _SECRET_RES[idx].findall(content)
                 if matches:
+                    _, secret_type, severity = SECRET_PATTERNS[idx]
                     findings["secrets"].append({
                         "file": rel_path,
                         "type": secret_type,
@@ -215,12 +364,17 @@ def scan_file_content(filepath: Path, project_path: str, checks: List[str]) -> D
 
         # 2. Code Patterns (Code files only)
         if "patterns" in checks and ext in CODE_EXTENSIONS:
-            for line_num, line in enumerate(lines, 1):
-                for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                    if re.search(pattern, line, re.IGNORECASE):
+            lines = content.splitlines(keepends=True)
+            per_line = _PATTERN_FILTER.line_candidates(folded, _line_starts(lines))
+            for line_idx in sorted(per_line):
+                # Strip the line ending so `$`/`.` behave exactly as on splitlines()
+                line = lines[line_idx].splitlines()[0]
+                for idx in sorted(per_line[line_idx]):
+                    if _PATTERN_RES[idx].search(line):
+                        _, name, severity, category = DANGEROUS_PATTERNS[idx]
                         findings["patterns"].append({
                             "file": rel_path,
-                            "line": line_num,
+                            "line": line_idx + 1,
                             "pattern": name,
                             "severity": severity,
                             "category": category,
@@ -228,19 +382,9 @@ def scan_file_content(filepath: Path, project_path: str, checks: List[str]) -> D
                         })
 
         # 3. Configuration (Config files only)
-        if "config" in checks and (ext in CONFIG_EXTENSIONS or filepath.name in ['next.config.js', 'webpack.config.js', '.eslintrc.js']):
-            # Common config issues
-            config_issues = [
-                (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-                (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-                (r'NODE_ENV.*development', "Development mode in config", "medium"),
-                (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-                (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-                (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-            ]
-            
-            for pattern, issue, severity in config_issues:
-                if re.search(pattern, content, re.IGNORECASE):
+        if "config" in checks and (ext in CONFIG_EXTENSIONS or filepath.name in CONFIG_FILENAMES):
+            for regex, issue, severity in _CONFIG_RES:
+                if regex.search(content):
                     findings["config"].append({
                         "file": rel_path,
                         "issue": issue,
@@ -252,13 +396,490 @@ def scan_file_content(filepath: Path, project_path: str, checks: List[str]) -> D
 
     return findings
 
-def run_unified_scan(project_path: str, scan_types: List[str]) -> Dict[str, Any]:
+
+def _is_binary(head: bytes) -> bool:
+    return b"\0" in head[:SNIFF_BYTES]
+
+
+def _sample_regions(mm: mmap.mmap, size: int, max_bytes: int) -> List[Tuple[int, int]]:
+    """Byte ranges to scan: the whole file, or line-aligned head and tail halves."""
+    if size <= max_bytes:
+        return [(0, size)]
+    half = max_bytes // 2
+    head_end = mm.rfind(b"\n", 0, half) + 1 or half
+    tail_start = mm.find(b"\n", size - half) + 1 or size - half
+    return [(0, head_end), (max(head_end, tail_start), size)]
+
+
+def _iter_chunks(mm: mmap.mmap, start: int, end: int) -> Iterator[Tuple[int, bytes]]:
+    """(offset, chunk) over [start, end), each chunk ending on a line boundary when possible."""
+    pos = start
+    while pos < end:
+        stop = min(pos + SCAN_CHUNK_BYTES, end)
+        if stop < end:
+            nl = mm.rfind(b"\n", pos, stop)
+            if nl != -1:
+                stop = nl + 1
+        yield pos, mm[pos:stop]
+        pos = stop
+
+
+def _count_lines(mm: mmap.mmap, start: int, end: int) -> int:
+    return sum(mm[i:min(i + SCAN_CHUNK_BYTES, end)].count(b"\n")
+               for i in range(start, end, SCAN_CHUNK_BYTES))
+
+
+def scan_mapped(mm: mmap.mmap, filepath: Path, project_path: str, checks: List[str],
+                max_bytes: int = MAX_SCAN_BYTES) -> Dict[str, Any]:
+    """
+    Bytes-level twin of scan_text() for large files.
+
+    The file is never decoded as a whole: it is walked in line-aligned
+    chunks of SCAN_CHUNK_BYTES, so memory stays flat however big it is.
+    Files over `max_bytes` are sampled (first and last max_bytes/2) and
+    marked "sampled"; line numbers in the tail stay exact. A match that
+    straddles a chunk boundary (only possible inside a single line longer
+    than a chunk) is not reported.
+    """
+    findings: Dict[str, Any] = _empty_findings()
+    rel_path = str(filepath.relative_to(project_path))
+    ext = _file_ext(filepath.name)
+    do_secrets = "secrets" in checks and (ext in CODE_EXTENSIONS or ext in CONFIG_EXTENSIONS)
+    do_patterns = "patterns" in checks and ext in CODE_EXTENSIONS
+    do_config = "config" in checks and (ext in CONFIG_EXTENSIONS or filepath.name in CONFIG_FILENAMES)
+
+    size = len(mm)
+    regions = _sample_regions(mm, size, max_bytes)
+    if len(regions) > 1:
+        findings["sampled"] = True
+    secret_counts: Dict[int, int] = {}
+    config_hits: Set[int] = set()
+
+    line_base = 0
+    prev_end = 0
+    for start, end in regions:
+        line_base += _count_lines(mm, prev_end, start)
+        prev_end = end
+        for _, chunk in _iter_chunks(mm, start, end):
+            folded = chunk.lower()
+
+            if do_secrets:
+                for idx in _SECRET_FILTER_B.candidates(folded):
+                    n = len(_SECRET_RES_B[idx].findall(chunk))
+                    if n:
+                        secret_counts[idx] = secret_counts.get(idx, 0) + n
+
+            if do_patterns:
+                lines = chunk.split(b"\n")
+                starts, pos = [], 0
+                for line in lines:
+                    starts.append(pos)
+                    pos += len(line) + 1
+                per_line = _PATTERN_FILTER_B.line_candidates(folded, starts)
+                for line_idx in sorted(per_line):
+                    line = lines[line_idx].rstrip(b"\r")
+                    for idx in sorted(per_line[line_idx]):
+                        if _PATTERN_RES_B[idx].search(line):
+                            _, name, severity, category = DANGEROUS_PATTERNS[idx]
+                            findings["patterns"].append({
+                                "file": rel_path,
+                                "line": line_base + line_idx + 1,
+                                "pattern": name,
+                                "severity": severity,
+                                "category": category,
+                                "snippet": line[:1024].decode("utf-8", errors="ignore").strip()[:80]
+                            })
+
+            if do_config:
+                for i, (regex, _, _) in enumerate(_CONFIG_RES_B):
+                    if i not in config_hits and regex.search(chunk):
+                        config_hits.add(i)
+
+            line_base += chunk.count(b"\n")
+
+    for idx in sorted(secret_counts):
+        _, secret_type, severity = SECRET_PATTERNS[idx]
+        findings["secrets"].append({
+            "file": rel_path,
+            "type": secret_type,
+            "severity": severity,
+            "count": secret_counts[idx]
+        })
+    for i in sorted(config_hits):
+        _, issue, severity = _CONFIG_RES_B[i]
+        findings["config"].append({
+            "file": rel_path,
+            "issue": issue,
+            "severity": severity
+        })
+    return findings
+
+
+# ============================================================================
+#  FINDINGS CACHE
+# ============================================================================
+
+def rules_hash(checks: List[str], max_bytes: int = MAX_SCAN_BYTES) -> str:
+    """Hash of everything that decides a file's findings besides its content."""
+    blob = json.dumps({
+        "secrets": SECRET_PATTERNS, "secret_literals": SECRET_LITERALS,
+        "patterns": DANGEROUS_PATTERNS, "pattern_literals": PATTERN_LITERALS,
+        "config": CONFIG_ISSUES, "code_ext": sorted(CODE_EXTENSIONS),
+        "config_ext": sorted(CONFIG_EXTENSIONS), "config_files": sorted(CONFIG_FILENAMES),
+        "checks": sorted(checks), "max_bytes": max_bytes,
+    }, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+class FindingsCache:
+    """
+    Persistent per-file findings, stored under the scanned project.
+
+    An entry is reused when the file's mtime and size are unchanged; if
+    only the mtime moved, the content hash decides. The whole cache is
+    dropped when the rule set (or the requested checks) change.
+    """
+
+    CACHE_FILE = Path(".agent/.cache/security_scan.json")
+
+    def __init__(self, project_path: str, checks: List[str], enabled: bool = True,
+                 max_bytes: int = MAX_SCAN_BYTES):
+        self.path = Path(project_path) / self.CACHE_FILE
+        self.enabled = enabled
+        self.rules = rules_hash(checks, max_bytes)
+        self.entries: Dict[str, list] = {}
+        self.seen: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        if enabled:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("rules") == self.rules:
+                    self.entries = data.get("files", {})
+            except (OSError, ValueError):
+                pass
+
+    def lookup(self, rel: str, st: os.stat_result) -> Tuple[Optional[Dict], Optional[str]]:
+        """(cached findings if stat matches, else None; known content hash)."""
+        entry = self.entries.get(rel) if self.enabled else None
+        if not entry:
+            return None, None
+        if entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[3], entry[2]
+        return None, entry[2]
+
+    def store(self, rel: str, st: os.stat_result, digest: str, findings: Dict) -> None:
+        if self.enabled and digest:
+            self.entries[rel] = [st.st_mtime_ns, st.st_size, digest, findings]
+
+    def save(self, prune: bool) -> None:
+        """Write atomically; `prune` drops entries for files not seen this run."""
+        if not self.enabled:
+            return
+        files = {k: v for k, v in self.entries.items() if k in self.seen} if prune else self.entries
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"rules": self.rules, "files": files}), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+def _scan_path(path: str, project_path: str, checks: List[str], known_hash: Optional[str],
+               max_bytes: int = MAX_SCAN_BYTES) -> Tuple[Optional[str], Optional[Dict]]:
+    """
+    Read, hash and scan one file. Returns (content hash, findings), with
+    findings None when the hash equals `known_hash` (cached ones still hold).
+    Binary files (NUL in the first SNIFF_BYTES) get empty findings marked
+    "binary"; large ones are mapped and handed to scan_mapped().
+    """
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > min(MMAP_THRESHOLD, max_bytes):
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest = hashlib.sha1(mm).hexdigest()
+                    if digest == known_hash:
+                        return digest, None
+                    if _is_binary(mm[:SNIFF_BYTES]):
+                        return digest, dict(_empty_findings(), binary=True)
+                    return digest, scan_mapped(mm, Path(path), project_path, checks, max_bytes)
+            data = f.read()
+    except (OSError, ValueError):
+        return None, _empty_findings()
+    digest = hashlib.sha1(data).hexdigest()
+    if digest == known_hash:
+        return digest, None
+    if _is_binary(data):
+        return digest, dict(_empty_findings(), binary=True)
+    # Same text as open(..., 'r', errors='ignore'): universal newlines
+    content = data.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+    return digest, scan_text(content, Path(path), project_path, checks)
+
+
+# ============================================================================
+#  FILE PIPELINE
+# ============================================================================
+
+def _is_scannable(name: str) -> bool:
+    ext = _file_ext(name)
+    return ext in CODE_EXTENSIONS or ext in CONFIG_EXTENSIONS or name in CONFIG_FILENAMES
+
+
+def _iter_scan_files(project_path: str) -> Iterator[Path]:
+    """Files worth scanning from the shared inventory, in path order."""
+    # The inventory already prunes .agent/.cache (our findings cache).
+    # Ignored files are listed too: .env and friends are gitignored exactly
+    # because they hold secrets.
+    inventory = get_inventory(project_path, gitignore=False)
+    for entry in inventory.files(skip_dirs=SKIP_DIRS, where=lambda e: _is_scannable(e.name)):
+        yield Path(project_path) / entry.rel
+
+
+def _git_lines(project_path: str, cmd: List[str]) -> List[str]:
+    result = subprocess.run(cmd, cwd=project_path, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} failed: {result.stderr.strip()}")
+    return result.stdout.splitlines()
+
+
+def _walk_prunes(parts: Tuple[str, ...]) -> bool:
+    """Whether the full walk skips a path with these directory parts."""
+    return any(p in SKIP_DIRS for p in parts) or parts[:2] == FindingsCache.CACHE_FILE.parent.parts
+
+
+def git_changed_files(project_path: str, ref: str) -> List[Path]:
+    """
+    Files changed since `ref` (committed, staged, unstaged and untracked),
+    plus every gitignored file, limited to what a full walk would scan.
+    Ignored files have no history to compare against, and the full scan
+    reads them (that is where .env secrets live), so they are always listed;
+    the findings cache makes the unchanged ones cheap.
+    """
+    paths = _git_lines(project_path, ["git", "diff", "--name-only", "--relative", ref, "--"])
+    paths += _git_lines(project_path, ["git", "ls-files", "--others", "--exclude-standard"])
+    # --directory reports an ignored directory as one "dir/" entry instead of
+    # listing node_modules and friends file by file; expand only the ones
+    # the full walk would enter
+    ignored = ["git", "ls-files", "--others", "--ignored", "--exclude-standard"]
+    for rel in _git_lines(project_path, ignored + ["--directory"]):
+        if not rel.endswith("/"):
+            paths.append(rel)
+        elif not _walk_prunes(Path(rel).parts):
+            paths += _git_lines(project_path, ignored + ["--", rel])
+
+    files = []
+    for rel in sorted(set(paths)):
+        parts = Path(rel).parts
+        full = Path(project_path) / rel
+        if _walk_prunes(parts[:-1]) or not _is_scannable(parts[-1]):
+            continue
+        if full.is_file():
+            files.append(full)
+    return files
+
+
+# A batch item: (path, cached findings or None, known hash, stat)
+_Item = Tuple[str, Optional[Dict], Optional[str], Optional[os.stat_result]]
+
+
+def _scan_batch(items: List[Tuple[str, Optional[str]]], project_path: str, checks: List[str],
+                max_bytes: int = MAX_SCAN_BYTES) -> List[Tuple[Optional[str], Optional[Dict]]]:
+    """Worker entry point: scan a batch of (path, known hash), in input order."""
+    return [_scan_path(p, project_path, checks, h, max_bytes) for p, h in items]
+
+
+def _walk_batches(paths: Iterator[Path], project_path: str, cache: FindingsCache,
+                  out: "queue.Queue[Optional[List[_Item]]]", stop: threading.Event) -> None:
+    """Producer: stat + cache lookup, feed batches to `out`, then None (early once `stop` is set)."""
+    try:
+        batch: List[_Item] = []
+        for filepath in paths:
+            if stop.is_set():
+                return
+            try:
+                st = filepath.stat()
+            except OSError:
+                st = None
+            rel = str(filepath.relative_to(project_path))
+            cached, known = cache.lookup(rel, st) if st else (None, None)
+            batch.append((str(filepath), cached, known, st))
+            if len(batch) >= SCAN_BATCH_SIZE:
+                out.put(batch)
+                batch = []
+        if batch:
+            out.put(batch)
+    finally:
+        out.put(None)
+
+
+def _scan_files(project_path: str, scan_types: List[str], jobs: Optional[int] = None,
+                cache: Optional[FindingsCache] = None,
+                paths: Optional[List[Path]] = None,
+                max_bytes: int = MAX_SCAN_BYTES,
+                cancelled: Optional[Callable[[], bool]] = None) -> Iterator[Tuple[Path, Dict[str, List[Dict]]]]:
+    """
+    Yield (path, findings) for every scannable file, in inventory order
+    (or in `paths` order when an explicit file list is given).
+
+    A walker thread stats files and resolves cache hits; only misses are
+    read and scanned, on a process pool when jobs > 1. Results are yielded
+    strictly in that order, so the merged report is identical to a serial,
+    uncached run. In-flight batches are bounded to keep memory flat.
+    `cancelled` is polled between batches; once it returns True the walker
+    and the pool are stopped and CheckCancelled is raised.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    cache = cache or FindingsCache(project_path, scan_types, enabled=False, max_bytes=max_bytes)
+    source = iter(paths) if paths is not None else _iter_scan_files(project_path)
+    batches: "queue.Queue[Optional[List[_Item]]]" = queue.Queue(maxsize=jobs * 4)
+    stop = threading.Event()
+    walker = threading.Thread(target=_walk_batches, args=(source, project_path, cache, batches, stop), daemon=True)
+    walker.start()
+
+    def check_cancelled() -> None:
+        if cancelled is not None and cancelled():
+            raise CheckCancelled("security scan cancelled")
+
+    def stop_walker() -> None:
+        stop.set()
+        while walker.is_alive():      # unblock a walker waiting on a full queue
+            try:
+                batches.get(timeout=0.05)
+            except queue.Empty:
+                pass
+
+    first = batches.get()
+    second = batches.get() if first is not None else None
+
+    def drain() -> Iterator[List[_Item]]:
+        for batch in (first, second):
+            if batch is None:
+                return
+            yield batch
+        yield from iter(batches.get, None)
+
+    def misses(batch: List[_Item]) -> List[Tuple[str, Optional[str]]]:
+        return [(path, known) for path, cached, known, _ in batch if cached is None]
+
+    def resolve(batch: List[_Item], scanned: List[Tuple[Optional[str], Optional[Dict]]]):
+        results = iter(scanned)
+        for path, cached, known, st in batch:
+            rel = str(Path(path).relative_to(project_path))
+            cache.seen.add(rel)
+            if cached is not None:
+                cache.hits += 1
+                yield Path(path), cached
+                continue
+            digest, findings = next(results)
+            if findings is None:   # content unchanged, only mtime moved
+                cache.hits += 1
+                findings = cache.entries[rel][3]
+            else:
+                cache.misses += 1
+            if st is not None:
+                cache.store(rel, st, digest, findings)
+            yield Path(path), findings
+
+    # Small trees (or --jobs 1): pool startup would cost more than it saves
+    if jobs <= 1 or second is None:
+        try:
+            for batch in drain():
+                check_cancelled()
+                yield from resolve(batch, _scan_batch(misses(batch), project_path, scan_types, max_bytes))
+        except BaseException:
+            stop_walker()
+            raise
+        walker.join()
+        return
+
+    pending: "deque[Tuple[List[_Item], Optional[Future]]]" = deque()
+    pool = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        for batch in drain():
+            check_cancelled()
+            todo = misses(batch)
+            fut = pool.submit(_scan_batch, todo, project_path, scan_types, max_bytes) if todo else None
+            pending.append((batch, fut))
+            # Bounded window: yield the oldest batch before submitting more
+            while len(pending) >= jobs * 2:
+                done, fut = pending.popleft()
+                yield from resolve(done, fut.result() if fut else [])
+        while pending:
+            check_cancelled()
+            done, fut = pending.popleft()
+            yield from resolve(done, fut.result() if fut else [])
+    except BaseException:
+        # Cancelled (or abandoned): drop queued batches rather than finish them
+        pool.shutdown(wait=False, cancel_futures=True)
+        stop_walker()
+        raise
+    pool.shutdown()
+    walker.join()
+
+
+def _keep(findings: List[Dict], new: List[Dict], scan: str) -> None:
+    """Extend `findings` with `new`, up to the report limit for `scan`."""
+    room = REPORT_LIMITS[scan] - len(findings)
+    if room > 0:
+        findings.extend(new[:room])
+
+
+def _merge_file_findings(results: Dict[str, Any], filepath: Path,
+                         file_findings: Dict[str, List[Dict]], scan_types: List[str],
+                         reporter: Optional["Reporter"] = None) -> None:
+    """
+    Aggregate one file's findings into the unified results. Only the first
+    REPORT_LIMITS findings are retained; every one goes to `reporter`.
+    """
+    ext = _file_ext(filepath.name)
+
+    if "secrets" in scan_types:
+        results["secrets"]["scanned_files"] += 1
+        if file_findings["secrets"]:
+            _keep(results["secrets"]["findings"], file_findings["secrets"], "secrets")
+            for f in file_findings["secrets"]:
+                results["secrets"]["by_severity"][f["severity"]] += 1
+                if reporter:
+                    reporter.finding("secrets", f)
+
+    if "patterns" in scan_types and ext in CODE_EXTENSIONS:
+        results["patterns"]["scanned_files"] += 1
+        if file_findings["patterns"]:
+            _keep(results["patterns"]["findings"], file_findings["patterns"], "patterns")
+            for f in file_findings["patterns"]:
+                results["patterns"]["by_category"][f["category"]] = results["patterns"]["by_category"].get(f["category"], 0) + 1
+                results["patterns"]["by_severity"][f["severity"]] = results["patterns"]["by_severity"].get(f["severity"], 0) + 1
+                if reporter:
+                    reporter.finding("patterns", f)
+
+    if "config" in scan_types and (ext in CONFIG_EXTENSIONS or filepath.name in CONFIG_FILENAMES):
+        if file_findings["config"]:
+            results["config"]["findings"].extend(file_findings["config"])
+            if reporter:
+                for f in file_findings["config"]:
+                    reporter.finding("config", f)
+
+
+def run_unified_scan(project_path: str, scan_types: List[str], jobs: Optional[int] = None,
+                     use_cache: bool = True, since: Optional[str] = None,
+                     meta: Optional[Dict[str, Any]] = None,
+                     max_bytes: int = MAX_SCAN_BYTES,
+                     reporter: Optional["Reporter"] = None,
+                     cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
     """
     Perform a single-pass scan of the file system.
+    `jobs` scanner processes are used (default: CPU count; 1 = serial).
+    Unchanged files reuse cached findings; `since` limits the scan to files
+    changed relative to that git ref (and gitignored ones). Files over `max_bytes` are head/tail
+    sampled. Cache and large-file statistics go into `meta`. Each finding
+    is passed to `reporter` as soon as its file has been merged. The scan
+    stops with CheckCancelled once `cancelled()` returns True.
     """
     results = {
         "secrets": {"tool": "secret_scanner", "findings": [], "status": "[OK]", "scanned_files": 0, "by_severity": {"critical": 0, "high": 0, "medium": 0}},
-        "patterns": {"tool": "pattern_scanner", "findings": [], "status": "[OK]", "scanned_files": 0, "by_category": {}},
+        "patterns": {"tool": "pattern_scanner", "findings": [], "status": "[OK]", "scanned_files": 0, "by_category": {}, "by_severity": {}},
         "config": {"tool": "config_scanner", "findings": [], "status": "[OK]", "checks": {}}
     }
 
@@ -271,44 +892,33 @@ def run_unified_scan(project_path: str, scan_types: List[str]) -> Dict[str, Any]
                 break
         else:
             results["config"]["checks"]["security_headers_config"] = False
-            results["config"]["findings"].append({
+            missing = {
                 "issue": "No security headers configuration found",
                 "severity": "medium",
                 "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
-            })
+            }
+            results["config"]["findings"].append(missing)
+            if reporter:
+                reporter.finding("config", missing)
 
-    # Main O(N) Walk
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            filepath = Path(root) / file
-            ext = filepath.suffix.lower()
-            
-            # Optimization: Skip likely binary/irrelevant files early
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-
-            file_findings = scan_file_content(filepath, project_path, scan_types)
-            
-            # Aggregate Results
-            if "secrets" in scan_types:
-                results["secrets"]["scanned_files"] += 1
-                if file_findings["secrets"]:
-                    results["secrets"]["findings"].extend(file_findings["secrets"])
-                    for f in file_findings["secrets"]:
-                        results["secrets"]["by_severity"][f["severity"]] += 1
-
-            if "patterns" in scan_types and ext in CODE_EXTENSIONS:
-                results["patterns"]["scanned_files"] += 1
-                if file_findings["patterns"]:
-                    results["patterns"]["findings"].extend(file_findings["patterns"])
-                    for f in file_findings["patterns"]:
-                         results["patterns"]["by_category"][f["category"]] = results["patterns"]["by_category"].get(f["category"], 0) + 1
-
-            if "config" in scan_types and (ext in CONFIG_EXTENSIONS or file in ['next.config.js', 'webpack.config.js', '.eslintrc.js']):
-                if file_findings["config"]:
-                    results["config"]["findings"].extend(file_findings["config"])
+    # Main O(N) Walk, scanned serially or on a process pool
+    cache = FindingsCache(project_path, scan_types, enabled=use_cache, max_bytes=max_bytes)
+    paths = git_changed_files(project_path, since) if since else None
+    sampled: List[str] = []
+    binary = 0
+    for filepath, file_findings in _scan_files(project_path, scan_types, jobs, cache, paths, max_bytes, cancelled):
+        _merge_file_findings(results, filepath, file_findings, scan_types, reporter)
+        if file_findings.get("binary"):
+            binary += 1
+        elif file_findings.get("sampled"):
+            sampled.append(str(filepath.relative_to(project_path)))
+    cache.save(prune=since is None)
+    if meta is not None:
+        meta["cache"] = {"enabled": use_cache, "hits": cache.hits, "misses": cache.misses}
+        meta["large_files"] = {"max_file_bytes": max_bytes, "sampled": sampled, "binary_skipped": binary}
+        if since:
+            meta["since"] = since
+            meta["changed_files"] = len(paths)
 
     # Post-process statuses
     # Secrets Status
@@ -318,18 +928,16 @@ def run_unified_scan(project_path: str, scan_types: List[str]) -> Dict[str, Any]
         results["secrets"]["status"] = "[!] HIGH: Secrets found"
     elif results["secrets"]["findings"]:
          results["secrets"]["status"] = "[?] Potential secrets detected"
-    results["secrets"]["findings"] = results["secrets"]["findings"][:15]
 
     # Patterns Status
-    crit_p = sum(1 for f in results["patterns"]["findings"] if f["severity"] == "critical")
-    high_p = sum(1 for f in results["patterns"]["findings"] if f["severity"] == "high")
+    crit_p = results["patterns"]["by_severity"].get("critical", 0)
+    high_p = results["patterns"]["by_severity"].get("high", 0)
     if crit_p > 0:
         results["patterns"]["status"] = f"[!!] CRITICAL: {crit_p} dangerous patterns"
     elif high_p > 0:
         results["patterns"]["status"] = f"[!] HIGH: {high_p} risky patterns"
     elif results["patterns"]["findings"]:
          results["patterns"]["status"] = "[?] Some patterns need review"
-    results["patterns"]["findings"] = results["patterns"]["findings"][:20]
 
     # Config Status
     if any(f["severity"] == "critical" for f in results["config"]["findings"]):
@@ -341,13 +949,209 @@ def run_unified_scan(project_path: str, scan_types: List[str]) -> Dict[str, Any]
 
     return results
 
+
+# ============================================================================
+#  REPORTERS
+# ============================================================================
+
+class Reporter:
+    """
+    Receives the scan as a stream: start(), one finding() per finding in
+    walk order, then finish() with the aggregated report.
+    """
+
+    def start(self, header: Dict[str, Any]) -> None:
+        pass
+
+    def finding(self, scan: str, finding: Dict[str, Any]) -> None:
+        pass
+
+    def finish(self, report: Dict[str, Any]) -> None:
+        pass
+
+
+class JsonlReporter(Reporter):
+    """One JSON object per line, flushed as soon as it is known."""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
+
+    def start(self, header: Dict[str, Any]) -> None:
+        self._write({"type": "start", **header})
+
+    def finding(self, scan: str, finding: Dict[str, Any]) -> None:
+        self._write({"type": "finding", "scan": scan, "finding": finding})
+
+    def finish(self, report: Dict[str, Any]) -> None:
+        record = {k: v for k, v in report.items() if k != "scans"}
+        record["status"] = {name: scan.get("status") for name, scan in report["scans"].items()}
+        self._write({"type": "summary", **record})
+
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {"critical": "error", "high": "error", "medium": "warning", "moderate": "warning"}
+SARIF_SECURITY_SEVERITY = {"critical": "9.0", "high": "7.0", "medium": "5.0", "moderate": "5.0", "low": "3.0"}
+
+
+def _rule_name(scan: str, finding: Dict[str, Any]) -> str:
+    return str(finding.get("pattern") or finding.get("type") or finding.get("issue") or scan)
+
+
+class SarifWriter(Reporter):
+    """
+    SARIF 2.1.0 log written incrementally from the finding stream.
+
+    Results are written as they arrive; the rule table (the only state
+    kept) is emitted after them, which JSON key order allows.
+    """
+
+    def __init__(self, stream: IO[str], project_path: str):
+        self.stream = stream
+        self.root_uri = Path(project_path).resolve().as_uri() + "/"
+        self.rules: Dict[str, Dict[str, Any]] = {}
+        self.results = 0
+
+    def start(self, header: Dict[str, Any]) -> None:
+        self.stream.write('{"$schema": "%s", "version": "2.1.0", "runs": [{"results": [' % SARIF_SCHEMA)
+
+    def finding(self, scan: str, finding: Dict[str, Any]) -> None:
+        name = _rule_name(scan, finding)
+        rule_id = f"{scan}/" + re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+        severity = finding.get("severity", "low")
+        if rule_id not in self.rules:
+            self.rules[rule_id] = {
+                "id": rule_id,
+                "name": name,
+                "shortDescription": {"text": finding.get("category") or name},
+                "defaultConfiguration": {"level": SARIF_LEVELS.get(severity, "note")},
+                "properties": {"tags": ["security", scan],
+                               "security-severity": SARIF_SECURITY_SEVERITY.get(severity, "3.0")},
+            }
+
+        text = finding.get("message") or name
+        if finding.get("count"):
+            text += f" ({finding['count']} occurrence(s))"
+        if finding.get("recommendation"):
+            text += f". {finding['recommendation']}"
+        result: Dict[str, Any] = {
+            "ruleId": rule_id,
+            "level": SARIF_LEVELS.get(severity, "note"),
+            "message": {"text": text},
+            "properties": {"severity": severity},
+        }
+        if finding.get("file"):
+            location: Dict[str, Any] = {
+                "artifactLocation": {"uri": Path(finding["file"]).as_posix(), "uriBaseId": "%SRCROOT%"}
+            }
+            if finding.get("line"):
+                location["region"] = {"startLine": finding["line"]}
+                if finding.get("snippet"):
+                    location["region"]["snippet"] = {"text": finding["snippet"]}
+            result["locations"] = [{"physicalLocation": location}]
+
+        self.stream.write(("," if self.results else "") + "\n" + json.dumps(result))
+        self.results += 1
+
+    def finish(self, report: Dict[str, Any]) -> None:
+        tail = {
+            "tool": {"driver": {
+                "name": "security_scan",
+                "informationUri": "https://owasp.org/Top10/",
+                "rules": list(self.rules.values()),
+            }},
+            "originalUriBaseIds": {"%SRCROOT%": {"uri": self.root_uri}},
+            "invocations": [{
+                "executionSuccessful": True,
+                "endTimeUtc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }],
+        }
+        self.stream.write("\n], " + json.dumps(tail)[1:] + "]}\n")
+        self.stream.flush()
+
+
+class FanoutReporter(Reporter):
+    """Feed one stream to several reporters."""
+
+    def __init__(self, reporters: List[Reporter]):
+        self.reporters = reporters
+
+    def start(self, header: Dict[str, Any]) -> None:
+        for r in self.reporters:
+            r.start(header)
+
+    def finding(self, scan: str, finding: Dict[str, Any]) -> None:
+        for r in self.reporters:
+            r.finding(scan, finding)
+
+    def finish(self, report: Dict[str, Any]) -> None:
+        for r in self.reporters:
+            r.finish(report)
+
+
+class FindingsCollector(Reporter):
+    """Collect the stream as checker_api Findings (the in-process plugin path)."""
+
+    def __init__(self):
+        self.findings: List[Finding] = []
+
+    def finding(self, scan: str, finding: Dict[str, Any]) -> None:
+        name = _rule_name(scan, finding)
+        severity = finding.get("severity", "low")
+        self.findings.append(Finding(
+            message=finding.get("message") or name,
+            severity="medium" if severity == "moderate" else severity,
+            file=Path(finding["file"]).as_posix() if finding.get("file") else None,
+            line=finding.get("line"),
+            rule=f"{scan}/{name}",
+        ))
+
+
+# ============================================================================
+#  PLUGIN ENTRY POINT
+# ============================================================================
+
+def run(context: CheckContext) -> Findings:
+    """
+    In-process entry point for verify_all/checklist (.agent/scripts/checker_api.py).
+    Every finding is collected, not just the REPORT_LIMITS kept in the
+    report; like main(), only a scan that cannot run fails the check.
+    """
+    collector = FindingsCollector()
+    try:
+        report = run_full_scan(str(context.project_path), context.options.get("scan_type", "all"),
+                               jobs=context.options.get("jobs"), reporter=collector,
+                               cancelled=lambda: context.cancelled)
+    except RuntimeError as e:
+        return Findings(False, summary=str(e))
+    summary = report["summary"]
+    return Findings(
+        passed=True,
+        findings=collector.findings,
+        summary=(f"{summary['overall_status']}: {summary['total_findings']} finding(s), "
+                 f"{summary['critical']} critical, {summary['high']} high"),
+        data=report,
+    )
+
+
 # ============================================================================
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
-    
+def run_full_scan(project_path: str, scan_type: str = "all", jobs: Optional[int] = None,
+                  use_cache: bool = True, since: Optional[str] = None,
+                  max_bytes: int = MAX_SCAN_BYTES,
+                  reporter: Optional[Reporter] = None,
+                  cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """
+    Execute security validation scans, streaming findings to `reporter`.
+    Raises CheckCancelled once `cancelled()` returns True.
+    """
+    reporter = reporter or Reporter()
+
     report = {
         "project": project_path,
         "timestamp": datetime.now().isoformat(),
@@ -360,10 +1164,13 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
             "overall_status": "[OK] SECURE"
         }
     }
+    reporter.start({k: report[k] for k in ("project", "timestamp", "scan_type")})
 
     # 1. Dependency Scan (Independent)
     if scan_type == "all" or scan_type == "deps":
         report["scans"]["dependencies"] = scan_dependencies(project_path)
+        for finding in report["scans"]["dependencies"]["findings"]:
+            reporter.finding("dependencies", finding)
 
     # 2. Content Scans (Unified)
     active_types = []
@@ -374,8 +1181,12 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
             active_types = [scan_type]
     
     if active_types:
-        unified_results = run_unified_scan(project_path, active_types)
+        meta: Dict[str, Any] = {}
+        unified_results = run_unified_scan(project_path, active_types, jobs=jobs,
+                                           use_cache=use_cache, since=since, meta=meta,
+                                           max_bytes=max_bytes, reporter=reporter, cancelled=cancelled)
         report["scans"].update(unified_results)
+        report.update(meta)
     
     # Summary Aggregation
     for scan in report["scans"].values():
@@ -396,7 +1207,8 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
         report["summary"]["overall_status"] = "[!] HIGH RISK ISSUES"
     elif report["summary"]["total_findings"] > 0:
         report["summary"]["overall_status"] = "[?] REVIEW RECOMMENDED"
-    
+
+    reporter.finish(report)
     return report
 
 
@@ -407,8 +1219,18 @@ def main():
     parser.add_argument("project_path", nargs="?", default=".", help="Project directory to scan")
     parser.add_argument("--scan-type", choices=["all", "deps", "secrets", "patterns", "config"],
                         default="all", help="Type of scan to run")
-    parser.add_argument("--output", choices=["json", "summary"], default="json",
-                        help="Output format")
+    parser.add_argument("--output", choices=["json", "summary", "jsonl", "sarif"], default="json",
+                        help="Output format (jsonl and sarif stream findings as they are found)")
+    parser.add_argument("--sarif", metavar="PATH", default=None,
+                        help="Also write a SARIF 2.1.0 log to PATH")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Scanner processes (default: CPU count, 1 = serial)")
+    parser.add_argument("--since", metavar="GIT_REF", default=None,
+                        help="Only scan files changed since this git ref (plus untracked and gitignored files)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore and do not update the per-file findings cache")
+    parser.add_argument("--max-file-size", type=float, default=MAX_SCAN_BYTES / (1024 * 1024), metavar="MB",
+                        help="Scan only the head and tail of files larger than this (default: %(default)g)")
     
     args = parser.parse_args()
     
@@ -416,9 +1238,30 @@ def main():
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
     
-    result = run_full_scan(args.project_path, args.scan_type)
-    
-    if args.output == "summary":
+    reporters: List[Reporter] = []
+    if args.output == "jsonl":
+        reporters.append(JsonlReporter(sys.stdout))
+    elif args.output == "sarif":
+        reporters.append(SarifWriter(sys.stdout, args.project_path))
+    sarif_file = open(args.sarif, "w", encoding="utf-8") if args.sarif else None
+    if sarif_file:
+        reporters.append(SarifWriter(sarif_file, args.project_path))
+
+    try:
+        result = run_full_scan(args.project_path, args.scan_type, jobs=args.jobs,
+                               use_cache=not args.no_cache, since=args.since,
+                               max_bytes=max(1, int(args.max_file_size * 1024 * 1024)),
+                               reporter=FanoutReporter(reporters))
+    except RuntimeError as e:
+        print(json.dumps({"error": str(e)}))
+        sys.exit(1)
+    finally:
+        if sarif_file:
+            sarif_file.close()
+
+    if args.output in ("jsonl", "sarif"):
+        pass  # already streamed
+    elif args.output == "summary":
         print(f"\n{'='*60}")
         print(f"Security Scan: {result['project']}")
         print(f"{'='*60}")
@@ -0,0 +1,157 @@
+"""
+test_check_scheduler.py — Test Suite for the resource-aware check scheduler
+Covers resource packing, dependencies, stop-on-fail and the critical path.
+"""
+
+import os
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts dir to path
+sys.path.insert(0, str(Path(__file__).parent.parent / ".agent" / "scripts"))
+from check_scheduler import (ALL_CORES, Check, DurationHistory, Needs, Scheduler,
+                             critical_path, run_command)
+from checker_api import CheckContext, run_plugin
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+def _check(name, needs=Needs(), required=False, after=()):
+    return Check(name, Path(f"{name}.py"), required, "Test", needs, after)
+
+
+def _runner(durations, failing=()):
+    def run_one(check):
+        time.sleep(durations.get(check.name, 0.02))
+        return {"name": check.name, "passed": check.name not in failing, "skipped": False}
+    return run_one
+
+
+def _gone(pid):
+    """True if `pid` has exited (a zombie awaiting its reaper counts as gone)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    stat = Path(f"/proc/{pid}/stat")
+    return stat.exists() and stat.read_text().rsplit(")", 1)[1].split()[0] == "Z"
+
+
+def _overlap(a, b):
+    return a["start"] < b["end"] and b["start"] < a["end"]
+
+
+# ── Tests: packing ────────────────────────────────────────────────────────────
+
+class TestPacking:
+
+    def test_light_checks_share_cores(self):
+        checks = [_check(n) for n in "abcd"]
+        results = Scheduler(checks, _runner({}), cores=4).run()
+        assert all(_overlap(results[0], r) for r in results[1:])
+
+    def test_browser_slot_and_all_cores_are_exclusive(self):
+        browser = Needs(cpu=1, browser=True)
+        checks = [_check("lighthouse", browser), _check("playwright", browser),
+                  _check("lint", Needs(cpu=ALL_CORES)), _check("seo")]
+        by_name = {r["name"]: r for r in Scheduler(checks, _runner({}), cores=4).run()}
+        assert not _overlap(by_name["lighthouse"], by_name["playwright"])
+        assert not any(_overlap(by_name["lint"], r) for n, r in by_name.items() if n != "lint")
+
+    def test_longest_chain_starts_first(self, tmp_path):
+        history = DurationHistory(tmp_path)
+        history.record("slow.py", 30.0)
+        checks = [_check("fast"), _check("slow")]
+        results = Scheduler(checks, _runner({}), cores=1, history=history).run()
+        assert results[1]["start"] < results[0]["start"]
+
+
+# ── Tests: dependencies and stopping ──────────────────────────────────────────
+
+class TestOrdering:
+
+    def test_dependency_waits_and_blocks_on_failure(self):
+        checks = [_check("tests"), _check("e2e", after=("tests.py",)), _check("report", after=("e2e.py",))]
+        results = Scheduler(checks, _runner({}, failing={"tests"}), cores=4).run()
+        assert results[1]["blocked"] and results[2]["blocked"]
+        assert "tests" in results[1]["warning"]
+
+    def test_declared_order_does_not_block_on_failure(self):
+        checks = [_check("tests"), _check("e2e", Needs(after=("tests.py",)))]
+        tests, e2e = Scheduler(checks, _runner({"tests": 0.02}, failing={"tests"}), cores=4).run()
+        assert not tests["passed"] and not e2e.get("skipped")
+        assert e2e["start"] >= tests["end"]
+
+    def test_finish_policy_skips_unstarted(self):
+        checks = [_check("security", Needs(cpu=ALL_CORES), required=True), _check("seo")]
+        results = Scheduler(checks, _runner({}, failing={"security"}), cores=2).run(lambda c, r: "finish")
+        assert results[0]["passed"] is False
+        assert results[1]["skipped"] and results[1]["warning"].startswith("not started")
+
+    def test_category_policy_leaves_other_categories(self):
+        checks = [_check("lighthouse"), _check("bundle"), _check("seo")]
+        checks[0].category = checks[1].category = "Performance"
+        results = Scheduler(checks, _runner({"lighthouse": 0.01}, failing={"lighthouse"}),
+                            cores=1).run(lambda c, r: "category")
+        assert results[1]["blocked"] and not results[2].get("skipped")
+
+    def test_critical_path_follows_resource_waits(self):
+        checks = [_check("lint", Needs(cpu=ALL_CORES)), _check("tests", Needs(cpu=ALL_CORES)), _check("seo")]
+        results = Scheduler(checks, _runner({"lint": 0.05, "tests": 0.05, "seo": 0.01}), cores=2).run()
+        # Equal estimates keep declaration order; each check waited for the previous one's cores
+        assert [r["name"] for r in critical_path(results)] == ["lint", "tests", "seo"]
+
+
+# ── Tests: cancellation ───────────────────────────────────────────────────────
+
+@pytest.mark.skipif(os.name == "nt", reason="process groups are POSIX here")
+class TestCancellation:
+
+    def test_failure_terminates_sibling_process_group(self, tmp_path):
+        marker = tmp_path / "grandchild.pid"
+        slow = f"sleep 30 & echo $! > {marker}; echo partial; wait"
+
+        def run_one(check):
+            if check.name == "security":
+                time.sleep(0.3)
+                return {"name": check.name, "passed": False, "skipped": False}
+            result = run_command(["sh", "-c", slow], token=check.token)
+            return {"name": check.name, "passed": True, "skipped": result["cancelled"],
+                    "cancelled": result["cancelled"], "output": result["stdout"]}
+
+        checks = [_check("tests"), _check("security", required=True)]
+        start = time.perf_counter()
+        results = Scheduler(checks, run_one, cores=2).run(lambda c, r: "cancel")
+        assert time.perf_counter() - start < 10
+        assert results[0]["cancelled"] and results[0]["output"] == "partial\n"
+        grandchild = int(marker.read_text())
+        time.sleep(0.1)
+        assert _gone(grandchild)
+
+    def test_failure_cancels_in_process_plugin(self, tmp_path):
+        plugin = tmp_path / "slow_plugin.py"
+        plugin.write_text(textwrap.dedent("""\
+            import time
+
+            def run(context):
+                deadline = time.monotonic() + 30
+                while time.monotonic() < deadline:
+                    context.raise_if_cancelled()
+                    time.sleep(0.01)
+                raise AssertionError("never cancelled")
+        """), encoding="utf-8")
+
+        def run_one(check):
+            if check.name == "security":
+                time.sleep(0.3)
+                return {"name": check.name, "passed": False, "skipped": False}
+            return run_plugin(check.name, plugin, CheckContext(tmp_path, token=check.token))
+
+        checks = [_check("tests"), _check("security", required=True)]
+        start = time.perf_counter()
+        results = Scheduler(checks, run_one, cores=2).run(lambda c, r: "cancel")
+        assert time.perf_counter() - start < 5
+        assert results[0]["cancelled"] and results[0]["skipped"] and results[0]["mode"] == "plugin"
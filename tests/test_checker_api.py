@@ -0,0 +1,107 @@
+"""
+test_checker_api.py — Test Suite for the in-process checker plugin API
+Covers plugin loading, result shape and the orchestrator fallback.
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Add scripts dir to path
+SCRIPTS_DIR = Path(__file__).parent.parent / ".agent" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+from checker_api import CheckContext, load_plugin, parse_tagged, run_plugin
+from verify_all import run_check
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+PLUGIN = textwrap.dedent("""\
+    import sys
+    sys.path.insert(0, SCRIPTS_DIR)
+    from checker_api import Finding, Findings
+
+    def run(context):
+        names = [e.name for e in context.inventory]
+        return Findings(
+            passed="bad.txt" not in names,
+            findings=[Finding("bad file", "high", file="bad.txt", line=1)] if "bad.txt" in names else [],
+            summary=f"{len(names)} file(s)",
+        )
+
+    if __name__ == "__main__":
+        sys.exit(0)
+""")
+
+CRASHING = textwrap.dedent("""\
+    def run(context):
+        raise ValueError("boom")
+""")
+
+LEGACY = textwrap.dedent("""\
+    import sys
+    print("legacy output")
+    sys.exit(1 if len(sys.argv) > 1 else 0)
+""")
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    d = tmp_path / "scripts"
+    d.mkdir()
+    plugin = PLUGIN.replace("SCRIPTS_DIR", repr(str(SCRIPTS_DIR.resolve())))
+    for name, text in (("plugin_ok.py", plugin), ("plugin_crash.py", CRASHING), ("legacy.py", LEGACY)):
+        (d / name).write_text(text, encoding="utf-8")
+    return d
+
+
+@pytest.fixture
+def project(tmp_path):
+    p = tmp_path / "proj"
+    p.mkdir()
+    (p / "bad.txt").write_text("x\n", encoding="utf-8")
+    return p
+
+
+# ── Tests: loading ────────────────────────────────────────────────────────────
+
+class TestLoadPlugin:
+
+    def test_loaded_once_and_registered_by_stem(self, scripts):
+        module = load_plugin(scripts / "plugin_ok.py")
+        assert module is load_plugin(scripts / "plugin_ok.py")
+        assert sys.modules["plugin_ok"] is module
+
+    def test_script_without_run_is_not_a_plugin(self, scripts):
+        assert load_plugin(scripts / "legacy.py") is None
+
+
+# ── Tests: execution ──────────────────────────────────────────────────────────
+
+class TestRunPlugin:
+
+    def test_structured_result(self, scripts, project):
+        result = run_plugin("OK", scripts / "plugin_ok.py", CheckContext(project))
+        assert result["passed"] is False
+        assert result["error"] == "1 file(s)"
+        assert result["findings"] == [{"message": "bad file", "severity": "high", "file": "bad.txt",
+                                       "line": 1, "rule": None}]
+        assert "[high] bad.txt:1 bad file" in result["output"]
+
+    def test_exception_fails_the_check(self, scripts, project):
+        result = run_plugin("Crash", scripts / "plugin_crash.py", CheckContext(project))
+        assert result["passed"] is False
+        assert result["error"] == "ValueError: boom"
+
+    def test_orchestrator_modes(self, scripts, project):
+        result = run_check("OK", scripts / "plugin_ok.py", str(project))
+        assert result["mode"] == "plugin"
+        isolated = run_check("OK", scripts / "plugin_ok.py", str(project), in_process=False)
+        assert "mode" not in isolated and isolated["passed"] is True   # its CLI always exits 0
+        legacy = run_check("Legacy", scripts / "legacy.py", str(project))
+        assert legacy["passed"] is False and "legacy output" in legacy["output"]
+
+    def test_parse_tagged(self):
+        f = parse_tagged("[Performance CRITICAL] App.tsx: Use FlatList", "high")
+        assert (f.rule, f.file, f.message, f.severity) == ("Performance", "App.tsx", "Use FlatList", "critical")
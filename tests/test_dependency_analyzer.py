@@ -0,0 +1,145 @@
+"""
+test_dependency_analyzer.py — Test Suite for the offline advisory index
+Covers version ordering, lockfile resolution and range queries.
+"""
+
+import json
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Add skill scripts dir to path
+sys.path.insert(0, str(Path(__file__).parent.parent / ".agent" / "skills" / "vulnerability-scanner" / "scripts"))
+from dependency_analyzer import (AdvisoryIndex, build_index, check_project, pep440_key,
+                                 resolve_packages, semver_key)
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+ADVISORIES = [
+    {"id": "GHSA-1", "summary": "Prototype pollution",
+     "database_specific": {"severity": "HIGH"},
+     "affected": [{"package": {"ecosystem": "npm", "name": "lodash"},
+                   "ranges": [{"type": "SEMVER", "events": [{"introduced": "0"}, {"fixed": "4.17.21"}]}]}]},
+    {"id": "GHSA-2", "database_specific": {"severity": "CRITICAL"},
+     "affected": [{"package": {"ecosystem": "npm", "name": "@babel/traverse"},
+                   "ranges": [{"type": "SEMVER", "events": [{"introduced": "7.0.0"}, {"last_affected": "7.23.1"}]}]}]},
+    {"id": "PYSEC-1",
+     "affected": [{"package": {"ecosystem": "PyPI", "name": "Jinja2"},
+                   "ranges": [{"type": "ECOSYSTEM", "events": [{"introduced": "2.0"}, {"fixed": "3.1.3"}]}],
+                   "versions": ["1.0"]}]},
+    {"id": "GO-1", "affected": [{"package": {"ecosystem": "Go", "name": "x"}}]},
+]
+
+PNPM_LOCK = textwrap.dedent("""\
+    lockfileVersion: '6.0'
+
+    dependencies:
+      lodash:
+        version: 4.17.15
+
+    packages:
+
+      /@babel/traverse@7.23.0(supports-color@5.5.0):
+        resolution: {integrity: sha512-x}
+
+      /debug@4.3.4:
+        resolution: {integrity: sha512-y}
+""")
+
+POETRY_LOCK = textwrap.dedent("""\
+    [[package]]
+    name = "jinja2"
+    version = "3.1.2"
+
+    [package.dependencies]
+    MarkupSafe = ">=2.0"
+
+    [metadata]
+    lock-version = "2.0"
+""")
+
+
+@pytest.fixture
+def index(tmp_path):
+    dump = tmp_path / "advisories.json"
+    dump.write_text(json.dumps(ADVISORIES), encoding="utf-8")
+    return AdvisoryIndex(build_index([dump]))
+
+
+@pytest.fixture
+def project(tmp_path):
+    proj = tmp_path / "proj"
+    proj.mkdir()
+    (proj / "package-lock.json").write_text(json.dumps({"lockfileVersion": 3, "packages": {
+        "": {"name": "app"},
+        "node_modules/lodash": {"version": "4.17.20"},
+        "node_modules/a/node_modules/lodash": {"version": "4.17.21"},
+    }}), encoding="utf-8")
+    (proj / "pnpm-lock.yaml").write_text(PNPM_LOCK, encoding="utf-8")
+    (proj / "poetry.lock").write_text(POETRY_LOCK, encoding="utf-8")
+    (proj / "requirements.txt").write_text("requests[socks]==2.30.0 ; python_version>'3'\nflask>=2\n",
+                                           encoding="utf-8")
+    return proj
+
+
+# ── Tests: version ordering ───────────────────────────────────────────────────
+
+class TestVersionKeys:
+
+    def test_semver_prerelease_precedence(self):
+        ordered = ["1.0.0-alpha", "1.0.0-alpha.1", "1.0.0-beta", "1.0.0-beta.2",
+                   "1.0.0-beta.11", "1.0.0-rc.1", "1.0.0", "1.0.1"]
+        assert sorted(reversed(ordered), key=semver_key) == ordered
+
+    def test_pep440_ordering(self):
+        ordered = ["1.0.dev0", "1.0a1", "1.0b2", "1.0rc1", "1.0", "1.0.post1", "1.1", "1!0.1"]
+        assert sorted(reversed(ordered), key=pep440_key) == ordered
+
+    def test_pep440_trailing_zeros(self):
+        assert pep440_key("1.0.0") == pep440_key("1")
+
+
+# ── Tests: index queries ──────────────────────────────────────────────────────
+
+class TestAdvisoryIndex:
+
+    def test_fixed_bound_is_exclusive(self, index):
+        assert [a["id"] for a in index.query("npm", "lodash", "4.17.20")] == ["GHSA-1"]
+        assert index.query("npm", "lodash", "4.17.21") == []
+
+    def test_last_affected_is_inclusive(self, index):
+        assert index.query("npm", "@babel/traverse", "7.23.1")
+        assert not index.query("npm", "@babel/traverse", "7.23.2")
+        assert not index.query("npm", "@babel/traverse", "6.26.0")
+
+    def test_pypi_names_are_normalized_and_versions_listed(self, index):
+        assert index.query("PyPI", "jinja2", "3.1.2")
+        assert index.query("PyPI", "JINJA2", "1.0")
+        assert not index.query("PyPI", "jinja2", "1.5")
+
+    def test_unsupported_ecosystem_skipped(self, index):
+        assert "Go" not in index.packages
+
+
+# ── Tests: lockfile resolution ────────────────────────────────────────────────
+
+class TestLockfiles:
+
+    def test_resolve_all_lockfiles(self, project):
+        packages, errors = resolve_packages(str(project))
+        assert errors == []
+        assert {(name, version, source) for _, name, version, source in packages} == {
+            ("lodash", "4.17.20", "package-lock.json"),
+            ("lodash", "4.17.21", "package-lock.json"),
+            ("@babel/traverse", "7.23.0", "pnpm-lock.yaml"),
+            ("debug", "4.3.4", "pnpm-lock.yaml"),
+            ("jinja2", "3.1.2", "poetry.lock"),
+            ("requests", "2.30.0", "requirements.txt"),
+        }
+
+    def test_check_project(self, project, index):
+        result = check_project(str(project), index)
+        assert sorted(v["advisory"] for v in result["vulnerable"]) == ["GHSA-1", "GHSA-2", "PYSEC-1"]
+        assert result["by_severity"]["critical"] == 1
@@ -0,0 +1,140 @@
+"""
+test_file_inventory.py — Test Suite for the shared file inventory
+Covers git-aware listing, filters, the content LRU and snapshots.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts dir to path
+sys.path.insert(0, str(Path(__file__).parent.parent / ".agent" / "scripts"))
+import file_inventory as fi
+from file_inventory import FileInventory
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+FILES = {
+    "src/app/page.tsx": "export default 1\n",
+    "src/util.py": "x = 1\n",
+    "docs/guide.md": "# Guide\n",
+    "node_modules/pkg/index.js": "module.exports = 1\n",
+    ".agent/.cache/security_scan.json": "{}\n",
+    "out/bundle.js": "ignored by .gitignore\n",
+}
+
+
+def _make(root: Path) -> None:
+    for rel, text in FILES.items():
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(text, encoding="utf-8")
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    _make(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _make(tmp_path)
+    (tmp_path / ".gitignore").write_text("out/\n", encoding="utf-8")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "src/util.py")     # the rest stays untracked
+    return tmp_path
+
+
+# ── Tests: listing ────────────────────────────────────────────────────────────
+
+class TestScan:
+
+    def test_walk_prunes_skip_dirs_and_cache(self, tree):
+        inv = FileInventory.scan(tree)
+        assert inv.source == "walk"
+        assert [e.rel for e in inv] == ["docs/guide.md", "out/bundle.js", "src/app/page.tsx", "src/util.py"]
+
+    def test_git_lists_untracked_and_honours_gitignore(self, repo):
+        inv = FileInventory.scan(repo)
+        assert inv.source == "git"
+        assert [e.rel for e in inv] == [".gitignore", "docs/guide.md", "src/app/page.tsx", "src/util.py"]
+
+    def test_gitignore_false_walks_ignored_files(self, repo):
+        inv = FileInventory.scan(repo, gitignore=False)
+        assert inv.source == "walk"
+        assert "out/bundle.js" in [e.rel for e in inv]
+
+    def test_entries_record_stat_and_kind(self, tree):
+        entry = FileInventory.scan(tree).get("src/util.py")
+        assert (entry.size, entry.ext, entry.kind) == (6, ".py", "code")
+        assert entry.mtime_ns == os.stat(tree / "src/util.py").st_mtime_ns
+
+    def test_files_filters(self, tree):
+        inv = FileInventory.scan(tree)
+        assert [e.rel for e in inv.files(exts={".PY", ".md"})] == ["docs/guide.md", "src/util.py"]
+        assert [e.rel for e in inv.files(skip_dirs={"docs", "out"}, under="src")] == \
+            ["src/app/page.tsx", "src/util.py"]
+        assert [e.name for e in inv.files(where=lambda e: e.kind == "code")] == ["bundle.js", "page.tsx", "util.py"]
+
+
+# ── Tests: content cache ──────────────────────────────────────────────────────
+
+class TestReadText:
+
+    def test_cached_until_file_changes(self, tree):
+        inv = FileInventory.scan(tree)
+        assert inv.read_text("src/util.py") == "x = 1\n"
+        assert inv.read_text(inv.get("src/util.py")) == "x = 1\n"
+        assert (inv.hits, inv.misses) == (1, 1)
+
+        path = tree / "src/util.py"
+        path.write_text("x = 22\n", encoding="utf-8")
+        os.utime(path, ns=(1, 1))
+        assert inv.read_text("src/util.py") == "x = 22\n"
+
+    def test_lru_is_bounded(self, tree):
+        for i in range(5):
+            (tree / f"f{i}.txt").write_text("0123456789", encoding="utf-8")
+        inv = FileInventory(tree, FileInventory.scan(tree).entries, "walk", cache_bytes=40)
+        for i in range(5):
+            inv.read_text(f"f{i}.txt")
+        assert inv._cached_bytes == 40
+        inv.read_text("f4.txt")
+        inv.read_text("f0.txt")               # least recently used: evicted
+        assert (inv.hits, inv.misses) == (1, 6)
+
+    def test_universal_newlines(self, tree):
+        (tree / "crlf.py").write_bytes(b"a\r\nb\r\n")
+        assert FileInventory.scan(tree).read_text("crlf.py") == "a\nb\n"
+
+
+# ── Tests: sharing ────────────────────────────────────────────────────────────
+
+class TestSharing:
+
+    def test_snapshot_roundtrip(self, tree, tmp_path_factory):
+        inv = FileInventory.scan(tree)
+        snap = tmp_path_factory.mktemp("snap") / "inv.json"
+        inv.save(snap)
+        loaded = FileInventory.load(snap)
+        assert loaded.root == inv.root
+        assert loaded.entries == inv.entries
+
+    def test_get_inventory_uses_snapshot(self, tree, tmp_path_factory, monkeypatch):
+        snap = tmp_path_factory.mktemp("snap") / "inv.json"
+        FileInventory.scan(tree).save(snap)
+        monkeypatch.setattr(fi, "_inventories", {})
+        monkeypatch.setenv(fi.SNAPSHOT_ENV, str(snap))
+        monkeypatch.setattr(FileInventory, "scan", classmethod(lambda cls, root, jobs=None: pytest.fail("walked")))
+        inv = fi.get_inventory(tree)
+        assert fi.get_inventory(tree) is inv
+        assert fi.read_text(tree / "src/util.py") == "x = 1\n"
+        assert inv.misses == 1
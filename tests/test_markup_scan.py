@@ -0,0 +1,110 @@
+"""
+test_markup_scan.py — Test Suite for the shared HTML/JSX/Vue tag tokenizer
+Covers attribute parsing, what is not a tag, element scoping and the audits built on it.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts dirs to path
+ROOT = Path(__file__).parent.parent / ".agent"
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "skills" / "frontend-design" / "scripts"))
+from markup_scan import Markup, iter_tags
+from accessibility_checker import check_accessibility
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+FORM = """
+export const Signup = ({ base, ...rest }) => {
+  const [name, setName] = useState<string>("");
+  return (
+    <form onSubmit={e => { e.preventDefault(); send({ ok: "}" }); }}>
+      <label>Name <input type="text" /></label>
+      <input id="email" {...rest} disabled/>
+      <img src={`${base}/logo.png`} alt="" />
+      <Img :alt="caption" src=photo.png>
+      {/* <img src="commented.png"> */}
+      <p>{a < b ? "less" : "more"}</p>
+      <!-- <select></select> -->
+    </form>
+  );
+};
+"""
+
+
+@pytest.fixture(scope="module")
+def markup():
+    return Markup(FORM)
+
+
+# ── Tests: tokenizer ──────────────────────────────────────────────────────────
+
+class TestTokenizer:
+
+    def test_attribute_forms(self, markup):
+        form, _, _, email, img, vue = markup.find("form", "label", "input", "img")[:6]
+        assert form.attrs["onsubmit"].startswith("{e =>") and form.attrs["onsubmit"].endswith("}}")
+        assert email.attrs == {"id": "email", "disabled": None}
+        assert img.get("alt") == "" and img.get("src") == "{`${base}/logo.png`}"
+        assert vue.has("alt") and vue.get("src") == "photo.png"
+
+    def test_comments_and_raw_text_are_not_elements(self, markup):
+        names = [el.name for el in markup.elements]
+        # The generic in useState<string> is the only phantom element
+        assert names == ["string", "form", "label", "input", "input", "img", "Img", "img", "p"]
+        tags = list(iter_tags("<script>if (a<b && c>d) {}</script><br/>"))
+        assert [(t.name, t.closing, t.self_closing) for t in tags] == \
+            [("script", False, False), ("script", True, False), ("br", False, True)]
+
+    def test_pathological_input_is_linear(self):
+        text = '<div class="x">' + '<img src="a" ' * 40000 + '<img alt="b">' * 20000
+        start = time.perf_counter()
+        markup = Markup(text)
+        assert time.perf_counter() - start < 5
+        assert markup.count("img") == 20000
+
+    @pytest.mark.parametrize("chunk", ["<b {", '<b {"', "<b a={", "<b {'x"])
+    def test_unterminated_braces_are_linear(self, chunk):
+        start = time.perf_counter()
+        markup = Markup(chunk * 50000 + '<img alt="b">')
+        assert time.perf_counter() - start < 5
+        assert [el.name for el in markup.elements] == ["img"]
+
+    def test_braces_resumed_across_tags(self):
+        text = '<a {...p} x={{y: "}"}}><b {...{q}} c={1}/>'
+        assert [(t.name, t.attrs, t.end) for t in iter_tags("<z {" + text)] == \
+            [(t.name, t.attrs, t.end + 4) for t in iter_tags(text)]
+
+
+# ── Tests: element scope ──────────────────────────────────────────────────────
+
+class TestScope:
+
+    def test_descendants_inside_and_content(self, markup):
+        form = markup.find("form")[0]
+        inputs = markup.find("input")
+        assert len(markup.descendants(form, "input", "select")) == 2
+        assert [markup.inside(i, "label") for i in inputs] == [True, False]
+        assert markup.content(markup.find("p")[0]) == '{a < b ? "less" : "more"}'
+
+    def test_missing_end_tags_close_implicitly(self):
+        markup = Markup("<ul><li>one<li>two</ul><p>after")
+        ul, one, two, p = markup.elements
+        assert two.parent == one.index and ul.last == two.index
+        assert p.parent is None and markup.content(p) is None
+
+    def test_accessibility_checks_are_element_scoped(self, tmp_path):
+        page = tmp_path / "page.html"
+        page.write_text('<html lang="en"><main><a href="#main">skip</a>'
+                        '<label>Email <input type="email"></label>'
+                        '<button onclick="go()">Go</button><img src="x.png" alt=""></main></html>')
+        assert check_accessibility(page) == []
+        page.write_text('<html><div onclick="go()" role="button">Go</div><input name="q"></html>')
+        assert check_accessibility(page) == ["Input without label or aria-label",
+                                             "Missing lang attribute on <html>",
+                                             "onClick without keyboard handler (onKeyDown)",
+                                             "role='button' without tabindex"]
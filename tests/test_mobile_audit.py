@@ -0,0 +1,111 @@
+"""
+test_mobile_audit.py — Test Suite for the parallel, cached mobile audit
+Covers structured findings, the per-file result cache and pool/serial parity.
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Add scripts dirs to path
+ROOT = Path(__file__).parent.parent / ".agent"
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "skills" / "mobile-design" / "scripts"))
+import file_inventory
+import mobile_audit
+from mobile_audit import MobileAuditor, audit_source
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+SCREEN = textwrap.dedent("""\
+    import { ScrollView, Text } from 'react-native';
+    export const List = ({ items }) => (
+      <ScrollView>{items.map(i => <Text style={{ fontSize: 10 }}>{i}</Text>)}</ScrollView>
+    );
+""")
+
+PLAIN = "export const add = (a, b) => a + b;\n"
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    for i in range(6):
+        (tmp_path / f"Screen{i}.tsx").write_text(SCREEN.replace("10", str(10 + i)), encoding="utf-8")
+    (tmp_path / "util.js").write_text(PLAIN, encoding="utf-8")
+    monkeypatch.setattr(file_inventory, "_inventories", {})
+    return tmp_path
+
+
+def _audit(project, monkeypatch, **kwargs):
+    monkeypatch.setattr(file_inventory, "_inventories", {})   # pick up edits made by the test
+    auditor = MobileAuditor(**kwargs)
+    auditor.audit_directory(str(project))
+    return auditor
+
+
+# ── Tests: findings ───────────────────────────────────────────────────────────
+
+class TestFindings:
+
+    def test_structured_records(self):
+        audit = audit_source("app/List.tsx", SCREEN)
+        critical = [f for f in audit.findings if f.severity == "critical"]
+        assert critical[0].rule == "Performance" and critical[0].file == "app/List.tsx"
+        assert any(f.rule == "Typography" and f.severity == "low" for f in audit.findings)
+
+    def test_report_keeps_legacy_lines(self):
+        auditor = MobileAuditor()
+        auditor.audit_file("app/List.tsx", SCREEN)
+        auditor.audit_file("util.js", PLAIN)
+        assert auditor.files_checked == 2
+        assert ("[Performance CRITICAL] List.tsx: ScrollView with .map() detected. "
+                "Use FlatList for lists to prevent memory explosion.") in auditor.issues
+        assert not auditor.get_report()["compliant"]
+
+
+    def test_multiline_scrollview_map_is_critical(self):
+        screen = textwrap.dedent("""\
+            import { ScrollView, Text } from 'react-native';
+            export const List = ({ items }) => (
+              <ScrollView>
+                {items.map(i => (
+                  <Text>{i}</Text>
+                ))}
+              </ScrollView>
+            );
+        """)
+        audit = audit_source("app/List.tsx", screen)
+        assert [f.rule for f in audit.findings if f.severity == "critical"] == ["Performance"]
+        outside = screen.replace("</ScrollView>\n", "").replace("<ScrollView>", "<ScrollView />")
+        assert not [f for f in audit_source("app/List.tsx", outside).findings if f.severity == "critical"]
+
+
+# ── Tests: cache and pool ─────────────────────────────────────────────────────
+
+class TestIncremental:
+
+    def test_only_changed_files_are_reaudited(self, project, monkeypatch):
+        first = _audit(project, monkeypatch, jobs=1)
+        assert first.cached_files == 0
+        again = _audit(project, monkeypatch, jobs=1)
+        assert again.cached_files == 7 and again.get_report() == dict(first.get_report(), cached_files=7)
+
+        (project / "Screen2.tsx").write_text(SCREEN + "console.log(1)\n", encoding="utf-8")
+        edited = _audit(project, monkeypatch, jobs=1)
+        assert edited.cached_files == 6
+        assert edited.files_checked == 7
+
+    def test_rule_change_invalidates_cache(self, project, monkeypatch):
+        _audit(project, monkeypatch, jobs=1)
+        monkeypatch.setattr(mobile_audit, "RULES_VERSION", "changed")
+        assert _audit(project, monkeypatch, jobs=1).cached_files == 0
+
+    def test_pool_matches_serial(self, project, monkeypatch):
+        serial = _audit(project, monkeypatch, jobs=1, use_cache=False)
+        monkeypatch.setattr(mobile_audit, "PARALLEL_MIN_FILES", 1)
+        monkeypatch.setattr(mobile_audit, "AUDIT_BATCH", 2)
+        pooled = _audit(project, monkeypatch, jobs=2, use_cache=False)
+        assert pooled.findings == serial.findings
+        assert pooled.passed_count == serial.passed_count
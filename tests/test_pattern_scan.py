@@ -0,0 +1,79 @@
+"""
+test_pattern_scan.py — Test Suite for the shared regex table used by the design audits
+Covers agreement with the re module, pattern merging and the UX rule table.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts dirs to path
+ROOT = Path(__file__).parent.parent / ".agent"
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "skills" / "frontend-design" / "scripts"))
+from pattern_scan import PatternSet
+from ux_audit import RULES, UXAuditor
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+I = re.IGNORECASE
+
+SPECS = {
+    "literal":     r"footer|<footer",
+    "literal_i":   (r"trust|trusted by|ssl", I),
+    "single_i":    (r"gradient", I),
+    "regex":       r"box-shadow:\s*([^;]+)",
+    "groups":      (r"font-weight:\s*(\d+)|fw-(\d+)", I),
+    "escaped":     r"more\.\.\.|\$",
+    "absent":      r"never-there",
+}
+
+TEXTS = [
+    "",
+    "<FOOTER>Trusted by 10k teams — ſsl secured</FOOTER>",
+    "İnput gradient GRADIENT Gradient more... costs $5",
+    "box-shadow: 0 1px 2px red; box-shadow:none; font-weight: 700 fw-300 FONT-WEIGHT:100",
+]
+
+
+@pytest.fixture(scope="module")
+def patterns():
+    return PatternSet(SPECS)
+
+
+# ── Tests: agreement with re ──────────────────────────────────────────────────
+
+class TestAgreement:
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_same_answers_as_re(self, patterns, text):
+        scan = patterns.scan(text)
+        for name, spec in SPECS.items():
+            regex, flags = (spec, 0) if isinstance(spec, str) else spec
+            assert scan.has(name) == bool(re.search(regex, text, flags)), name
+            assert scan.count(name) == len(re.findall(regex, text, flags)), name
+            assert scan.findall(name) == re.findall(regex, text, flags), name
+
+    def test_identical_patterns_are_merged(self):
+        patterns = PatternSet({"a": r"x|y", "b": r"x|y", "c": (r"x|y", I)})
+        assert len(patterns) == 2
+
+
+# ── Tests: UX rule table ──────────────────────────────────────────────────────
+
+class TestUXRules:
+
+    def test_findings_keep_tag_file_and_order(self):
+        auditor = UXAuditor()
+        auditor.audit_file("Nav.tsx", '<nav>' + '<a href="/x">x</a>' * 8 + '<img src="a.png"></nav>')
+        assert auditor.issues == ["[Hick's Law] Nav.tsx: 8 nav items (Max 7)",
+                                  "[Accessibility] Nav.tsx: Missing img alt text"]
+        assert "[Serial Position] Nav.tsx: Last nav item may not be important. Place key actions at start/end." \
+            in auditor.warnings
+
+    def test_rule_subset(self):
+        auditor = UXAuditor(rules=[r for r in RULES if r.id == "img-alt"])
+        auditor.audit_file("a.html", '<img src="a.png"><p>text</p>')
+        assert auditor.issues == ["[Accessibility] a.html: Missing img alt text"] and not auditor.warnings
@@ -0,0 +1,245 @@
+"""
+test_pre_flight.py — Test Suite for the pre-flight validation gate
+Covers the gate DAG, WARN handling, the gate result cache and the
+incremental Python compile gate.
+"""
+
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts dir to path
+sys.path.insert(0, str(Path(__file__).parent.parent / ".agent" / "scripts"))
+import pre_flight as pf
+from pre_flight import GateCache, GateResult, GateSpec, PreFlightReport, PreFlightRunner, ProjectDetector
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+def _git(root: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=root, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / "app.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "requirements.txt").write_text("requests\n", encoding="utf-8")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "t@example.com")
+    _git(tmp_path, "config", "user.name", "t")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def _execute(root, gate_map, specs=pf.GATES, jobs=4):
+    runner = PreFlightRunner(root, jobs=jobs, use_cache=False)
+    return runner._execute(list(specs), gate_map, time.monotonic())
+
+
+def _gate(name, status="PASS", delay=0.0, log=None):
+    def run():
+        if log is not None:
+            log.append(("start", name))
+        time.sleep(delay)
+        if log is not None:
+            log.append(("end", name))
+        return GateResult(name, status, status.lower())
+    return run
+
+
+def _recompiled(result):
+    return int(re.search(r"(\d+) recompiled", result.message).group(1))
+
+
+# ── Tests: gate graph ─────────────────────────────────────────────────────────
+
+class TestGateGraph:
+
+    def test_tests_wait_for_build_and_deps(self, tmp_path):
+        log = []
+        gates = {name: _gate(name, delay=0.05, log=log) for name in ("git", "build", "tests", "deps")}
+        results = _execute(tmp_path, gates)
+        assert all(r.status == "PASS" for r in results.values())
+        started = log.index(("start", "tests"))
+        assert log.index(("end", "build")) < started and log.index(("end", "deps")) < started
+        assert results["tests"].started_s >= max(results["build"].finished_s, results["deps"].finished_s)
+        assert results["tests"].depends_on == ["build", "deps"]
+
+    def test_independent_gates_overlap(self, tmp_path):
+        gates = {name: _gate(name, delay=0.2) for name in ("git", "build", "tests", "deps")}
+        results = _execute(tmp_path, gates)
+        assert results["build"].started_s < results["deps"].finished_s
+        assert results["deps"].started_s < results["build"].finished_s
+
+    def test_failed_prerequisite_cancels_dependents(self, tmp_path):
+        ran = []
+        gates = {"git": _gate("git"), "build": _gate("build", "FAIL"), "deps": _gate("deps"),
+                 "tests": lambda: ran.append("tests")}
+        results = _execute(tmp_path, gates)
+        assert ran == []
+        assert results["tests"].status == "SKIP" and results["tests"].cancelled_by == "build"
+        assert results["deps"].status == "PASS"
+
+    def test_cancellation_is_transitive(self, tmp_path):
+        specs = (GateSpec("a"), GateSpec("b", ("a",)), GateSpec("c", ("b",)))
+        results = _execute(tmp_path, {"a": _gate("a", "FAIL"), "b": _gate("b"), "c": _gate("c")}, specs)
+        assert (results["b"].cancelled_by, results["c"].cancelled_by) == ("a", "b")
+
+    def test_unselected_prerequisites_do_not_block(self, tmp_path):
+        specs = [g for g in pf.GATES if g.name == "tests"]
+        results = _execute(tmp_path, {"tests": _gate("tests")}, specs)
+        assert results["tests"].status == "PASS"
+
+
+# ── Tests: statuses ───────────────────────────────────────────────────────────
+
+class TestStatus:
+
+    def test_warn_is_not_ok(self):
+        report = PreFlightReport("p", "generic", "now", gates=[
+            GateResult("git", "WARN", "untracked"), GateResult("build", "SKIP", "none")])
+        assert not report.gates[0].ok and report.gates[1].ok
+        assert not report.passed and report.exit_code == 1
+        assert report.to_dict()["failed_gates"] == []
+
+    def test_strict_git_warns_on_untracked(self, repo):
+        (repo / "new.txt").write_text("x\n", encoding="utf-8")
+        assert pf.gate_git(repo).status == "PASS"
+        assert pf.gate_git(repo, strict=True).status == "WARN"
+
+    def test_warn_blocks_dependents(self, tmp_path):
+        gates = {"git": _gate("git"), "build": _gate("build", "WARN"), "deps": _gate("deps"),
+                 "tests": _gate("tests")}
+        assert _execute(tmp_path, gates)["tests"].cancelled_by == "build"
+
+
+# ── Tests: gate cache ─────────────────────────────────────────────────────────
+
+class TestGateCache:
+
+    def _cache(self, root):
+        return GateCache(root, ProjectDetector(root))
+
+    def _store(self, root, *gates):
+        cache = self._cache(root)
+        for gate in gates:
+            result = GateResult(gate, "PASS", f"{gate} ok")
+            cache.put(result)
+            assert result.cache == "miss"
+        cache.save()
+
+    def test_hit_after_store(self, repo):
+        self._store(repo, "build", "deps")
+        cache = self._cache(repo)
+        hit = cache.get("build")
+        assert hit.cache == "hit" and (hit.status, hit.message) == ("PASS", "build ok")
+        assert cache.get("deps").cache == "hit"
+        assert cache.get("tests") is None
+
+    def test_only_passes_and_cacheable_gates_are_stored(self, repo):
+        cache = self._cache(repo)
+        cache.put(GateResult("build", "FAIL", "broken"))
+        cache.put(GateResult("git", "PASS", "clean"))
+        cache.save()
+        cache = self._cache(repo)
+        assert cache.get("build") is None and cache.get("git") is None
+
+    def test_source_edit_misses_build_but_not_deps(self, repo):
+        self._store(repo, "build", "tests", "deps")
+        (repo / "app.py").write_text("x = 2\n", encoding="utf-8")
+        cache = self._cache(repo)
+        assert cache.get("build") is None and cache.get("tests") is None
+        assert cache.get("deps").cache == "hit"
+
+    def test_lockfile_edit_misses_deps(self, repo):
+        self._store(repo, "deps")
+        (repo / "requirements.txt").write_text("requests\nrich\n", encoding="utf-8")
+        assert self._cache(repo).get("deps") is None
+
+    def test_environment_change_misses(self, repo, monkeypatch):
+        self._store(repo, "build", "tests", "deps")
+        monkeypatch.setattr(GateCache, "_site_marker", staticmethod(lambda: "reinstalled"))
+        cache = self._cache(repo)
+        assert cache.get("deps") is None and cache.get("tests") is None
+        assert cache.get("build").cache == "hit"
+        monkeypatch.setattr(pf.sys, "executable", "/other/python")
+        assert self._cache(repo).get("build") is None
+
+    def test_dirty_tree_without_snapshot_is_not_cached(self, repo):
+        self._store(repo, "build")
+        (repo / "app.py").write_text("x = (\n", encoding="utf-8")
+        (repo / ".git" / "index.lock").touch()      # another git process holds the index
+        cache = self._cache(repo)
+        assert cache.get("build") is None and cache.fingerprint()["tree"] == ""
+        (repo / ".git" / "index.lock").unlink()
+        assert self._cache(repo).get("build") is None
+
+    def test_fingerprint_taken_before_gates_run(self, repo):
+        runner = PreFlightRunner(repo, jobs=4)
+        seen = []
+
+        def probe(name):
+            def run():
+                seen.append(runner.cache._fp)
+                return GateResult(name, "PASS", "ok")
+            return run
+
+        gates = {name: probe(name) for name in ("git", "build", "tests", "deps")}
+        runner._execute(list(pf.GATES), gates, time.monotonic())
+        assert len(seen) == 4 and all(fp is not None for fp in seen)
+
+    def test_no_git_no_content_cache(self, tmp_path):
+        (tmp_path / "app.py").write_text("x = 1\n", encoding="utf-8")
+        self._store(tmp_path, "build")
+        assert self._cache(tmp_path).get("build") is None
+
+
+# ── Tests: Python compile gate ────────────────────────────────────────────────
+
+class TestPyCompile:
+
+    @pytest.fixture
+    def src(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "ok.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+        (tmp_path / "pkg" / "bad1.py").write_text("def f(:\n", encoding="utf-8")
+        (tmp_path / "bad2.py").write_text("x = 1\n  y = 2\n", encoding="utf-8")
+        return tmp_path
+
+    def test_reports_every_syntax_error(self, src):
+        result = pf.gate_py_compile(src)
+        assert result.status == "FAIL" and result.message.startswith("2 syntax error(s)")
+        assert [line.split(":")[0] for line in result.detail.splitlines()] == ["bad2.py", "pkg/bad1.py"]
+
+    def test_skips_ignored_directories(self, tmp_path):
+        (tmp_path / "ok.py").write_text("x = 1\n", encoding="utf-8")
+        for skipped in ("node_modules/m", ".venv/lib", "build", "pkg.egg-info"):
+            (tmp_path / skipped).mkdir(parents=True)
+            (tmp_path / skipped / "broken.py").write_text("def (\n", encoding="utf-8")
+        result = pf.gate_py_compile(tmp_path)
+        assert result.status == "PASS" and "1 file(s)" in result.message
+
+    def test_recompiles_only_changed_files(self, src):
+        assert _recompiled(pf.gate_py_compile(src)) == 3
+        again = pf.gate_py_compile(src)
+        assert _recompiled(again) == 0 and again.message.startswith("2 syntax error(s)")
+        (src / "pkg" / "bad1.py").write_text("def f():\n    pass\n", encoding="utf-8")
+        fixed = pf.gate_py_compile(src)
+        assert _recompiled(fixed) == 1 and fixed.detail.startswith("bad2.py")
+        assert fixed.message.startswith("1 syntax error(s)")
+
+    def test_interpreter_change_drops_cache(self, src, monkeypatch):
+        pf.gate_py_compile(src)
+        monkeypatch.setattr(pf.sys, "version", "0.0.0 (other interpreter)")
+        assert _recompiled(pf.gate_py_compile(src)) == 3
+
+    def test_compiler_exhaustion_is_a_file_error(self, tmp_path):
+        (tmp_path / "deep.py").write_text("x = [" + "1+" * 300000 + "1]\n", encoding="utf-8")
+        (tmp_path / "ok.py").write_text("x = 1\n", encoding="utf-8")
+        result = pf.gate_py_compile(tmp_path)
+        assert result.status == "FAIL" and result.detail.startswith("deep.py: RecursionError")
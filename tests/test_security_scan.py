@@ -0,0 +1,272 @@
+"""
+test_security_scan.py — Test Suite for the unified security scanner
+Covers prefilter/regex parity, pool/serial parity, the findings cache,
+large and binary files, streaming reporters and which files are scanned.
+"""
+
+import io
+import json
+import mmap
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts dirs to path
+ROOT = Path(__file__).parent.parent / ".agent"
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "skills" / "vulnerability-scanner" / "scripts"))
+import file_inventory
+import security_scan as ss
+from checker_api import CheckCancelled
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+SOURCES = [
+    'API_KEY = "sk_live_0123456789abcdef"\nresult = eval(user_input)\n',
+    'const t = { token: "abcdefghijklmnop" };\nel.innerHTML = html;\ndocument.write(x);\n',
+    'PASSWORD: "hunter22"\nevaluate(x)\nEVAL (y)\nexecute()\nexec(code)\n',
+    'q = "SELECT * FROM t WHERE id=" + user_id + ""\nq2 = f"DELETE FROM t WHERE id={i}"\n',
+    'requests.get(u, verify=False)\ncurl --insecure\nDISABLE_SSL = 1\npickle.loads(b)\n',
+    'yaml.load(f)\nyaml.load(f, Loader=SafeLoader)\nsubprocess.call(cmd, shell=True)\n',
+    'db = "postgres://u:p@h/db"\nkey = "-----BEGIN RSA KEY-----"\nssh-rsa AAAAB3Nza\n',
+    'jwt = "eyJhbGciOi.eyJzdWIiOi.sig_nature"\nAKIAABCDEFGHIJKLMNOP\nBearer abc.def\n',
+    '\u0130MPORT = 1\nchild_process.exec(cmd)\nnew Function("return 1")\n<div dangerouslySetInnerHTML={x} />\n',
+    'nothing to see here\n',
+]
+
+CONFIG = '{"DEBUG": true, "NODE_ENV": "development", "api_key": "0123456789abcdef"}\n'
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    (tmp_path / "app.py").write_text("print('hello')\n", encoding="utf-8")
+    (tmp_path / ".env").write_text('password = "hunter22"\n', encoding="utf-8")
+    (tmp_path / ".env.local").write_text('api_key = "0123456789abcdef"\n', encoding="utf-8")
+    (tmp_path / ".gitignore").write_text(".env\n.env.local\n", encoding="utf-8")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "app.py", ".gitignore")
+    monkeypatch.setattr(file_inventory, "_inventories", {})
+    return tmp_path
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    for i in range(12):
+        (tmp_path / "src" / f"m{i}").mkdir(parents=True)
+        for j, source in enumerate(SOURCES):
+            (tmp_path / "src" / f"m{i}" / f"f{j}.py").write_text(source, encoding="utf-8")
+    (tmp_path / "settings.json").write_text(CONFIG, encoding="utf-8")
+    monkeypatch.setattr(ss, "SCAN_BATCH_SIZE", 8)      # many batches from a small tree
+    monkeypatch.setattr(file_inventory, "_inventories", {})
+    return tmp_path
+
+
+def _scan(project, **kwargs):
+    kwargs.setdefault("use_cache", False)
+    return ss.run_unified_scan(str(project), ["secrets", "patterns", "config"], **kwargs)
+
+
+def _all_findings(project, **kwargs):
+    """Every finding in stream order (the report keeps only REPORT_LIMITS)."""
+    collected = []
+
+    class Collect(ss.Reporter):
+        def finding(self, scan, finding):
+            collected.append((scan, finding))
+
+    _scan(project, reporter=Collect(), **kwargs)
+    return collected
+
+
+def _plain_scan(content, rel):
+    """Reference: every pattern's regex over the whole text, no prefilter."""
+    secrets, patterns = [], []
+    for regex, secret_type, severity in ss.SECRET_PATTERNS:
+        matches = re.findall(regex, content, re.IGNORECASE)
+        if matches:
+            secrets.append({"file": rel, "type": secret_type, "severity": severity, "count": len(matches)})
+    for line_idx, line in enumerate(content.splitlines()):
+        for regex, name, severity, category in ss.DANGEROUS_PATTERNS:
+            if re.search(regex, line, re.IGNORECASE):
+                patterns.append({"file": rel, "line": line_idx + 1, "pattern": name, "severity": severity,
+                                 "category": category, "snippet": line.strip()[:80]})
+    return secrets, patterns
+
+
+# ── Tests: file selection ─────────────────────────────────────────────────────
+
+class TestFileSelection:
+
+    def test_gitignored_dotenv_is_scanned(self, repo):
+        secrets = _scan(repo, jobs=1)["secrets"]
+        found = {(f["file"], f["type"]) for f in secrets["findings"]}
+        assert (".env", "Password") in found
+        assert (".env.local", "API Key") in found
+
+    def test_since_scans_what_a_full_scan_scans(self, repo):
+        (repo / ".gitignore").write_text(".env\n.env.local\nlocal/\nnode_modules/\n", encoding="utf-8")
+        for rel in ("local/settings.json", "node_modules/pkg/.env"):
+            (repo / rel).parent.mkdir(parents=True)
+            (repo / rel).write_text('api_key = "0123456789abcdef"\n', encoding="utf-8")
+        _git(repo, "add", ".gitignore")
+        _git(repo, "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-q", "-m", "init")
+        full = {f["file"] for f in _scan(repo, jobs=1)["secrets"]["findings"]}
+        since = {f["file"] for f in _scan(repo, jobs=1, since="HEAD")["secrets"]["findings"]}
+        assert since == full == {".env", ".env.local", "local/settings.json"}
+
+    def test_other_checkers_still_honour_gitignore(self, repo):
+        rels = [e.rel for e in file_inventory.get_inventory(repo)]
+        assert ".env" not in rels and "app.py" in rels
+        assert ".env" in [e.rel for e in file_inventory.get_inventory(repo, gitignore=False)]
+
+
+# ── Tests: prefilter ──────────────────────────────────────────────────────────
+
+class TestPrefilter:
+
+    @pytest.mark.parametrize("source", SOURCES)
+    def test_matches_plain_regex_scan(self, tmp_path, source):
+        path = tmp_path / "a.py"
+        path.write_text(source, encoding="utf-8")
+        findings = ss.scan_file_content(path, str(tmp_path), ["secrets", "patterns"])
+        secrets, patterns = _plain_scan(source, "a.py")
+        assert findings["secrets"] == secrets
+        assert findings["patterns"] == patterns
+
+    def test_every_declared_literal_hits_its_pattern(self):
+        pf = ss.LiteralPrefilter([("abc",), (), ("b", "zz")])
+        assert pf.candidates("xxabcxx") == [0, 1, 2]
+        assert pf.candidates("zz") == [1, 2]
+        assert pf.line_candidates("q\nzz\nabc", [0, 2, 5]) == {0: {1}, 1: {1, 2}, 2: {0, 1, 2}}
+
+
+# ── Tests: pool and cache ─────────────────────────────────────────────────────
+
+class TestPipeline:
+
+    def test_jobs_parity(self, project):
+        serial = _all_findings(project, jobs=1)
+        assert serial and _all_findings(project, jobs=3) == serial
+        assert _scan(project, jobs=1) == _scan(project, jobs=3)
+
+    def test_cache_hits_and_invalidation(self, project):
+        meta = {}
+        first = _scan(project, jobs=1, use_cache=True, meta=meta)
+        files = meta["cache"]["misses"]
+        assert files == len(SOURCES) * 12 + 1 and meta["cache"]["hits"] == 0
+
+        assert _scan(project, jobs=1, use_cache=True, meta=meta) == first
+        assert meta["cache"] == {"enabled": True, "hits": files, "misses": 0}
+
+        edited = project / "src" / "m0" / "f9.py"
+        edited.write_text("exec(payload)\n", encoding="utf-8")
+        touched = project / "src" / "m1" / "f0.py"
+        os.utime(touched, ns=(touched.stat().st_atime_ns, touched.stat().st_mtime_ns + 10**9))
+        result = _scan(project, jobs=1, use_cache=True, meta=meta)
+        assert meta["cache"] == {"enabled": True, "hits": files - 1, "misses": 1}   # mtime only: hash decides
+        assert result["patterns"]["by_severity"]["critical"] == first["patterns"]["by_severity"]["critical"] + 1
+
+    def test_rules_change_drops_cache(self, project, monkeypatch):
+        meta = {}
+        _scan(project, jobs=1, use_cache=True)
+        monkeypatch.setattr(ss, "rules_hash", lambda checks, max_bytes=ss.MAX_SCAN_BYTES: "other-rules")
+        _scan(project, jobs=1, use_cache=True, meta=meta)
+        assert meta["cache"]["hits"] == 0
+        cached = json.loads((project / ss.FindingsCache.CACHE_FILE).read_text(encoding="utf-8"))
+        assert cached["rules"] == "other-rules"
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_cancelled_between_batches(self, project, jobs):
+        polls = []
+
+        def cancelled():
+            polls.append(1)
+            return len(polls) > 2
+
+        scanned = []
+        with pytest.raises(CheckCancelled):
+            for path, _ in ss._scan_files(str(project), ["secrets"], jobs=jobs, cancelled=cancelled):
+                scanned.append(path)
+        assert len(scanned) < len(SOURCES) * 12 and len(polls) == 3
+
+
+# ── Tests: large and binary files ─────────────────────────────────────────────
+
+class TestLargeFiles:
+
+    def _mapped(self, path, project, max_bytes=ss.MAX_SCAN_BYTES):
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return ss.scan_mapped(mm, path, str(project), ["secrets", "patterns", "config"], max_bytes)
+
+    def test_chunked_scan_matches_text_scan(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ss, "SCAN_CHUNK_BYTES", 256)
+        content = "".join(SOURCES) * 20
+        path = tmp_path / "big.py"
+        path.write_text(content, encoding="utf-8")
+        mapped = self._mapped(path, tmp_path)
+        text = ss.scan_text(content, path, str(tmp_path), ["secrets", "patterns", "config"])
+        assert "sampled" not in mapped
+        assert mapped == text
+
+    def test_oversized_file_is_sampled_with_exact_lines(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ss, "SCAN_CHUNK_BYTES", 512)
+        lines = ["x = 1"] * 5000 + ["eval(tail)"]
+        path = tmp_path / "huge.py"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        mapped = self._mapped(path, tmp_path, max_bytes=4096)
+        assert mapped["sampled"] is True
+        assert [(f["pattern"], f["line"]) for f in mapped["patterns"]] == [("eval() usage", 5001)]
+
+    def test_binary_file_is_skipped(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ss, "MMAP_THRESHOLD", 1024)
+        monkeypatch.setattr(file_inventory, "_inventories", {})
+        (tmp_path / "blob.js").write_bytes(b"eval(x)\0" + b"\xff" * 4096)
+        (tmp_path / "small.js").write_bytes(b"eval(x)\0")
+        meta = {}
+        result = _scan(tmp_path, jobs=1, meta=meta)
+        assert meta["large_files"]["binary_skipped"] == 2
+        assert result["patterns"]["findings"] == []
+
+
+# ── Tests: reporters ──────────────────────────────────────────────────────────
+
+class TestReporters:
+
+    def test_jsonl_stream(self, project):
+        out = io.StringIO()
+        report = ss.run_full_scan(str(project), "secrets", jobs=1, use_cache=False,
+                                  reporter=ss.JsonlReporter(out))
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert records[0]["type"] == "start" and records[0]["scan_type"] == "secrets"
+        assert records[-1]["type"] == "summary" and "scans" not in records[-1]
+        assert records[-1]["status"]["secrets"] == report["scans"]["secrets"]["status"]
+        findings = records[1:-1]
+        assert findings and all(r["type"] == "finding" and r["scan"] == "secrets" for r in findings)
+        assert len(findings) == sum(report["scans"]["secrets"]["by_severity"].values())
+
+    def test_sarif_log(self, project):
+        out = io.StringIO()
+        ss.run_full_scan(str(project), "patterns", jobs=1, use_cache=False,
+                         reporter=ss.SarifWriter(out, str(project)))
+        log = json.loads(out.getvalue())
+        assert log["$schema"] == ss.SARIF_SCHEMA and log["version"] == "2.1.0"
+        run = log["runs"][0]
+        rule_ids = {r["id"] for r in run["tool"]["driver"]["rules"]}
+        assert "patterns/eval-usage" in rule_ids
+        assert run["originalUriBaseIds"]["%SRCROOT%"]["uri"] == project.resolve().as_uri() + "/"
+        for result in run["results"]:
+            assert result["ruleId"] in rule_ids
+            assert result["level"] in ("error", "warning", "note")
+            location = result["locations"][0]["physicalLocation"]
+            assert location["artifactLocation"]["uriBaseId"] == "%SRCROOT%"
+            assert location["region"]["startLine"] >= 1
+        streamed = [f for scan, f in _all_findings(project, jobs=1) if scan == "patterns"]
+        assert len(run["results"]) == len(streamed)
@@ -0,0 +1,169 @@
+"""
+test_session_checkpoint.py — Test Suite for checkpoint diffing
+Covers plan-state digests, checkpoint parsing, diff_checkpoints(), tree
+hashes and the --diff output.
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Add scripts dir to path
+sys.path.insert(0, str(Path(__file__).parent.parent / ".agent" / "scripts"))
+import session_checkpoint as sc
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+PLAN_BEFORE = textwrap.dedent("""\
+    ## Phase 1 — Foundation
+    - [x] Initialize repository
+    - [/] Write README.md
+    - [ ] Add CI workflow
+""")
+
+PLAN_AFTER = textwrap.dedent("""\
+    ## Phase 1 — Foundation
+    - [x] Initialize repository
+    - [x] Write README.md
+    - [ ] Add CI workflow
+    - [ ] Publish release
+""")
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Throwaway git repo with the module paths pointed at it."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "t@example.com")
+    _git(tmp_path, "config", "user.name", "t")
+    (tmp_path / "a.txt").write_text("one\n", encoding="utf-8")
+    (tmp_path / "ralph_plan.md").write_text(PLAN_BEFORE, encoding="utf-8")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+
+    monkeypatch.setattr(sc, "ROOT", tmp_path)
+    monkeypatch.setattr(sc, "PLAN_FILE", tmp_path / "ralph_plan.md")
+    monkeypatch.setattr(sc, "SESSION_LOG", tmp_path / "SESSION_LOG.md")
+    return tmp_path
+
+
+# ── Tests: plan-state digest ──────────────────────────────────────────────────
+
+class TestPlanStateDigest:
+
+    def test_roundtrip(self, tmp_path):
+        plan = tmp_path / "plan.md"
+        plan.write_text(PLAN_BEFORE, encoding="utf-8")
+        state = sc.parse_plan_state(sc.plan_state_digest(plan))
+        assert sorted(state.values()) == ["/", "_", "x"]
+
+    def test_duplicate_tasks_get_unique_keys(self, tmp_path):
+        plan = tmp_path / "plan.md"
+        plan.write_text("- [x] Same\n- [ ] Same\n", encoding="utf-8")
+        assert len(sc.parse_plan_state(sc.plan_state_digest(plan))) == 2
+
+    def test_missing_plan_is_empty(self, tmp_path):
+        assert sc.plan_state_digest(tmp_path / "nope.md") == ""
+
+
+# ── Tests: resolve_checkpoint ─────────────────────────────────────────────────
+
+class TestResolveCheckpoint:
+
+    CPS = [{"timestamp": "2026-01-01T10:00:00+00:00"}, {"timestamp": "2026-01-02T10:00:00+00:00"}]
+
+    def test_positive_index(self):
+        assert sc.resolve_checkpoint("1", self.CPS) == 0
+
+    def test_negative_index(self):
+        assert sc.resolve_checkpoint("-1", self.CPS) == 1
+
+    def test_timestamp_prefix(self):
+        assert sc.resolve_checkpoint("2026-01-02", self.CPS) == 1
+
+    def test_unknown(self):
+        assert sc.resolve_checkpoint("9", self.CPS) is None
+
+
+# ── Tests: diff_checkpoints ───────────────────────────────────────────────────
+
+class TestDiffCheckpoints:
+
+    def test_diff_between_written_checkpoints(self, repo, capsys):
+        sc.write_checkpoint("first", decisions=["use sqlite"])
+        (repo / "a.txt").write_text("two\n", encoding="utf-8")
+        (repo / "ralph_plan.md").write_text(PLAN_AFTER, encoding="utf-8")
+        sc.write_checkpoint("second", decisions=["use sqlite", "drop redis"])
+
+        cps = sc.read_checkpoints()
+        assert [cp["description"] for cp in cps] == ["first", "second"]
+        assert cps[0]["tree"] != cps[1]["tree"]
+
+        result = sc.diff_checkpoints(cps, 0, 1)
+        assert result["comparable"]
+        assert {f["path"] for f in result["files"]} == {"a.txt", "ralph_plan.md"}
+        transitions = {t["task"]: (t["from"], t["to"]) for t in result["tasks"]}
+        assert transitions == {
+            "Write README.md": ("in_progress", "done"),
+            "Publish release": ("absent", "todo"),
+        }
+        assert result["decisions_added"] == ["drop redis"]
+
+    def test_unchanged_state_is_empty(self, repo, capsys):
+        sc.write_checkpoint("only")
+        cps = sc.read_checkpoints()
+        result = sc.diff_checkpoints(cps, 0)
+        assert result["files"] == []
+        assert result["tasks"] == []
+
+    def test_legacy_checkpoints_fall_back_to_files_modified(self):
+        cps = [
+            {"timestamp": "t0", "files_modified": ["x.py"]},
+            {"timestamp": "t1", "files_modified": ["y.py", "x.py"], "decisions": ["d1"]},
+        ]
+        result = sc.diff_checkpoints(cps, 0, 1)
+        assert not result["comparable"]
+        assert [f["path"] for f in result["files"]] == ["y.py", "x.py"]
+        assert result["decisions_added"] == ["d1"]
+
+
+# ── Tests: tree hash and CLI output ───────────────────────────────────────────
+
+class TestTreeHashAndOutput:
+
+    def test_no_tree_when_snapshot_fails(self, repo):
+        (repo / "a.txt").write_text("dirty\n", encoding="utf-8")
+        (repo / ".git" / "index.lock").touch()      # another git process holds the index
+        assert sc._git_tree_hash() is None
+        sc.write_checkpoint("locked")
+        assert "tree" not in sc.read_checkpoints()[-1]
+        (repo / ".git" / "index.lock").unlink()
+        assert sc._git_tree_hash() not in (None, sc._run(["git", "rev-parse", "HEAD^{tree}"])[1])
+
+    def test_json_diff_without_tree_is_json(self, repo, monkeypatch, capsys):
+        monkeypatch.setattr(sc, "_git_tree_hash", lambda: None)
+        assert sc.diff_since_checkpoint(as_json=True) == 1
+        assert "error" in json.loads(capsys.readouterr().out)
+        sc.write_checkpoint("no tree")
+        capsys.readouterr()
+        assert sc.diff_since_checkpoint(as_json=True) == 0
+        result = json.loads(capsys.readouterr().out)
+        assert not result["comparable"] and result["from"]["description"] == "no tree"
+
+    def test_header_names_the_compared_checkpoints(self, repo, capsys):
+        sc.write_checkpoint("first")
+        sc.write_checkpoint("second")
+        capsys.readouterr()
+        sc.diff_since_checkpoint(["1", "2"])
+        out = capsys.readouterr().out
+        assert "BETWEEN CHECKPOINTS 1 AND 2" in out and "SINCE LAST" not in out
+        sc.diff_since_checkpoint()
+        assert "DIFF SINCE LAST CHECKPOINT" in capsys.readouterr().out
@@ -0,0 +1,116 @@
+"""
+test_smart_commit.py — Test Suite for the batch commit planner
+Covers cluster keys, task mapping and one-commit-per-cluster execution.
+"""
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Add scripts dir to path
+sys.path.insert(0, str(Path(__file__).parent.parent / ".agent" / "scripts"))
+from smart_commit import CommitGenerator, CommitPlanner, GitContext
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+PLAN = textwrap.dedent("""\
+    ## Phase 1 — Foundation
+    - [x] Create `.agent/scripts/pre_flight.py`
+    - [x] Add new skill .agent/skills/api-patterns/validator
+    - [ ] Portfolio hero section
+""")
+
+
+def _git(root: Path, *args: str) -> str:
+    r = subprocess.run(["git", *args], cwd=root, check=True, capture_output=True, text=True)
+    return r.stdout
+
+
+def _write(root: Path, rel: str, text: str = "x\n") -> None:
+    p = root / rel
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "t@example.com")
+    _git(tmp_path, "config", "user.name", "t")
+    _write(tmp_path, "ralph_plan.md", PLAN)
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def _planner(root: Path) -> CommitPlanner:
+    ctx = GitContext(root)
+    return CommitPlanner(root, ctx, CommitGenerator(root))
+
+
+# ── Tests: cluster_key ────────────────────────────────────────────────────────
+
+class TestClusterKey:
+
+    def test_agent_scripts(self):
+        assert CommitPlanner.cluster_key(".agent/scripts/pre_flight.py") == (".agent/scripts", "scripts")
+
+    def test_skill_is_its_own_cluster(self):
+        key, scope = CommitPlanner.cluster_key(".agent/skills/api-patterns/scripts/x.py")
+        assert key == ".agent/skills/api-patterns"
+        assert scope == "api_patterns"
+
+    def test_nested_project_dir(self):
+        assert CommitPlanner.cluster_key("portfolio/src/app.tsx") == ("portfolio/src", "portfolio")
+
+    def test_root_file(self):
+        assert CommitPlanner.cluster_key("README.md") == (".", None)
+
+
+# ── Tests: plan / commit ──────────────────────────────────────────────────────
+
+class TestCommitPlanner:
+
+    def test_plan_groups_and_maps_tasks(self, repo):
+        _write(repo, ".agent/scripts/pre_flight.py")
+        _write(repo, ".agent/skills/api-patterns/SKILL.md")
+        _write(repo, "portfolio/src/app.tsx")
+        groups = {g.key: g for g in _planner(repo).plan()}
+
+        assert set(groups) == {".agent/scripts", ".agent/skills/api-patterns", "portfolio/src"}
+        assert groups[".agent/scripts"].message.startswith("feat")
+        assert "pre_flight" in groups[".agent/scripts"].task
+        assert groups["portfolio/src"].task is None
+        assert groups["portfolio/src"].message == "chore(portfolio): update portfolio/src"
+
+    def test_cochanged_clusters_merge(self, repo):
+        planner = _planner(repo)
+        for i in range(3):
+            _write(repo, "portfolio/src/app.tsx", f"{i}\n")
+            _write(repo, "portfolio/public/app.css", f"{i}\n")
+            _git(repo, "add", "-A")
+            _git(repo, "commit", "-q", "-m", f"c{i}")
+        _write(repo, "portfolio/src/app.tsx", "new\n")
+        _write(repo, "portfolio/public/app.css", "new\n")
+        groups = planner.plan()
+        assert len(groups) == 1
+        assert sorted(groups[0].files) == ["portfolio/public/app.css", "portfolio/src/app.tsx"]
+
+    def test_one_commit_per_group_leaves_others_dirty(self, repo):
+        _write(repo, ".agent/scripts/pre_flight.py")
+        _write(repo, "portfolio/src/app.tsx")
+        planner = _planner(repo)
+        groups = planner.plan()
+        planner.commit_group(groups[0])
+
+        committed = _git(repo, "show", "--name-only", "--format=", "HEAD").split()
+        assert committed == groups[0].files
+        assert GitContext(repo).dirty_paths() == groups[1].files
+
+    def test_deleted_and_renamed_files(self, repo):
+        _git(repo, "mv", "ralph_plan.md", "plan.md")
+        groups = _planner(repo).plan()
+        assert sorted(f for g in groups for f in g.files) == ["plan.md", "ralph_plan.md"]
@@ -0,0 +1,329 @@
+"""
+test_uiux_search.py — Test Suite for the ui-ux-pro-max search engine
+Covers the persistent per-CSV index, inverted-index scoring, top-k selection,
+engine profiles, reasoning-rule lookup, incremental persistence, the batch
+query API and the search daemon.
+"""
+
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+from math import log
+from pathlib import Path
+
+import pytest
+
+# Add scripts dir to path
+sys.path.insert(0, str(Path(__file__).parent.parent / ".agent" / "skills" / "ui-ux-pro-max" / "scripts"))
+import client
+import core
+import daemon
+import design_system
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+ROWS = [
+    ("Glassmorphism", "glass blur frosted translucent"),
+    ("Brutalism", "raw bold harsh blocky"),
+    ("Minimalism", "clean simple whitespace calm"),
+]
+
+
+def _write_csv(path, rows):
+    path.write_text("Name,Keywords\n" + "".join(f"{n},{k}\n" for n, k in rows), encoding="utf-8")
+
+
+@pytest.fixture
+def styles(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "INDEX_DIR", tmp_path / "index")
+    monkeypatch.setattr(core, "_indexes", {})
+    path = tmp_path / "styles.csv"
+    _write_csv(path, ROWS)
+    return path
+
+
+def _search(path, query, n=3):
+    return core._search_csv(path, ["Name", "Keywords"], ["Name"], query, n)
+
+
+def _reference_ranking(bm25, documents, query):
+    """The original full-scan BM25: every document, every query token, full sort."""
+    corpus = [bm25.tokenize(d) for d in documents]
+    scores = []
+    for idx, doc in enumerate(corpus):
+        score = 0
+        for token in bm25.tokenize(query):
+            if token in bm25.idf:
+                tf = doc.count(token)
+                denominator = tf + bm25.k1 * (1 - bm25.b + bm25.b * len(doc) / bm25.avgdl)
+                score += bm25.idf[token] * (tf * (bm25.k1 + 1)) / denominator
+        scores.append((idx, score))
+    return sorted(scores, key=lambda x: x[1], reverse=True)
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = random.Random(3)
+    vocab = [f"term{i}" for i in range(60)]
+    documents = [" ".join(rng.choices(vocab, k=rng.randint(0, 12))) for _ in range(400)]
+    queries = [" ".join(rng.choices(vocab, k=rng.randint(1, 4))) for _ in range(50)] + ["term1 term1", "none"]
+    bm25 = core.BM25()
+    bm25.fit(documents)
+    return bm25, documents, queries
+
+
+# ── Tests: persistent index ───────────────────────────────────────────────────
+
+class TestIndex:
+
+    def test_index_is_saved_and_reused(self, styles, monkeypatch):
+        assert _search(styles, "frosted glass") == [{"Name": "Glassmorphism"}]
+        assert len(list(core.INDEX_DIR.glob("styles-*.pickle"))) == 1
+
+        # A new process loads the pickle instead of re-reading the CSV
+        monkeypatch.setattr(core, "_indexes", {})
+        monkeypatch.setattr(core, "_load_csv", lambda path: pytest.fail("CSV re-read"))
+        assert _search(styles, "frosted glass") == [{"Name": "Glassmorphism"}]
+
+    def test_csv_change_rebuilds(self, styles):
+        assert _search(styles, "neon") == []
+        _write_csv(styles, ROWS + [("Cyberpunk", "neon glow dark")])
+        stat = styles.stat()
+        os.utime(styles, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert _search(styles, "neon") == [{"Name": "Cyberpunk"}]
+
+    def test_corrupt_index_is_rebuilt(self, styles, monkeypatch):
+        _search(styles, "glass")
+        for pickled in core.INDEX_DIR.glob("*.pickle"):
+            pickled.write_bytes(b"not a pickle")
+        monkeypatch.setattr(core, "_indexes", {})
+        assert _search(styles, "calm whitespace") == [{"Name": "Minimalism"}]
+
+
+# ── Tests: scoring ────────────────────────────────────────────────────────────
+
+class TestScoring:
+
+    def test_top_k_matches_full_scan(self, corpus):
+        bm25, documents, queries = corpus
+        for query in queries:
+            expected = [(i, s) for i, s in _reference_ranking(bm25, documents, query)[:5] if s > 0]
+            assert bm25.top_k(query, 5) == expected, query
+
+    def test_state_round_trip(self, corpus):
+        bm25, _, queries = corpus
+        restored = core.BM25.from_state(bm25.state())
+        assert [restored.top_k(q, 3) for q in queries] == [bm25.top_k(q, 3) for q in queries]
+
+    def test_vectorized_scores_are_identical(self, corpus):
+        pytest.importorskip("numpy")
+        bm25, _, queries = corpus
+        assert bm25.top_k_many(queries, 7, vectorized=True) == bm25.top_k_many(queries, 7, vectorized=False)
+
+
+# ── Tests: profiles ───────────────────────────────────────────────────────────
+
+class TestProfiles:
+
+    def test_profiles_search_their_own_data(self):
+        shared = core.search("glassmorphism blur", "prompt", profile="shared")
+        assert shared["file"] == "prompts.csv" and shared["count"] > 0
+        assert core.detect_domain("tailwind css", "shared") == "prompt"
+        assert core.detect_domain("tailwind css") == "style"
+        assert "Unknown stack" in core.search_stack("islands", "astro", profile="shared")["error"]
+        with pytest.raises(ValueError):
+            core.search("glass", profile="missing")
+
+    def test_identical_csvs_share_one_index(self):
+        skills, shared = core.PROFILES["skills"], core.PROFILES["shared"]
+        cols = core.CSV_CONFIG["product"]["search_cols"]
+        assert core.load_index(skills.data_dir / "products.csv", cols) is \
+            core.load_index(shared.data_dir / "products.csv", cols)
+
+    def test_build_indexes_drops_unused_files(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(core, "INDEX_DIR", tmp_path)
+        monkeypatch.setattr(core, "_indexes", {})
+        stale = tmp_path / "styles-000000000000.pickle"
+        stale.write_bytes(b"old")
+        built = core.build_indexes()
+        assert not stale.exists()
+        # One file per distinct (content, columns): shared CSVs are stored once
+        assert 0 < len(list(tmp_path.glob("*.pickle"))) < len(built)
+
+
+# ── Tests: reasoning rules ────────────────────────────────────────────────────
+
+def _reference_rule(rules, category):
+    """The original linear lookup: exact name, then containment, then a shared keyword."""
+    category = category.lower()
+    names = [rule["UI_Category"].lower() for rule in rules]
+    for test in (lambda n: n == category,
+                 lambda n: n in category or category in n,
+                 lambda n: any(kw in category for kw in n.replace("/", " ").replace("-", " ").split())):
+        for rule, name in zip(rules, names):
+            if test(name):
+                return rule
+    return {}
+
+
+class TestReasoningRules:
+
+    def test_lookup_matches_linear_scan(self):
+        generator = design_system.DesignSystemGenerator()
+        names = [rule["UI_Category"] for rule in generator.reasoning_data]
+        words = " ".join(names).split()
+        rng = random.Random(5)
+        categories = names + [n.upper() for n in names] + ["", "General", "zzz"]
+        categories += [" ".join(rng.sample(words, 2)) for _ in range(200)]
+        for category in categories:
+            assert generator._find_reasoning_rule(category) == _reference_rule(generator.reasoning_data, category)
+
+    def test_rules_are_shared_until_the_csv_changes(self, tmp_path):
+        path = tmp_path / "ui-reasoning.csv"
+        path.write_text("UI_Category,Style_Priority\nFintech,Flat\n", encoding="utf-8")
+        rules = design_system.load_reasoning_rules(path)
+        assert design_system.load_reasoning_rules(path) is rules
+        path.write_text("UI_Category,Style_Priority\nFintech,Dark Mode\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        changed = design_system.load_reasoning_rules(path)
+        assert changed.reasoning(changed.find("fintech"))["style_priority"] == ["Dark Mode"]
+
+
+# ── Tests: persistence ────────────────────────────────────────────────────────
+
+@pytest.fixture(scope="module")
+def spa():
+    return design_system.DesignSystemGenerator().generate("beauty spa wellness", "Serenity")
+
+
+def _persist(spa, out, page_query="spa booking"):
+    return design_system.persist_design_system(spa, "booking", str(out), page_query)
+
+
+class TestPersistence:
+
+    def test_unchanged_design_system_writes_nothing(self, spa, tmp_path):
+        first = _persist(spa, tmp_path)
+        assert len(first["written"]) == 2
+        mtimes = [os.stat(f).st_mtime_ns for f in first["created_files"]]
+        again = _persist(spa, tmp_path)
+        assert again["written"] == [] and again["unchanged"] == first["created_files"]
+        assert [os.stat(f).st_mtime_ns for f in again["created_files"]] == mtimes
+
+    def test_only_changed_files_are_written(self, spa, tmp_path):
+        master, page = _persist(spa, tmp_path)["created_files"]
+        result = _persist(spa, tmp_path, "checkout payment form")
+        assert result["written"] == [page] and result["unchanged"] == [master]
+
+    def test_edited_file_is_restored(self, spa, tmp_path):
+        master, _ = _persist(spa, tmp_path)["created_files"]
+        with open(master, "a", encoding="utf-8") as f:
+            f.write("hand edit\n")
+        assert _persist(spa, tmp_path)["written"] == [master]
+        assert "hand edit" not in open(master, encoding="utf-8").read()
+
+    def test_cli_reports_written_and_unchanged_files(self, tmp_path):
+        cmd = [sys.executable, "search.py", "beauty spa wellness", "--design-system", "--persist",
+               "-p", "Serenity", "--page", "booking", "-o", str(tmp_path), "--no-daemon"]
+
+        def persist():
+            return subprocess.run(cmd, cwd=Path(client.SCRIPTS_DIR), capture_output=True, text=True,
+                                  check=True).stdout
+
+        first = persist()
+        assert "(2 written, 0 unchanged)" in first
+        assert "📄 design-system/serenity/MASTER.md (Global Source of Truth, written)" in first
+        assert "📄 design-system/serenity/pages/booking.md (Page Overrides, written)" in first
+        again = persist()
+        assert "is up to date (nothing written)" in again
+        assert "📄 design-system/serenity/MASTER.md (Global Source of Truth, unchanged)" in again
+
+
+# ── Tests: batches ────────────────────────────────────────────────────────────
+
+BATCH_QUERIES = ["fintech crypto", "beauty spa wellness", "SaaS dashboard dark mode", "", "zzz"]
+
+
+class TestBatch:
+
+    def test_search_many_matches_single_searches(self):
+        domains = ["style", "color", "ux"]
+        assert core.search_many(BATCH_QUERIES, domains, 4) == \
+            [{d: core.search(q, d, 4) for d in domains} for q in BATCH_QUERIES]
+        assert core.search_many(BATCH_QUERIES) == [{r["domain"]: r} for r in map(core.search, BATCH_QUERIES)]
+
+    def test_worker_processes_match_serial(self, monkeypatch):
+        monkeypatch.setattr(core, "PARALLEL_MIN_SEARCHES", 2)
+        requests = [(q, d, 3) for q in BATCH_QUERIES for d in ("style", "product", "typography")]
+        assert core.run_searches(requests, jobs=2) == core.run_searches(requests)
+
+    def test_design_systems_match_single_generation(self):
+        requests = BATCH_QUERIES[:3] + [("fintech crypto", "Ledger")]
+        expected = [design_system.generate_design_system(q, None) for q in BATCH_QUERIES[:3]]
+        expected.append(design_system.generate_design_system("fintech crypto", "Ledger"))
+        assert design_system.generate_design_systems(requests) == expected
+
+
+# ── Tests: daemon ─────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def server(tmp_path):
+    server = daemon.SearchDaemon(tmp_path / "d.sock", idle_timeout=0)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server, thread
+    server.shutdown()
+    thread.join(5)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+class TestDaemon:
+
+    def test_answers_match_in_process(self, server):
+        path = server[0].path
+        for op, args in [("search", {"query": "glass dark", "max_results": 5}),
+                         ("search_stack", {"query": "form", "stack": "react"}),
+                         ("design_system", {"query": "fintech crypto", "output_format": "markdown"}),
+                         ("search", {"query": "glassmorphism blur", "domain": "prompt", "profile": "shared"})]:
+            assert daemon.request(op, args, socket_path=path) == daemon.dispatch(op, args)
+
+    def test_no_daemon_means_fallback(self, tmp_path):
+        with pytest.raises(daemon.DaemonUnavailable):
+            daemon.request("search", {"query": "glass"}, socket_path=tmp_path / "none.sock")
+
+    def test_code_change_stops_daemon(self, server, monkeypatch):
+        path, thread = server[0].path, server[1]
+        monkeypatch.setattr(daemon, "_source_stamp", lambda: ["changed"])
+        with pytest.raises(daemon.DaemonUnavailable, match="code changed"):
+            daemon.request("search", {"query": "glass"}, socket_path=path)
+        thread.join(5)
+        assert not thread.is_alive() and not path.exists()
+
+
+# ── Tests: thin client ────────────────────────────────────────────────────────
+
+class TestClient:
+
+    def test_static_lists_match_profiles(self):
+        assert sorted(client.DOMAINS) == sorted(core.PROFILES)
+        for name, profile in core.PROFILES.items():
+            assert client.DOMAINS[name] == list(profile.csv_config)
+            assert client.STACKS[name] == profile.stacks
+        assert (client.DEFAULT_PROFILE, client.MAX_RESULTS) == (core.DEFAULT_PROFILE, core.MAX_RESULTS)
+
+    def test_socket_lives_next_to_the_indexes(self, monkeypatch):
+        monkeypatch.delenv("UIUX_SEARCH_SOCKET", raising=False)
+        assert Path(client.INDEX_DIR) == core.INDEX_DIR
+        path = Path(client.default_socket())
+        assert path.parent in (core.INDEX_DIR, Path(tempfile.gettempdir()))
+
+    def test_search_cli_does_not_load_the_engine(self):
+        code = "import sys, search; print(sorted({'core', 'design_system', 'daemon'} & set(sys.modules)))"
+        out = subprocess.run([sys.executable, "-c", code], cwd=Path(client.SCRIPTS_DIR),
+                             capture_output=True, text=True, check=True).stdout
+        assert out.strip() == "[]"